@@ -8,8 +8,9 @@ Combines best practices from:
 """
 
 import os
+import time
 from pathlib import Path
-from typing import Final, Optional, Union
+from typing import Final, Optional, Set, Tuple, Union
 
 
 class Config:
@@ -58,6 +59,61 @@ class Config:
     HOVER_VIDEO_FADE_DURATION: Final[int] = 200  # Fade animation duration (ms)
     HOVER_VIDEO_AUTO_HIDE_DELAY: Final[int] = 0  # 0 = hide when mouse leaves, >0 = auto-hide after N ms
     HOVER_VIDEO_FOLLOW_MOUSE: Final[bool] = True  # Follow mouse movement
+    HOVER_STRIP_FRAMES: Final[int] = 48  # Frames sampled into a hover sprite strip
+    HOVER_STRIP_COLUMNS: Final[int] = 8  # Frames per strip row
+    HOVER_STRIP_THREAD_COUNT: Final[int] = 2  # Workers building strips
+    HOVER_STRIP_MEMORY_COUNT: Final[int] = 16  # Ready strips kept in memory
+
+    # Video preview playback (decoder thread)
+    VIDEO_READ_AHEAD_FRAMES: Final[int] = 48  # Ring buffer frames ahead of the playhead
+    VIDEO_CLIP_CACHE_MAX_MB: Final[int] = 128  # Decode whole clip if it fits (per preview)
+    VIDEO_SEEK_WAIT_MS: Final[int] = 1000  # Max GUI wait for a frame when seeking/paused
+
+    # Drawover overlays during playback
+    DRAWOVER_OVERLAY_THREAD_COUNT: Final[int] = 2  # Workers rendering overlay pixmaps
+    DRAWOVER_OVERLAY_CACHE_MB: Final[int] = 256  # Memory budget for rendered overlays
+    DRAWOVER_OVERLAY_LOOKAHEAD_FRAMES: Final[int] = 24  # Frames ahead of the playhead rendered in advance
+
+    # Metadata panel selection details
+    SELECTION_DETAILS_THREAD_COUNT: Final[int] = 2  # Workers loading details
+    SELECTION_DETAILS_CACHE_SIZE: Final[int] = 64  # Animations kept in the details LRU
+    METADATA_PREVIEW_SETTLE_MS: Final[int] = 120  # Selection must rest this long before its video opens
+
+    # Background jobs (sync, backup, maintenance, bulk edits)
+    JOB_THREAD_COUNT: Final[int] = 2  # Workers running long operations
+    JOB_PROGRESS_INTERVAL_MS: Final[int] = 100  # Min time between progress updates per job
+
+    # Startup
+    STARTUP_FIRST_PAGE_SIZE: Final[int] = 500  # Animations shown before the full list has loaded
+    STARTUP_BUDGET_MS: Final[int] = 1500  # First paint target; the startup report warns above it
+
+    # Logging
+    LOG_BUFFER_CAPACITY: Final[int] = 5000  # Records held for the console between flushes (oldest dropped)
+    LOG_CONSOLE_FLUSH_INTERVAL_MS: Final[int] = 100  # Console appends buffered records at this rate
+    LOG_CONSOLE_MAX_BLOCKS: Final[int] = 1000  # Lines kept in the console
+    LOG_RATE_LIMIT_PER_SECOND: Final[int] = 20  # Records per second from one hot-loop call site
+    # Console subsystem filter: display name -> logger name prefix
+    LOG_SUBSYSTEMS: Final[dict] = {
+        "Library scan": "animation_library.services.database.library_scanner",
+        "Database": "animation_library.services.database",
+        "Services": "animation_library.services",
+        "Blender": "animation_library.services.blender_service",
+        "Views": "animation_library.views",
+        "Widgets": "animation_library.widgets",
+        "Themes": "animation_library.themes",
+        "Core": "animation_library.core",
+    }
+
+    # Directory listing cache (preview/thumbnail path resolution)
+    FS_CACHE_REVALIDATE_SECONDS: Final[float] = 5.0  # Cached listings older than this re-stat their folder
+    FS_CACHE_MAX_FOLDERS: Final[int] = 20000  # Folder listings kept (LRU)
+
+    # Library change watcher
+    LIBRARY_WATCH_BACKEND: Final[str] = "auto"  # "auto", "inotify" (Linux, local disks) or "poll"
+    LIBRARY_WATCH_DEBOUNCE_MS: Final[int] = 500  # Quiet time before a burst of changes is applied
+    LIBRARY_WATCH_MAX_LATENCY_MS: Final[int] = 3000  # Changes are applied at least this often during long bursts
+    LIBRARY_POLL_INTERVAL_SECONDS: Final[float] = 5.0  # Snapshot interval of the polling backend
+    LIBRARY_WATCH_FULL_SYNC_THRESHOLD: Final[int] = 2000  # Larger change sets run a full sync instead
 
     # Thumbnail settings
     THUMBNAIL_SIZE: Final[int] = 300  # Max size for stored thumbnails
@@ -103,6 +159,68 @@ class Config:
     DELETED_FOLDER_NAME: Final[str] = ".deleted"    # Soft-deleted items
     TRASH_FOLDER_NAME: Final[str] = ".trash"        # Staging for permanent deletion
     ALLOW_HARD_DELETE: bool = False                 # Setting toggle for permanent deletion
+    LIBRARY_PATH_RETRY_SECONDS: Final[float] = 5.0  # A missing library (unmounted share) is re-checked this often
+
+    # Session caches for the path getters (see invalidate_path_cache)
+    _user_data_dir: Optional[Path] = None
+    _library_path_cache: Optional[Tuple[Optional[Path], float]] = None  # (path, monotonic time resolved)
+    _ensured_dirs: Set[Path] = set()
+
+    @classmethod
+    def _ensure_dir(cls, path: Path) -> Path:
+        """
+        Create a directory once per session.
+
+        Later calls for the same path skip the mkdir entirely; the cache
+        is reset by invalidate_path_cache().
+
+        Args:
+            path: Directory to create
+
+        Returns:
+            The same path
+        """
+        if path not in cls._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            cls._ensured_dirs.add(path)
+        return path
+
+    @classmethod
+    def _ensure_library_dir(cls, *parts: str) -> Optional[Path]:
+        """
+        Create a folder inside the library root once per session.
+
+        The root itself is never created. Until the folder has been
+        created, the root is checked first, so a library on a share that
+        is not mounted does not get empty folders on its mount point.
+
+        Args:
+            *parts: Path components below the library root
+
+        Returns:
+            The folder, or None if no library is configured or its root is missing
+        """
+        library_path = cls.load_library_path()
+        if not library_path:
+            return None
+        path = library_path.joinpath(*parts)
+        if path not in cls._ensured_dirs:
+            if not library_path.exists():
+                return None
+            path.mkdir(parents=True, exist_ok=True)
+            cls._ensured_dirs.add(path)
+        return path
+
+    @classmethod
+    def invalidate_path_cache(cls):
+        """
+        Forget the resolved library path and created directories.
+
+        Called by save_library_path(); call it directly if the library
+        folder is changed or removed behind the app's back.
+        """
+        cls._library_path_cache = None
+        cls._ensured_dirs.clear()
 
     @classmethod
     def get_user_data_dir(cls) -> Path:
@@ -113,7 +231,10 @@ class Config:
         to ensure settings persist across application updates.
         """
         import sys
-        
+
+        if cls._user_data_dir is not None:
+            return cls._user_data_dir
+
         # Check if we should override with portable mode (optional flag file)
         # If 'portable.txt' exists next to exe, stick to local folder
         portable_flag = cls.APP_ROOT.parent / 'portable.txt'
@@ -131,21 +252,17 @@ class Config:
                 user_dir = Path.home() / '.local' / 'share' / 'ActionLibrary'
 
         user_dir.mkdir(parents=True, exist_ok=True)
+        cls._user_data_dir = user_dir
         return user_dir
 
     @classmethod
     def get_database_folder(cls) -> Path:
         """Get the database folder path (.meta folder at library root)."""
-        library_path = cls.load_library_path()
-        if library_path and library_path.exists():
-            meta_folder = library_path / cls.META_FOLDER_NAME
-            meta_folder.mkdir(parents=True, exist_ok=True)
+        meta_folder = cls._ensure_library_dir(cls.META_FOLDER_NAME)
+        if meta_folder:
             return meta_folder
-        else:
-            # Fallback to user data dir if no library configured
-            db_folder = cls.get_user_data_dir() / cls.META_FOLDER_NAME
-            db_folder.mkdir(parents=True, exist_ok=True)
-            return db_folder
+        # Fallback to user data dir if no library configured
+        return cls._ensure_dir(cls.get_user_data_dir() / cls.META_FOLDER_NAME)
 
     @classmethod
     def get_meta_folder(cls) -> Path:
@@ -155,46 +272,34 @@ class Config:
     @classmethod
     def get_library_folder(cls) -> Path:
         """Get the library/ folder path (hot storage for latest versions)."""
-        library_path = cls.load_library_path()
-        if library_path and library_path.exists():
-            lib_folder = library_path / cls.LIBRARY_FOLDER_NAME
-            lib_folder.mkdir(parents=True, exist_ok=True)
+        lib_folder = cls._ensure_library_dir(cls.LIBRARY_FOLDER_NAME)
+        if lib_folder:
             return lib_folder
         raise ValueError("Library path not configured")
 
     @classmethod
     def get_actions_folder(cls) -> Path:
         """Get the library/actions/ folder path (for multi-frame animations)."""
-        lib_folder = cls.get_library_folder()
-        actions_folder = lib_folder / cls.ACTIONS_FOLDER_NAME
-        actions_folder.mkdir(parents=True, exist_ok=True)
-        return actions_folder
+        return cls._ensure_dir(cls.get_library_folder() / cls.ACTIONS_FOLDER_NAME)
 
     @classmethod
     def get_poses_folder(cls) -> Path:
         """Get the library/poses/ folder path (for single-frame poses)."""
-        lib_folder = cls.get_library_folder()
-        poses_folder = lib_folder / cls.POSES_FOLDER_NAME
-        poses_folder.mkdir(parents=True, exist_ok=True)
-        return poses_folder
+        return cls._ensure_dir(cls.get_library_folder() / cls.POSES_FOLDER_NAME)
 
     @classmethod
     def get_versions_folder(cls) -> Path:
         """Get the _versions/ folder path (cold storage for old versions)."""
-        library_path = cls.load_library_path()
-        if library_path and library_path.exists():
-            versions_folder = library_path / cls.VERSIONS_FOLDER_NAME
-            versions_folder.mkdir(parents=True, exist_ok=True)
+        versions_folder = cls._ensure_library_dir(cls.VERSIONS_FOLDER_NAME)
+        if versions_folder:
             return versions_folder
         raise ValueError("Library path not configured")
 
     @classmethod
     def get_deleted_folder(cls) -> Path:
         """Get the soft-deleted items folder path (.deleted folder)."""
-        library_path = cls.load_library_path()
-        if library_path and library_path.exists():
-            deleted_folder = library_path / cls.DELETED_FOLDER_NAME
-            deleted_folder.mkdir(parents=True, exist_ok=True)
+        deleted_folder = cls._ensure_library_dir(cls.DELETED_FOLDER_NAME)
+        if deleted_folder:
             return deleted_folder
         raise ValueError("Library path not configured")
 
@@ -275,23 +380,22 @@ class Config:
     @classmethod
     def get_cache_dir(cls) -> Path:
         """Get cache directory for thumbnails and previews"""
-        cache_dir = cls.get_user_data_dir() / 'cache'
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        return cls._ensure_dir(cls.get_user_data_dir() / 'cache')
 
     @classmethod
     def get_thumbnails_dir(cls) -> Path:
         """Get thumbnails directory"""
-        thumb_dir = cls.get_cache_dir() / 'thumbnails'
-        thumb_dir.mkdir(parents=True, exist_ok=True)
-        return thumb_dir
+        return cls._ensure_dir(cls.get_cache_dir() / 'thumbnails')
 
     @classmethod
     def get_previews_dir(cls) -> Path:
         """Get video previews directory"""
-        preview_dir = cls.get_cache_dir() / 'previews'
-        preview_dir.mkdir(parents=True, exist_ok=True)
-        return preview_dir
+        return cls._ensure_dir(cls.get_cache_dir() / 'previews')
+
+    @classmethod
+    def get_hover_strips_dir(cls) -> Path:
+        """Get hover preview sprite strip cache directory"""
+        return cls._ensure_dir(cls.get_cache_dir() / 'hover_strips')
 
     @classmethod
     def get_settings_file(cls) -> Path:
@@ -390,9 +494,28 @@ class Config:
         """
         Load saved library path from config file
 
+        A resolved path is kept for the session (the config file and the
+        folder are not re-checked on every call); save_library_path() and
+        invalidate_path_cache() reset it. A missing library is only
+        remembered for LIBRARY_PATH_RETRY_SECONDS, so a share that is
+        mounted late is picked up without a restart.
+
         Returns:
             Path: Library path if configured and exists, None otherwise
         """
+        cached = cls._library_path_cache
+        if cached is not None:
+            library_path, resolved_at = cached
+            if library_path is not None or time.monotonic() - resolved_at < cls.LIBRARY_PATH_RETRY_SECONDS:
+                return library_path
+
+        library_path = cls._read_library_path()
+        cls._library_path_cache = (library_path, time.monotonic())
+        return library_path
+
+    @classmethod
+    def _read_library_path(cls) -> Optional[Path]:
+        """Read the library path from the config file (uncached)"""
         config_file = cls.get_library_config_path()
         if config_file.exists():
             try:
@@ -429,6 +552,9 @@ class Config:
             return True
         except Exception:
             return False
+        finally:
+            # After the write, so a concurrent reader cannot re-cache the old path
+            cls.invalidate_path_cache()
 
     @classmethod
     def is_first_run(cls) -> bool:
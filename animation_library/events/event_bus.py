@@ -59,11 +59,15 @@ class EventBus(QObject):
     # Archive events (first stage - soft delete)
     animation_archived = pyqtSignal(str)  # animation_id moved to archive
     animation_restored_from_archive = pyqtSignal(str)  # animation_id restored from archive to library
+    animations_archived = pyqtSignal(list)  # List[animation_id] moved to archive in one batch
+    animations_restored_from_archive = pyqtSignal(list)  # List[animation_id] restored in one batch
     archive_count_changed = pyqtSignal(int)  # new archive count
 
     # Trash events (second stage - hard delete staging)
     animation_moved_to_trash = pyqtSignal(str)  # animation_id moved from archive to trash
     animation_restored_to_archive = pyqtSignal(str)  # animation_id restored from trash to archive
+    animations_moved_to_trash = pyqtSignal(list)  # List[animation_id] moved to trash in one batch
+    animations_restored_to_archive = pyqtSignal(list)  # List[animation_id] restored in one batch
     trash_item_deleted = pyqtSignal(str)  # animation_id permanently deleted
     trash_emptied = pyqtSignal()  # all trash items deleted
     trash_count_changed = pyqtSignal(int)  # new trash count
@@ -86,6 +90,12 @@ class EventBus(QObject):
     loading_finished = pyqtSignal(str)  # operation_name
     loading_progress = pyqtSignal(int, int)  # current, total
 
+    # Background job events (see services/job_manager.py)
+    job_added = pyqtSignal(int, str, str)  # job_id, kind, title
+    job_started = pyqtSignal(int)  # job_id
+    job_progress = pyqtSignal(int, int, int, str)  # job_id, current, total (0 = unknown), message
+    job_finished = pyqtSignal(int, str)  # job_id, state ('finished', 'failed' or 'cancelled')
+
     # Error events
     error_occurred = pyqtSignal(str, str)  # error_type, error_message
 
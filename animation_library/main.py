@@ -9,6 +9,7 @@ Usage:
 
 import sys
 import shutil
+import hashlib
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPixmapCache, QIcon, QFontDatabase
@@ -19,6 +20,33 @@ from .themes.theme_manager import get_theme_manager
 from .themes.fonts import get_app_font
 from .events.event_bus import get_event_bus
 from .utils.logging_config import LoggingConfig
+from .utils.startup_timer import get_startup_timer
+
+# Started at import so the report includes module loading
+_startup_timer = get_startup_timer()
+
+# Written next to the synced protocol files; matching hash skips the copy
+PROTOCOL_HASH_FILE = '.content_hash'
+
+
+def _protocol_content_hash(source: Path) -> str:
+    """
+    Hash protocol file names and contents
+
+    Args:
+        source: Protocol source directory
+
+    Returns:
+        Hex digest covering every file (excluding __pycache__)
+    """
+    digest = hashlib.sha1()
+    for path in sorted(source.rglob('*')):
+        if not path.is_file() or '__pycache__' in path.parts:
+            continue
+        digest.update(path.relative_to(source).as_posix().encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
 
 
 def sync_protocol_to_library():
@@ -42,13 +70,20 @@ def sync_protocol_to_library():
     dest_protocol = dest_schema / 'protocol'
 
     try:
+        # Skip the copy when the library already has these exact files
+        content_hash = _protocol_content_hash(source_protocol)
+        hash_file = dest_protocol / PROTOCOL_HASH_FILE
+        if hash_file.exists() and hash_file.read_text(encoding='utf-8').strip() == content_hash:
+            return
+
         # Create .schema directory if needed
         dest_schema.mkdir(parents=True, exist_ok=True)
 
         # Copy protocol files (overwrite existing)
         if dest_protocol.exists():
             shutil.rmtree(dest_protocol)
-        shutil.copytree(source_protocol, dest_protocol)
+        shutil.copytree(source_protocol, dest_protocol, ignore=shutil.ignore_patterns('__pycache__'))
+        hash_file.write_text(content_hash, encoding='utf-8')
 
     except Exception as e:
         # Non-fatal - addon can fall back to bundled copy
@@ -152,17 +187,15 @@ def setup_application() -> QApplication:
 
     # Initialize theme manager and apply default theme
     theme_manager = get_theme_manager()
-    stylesheet = theme_manager.get_current_stylesheet()
-    app.setStyleSheet(stylesheet)
+    theme_manager.apply_stylesheet(app)
 
     # Initialize event bus (singleton)
     event_bus = get_event_bus()
 
     # Connect theme changes to stylesheet updates
     def on_theme_changed(theme_name: str):
-        """Update stylesheet when theme changes"""
-        new_stylesheet = theme_manager.get_current_stylesheet()
-        app.setStyleSheet(new_stylesheet)
+        """Update stylesheet when theme changes (one polish pass, skipped if unchanged)"""
+        theme_manager.apply_stylesheet(app)
 
     theme_manager.theme_changed.connect(on_theme_changed)
 
@@ -183,17 +216,23 @@ def main():
     logger.info(f"Starting {Config.APP_NAME} {Config.APP_VERSION}...")
     logger.info(f"Database: {Config.get_database_path()}")
     logger.info(f"Cache: {Config.get_cache_dir()}")
+    _startup_timer.mark("Imports and logging")
 
     # Sync protocol schema to library for Blender addon access
     sync_protocol_to_library()
+    _startup_timer.mark("Protocol sync")
 
     # Setup application
     app = setup_application()
+    _startup_timer.mark("Application")
 
-    # Create and show main window
+    # Create and show main window (it marks first paint and logs the
+    # startup report once its deferred services have started)
     from .widgets.main_window import MainWindow
     window = MainWindow()
+    _startup_timer.mark("Main window")
     window.show()
+    _startup_timer.mark("Window shown")
 
     logger.info(f"Application started successfully!")
     logger.info(f"Theme: {get_theme_manager().get_current_theme().name}")
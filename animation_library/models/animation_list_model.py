@@ -7,7 +7,6 @@ Inspired by: Hybrid plan + Maya Studio Library patterns
 
 import time
 from enum import IntEnum
-from pathlib import Path
 from typing import List, Dict, Any, Optional
 from PyQt6.QtCore import (
     QAbstractListModel, QModelIndex, Qt, QMimeData, QByteArray
@@ -15,6 +14,7 @@ from PyQt6.QtCore import (
 
 from ..config import Config
 from ..services.database_service import get_database_service
+from ..services.directory_cache import get_directory_cache
 from ..services.notes_database import get_notes_database
 
 
@@ -71,6 +71,12 @@ class AnimationRole(IntEnum):
     VersionGroupIdRole = Qt.ItemDataRole.UserRole + 82
     IsLatestRole = Qt.ItemDataRole.UserRole + 83
 
+    # Version group summary (v13)
+    VersionCountRole = Qt.ItemDataRole.UserRole + 84
+    VersionLabelsRole = Qt.ItemDataRole.UserRole + 85
+    LatestVersionUUIDRole = Qt.ItemDataRole.UserRole + 86
+    NewestVersionDateRole = Qt.ItemDataRole.UserRole + 87
+
     # Lifecycle status (v6)
     StatusRole = Qt.ItemDataRole.UserRole + 90
 
@@ -106,6 +112,8 @@ class AnimationListModel(QAbstractListModel):
     def __init__(self, parent=None, db_service=None):
         super().__init__(parent)
         self._animations: List[Dict[str, Any]] = []
+        self._row_by_uuid: Dict[str, int] = {}  # uuid -> row, kept in sync with _animations
+        self._reset_generation: int = 0  # Bumped by set_animations (stale background load check)
         self._db_service = db_service  # Lazy init - use get_db_service()
 
         # Performance monitoring (Maya-inspired)
@@ -116,6 +124,10 @@ class AnimationListModel(QAbstractListModel):
         self._animations_with_notes: set = set()
         self._unresolved_counts: dict = {}
 
+        # Summaries of version groups with more than one version
+        # (groups not in here have a single version)
+        self._versioned_groups: Dict[str, Dict[str, Any]] = {}
+
     def _get_db_service(self):
         """Get database service (lazy initialization)"""
         if self._db_service is None:
@@ -133,12 +145,42 @@ class AnimationListModel(QAbstractListModel):
 
         self.beginResetModel()
         self._animations = animations
+        self._rebuild_row_index()
+        self._reset_generation += 1
         self.endResetModel()
 
         self._load_time = (time.time() - start_time) * 1000  # Convert to ms
 
-        # Refresh notes cache
+        # Refresh notes and version caches
         self.refresh_notes_cache()
+        self.refresh_version_cache()
+
+    def get_reset_generation(self) -> int:
+        """
+        Get the number of set_animations calls so far
+
+        Returns:
+            Counter value (compare two values to detect a newer reset)
+        """
+        return self._reset_generation
+
+    def _rebuild_row_index(self, from_row: int = 0):
+        """
+        Rebuild UUID -> row lookup from the given row onwards
+
+        Args:
+            from_row: First row whose index entry may be stale
+        """
+        if from_row == 0:
+            self._row_by_uuid = {}
+        for row in range(from_row, len(self._animations)):
+            uuid = self._animations[row].get('uuid')
+            if uuid:
+                self._row_by_uuid[uuid] = row
+
+    def _find_row(self, uuid: str) -> int:
+        """Get row for UUID, or -1 if not in model"""
+        return self._row_by_uuid.get(uuid, -1)
 
     def refresh_notes_cache(self, emit_change: bool = False):
         """
@@ -148,9 +190,13 @@ class AnimationListModel(QAbstractListModel):
             emit_change: If True, emit dataChanged for all items to trigger repaint
         """
         try:
-            notes_db = get_notes_database()
-            self._animations_with_notes = notes_db.get_animations_with_notes()
-            self._unresolved_counts = notes_db.get_unresolved_counts()
+            # One query for every card's badges
+            uuids = [a['uuid'] for a in self._animations if a.get('uuid')]
+            counts = get_notes_database().get_note_counts(uuids)
+            self._animations_with_notes = set(counts)
+            self._unresolved_counts = {
+                uuid: c['unresolved'] for uuid, c in counts.items() if c['unresolved']
+            }
         except Exception:
             self._animations_with_notes = set()
             self._unresolved_counts = {}
@@ -161,6 +207,52 @@ class AnimationListModel(QAbstractListModel):
             bottom_right = self.index(len(self._animations) - 1, 0)
             self.dataChanged.emit(top_left, bottom_right)
 
+    def refresh_version_cache(self, version_group_id: Optional[str] = None):
+        """
+        Refresh the version group summaries behind the version roles.
+
+        Args:
+            version_group_id: Only refresh this group (one primary key
+                lookup); None reloads every versioned group in one query
+        """
+        db_service = self._get_db_service()
+        if version_group_id is None:
+            self._versioned_groups = db_service.get_versioned_groups()
+            return
+
+        summary = db_service.get_version_summary(version_group_id)
+        if summary and summary['version_count'] > 1:
+            self._versioned_groups[version_group_id] = summary
+        else:
+            self._versioned_groups.pop(version_group_id, None)
+
+    def _get_version_summary(self, animation: Dict[str, Any]) -> Dict[str, Any]:
+        """Get an animation's version group summary (derived if unversioned)"""
+        group_id = animation.get('version_group_id') or animation.get('uuid')
+        summary = self._versioned_groups.get(group_id)
+        if summary is not None:
+            return summary
+        return {
+            'latest_uuid': animation.get('uuid') if animation.get('is_latest', 1) else None,
+            'version_count': 1,
+            'max_version': animation.get('version', 1),
+            'newest_date': animation.get('created_date'),
+            'version_labels': [animation.get('version_label', 'v001')],
+        }
+
+    def get_version_count(self, uuid: str) -> int:
+        """
+        Get the number of versions in an animation's version group
+
+        Args:
+            uuid: Animation UUID
+
+        Returns:
+            Version count (0 if the animation is not in the model)
+        """
+        animation = self.get_animation_by_uuid(uuid)
+        return self._get_version_summary(animation)['version_count'] if animation else 0
+
     def append_animation(self, animation: Dict[str, Any]):
         """
         Append single animation to model
@@ -171,8 +263,32 @@ class AnimationListModel(QAbstractListModel):
         row = len(self._animations)
         self.beginInsertRows(QModelIndex(), row, row)
         self._animations.append(animation)
+        if animation.get('uuid'):
+            self._row_by_uuid[animation['uuid']] = row
         self.endInsertRows()
 
+    def upsert_animation(self, animation: Dict[str, Any]) -> bool:
+        """
+        Replace the row for an animation, or append it if not present
+
+        Args:
+            animation: Animation data dict (must contain 'uuid')
+
+        Returns:
+            True if an existing row was replaced, False if appended
+        """
+        self.refresh_version_cache(animation.get('version_group_id') or animation.get('uuid'))
+
+        row = self._find_row(animation.get('uuid'))
+        if row < 0:
+            self.append_animation(animation)
+            return False
+
+        self._animations[row] = animation
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+        return True
+
     def remove_animation(self, uuid: str) -> bool:
         """
         Remove animation by UUID
@@ -183,13 +299,55 @@ class AnimationListModel(QAbstractListModel):
         Returns:
             True if removed, False if not found
         """
-        for i, anim in enumerate(self._animations):
-            if anim.get('uuid') == uuid:
-                self.beginRemoveRows(QModelIndex(), i, i)
-                del self._animations[i]
-                self.endRemoveRows()
-                return True
-        return False
+        row = self._find_row(uuid)
+        if row < 0:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._animations[row]
+        del self._row_by_uuid[uuid]
+        self._rebuild_row_index(row)
+        self.endRemoveRows()
+        return True
+
+    def remove_animations(self, uuids: List[str]) -> int:
+        """
+        Remove several animations, one beginRemoveRows() per contiguous run
+
+        The row index is rebuilt once afterwards, instead of after every
+        row as repeated remove_animation() calls would.
+
+        Args:
+            uuids: Animation UUIDs
+
+        Returns:
+            Number of rows removed
+        """
+        rows = sorted({row for row in map(self._find_row, uuids) if row >= 0})
+        if not rows:
+            return 0
+
+        # Remove runs bottom-up so earlier row numbers stay valid
+        run_end = rows[-1]
+        run_start = run_end
+        for row in reversed(rows[:-1]):
+            if row == run_start - 1:
+                run_start = row
+                continue
+            self._remove_row_run(run_start, run_end)
+            run_start = run_end = row
+        self._remove_row_run(run_start, run_end)
+
+        self._rebuild_row_index(rows[0])
+        return len(rows)
+
+    def _remove_row_run(self, first: int, last: int):
+        """Remove the contiguous rows first..last (row index rebuilt by the caller)"""
+        self.beginRemoveRows(QModelIndex(), first, last)
+        for removed in self._animations[first:last + 1]:
+            self._row_by_uuid.pop(removed.get('uuid'), None)
+        del self._animations[first:last + 1]
+        self.endRemoveRows()
 
     def update_animation(self, uuid: str, updates: Dict[str, Any]) -> bool:
         """
@@ -202,14 +360,15 @@ class AnimationListModel(QAbstractListModel):
         Returns:
             True if updated, False if not found
         """
-        for i, anim in enumerate(self._animations):
-            if anim.get('uuid') == uuid:
-                anim.update(updates)
-                # Emit dataChanged for this row
-                index = self.index(i, 0)
-                self.dataChanged.emit(index, index)
-                return True
-        return False
+        row = self._find_row(uuid)
+        if row < 0:
+            return False
+
+        self._animations[row].update(updates)
+        # Emit dataChanged for this row
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+        return True
 
     def refresh_animation(self, uuid: str) -> bool:
         """
@@ -221,17 +380,20 @@ class AnimationListModel(QAbstractListModel):
         Returns:
             True if refreshed, False if not found
         """
+        row = self._find_row(uuid)
+        if row < 0:
+            return False
+
         db_service = self._get_db_service()
         updated_data = db_service.get_animation_by_uuid(uuid)
 
         if updated_data:
-            for i, anim in enumerate(self._animations):
-                if anim.get('uuid') == uuid:
-                    self._animations[i] = updated_data
-                    # Emit dataChanged for this row
-                    index = self.index(i, 0)
-                    self.dataChanged.emit(index, index)
-                    return True
+            self._animations[row] = updated_data
+            self.refresh_version_cache(updated_data.get('version_group_id') or uuid)
+            # Emit dataChanged for this row
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+            return True
         return False
 
     def get_animation_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
@@ -244,10 +406,10 @@ class AnimationListModel(QAbstractListModel):
         Returns:
             Animation dict or None
         """
-        for anim in self._animations:
-            if anim.get('uuid') == uuid:
-                return anim
-        return None
+        row = self._find_row(uuid)
+        if row < 0:
+            return None
+        return self._animations[row]
 
     def get_animation_at_index(self, row: int) -> Optional[Dict[str, Any]]:
         """
@@ -332,7 +494,7 @@ class AnimationListModel(QAbstractListModel):
         elif role == AnimationRole.PreviewPathRole:
             # Resolve preview path (checks library and archive folders)
             stored_path = animation.get('preview_path')
-            if stored_path and Path(stored_path).exists():
+            if stored_path and get_directory_cache().exists(stored_path):
                 return stored_path
             # Try to resolve actual path for archived versions
             db_service = self._get_db_service()
@@ -342,7 +504,7 @@ class AnimationListModel(QAbstractListModel):
         elif role == AnimationRole.ThumbnailPathRole:
             # Resolve thumbnail path (checks library and archive folders)
             stored_path = animation.get('thumbnail_path')
-            if stored_path and Path(stored_path).exists():
+            if stored_path and get_directory_cache().exists(stored_path):
                 return stored_path
             # Try to resolve actual path for archived versions
             db_service = self._get_db_service()
@@ -401,6 +563,20 @@ class AnimationListModel(QAbstractListModel):
         elif role == AnimationRole.IsLatestRole:
             return animation.get('is_latest', 1)
 
+        elif role == AnimationRole.VersionCountRole:
+            # Painted on every card - skip building the unversioned summary
+            summary = self._versioned_groups.get(animation.get('version_group_id') or animation.get('uuid'))
+            return summary['version_count'] if summary else 1
+
+        elif role == AnimationRole.VersionLabelsRole:
+            return self._get_version_summary(animation)['version_labels']
+
+        elif role == AnimationRole.LatestVersionUUIDRole:
+            return self._get_version_summary(animation)['latest_uuid']
+
+        elif role == AnimationRole.NewestVersionDateRole:
+            return self._get_version_summary(animation)['newest_date']
+
         elif role == AnimationRole.StatusRole:
             return animation.get('status', 'none')
 
@@ -10,6 +10,8 @@ Architecture:
 
 Communication Methods:
     1. Socket-based (preferred): Real-time TCP socket (~10-50ms latency)
+       - Desktop→Blender commands go to the Blender socket server
+       - Blender→Desktop notifications go to the desktop notification server
     2. File-based (fallback): JSON queue files (~100-500ms latency)
 
 Usage - Desktop App:
@@ -86,6 +88,11 @@ from .constants import (
     APPLY_ANIMATION_FILE,
     APPLY_POSE_FILE,
     QUEUE_FILE_PATTERN,
+    NOTIFICATION_FILE_PREFIXES,
+
+    # File operation journal
+    META_DIR_NAME,
+    FILE_JOURNAL_DIR_NAME,
 
     # Socket
     DEFAULT_SOCKET_PORT,
@@ -97,11 +104,18 @@ from .constants import (
     MAX_CONNECTION_RETRIES,
     RETRY_DELAY_MS,
 
+    # Notification channel
+    DEFAULT_NOTIFY_PORT,
+    NOTIFY_PORT_ENV_VAR,
+    NOTIFY_ENDPOINT_FILE,
+    NOTIFY_SEND_TIMEOUT,
+
     # Enums
     MessageStatus,
     ApplyMode,
     RigType,
     CommandType,
+    NotificationType,
 
     # Polling
     SOCKET_POLL_INTERVAL_MS,
@@ -113,6 +127,13 @@ from .constants import (
     PROTOCOL_VERSION,
 )
 
+# File operation journal (shared crash recovery for multi-file moves)
+from .file_journal import (
+    FileJournal,
+    JOURNAL_FORMAT_VERSION,
+    JOURNAL_STALE_SECONDS,
+)
+
 
 __all__ = [
     # Schema
@@ -148,6 +169,9 @@ __all__ = [
     'APPLY_ANIMATION_FILE',
     'APPLY_POSE_FILE',
     'QUEUE_FILE_PATTERN',
+    'NOTIFICATION_FILE_PREFIXES',
+    'META_DIR_NAME',
+    'FILE_JOURNAL_DIR_NAME',
     'DEFAULT_SOCKET_PORT',
     'SOCKET_HOST',
     'SOCKET_PORT_ENV_VAR',
@@ -156,13 +180,23 @@ __all__ = [
     'SOCKET_COMMAND_TIMEOUT',
     'MAX_CONNECTION_RETRIES',
     'RETRY_DELAY_MS',
+    'DEFAULT_NOTIFY_PORT',
+    'NOTIFY_PORT_ENV_VAR',
+    'NOTIFY_ENDPOINT_FILE',
+    'NOTIFY_SEND_TIMEOUT',
     'MessageStatus',
     'ApplyMode',
     'RigType',
     'CommandType',
+    'NotificationType',
     'SOCKET_POLL_INTERVAL_MS',
     'QUEUE_TIME_BUDGET_MS',
     'MAX_HEAVY_COMMANDS_PER_TICK',
     'HEAVY_COMMANDS',
     'PROTOCOL_VERSION',
+
+    # File operation journal
+    'FileJournal',
+    'JOURNAL_FORMAT_VERSION',
+    'JOURNAL_STALE_SECONDS',
 ]
@@ -25,6 +25,24 @@ APPLY_POSE_FILE = "apply_pose.json"  # Currently uses same as animation
 # File patterns for queue polling
 QUEUE_FILE_PATTERN = "apply_*.json"
 
+# Notification file prefixes (Blender→Desktop file fallback)
+NOTIFICATION_FILE_PREFIXES = (
+    "preview_updating_",
+    "animation_captured_",
+    "preview_updated_",
+)
+
+
+# ============================================================================
+# FILE OPERATION JOURNAL
+# ============================================================================
+
+# Library metadata folder (databases, journal)
+META_DIR_NAME = ".meta"
+
+# Intent files of pending multi-file operations (inside META_DIR_NAME)
+FILE_JOURNAL_DIR_NAME = "journal"
+
 
 # ============================================================================
 # SOCKET CONFIGURATION
@@ -49,6 +67,23 @@ MAX_CONNECTION_RETRIES = 3
 RETRY_DELAY_MS = 100
 
 
+# ============================================================================
+# NOTIFICATION CHANNEL (Blender→Desktop)
+# ============================================================================
+
+# Default port the desktop app listens on for Blender notifications
+DEFAULT_NOTIFY_PORT = 9877
+
+# Environment variable for notification port override
+NOTIFY_PORT_ENV_VAR = "ANIMLIB_NOTIFY_PORT"
+
+# Endpoint file (in queue dir) advertising the port the desktop app bound
+NOTIFY_ENDPOINT_FILE = "notify_endpoint.json"
+
+# Notification send timeout (seconds) - kept short, file queue is the fallback
+NOTIFY_SEND_TIMEOUT = 0.5
+
+
 # ============================================================================
 # MESSAGE STATUS VALUES
 # ============================================================================
@@ -109,6 +144,13 @@ class CommandType:
     PING = "ping"
 
 
+class NotificationType:
+    """Message type constants for Blender→Desktop notifications."""
+    ANIMATION_CAPTURED = "animation_captured"
+    PREVIEW_UPDATING = "preview_updating"
+    PREVIEW_UPDATED = "preview_updated"
+
+
 # ============================================================================
 # POLLING CONFIGURATION
 # ============================================================================
@@ -145,6 +187,7 @@ __all__ = [
     'APPLY_ANIMATION_FILE',
     'APPLY_POSE_FILE',
     'QUEUE_FILE_PATTERN',
+    'NOTIFICATION_FILE_PREFIXES',
 
     # Socket
     'DEFAULT_SOCKET_PORT',
@@ -156,11 +199,18 @@ __all__ = [
     'MAX_CONNECTION_RETRIES',
     'RETRY_DELAY_MS',
 
+    # Notification channel
+    'DEFAULT_NOTIFY_PORT',
+    'NOTIFY_PORT_ENV_VAR',
+    'NOTIFY_ENDPOINT_FILE',
+    'NOTIFY_SEND_TIMEOUT',
+
     # Enums/Constants
     'MessageStatus',
     'ApplyMode',
     'RigType',
     'CommandType',
+    'NotificationType',
 
     # Polling
     'SOCKET_POLL_INTERVAL_MS',
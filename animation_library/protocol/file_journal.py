@@ -0,0 +1,566 @@
+"""
+File Journal - Write-ahead journal for multi-file library operations.
+
+Shared by the desktop app (renames, folder migrations) and the Blender
+plugin (moving the previous latest version to cold storage), so an
+operation interrupted in either process can be finished or undone by the
+other one.
+
+Each operation is recorded as one intent file in .meta/journal/ before
+anything on disk changes, and the intent file is deleted once the
+operation is complete. Recovery therefore only reads the pending intent
+files - O(pending operations), not a library rescan.
+
+Operations are an ordered list of steps:
+    rename       Rename a folder or file (whole asset folders move with
+                 one directory rename)
+    update_json  Set keys in a JSON file (atomic temp file + replace)
+
+All rename steps come before all update_json steps, and update_json paths
+are final locations. Progress is not journaled step by step: a rename is
+done when its source is gone and its destination exists, so recovery
+finds how far an operation got from the filesystem alone. Recovery rolls
+an operation forward when every remaining step can still be applied,
+otherwise it rolls the completed steps back.
+
+An optional database payload is applied through a caller-supplied
+callback after the file steps, and the intent file is removed only after
+that callback returns, so files and database paths change as one logical
+transaction. The callback must be idempotent (set absolute values).
+A process without database access (Blender) runs the file steps and
+hands the payload off: the intent is marked files_done and kept, and
+the database owner applies the payload on its next recover().
+
+Usage:
+    journal = FileJournal(library_path / META_DIR_NAME / FILE_JOURNAL_DIR_NAME)
+    journal.run('rename_animation', [
+        FileJournal.rename(old_folder, new_folder),
+        FileJournal.update_json(new_folder / 'walk.json', {'name': 'Walk'},
+                                current_path=old_folder / 'walk.json'),
+    ], db={...}, db_undo={...}, apply_db=apply_paths)
+
+    journal.recover(apply_db=apply_paths)  # at startup
+
+    # Blender: files now, database paths when the app next recovers
+    journal.run('promote_version', steps, db={...}, db_undo={...})
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Intent file format version (bump on incompatible changes)
+JOURNAL_FORMAT_VERSION = 1
+
+# Pending operations younger than this whose process is still running may
+# still be in progress there (e.g. Blender promoting a version while the
+# app starts), so recovery leaves them alone
+JOURNAL_STALE_SECONDS = 30.0
+
+# Renames of files held open by another program (Windows) are retried
+RENAME_RETRIES = 3
+RENAME_RETRY_DELAY = 0.2
+
+
+def _fsync_dir(folder: PathLike):
+    """Flush a directory entry change to disk (best effort, POSIX only)"""
+    if os.name != 'posix':
+        return
+    try:
+        fd = os.open(str(folder), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_json_atomic(path: PathLike, data: Any, durable: bool = False):
+    """Write JSON via a temp file in the same folder and os.replace()"""
+    path = str(path)
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_dir(os.path.dirname(path))
+
+
+def _process_start_time(pid: int) -> Optional[int]:
+    """
+    Get a process's start time, to tell it apart from a later process
+    that reuses its pid.
+
+    Returns:
+        Start time in platform units, or None if the process does not
+        exist or the platform offers no cheap way to read it
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            with open(f'/proc/{pid}/stat', 'rb') as f:
+                stat = f.read()
+            # Field 22 (starttime); the command name in field 2 may contain spaces
+            return int(stat[stat.rindex(b')') + 2:].split()[19])
+        except (OSError, ValueError, IndexError):
+            return None
+
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return None
+        try:
+            times = [wintypes.FILETIME() for _ in range(4)]
+            if not kernel32.GetProcessTimes(handle, *[ctypes.byref(t) for t in times]):
+                return None
+            return (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime
+        finally:
+            kernel32.CloseHandle(handle)
+
+    return None
+
+
+def _process_running(pid: Optional[int], started: Optional[int]) -> bool:
+    """
+    Check whether the process that wrote an intent file is still running.
+
+    Args:
+        pid: Process ID recorded in the intent
+        started: Process start time recorded with it
+
+    Returns:
+        True if that process (not a later one with the same pid) is running
+    """
+    if pid is None:
+        return False
+    current = _process_start_time(pid)
+    if current is not None:
+        return current == started
+    if sys.platform.startswith('linux') or sys.platform == 'win32':
+        return False  # Start time is readable there, so the process is gone
+
+    # Other platforms: existence only (a reused pid just delays recovery
+    # until the operation is JOURNAL_STALE_SECONDS old)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+# Operations being executed by this process (intent IDs)
+_in_flight = set()
+_in_flight_lock = threading.Lock()
+
+
+def _same_entry(src: str, dst: str) -> bool:
+    """Check whether two paths name the same entry (case-only rename on a
+    case-insensitive filesystem)"""
+    try:
+        return os.path.samefile(src, dst)
+    except OSError:
+        return False
+
+
+class FileJournal:
+    """
+    Journaled executor for multi-step file operations.
+
+    Thread/process safety: every operation has its own intent file, so
+    several processes can journal into the same folder. Recovery skips
+    operations still running in this process, and recent operations of
+    other processes that are still alive (matched by pid and process
+    start time, so a reused pid is not mistaken for the owner).
+    """
+
+    def __init__(self, journal_dir: PathLike,
+                 on_path_changed: Optional[Callable[[str], None]] = None):
+        """
+        Initialize the journal.
+
+        Args:
+            journal_dir: Folder holding intent files (created on demand)
+            on_path_changed: Called with every path a step changed (e.g. to
+                invalidate caches)
+        """
+        self.journal_dir = Path(journal_dir)
+        self._on_path_changed = on_path_changed
+        self._recover_lock = threading.Lock()
+
+    # ==================== STEP BUILDERS ====================
+
+    @staticmethod
+    def rename(src: PathLike, dst: PathLike) -> Dict[str, Any]:
+        """
+        Build a rename step (folder or file; dst must not exist yet).
+
+        Args:
+            src: Current path
+            dst: New path (missing parent folders are created)
+
+        Returns:
+            Step dict
+        """
+        return {'action': 'rename', 'src': str(src), 'dst': str(dst)}
+
+    @staticmethod
+    def update_json(path: PathLike, values: Dict[str, Any],
+                    current_path: Optional[PathLike] = None) -> Dict[str, Any]:
+        """
+        Build a step that sets keys in a JSON file.
+
+        The current values of those keys are read now and stored in the
+        step, so the change can be undone.
+
+        Args:
+            path: Location of the file once the operation's renames are done
+            values: Keys to set
+            current_path: Where the file is now, if a rename moves it
+
+        Returns:
+            Step dict
+
+        Raises:
+            OSError, ValueError: The file cannot be read or is not a JSON object
+        """
+        with open(current_path or path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{current_path or path} is not a JSON object")
+        return {
+            'action': 'update_json',
+            'path': str(path),
+            'set': dict(values),
+            'previous': {key: data[key] for key in values if key in data},
+            'absent': [key for key in values if key not in data],
+        }
+
+    # ==================== EXECUTION ====================
+
+    def run(self, kind: str, steps: List[Dict[str, Any]],
+            db: Optional[Dict[str, Any]] = None,
+            db_undo: Optional[Dict[str, Any]] = None,
+            apply_db: Optional[Callable[[Dict[str, Any]], None]] = None) -> bool:
+        """
+        Journal and execute an operation.
+
+        Args:
+            kind: Operation name for logs (e.g. 'rename_animation')
+            steps: Step dicts from rename() / update_json()
+            db: Database payload applied after the file steps
+            db_undo: Payload restoring the previous database state (used if
+                recovery has to roll back after the database was updated)
+            apply_db: Callback applying a database payload. Without it, the
+                payload is handed off: once the file steps are done the
+                intent is kept (marked files_done) for the database owner's
+                recover() to apply.
+
+        Returns:
+            True if the operation completed (or its files did, for a handed
+            off payload), False if it was rolled back
+        """
+        self._check_steps(steps)
+
+        intent = {
+            'format': JOURNAL_FORMAT_VERSION,
+            'id': uuid.uuid4().hex,
+            'kind': kind,
+            'created': time.time(),
+            'pid': os.getpid(),
+            'pid_started': _process_start_time(os.getpid()),
+            'steps': steps,
+            'db': db,
+            'db_undo': db_undo,
+        }
+        with _in_flight_lock:
+            _in_flight.add(intent['id'])
+        try:
+            intent_path = self._write_intent(intent)
+
+            files_done = False
+            try:
+                self._apply_steps(steps, 0)
+                files_done = True
+                if db is not None and apply_db is None:
+                    # Files are final; only the database payload is left
+                    intent['files_done'] = True
+                    _write_json_atomic(intent_path, intent, durable=True)
+                    return True
+                if db is not None:
+                    apply_db(db)
+            except Exception as e:
+                logger.warning("%s failed, rolling back: %s", kind, e)
+                try:
+                    # apply_db may have committed before raising, so once it ran
+                    # the database is restored too (db_undo sets absolute values)
+                    self._roll_back(intent, len(steps), apply_db if files_done else None)
+                except Exception as undo_error:
+                    # Leave the intent file so the next recovery retries
+                    logger.error("%s rollback incomplete (kept in journal): %s", kind, undo_error)
+                    return False
+                self._remove_intent(intent_path)
+                return False
+
+            self._remove_intent(intent_path)
+            return True
+        finally:
+            with _in_flight_lock:
+                _in_flight.discard(intent['id'])
+
+    def pending(self) -> List[Tuple[Path, Dict[str, Any]]]:
+        """
+        Get pending operations in creation order.
+
+        Returns:
+            List of (intent file, intent dict); unreadable intent files are skipped
+        """
+        try:
+            names = sorted(os.listdir(self.journal_dir))
+        except OSError:
+            return []
+
+        result = []
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            path = self.journal_dir / name
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    intent = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping unreadable journal entry %s: %s", name, e)
+                continue
+            result.append((path, intent))
+        return result
+
+    def recover(self, apply_db: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, int]:
+        """
+        Finish or undo operations interrupted by a crash.
+
+        Cheap when nothing is pending (one folder listing), so it can run
+        whenever another process may have left an operation behind.
+
+        Args:
+            apply_db: Callback applying database payloads. Without it,
+                operations that carry a database payload are left pending.
+
+        Returns:
+            Dict with counts: 'completed', 'rolled_back', 'skipped' (left
+            for later) and 'failed' (could not be resolved either way)
+        """
+        with self._recover_lock:
+            return self._recover(apply_db)
+
+    def _recover(self, apply_db: Optional[Callable[[Dict[str, Any]], None]]) -> Dict[str, int]:
+        """Recover pending operations (caller holds _recover_lock)"""
+        counts = {'completed': 0, 'rolled_back': 0, 'skipped': 0, 'failed': 0}
+        now = time.time()
+
+        for intent_path, intent in self.pending():
+            kind = intent.get('kind', '?')
+            if intent.get('format') != JOURNAL_FORMAT_VERSION:
+                logger.warning("Journal entry %s has unknown format, skipping", intent_path.name)
+                counts['skipped'] += 1
+                continue
+            if intent.get('files_done'):
+                # Handed off by its owner: apply the database payload only
+                if apply_db is None:
+                    counts['skipped'] += 1
+                    continue
+                try:
+                    apply_db(intent['db'])
+                except Exception as e:
+                    # Files stay final; the payload is retried next time
+                    logger.warning("Recovery: cannot apply database paths of %s: %s", kind, e)
+                    counts['failed'] += 1
+                    continue
+                self._remove_intent(intent_path)
+                counts['completed'] += 1
+                continue
+            with _in_flight_lock:
+                running_here = intent.get('id') in _in_flight
+            if running_here or (
+                now - intent.get('created', 0) < JOURNAL_STALE_SECONDS
+                and _process_running(intent.get('pid'), intent.get('pid_started'))
+            ):
+                counts['skipped'] += 1  # Still in progress (this or another process)
+                continue
+            if intent.get('db') is not None and apply_db is None:
+                counts['skipped'] += 1  # Needs the database owner to finish
+                continue
+
+            done = self._count_done_renames(intent['steps'])
+            try:
+                self._apply_steps(intent['steps'], done)
+                if intent.get('db') is not None:
+                    apply_db(intent['db'])
+            except Exception as e:
+                logger.warning("Recovery: cannot finish %s (%s), rolling back", kind, e)
+                try:
+                    self._roll_back(intent, len(intent['steps']), apply_db)
+                except Exception as undo_error:
+                    logger.error("Recovery: %s could not be resolved: %s", kind, undo_error)
+                    counts['failed'] += 1
+                    continue
+                self._remove_intent(intent_path)
+                counts['rolled_back'] += 1
+                continue
+
+            self._remove_intent(intent_path)
+            counts['completed'] += 1
+            logger.info("Recovery: finished interrupted %s", kind)
+
+        return counts
+
+    # ==================== INTERNALS ====================
+
+    @staticmethod
+    def _check_steps(steps: List[Dict[str, Any]]):
+        """Validate step order (renames first, then JSON updates)"""
+        seen_json = False
+        for step in steps:
+            action = step.get('action')
+            if action == 'update_json':
+                seen_json = True
+            elif action == 'rename':
+                if seen_json:
+                    raise ValueError("rename steps must come before update_json steps")
+            else:
+                raise ValueError(f"Unknown journal step: {action}")
+
+    def _write_intent(self, intent: Dict[str, Any]) -> Path:
+        """Durably write an intent file before any step runs"""
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        # Sortable name: creation time first, so recovery replays in order
+        path = self.journal_dir / f"{time.time_ns():020d}_{intent['id']}.json"
+        _write_json_atomic(path, intent, durable=True)
+        return path
+
+    def _remove_intent(self, path: Path):
+        """Mark an operation finished by deleting its intent file"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        _fsync_dir(self.journal_dir)
+
+    def _changed(self, path: str):
+        """Report a changed path to the caller"""
+        if self._on_path_changed is not None:
+            try:
+                self._on_path_changed(path)
+            except Exception as e:
+                logger.debug("on_path_changed failed for %s: %s", path, e)
+
+    @staticmethod
+    def _rename_done(step: Dict[str, Any]) -> bool:
+        """Check whether a rename step has happened (from the filesystem)"""
+        src, dst = step['src'], step['dst']
+        if not os.path.lexists(dst):
+            return False
+        if not os.path.lexists(src):
+            return True
+        if _same_entry(src, dst):
+            # Case-only rename: done once the folder lists the new spelling
+            try:
+                return os.path.basename(dst) in os.listdir(os.path.dirname(dst))
+            except OSError:
+                return False
+        return False
+
+    def _count_done_renames(self, steps: List[Dict[str, Any]]) -> int:
+        """Number of leading rename steps already applied"""
+        done = 0
+        for step in steps:
+            if step['action'] != 'rename' or not self._rename_done(step):
+                break
+            done += 1
+        return done
+
+    def _do_rename(self, src: str, dst: str):
+        """Rename with retries for files locked by another program"""
+        if os.path.lexists(dst) and not _same_entry(src, dst):
+            raise FileExistsError(f"Destination exists: {dst}")
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        for attempt in range(RENAME_RETRIES):
+            try:
+                os.rename(src, dst)
+                break
+            except PermissionError:
+                if attempt == RENAME_RETRIES - 1:
+                    raise
+                time.sleep(RENAME_RETRY_DELAY)
+        self._changed(src)
+        self._changed(dst)
+
+    def _set_json_keys(self, path: str, values: Dict[str, Any], remove: List[str] = ()):
+        """Set (and remove) keys in a JSON file atomically"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data.update(values)
+        for key in remove:
+            data.pop(key, None)
+        _write_json_atomic(path, data)
+        self._changed(path)
+
+    def _apply_steps(self, steps: List[Dict[str, Any]], start: int):
+        """Apply file steps from `start` (steps already done are skipped)"""
+        for step in steps[start:]:
+            if step['action'] == 'rename':
+                if not self._rename_done(step):
+                    self._do_rename(step['src'], step['dst'])
+            else:
+                # Idempotent - re-applied on recovery even if it already ran
+                self._set_json_keys(step['path'], step['set'])
+
+    def _roll_back(self, intent: Dict[str, Any], end: int,
+                   apply_db: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """Undo steps before `end` (newest first) and restore the database"""
+        if intent.get('db_undo') is not None and apply_db is not None:
+            apply_db(intent['db_undo'])
+        steps = intent['steps'][:end]
+        # JSON updates only run once every rename is done; otherwise the
+        # file at their path (if any) is not ours to edit
+        renames = [step for step in steps if step['action'] == 'rename']
+        json_ran = self._count_done_renames(renames) == len(renames)
+        for step in reversed(steps):
+            if step['action'] == 'rename':
+                if self._rename_done(step):
+                    self._do_rename(step['dst'], step['src'])
+            elif json_ran and os.path.exists(step['path']):
+                self._set_json_keys(step['path'], step['previous'], step.get('absent', []))
+
+
+__all__ = [
+    'FileJournal',
+    'JOURNAL_FORMAT_VERSION',
+    'JOURNAL_STALE_SECONDS',
+]
@@ -296,6 +296,72 @@ MESSAGE_TYPES: Dict[str, MessageDef] = {
         description='Connection test',
         fields=[]
     ),
+
+    # -------------------------------------------------------------------------
+    # Notifications (Blender → Desktop)
+    # -------------------------------------------------------------------------
+    'animation_captured': MessageDef(
+        type_name='animation_captured',
+        direction='blender_to_desktop',
+        description='A new animation or version was captured into the library',
+        fields=[
+            ANIMATION_ID_FIELD,
+            ANIMATION_NAME_FIELD,
+            FieldDef(
+                name='version',
+                field_type=int,
+                required=False,
+                default=1,
+                description='Version number of the captured animation'
+            ),
+            FieldDef(
+                name='version_label',
+                field_type=str,
+                required=False,
+                default='v001',
+                description='Version label of the captured animation'
+            ),
+            FieldDef(
+                name='json_file_path',
+                field_type=str,
+                required=False,
+                description='Metadata JSON of the capture (enables single-asset import)'
+            ),
+            FieldDef(
+                name='version_group_id',
+                field_type=str,
+                required=False,
+                description='Version group the capture belongs to'
+            ),
+        ]
+    ),
+
+    'preview_updating': MessageDef(
+        type_name='preview_updating',
+        direction='blender_to_desktop',
+        description='Blender is about to re-render a preview; release file handles',
+        fields=[
+            ANIMATION_ID_FIELD,
+            ANIMATION_NAME_FIELD,
+            FieldDef(
+                name='preview_path',
+                field_type=str,
+                required=False,
+                default='',
+                description='Path of the preview video being replaced'
+            ),
+        ]
+    ),
+
+    'preview_updated': MessageDef(
+        type_name='preview_updated',
+        direction='blender_to_desktop',
+        description='Preview video and thumbnail were re-rendered',
+        fields=[
+            ANIMATION_ID_FIELD,
+            ANIMATION_NAME_FIELD,
+        ]
+    ),
 }
 
 
@@ -5,6 +5,9 @@ from .thumbnail_loader import ThumbnailLoader, get_thumbnail_loader
 from .blender_service import BlenderService, get_blender_service
 from .archive_service import ArchiveService, get_archive_service
 from .trash_service import TrashService, get_trash_service
+from .job_manager import JobManager, JobKind, get_job_manager
+from .directory_cache import DirectoryCache, get_directory_cache
+from .library_watcher import LibraryWatcher, LibraryChangeSet, get_library_watcher
 
 __all__ = [
     'DatabaseService',
@@ -17,4 +20,12 @@ __all__ = [
     'get_archive_service',
     'TrashService',
     'get_trash_service',
+    'JobManager',
+    'JobKind',
+    'get_job_manager',
+    'DirectoryCache',
+    'get_directory_cache',
+    'LibraryWatcher',
+    'LibraryChangeSet',
+    'get_library_watcher',
 ]
@@ -1,16 +1,18 @@
 """
 Annotated Export Service - Export video with burned-in annotations
 
-Extracts video frames, composites annotation overlays, and encodes to MP4.
+Decodes video frames, composites annotation overlays, and streams them
+to FFmpeg for MP4 encoding.
 """
 
 import logging
 import sys
 import shutil
-import tempfile
+import threading
 import subprocess
+from collections import deque
 from pathlib import Path
-from typing import Optional, Callable, Tuple, List
+from typing import Optional, Callable, Tuple, Deque
 
 import cv2
 import numpy as np
@@ -81,11 +83,15 @@ def export_with_annotations(
     version_label: str,
     fps: int = 24,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
-    cancelled_check: Optional[Callable[[], bool]] = None
+    cancelled_check: Optional[Callable[[], bool]] = None,
+    hold_frames: bool = False
 ) -> Tuple[bool, str]:
     """
     Export video with annotations burned in.
 
+    Frames are decoded, composited and piped straight into FFmpeg's stdin
+    as raw BGR, so no intermediate images are written to disk.
+
     Args:
         video_path: Path to source video
         output_path: Path for output MP4
@@ -94,6 +100,8 @@ def export_with_annotations(
         fps: Video frame rate
         progress_callback: Optional callback(current, total, message)
         cancelled_check: Optional callable returning True if cancelled
+        hold_frames: Keep each annotation visible until the next annotated
+            frame (matches Hold mode in the review dialog)
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -105,68 +113,38 @@ def export_with_annotations(
     if not Path(video_path).exists():
         return False, f"Video file not found: {video_path}"
 
-    # Create temp directory for frame sequence
-    temp_dir = None
     try:
-        temp_dir = Path(tempfile.mkdtemp(prefix='annotated_export_'))
-
-        # Extract and composite frames
-        success, msg = _extract_and_composite_frames(
+        return _stream_composited_frames(
             video_path=video_path,
-            temp_dir=temp_dir,
+            output_path=output_path,
             animation_uuid=animation_uuid,
             version_label=version_label,
-            progress_callback=progress_callback,
-            cancelled_check=cancelled_check
-        )
-
-        if not success:
-            return False, msg
-
-        # Check if cancelled before encoding
-        if cancelled_check and cancelled_check():
-            return False, "Export cancelled"
-
-        # Encode to MP4
-        if progress_callback:
-            progress_callback(0, 0, "Encoding video...")
-
-        success, msg = _encode_to_mp4(
-            frame_dir=temp_dir,
-            output_path=output_path,
             fps=fps,
-            ffmpeg_path=ffmpeg_path
+            ffmpeg_path=ffmpeg_path,
+            progress_callback=progress_callback,
+            cancelled_check=cancelled_check,
+            hold_frames=hold_frames
         )
-
-        return success, msg
-
     except Exception as e:
         return False, f"Export failed: {str(e)}"
 
-    finally:
-        # Clean up temp directory (log on failure — leaked dir is recoverable but
-        # we want to know about it).
-        if temp_dir and temp_dir.exists():
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception:
-                logger.warning(
-                    "Failed to remove annotated-export temp dir %s", temp_dir, exc_info=True,
-                )
-
 
-def _extract_and_composite_frames(
+def _stream_composited_frames(
     video_path: str,
-    temp_dir: Path,
+    output_path: str,
     animation_uuid: str,
     version_label: str,
+    fps: int,
+    ffmpeg_path: Path,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
-    cancelled_check: Optional[Callable[[], bool]] = None
+    cancelled_check: Optional[Callable[[], bool]] = None,
+    hold_frames: bool = False
 ) -> Tuple[bool, str]:
     """
-    Extract video frames and composite annotations.
+    Decode video frames, composite annotations and pipe them to FFmpeg.
 
-    Saves composited frames as PNG sequence in temp_dir.
+    Each annotation is rendered once, in memory, into a premultiplied
+    overlay cropped to its bounding box; held frames reuse that overlay.
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -181,6 +159,8 @@ def _extract_and_composite_frames(
     if not cap.isOpened():
         return False, f"Could not open video: {video_path}"
 
+    encoder = None
+    completed = False
     try:
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -189,6 +169,9 @@ def _extract_and_composite_frames(
         if total_frames <= 0:
             return False, "Could not determine video frame count"
 
+        encoder = _FFmpegPipe(ffmpeg_path, output_path, width, height, fps)
+
+        overlay: Optional[_Overlay] = None
         for frame_num in range(total_frames):
             # Check for cancellation
             if cancelled_check and cancelled_check():
@@ -204,130 +187,209 @@ def _extract_and_composite_frames(
                 # End of video
                 break
 
-            # Check if this frame has annotations
+            # New annotation replaces the current overlay; without hold,
+            # un-annotated frames get none
             if frame_num in annotated_frames:
-                # Render annotation to PNG
-                png_path = storage.render_to_png(
+                image = storage.render_to_image(
                     animation_uuid,
                     version_label,
                     frame_num,
                     (width, height)
                 )
+                overlay = _Overlay.from_image(image) if image is not None else None
+            elif not hold_frames:
+                overlay = None
+
+            if overlay is not None:
+                overlay.apply(frame)
 
-                if png_path and png_path.exists():
-                    # Composite annotation onto frame
-                    frame = _composite_frame_with_annotation(frame, str(png_path))
+            if not encoder.write(frame):
+                return False, f"FFmpeg encoding failed:\n{encoder.error_output()}"
 
-            # Save frame as PNG
-            output_frame_path = temp_dir / f'frame_{frame_num:06d}.png'
-            cv2.imwrite(str(output_frame_path), frame)
+        # Remaining work is FFmpeg flushing its encoder
+        if progress_callback:
+            progress_callback(0, 0, "Encoding video...")
 
-        return True, "Frames processed successfully"
+        success, msg = encoder.finish()
+        completed = success
+        return success, msg
 
     finally:
         cap.release()
+        if encoder is not None and not completed:
+            encoder.abort()
 
 
-def _composite_frame_with_annotation(
-    frame: np.ndarray,
-    annotation_png_path: str
-) -> np.ndarray:
+class _Overlay:
     """
-    Composite annotation PNG onto video frame using alpha blending.
+    Annotation overlay ready for blending onto BGR frames.
 
-    Args:
-        frame: Video frame (BGR, uint8)
-        annotation_png_path: Path to annotation PNG with alpha channel
-
-    Returns:
-        Composited frame (BGR, uint8)
+    Holds premultiplied BGR and inverse alpha as uint16 for the bounding
+    box of the visible strokes only, so blending is a couple of integer
+    multiply-adds over a (usually small) region instead of a float64 pass
+    over the whole frame.
     """
-    # Load annotation with alpha channel
-    overlay = cv2.imread(annotation_png_path, cv2.IMREAD_UNCHANGED)
-
-    if overlay is None:
-        return frame
-
-    # Handle size mismatch
-    if overlay.shape[:2] != frame.shape[:2]:
-        overlay = cv2.resize(overlay, (frame.shape[1], frame.shape[0]), interpolation=cv2.INTER_AREA)
-
-    # Check if overlay has alpha channel
-    if overlay.shape[2] == 4:
-        # Extract alpha channel and normalize to 0-1
-        alpha = overlay[:, :, 3] / 255.0
-        alpha = alpha[:, :, np.newaxis]  # Add dimension for broadcasting
-
-        # Extract BGR channels from overlay (convert from BGRA)
-        overlay_bgr = overlay[:, :, :3]
 
-        # Alpha blend: result = overlay * alpha + frame * (1 - alpha)
-        result = (overlay_bgr * alpha + frame * (1 - alpha)).astype(np.uint8)
-        return result
-    else:
-        # No alpha channel - just return original frame
-        return frame
-
-
-def _encode_to_mp4(
-    frame_dir: Path,
-    output_path: str,
-    fps: int,
-    ffmpeg_path: Path
-) -> Tuple[bool, str]:
-    """
-    Encode PNG sequence to MP4 using FFmpeg.
-
-    Args:
-        frame_dir: Directory containing frame_XXXXXX.png files
-        output_path: Path for output MP4
-        fps: Frame rate
-        ffmpeg_path: Path to ffmpeg executable
-
-    Returns:
-        Tuple of (success: bool, message: str)
-    """
-    # Ensure output directory exists
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-    # Build FFmpeg command
-    input_pattern = str(frame_dir / 'frame_%06d.png')
-
-    cmd = [
-        str(ffmpeg_path),
-        '-y',  # Overwrite output
-        '-framerate', str(fps),
-        '-i', input_pattern,
-        '-c:v', 'libx264',
-        '-pix_fmt', 'yuv420p',
-        '-crf', '23',
-        '-movflags', '+faststart',
-        output_path
-    ]
+    __slots__ = ('_y0', '_y1', '_x0', '_x1', '_color', '_inv_alpha')
+
+    def __init__(self, y0: int, y1: int, x0: int, x1: int,
+                 color: np.ndarray, inv_alpha: np.ndarray):
+        self._y0, self._y1, self._x0, self._x1 = y0, y1, x0, x1
+        self._color = color
+        self._inv_alpha = inv_alpha
+
+    @classmethod
+    def from_image(cls, image) -> Optional['_Overlay']:
+        """
+        Build overlay from a premultiplied ARGB32 QImage.
+
+        Returns:
+            Overlay, or None if the image is fully transparent
+        """
+        width, height = image.width(), image.height()
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        # ARGB32 is stored as B, G, R, A bytes on little-endian platforms
+        bgra = np.frombuffer(bits, dtype=np.uint8).reshape(
+            height, image.bytesPerLine()
+        )[:, :width * 4].reshape(height, width, 4)
+
+        alpha = bgra[:, :, 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        if rows.size == 0:
+            return None
+        cols = np.flatnonzero(alpha.any(axis=0))
+        y0, y1 = int(rows[0]), int(rows[-1]) + 1
+        x0, x1 = int(cols[0]), int(cols[-1]) + 1
+
+        region = bgra[y0:y1, x0:x1]
+        color = region[:, :, :3].astype(np.uint16)
+        inv_alpha = (255 - region[:, :, 3:4]).astype(np.uint16)
+        return cls(y0, y1, x0, x1, color, inv_alpha)
+
+    def apply(self, frame: np.ndarray):
+        """
+        Blend overlay onto frame in place: out = color + frame * (1 - alpha).
+
+        Args:
+            frame: Video frame (BGR, uint8), same size as the overlay source
+        """
+        roi = frame[self._y0:self._y1, self._x0:self._x1]
+        blended = roi * self._inv_alpha  # uint16, max 255 * 255
+        blended += 127
+        blended //= 255
+        blended += self._color  # premultiplied color <= alpha, so no overflow
+        roi[...] = blended
+
+
+class _FFmpegPipe:
+    """FFmpeg process encoding raw BGR frames from stdin to MP4."""
+
+    # Seconds to wait for FFmpeg to finish after the last frame
+    FINISH_TIMEOUT = 600
+
+    def __init__(self, ffmpeg_path: Path, output_path: str,
+                 width: int, height: int, fps: int):
+        self._output_path = output_path
+
+        # Ensure output directory exists
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            str(ffmpeg_path),
+            '-y',  # Overwrite output
+            '-f', 'rawvideo',
+            '-pix_fmt', 'bgr24',
+            '-s', f'{width}x{height}',
+            '-framerate', str(fps),
+            '-i', '-',
+            '-c:v', 'libx264',
+            '-pix_fmt', 'yuv420p',
+            '-crf', '23',
+            '-movflags', '+faststart',
+            output_path
+        ]
 
-    try:
-        result = subprocess.run(
+        creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        self._process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            creationflags=creationflags
         )
 
-        if result.returncode != 0:
-            # Extract useful error info
-            error_msg = result.stderr[-500:] if result.stderr else "Unknown error"
-            return False, f"FFmpeg encoding failed:\n{error_msg}"
+        # Drain stderr continuously so FFmpeg never blocks on a full pipe
+        self._stderr_tail: Deque[bytes] = deque(maxlen=50)
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+
+    def _drain_stderr(self):
+        for line in self._process.stderr:
+            self._stderr_tail.append(line)
+
+    def error_output(self) -> str:
+        """Last lines FFmpeg wrote to stderr"""
+        self._stderr_thread.join(timeout=1)
+        text = b''.join(self._stderr_tail).decode('utf-8', errors='replace')
+        return text[-500:] if text else "Unknown error"
+
+    def write(self, frame: np.ndarray) -> bool:
+        """
+        Send one frame to FFmpeg.
+
+        Returns:
+            False if FFmpeg has exited (see error_output())
+        """
+        try:
+            self._process.stdin.write(np.ascontiguousarray(frame).data)
+            return True
+        except (BrokenPipeError, OSError):
+            self._process.wait()
+            return False
+
+    def finish(self) -> Tuple[bool, str]:
+        """
+        Close the input stream and wait for encoding to complete.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            self._process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+        try:
+            returncode = self._process.wait(timeout=self.FINISH_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            return False, "FFmpeg encoding timed out"
+
+        if returncode != 0:
+            return False, f"FFmpeg encoding failed:\n{self.error_output()}"
 
         # Verify output exists
-        if not Path(output_path).exists():
+        if not Path(self._output_path).exists():
             return False, "Output file was not created"
 
-        return True, f"Export completed: {output_path}"
-
-    except subprocess.TimeoutExpired:
-        return False, "FFmpeg encoding timed out"
-    except Exception as e:
-        return False, f"FFmpeg execution failed: {str(e)}"
+        return True, f"Export completed: {self._output_path}"
+
+    def abort(self):
+        """Kill FFmpeg and remove the partial output file."""
+        if self._process.poll() is None:
+            self._process.kill()
+        try:
+            self._process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        self._process.wait()
+
+        try:
+            Path(self._output_path).unlink(missing_ok=True)
+        except OSError:
+            logger.warning(
+                "Failed to remove partial export %s", self._output_path, exc_info=True,
+            )
 
 
 def generate_export_filename(
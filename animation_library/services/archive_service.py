@@ -7,6 +7,8 @@ Provides archive functionality:
 - Move archived animations to trash (second stage before hard delete)
 """
 
+import re
+import json
 import shutil
 import logging
 import gc
@@ -14,6 +16,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
 from .database_service import get_database_service, DatabaseService
+from .directory_cache import get_directory_cache
 from .utils.path_utils import (
     get_library_path,
     get_library_folder,
@@ -21,7 +24,8 @@ from .utils.path_utils import (
     get_trash_folder,
 )
 from .utils.file_operations import (
-    safe_copy_folder_contents,
+    move_folder,
+    undo_move_folder,
     safe_delete_folder_contents,
 )
 
@@ -57,6 +61,21 @@ def _get_unique_folder_name(base_folder: Path, desired_name: str) -> Path:
             return base_folder / f"{desired_name}_{uuid.uuid4().hex[:8]}"
 
 
+def _sanitize_name(name: str) -> str:
+    """
+    Make an animation name safe for use as a file or folder name
+
+    Args:
+        name: Animation name
+
+    Returns:
+        Name with invalid characters replaced (never empty)
+    """
+    safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
+    safe_name = safe_name.strip(' .') or 'unnamed'
+    return re.sub(r'_+', '_', safe_name)
+
+
 class ArchiveService:
     """
     Service for managing archive operations (first stage of deletion)
@@ -86,98 +105,121 @@ class ArchiveService:
         Returns:
             Tuple of (success, message)
         """
-        try:
-            # Get animation data
-            animation = self._db.get_animation_by_uuid(uuid)
-            if not animation:
-                return False, "Animation not found"
+        return self.move_many_to_archive([uuid])[uuid]
 
-            # Get paths
-            archive_folder = get_archive_folder()
-            if not archive_folder:
-                return False, "Library path not configured"
+    def move_many_to_archive(self, uuids: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Move animations to archive (soft delete) as one batch
 
-            # Source folder - derive from stored file paths
-            blend_path = animation.get('blend_file_path')
-            json_path = animation.get('json_file_path')
-            source_path = blend_path or json_path
-            if not source_path:
-                self._db.delete_animation(uuid)
-                return True, "Animation removed (no file paths stored)"
-
-            source_folder = Path(source_path).parent
-            if not source_folder.exists():
-                # Files already gone - just remove from database
-                self._db.delete_animation(uuid)
-                return True, "Animation removed (files were already missing)"
-
-            # Destination folder - preserve original folder name (.deleted/{folder_name}/)
-            dest_folder = _get_unique_folder_name(archive_folder, source_folder.name)
-
-            # Get folder info for restoration
-            folder_id = animation.get('folder_id')
-            folder_path = ""
-            if folder_id:
-                folder = self._db.get_folder_by_id(folder_id)
-                if folder:
-                    folder_path = folder.get('path', '')
-
-            # Copy files to archive (more reliable than move on Windows)
-            gc.collect()  # Release any Python file handles
-            all_copied, failed_files = safe_copy_folder_contents(source_folder, dest_folder)
-
-            if not all_copied:
-                logger.warning(f"Some files couldn't be copied to archive: {failed_files}")
-                # Continue anyway - we'll archive what we can
-
-            # Update thumbnail path to new location (find any .png file)
-            thumbnail_path = None
-            png_files = list(dest_folder.glob("*.png"))
-            if png_files:
-                thumbnail_path = str(png_files[0])
-
-            # Add to archive table
-            archive_data = {
-                'uuid': uuid,
-                'name': animation.get('name', 'Unknown'),
-                'original_folder_id': folder_id,
-                'original_folder_path': folder_path,
-                'rig_type': animation.get('rig_type'),
-                'frame_count': animation.get('frame_count'),
-                'duration_seconds': animation.get('duration_seconds'),
-                'file_size_mb': animation.get('file_size_mb'),
-                'archive_folder_path': str(dest_folder),
-                'thumbnail_path': thumbnail_path,
-                'original_created_date': animation.get('created_date')
-            }
+        Folders are renamed into the archive (copied only across volumes),
+        then every database change is committed in one transaction. Items
+        whose database change fails are moved back; if the commit fails,
+        every folder is moved back.
 
-            result = self._db.add_to_archive(archive_data)
-            if not result:
-                # Rollback - remove copied files
-                try:
-                    shutil.rmtree(dest_folder)
-                except PermissionError as e:
-                    logger.warning(f"Rollback failed - permission denied removing {dest_folder}: {e}")
-                except OSError as e:
-                    logger.warning(f"Rollback failed - could not remove {dest_folder}: {e}")
-                return False, "Failed to add to archive database"
-
-            # Remove from animations table first (so it's gone from UI)
-            self._db.delete_animation(uuid)
+        Args:
+            uuids: Animation UUIDs to archive
 
-            # Try to delete original files
-            still_locked = safe_delete_folder_contents(source_folder, skip_files=failed_files)
+        Returns:
+            Dict mapping UUID to (success, message)
+        """
+        archive_folder = get_archive_folder()
+        if not archive_folder:
+            return {uuid: (False, "Library path not configured") for uuid in uuids}
+
+        # Folder paths for restoration, looked up once for the batch
+        folder_paths = {folder['id']: folder.get('path', '') for folder in self._db.get_all_folders()}
+        gc.collect()  # Release any Python file handles
+
+        results: Dict[str, Tuple[bool, str]] = {}
+        archive_rows = []
+        removed_uuids = []
+        moves = {}  # uuid -> (source_folder, dest_folder, renamed, failed_files)
+
+        for uuid in uuids:
+            move = None
+            try:
+                animation = self._db.get_animation_by_uuid(uuid)
+                if not animation:
+                    results[uuid] = (False, "Animation not found")
+                    continue
+                if self._db.is_uuid_in_archive(uuid):
+                    # Checked before moving, so the conflict cannot fail the batch commit
+                    results[uuid] = (False, "An archived item with this UUID already exists")
+                    continue
+
+                # Source folder - derive from stored file paths
+                source_path = animation.get('blend_file_path') or animation.get('json_file_path')
+                if not source_path:
+                    removed_uuids.append(uuid)
+                    results[uuid] = (True, "Animation removed (no file paths stored)")
+                    continue
 
+                source_folder = Path(source_path).parent
+                if not source_folder.exists():
+                    # Files already gone - just remove from database
+                    removed_uuids.append(uuid)
+                    results[uuid] = (True, "Animation removed (files were already missing)")
+                    continue
+
+                # Destination folder - preserve original folder name (.deleted/{folder_name}/)
+                dest_folder = _get_unique_folder_name(archive_folder, source_folder.name)
+                renamed, failed_files = move_folder(source_folder, dest_folder)
+                move = (source_folder, dest_folder, renamed, failed_files)
+
+                if failed_files:
+                    logger.warning(f"Some files couldn't be copied to archive: {failed_files}")
+                    # Continue anyway - we'll archive what we can
+
+                # Update thumbnail path to new location (find any .png file)
+                thumbnail = next(iter(get_directory_cache().glob(dest_folder, "*.png")), None)
+
+                folder_id = animation.get('folder_id')
+                archive_rows.append({
+                    'uuid': uuid,
+                    'name': animation.get('name', 'Unknown'),
+                    'original_folder_id': folder_id,
+                    'original_folder_path': folder_paths.get(folder_id, '') if folder_id else '',
+                    'rig_type': animation.get('rig_type'),
+                    'frame_count': animation.get('frame_count'),
+                    'duration_seconds': animation.get('duration_seconds'),
+                    'file_size_mb': animation.get('file_size_mb'),
+                    'archive_folder_path': str(dest_folder),
+                    'thumbnail_path': str(thumbnail) if thumbnail else None,
+                    'original_created_date': animation.get('created_date')
+                })
+                removed_uuids.append(uuid)
+                moves[uuid] = move
+                results[uuid] = (True, "Moved to archive")
+
+            except Exception as e:
+                logger.error(f"Failed to move animation to archive: {e}")
+                if move is not None and uuid not in moves:
+                    undo_move_folder(move[0], move[1], move[2])
+                results[uuid] = (False, f"Error: {str(e)}")
+
+        if not removed_uuids:
+            return results
+
+        failed = self._db.archive_animations(archive_rows, removed_uuids)
+        if failed is None:
+            failed = {uuid: "transaction failed" for uuid in removed_uuids}
+        for uuid, error in failed.items():
+            results[uuid] = (False, f"Failed to add to archive database: {error}")
+            if uuid in moves:
+                source_folder, dest_folder, renamed, _ = moves.pop(uuid)
+                undo_move_folder(source_folder, dest_folder, renamed)
+
+        # Folders that had to be copied still exist at the source
+        for source_folder, _, renamed, failed_files in moves.values():
+            if renamed:
+                continue
+            still_locked = safe_delete_folder_contents(source_folder, skip_files=failed_files)
             if still_locked:
                 logger.info(f"Some files still locked, will be cleaned up later: {still_locked}")
                 # Files will be orphaned but that's OK - they'll be cleaned up on next scan
 
-            logger.info(f"Moved animation '{animation.get('name')}' to archive")
-            return True, "Moved to archive"
-
-        except Exception as e:
-            logger.error(f"Failed to move animation to archive: {e}")
-            return False, f"Error: {str(e)}"
+        logger.info(f"Moved {len(removed_uuids) - len(failed)} animation(s) to archive")
+        return results
 
     def restore_from_archive(self, uuid: str, target_folder_id: Optional[int] = None) -> Tuple[bool, str]:
         """
@@ -190,129 +232,181 @@ class ArchiveService:
         Returns:
             Tuple of (success, message)
         """
-        try:
-            import re
-
-            # Get archive item
-            archive_item = self._db.get_archive_item(uuid)
-            if not archive_item:
-                return False, "Item not found in archive"
-
-            # Get paths
-            library_folder = get_library_folder()
-            if not library_folder:
-                return False, "Library path not configured"
-
-            # Source folder (.deleted/{uuid}/)
-            source_folder = Path(archive_item['archive_folder_path'])
-            if not source_folder.exists():
-                # Files gone - just clean up database
-                self._db.delete_from_archive(uuid)
-                return False, "Archive files not found (already deleted?)"
-
-            # Destination folder - use animation base name (human-readable)
-            animation_name = archive_item.get('name', 'unnamed')
-
-            # Get base name (strip version suffix) for folder
-            base_name = re.sub(r'_v\d{2,4}$', '', animation_name)
-            safe_base_name = re.sub(r'[<>:"/\\|?*]', '_', base_name)
-            safe_base_name = safe_base_name.strip(' .') or 'unnamed'
-            safe_base_name = re.sub(r'_+', '_', safe_base_name)
-
-            # Folder name: {base_name}/ (human-readable, no UUID)
-            dest_folder = library_folder / safe_base_name
-
-            if dest_folder.exists():
-                # Check if it's already in the database
-                existing = self._db.get_animation_by_uuid(uuid)
-                if existing:
-                    # Already restored - just clean up archive record
-                    self._db.delete_from_archive(uuid)
-                    logger.info(f"Animation {uuid} already in library, cleaned up archive record")
-                    return True, "Animation already restored"
-                else:
+        return self.restore_many_from_archive([uuid], target_folder_id)[uuid]
+
+    def restore_many_from_archive(self, uuids: List[str],
+                                  target_folder_id: Optional[int] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Restore animations from archive back to library as one batch
+
+        Folders are renamed back into the library, then every database
+        change is committed in one transaction. Items whose database change
+        fails are moved back to the archive; if the commit fails, every
+        folder is.
+
+        Args:
+            uuids: Animation UUIDs to restore
+            target_folder_id: Optional folder ID to restore to (uses original if not specified)
+
+        Returns:
+            Dict mapping UUID to (success, message)
+        """
+        library_folder = get_library_folder()
+        if not library_folder:
+            return {uuid: (False, "Library path not configured") for uuid in uuids}
+
+        folder_ids = {folder['id'] for folder in self._db.get_all_folders()}
+        root_folder_id = self._db.get_root_folder_id()
+
+        results: Dict[str, Tuple[bool, str]] = {}
+        animation_rows = []
+        removed_uuids = []
+        moves = {}  # uuid -> (source_folder, dest_folder, renamed, failed_files)
+        claimed = set()  # Library folders restored into by this batch
+
+        for uuid in uuids:
+            move = None
+            try:
+                archive_item = self._db.get_archive_item(uuid)
+                if not archive_item:
+                    results[uuid] = (False, "Item not found in archive")
+                    continue
+
+                # Source folder (.deleted/{folder_name}/)
+                source_folder = Path(archive_item['archive_folder_path'])
+                if not source_folder.exists():
+                    # Files gone - just clean up database
+                    removed_uuids.append(uuid)
+                    results[uuid] = (False, "Archive files not found (already deleted?)")
+                    continue
+
+                # Destination folder: {base_name}/ (human-readable, strip version suffix)
+                animation_name = archive_item.get('name', 'unnamed')
+                dest_folder = library_folder / _sanitize_name(re.sub(r'_v\d{2,4}$', '', animation_name))
+
+                if dest_folder in claimed:
+                    # Another version in this batch was just restored there
+                    results[uuid] = (False, "Library folder already used by another restored animation")
+                    continue
+
+                # Checked before moving, so the conflict cannot fail the batch commit
+                in_library = self._db.get_animation_by_uuid(uuid) is not None
+                if in_library and not dest_folder.exists():
+                    results[uuid] = (False, "An animation with this UUID is already in the library")
+                    continue
+
+                if dest_folder.exists():
+                    if in_library:
+                        # Already restored - just clean up archive record
+                        removed_uuids.append(uuid)
+                        logger.info(f"Animation {uuid} already in library, cleaned up archive record")
+                        results[uuid] = (True, "Animation already restored")
+                        continue
                     # Folder exists but not in DB - remove orphan folder and continue
                     shutil.rmtree(str(dest_folder))
+                    get_directory_cache().invalidate_tree(dest_folder)
                     logger.warning(f"Removed orphan folder for {uuid}")
 
-            # Determine target folder
-            folder_id = target_folder_id
-            if folder_id is None:
-                folder_id = archive_item.get('original_folder_id')
-
-            # Validate folder exists (or use root)
-            if folder_id:
-                folder = self._db.get_folder_by_id(folder_id)
-                if not folder:
-                    # Original folder deleted - use root
-                    folder_id = self._db.get_root_folder_id()
-            else:
-                folder_id = self._db.get_root_folder_id()
-
-            # Move files back to library
-            shutil.move(str(source_folder), str(dest_folder))
-
-            # Sanitize full animation name (with version) for filenames
-            safe_anim_name = re.sub(r'[<>:"/\\|?*]', '_', animation_name)
-            safe_anim_name = safe_anim_name.strip(' .') or 'unnamed'
-            safe_anim_name = re.sub(r'_+', '_', safe_anim_name)
-
-            # Load animation data from JSON if available
-            # Try name-based file first, then any .json file in folder
-            json_file = dest_folder / f"{safe_anim_name}.json"
-            if not json_file.exists():
-                json_files = list(dest_folder.glob("*.json"))
-                json_file = json_files[0] if json_files else None
-
-            animation_data = None
-            if json_file and json_file.exists():
-                import json
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        animation_data = json.load(f)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON in {json_file}: {e}")
-                except IOError as e:
-                    logger.warning(f"Could not read {json_file}: {e}")
-
-            if not animation_data:
-                # Reconstruct minimal data from archive record
-                animation_data = {
-                    'uuid': uuid,
-                    'name': archive_item.get('name', 'Restored Animation'),
-                    'rig_type': archive_item.get('rig_type', 'unknown'),
-                    'frame_count': archive_item.get('frame_count'),
-                    'duration_seconds': archive_item.get('duration_seconds'),
-                    'file_size_mb': archive_item.get('file_size_mb'),
-                    'created_date': archive_item.get('original_created_date')
-                }
-
-            # Ensure uuid is set
-            animation_data['uuid'] = uuid
-            animation_data['folder_id'] = folder_id
-
-            # Update file paths - files use animation name with version: walk_cycle_v001.blend
-            animation_data['blend_file_path'] = str(dest_folder / f"{safe_anim_name}.blend")
-            animation_data['json_file_path'] = str(json_file) if json_file and json_file.exists() else None
-            animation_data['thumbnail_path'] = str(dest_folder / f"{safe_anim_name}.png")
-            animation_data['preview_path'] = str(dest_folder / f"{safe_anim_name}.webm")
-
-            # Add back to animations table
-            result = self._db.add_animation(animation_data)
-            if not result:
-                # Rollback - move files back to archive
-                shutil.move(str(dest_folder), str(source_folder))
-                return False, "Failed to restore to database"
-
-            # Remove from archive table
-            self._db.delete_from_archive(uuid)
-
-            logger.info(f"Restored animation '{archive_item.get('name')}' from archive")
-            return True, "Animation restored successfully"
+                # Determine target folder (original folder deleted - use root)
+                folder_id = target_folder_id
+                if folder_id is None:
+                    folder_id = archive_item.get('original_folder_id')
+                if not folder_id or folder_id not in folder_ids:
+                    folder_id = root_folder_id
+
+                # Move files back to library
+                renamed, failed_files = move_folder(source_folder, dest_folder)
+                move = (source_folder, dest_folder, renamed, failed_files)
+                claimed.add(dest_folder)
+
+                animation_rows.append(
+                    self._build_restored_animation(uuid, archive_item, dest_folder, folder_id)
+                )
+                removed_uuids.append(uuid)
+                moves[uuid] = move
+                results[uuid] = (True, "Animation restored successfully")
+
+            except Exception as e:
+                logger.error(f"Failed to restore animation from archive: {e}")
+                if move is not None and uuid not in moves:
+                    undo_move_folder(move[0], move[1], move[2])
+                results[uuid] = (False, f"Error: {str(e)}")
+
+        if not removed_uuids:
+            return results
+
+        failed = self._db.restore_archived_animations(animation_rows, removed_uuids)
+        if failed is None:
+            failed = {uuid: "transaction failed" for uuid in removed_uuids}
+        for uuid, error in failed.items():
+            results[uuid] = (False, f"Failed to restore to database: {error}")
+            if uuid in moves:
+                source_folder, dest_folder, renamed, _ = moves.pop(uuid)
+                undo_move_folder(source_folder, dest_folder, renamed)
+
+        for source_folder, _, renamed, failed_files in moves.values():
+            if not renamed:
+                safe_delete_folder_contents(source_folder, skip_files=failed_files)
+
+        logger.info(f"Restored {len(removed_uuids) - len(failed)} animation(s) from archive")
+        return results
+
+    def _build_restored_animation(self, uuid: str, archive_item: Dict[str, Any],
+                                  dest_folder: Path, folder_id: Optional[int]) -> Dict[str, Any]:
+        """
+        Build the animations row for a restored archive item
 
-        except Exception as e:
-            logger.error(f"Failed to restore animation from archive: {e}")
-            return False, f"Error: {str(e)}"
+        Args:
+            uuid: Animation UUID
+            archive_item: Archive record
+            dest_folder: Library folder the files were restored to
+            folder_id: Folder to restore into
+
+        Returns:
+            Animation data dict (from the JSON sidecar when readable)
+        """
+        # Sanitize full animation name (with version) for filenames
+        safe_anim_name = _sanitize_name(archive_item.get('name', 'unnamed'))
+
+        # Load animation data from JSON if available
+        # Try name-based file first, then any .json file in folder
+        directory_cache = get_directory_cache()
+        json_file = dest_folder / f"{safe_anim_name}.json"
+        if not directory_cache.exists(json_file):
+            json_file = next(iter(directory_cache.glob(dest_folder, "*.json")), None)
+
+        animation_data = None
+        if json_file:
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    animation_data = json.load(f)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid JSON in {json_file}: {e}")
+            except IOError as e:
+                logger.warning(f"Could not read {json_file}: {e}")
+
+        if not animation_data:
+            # Reconstruct minimal data from archive record
+            animation_data = {
+                'uuid': uuid,
+                'name': archive_item.get('name', 'Restored Animation'),
+                'rig_type': archive_item.get('rig_type', 'unknown'),
+                'frame_count': archive_item.get('frame_count'),
+                'duration_seconds': archive_item.get('duration_seconds'),
+                'file_size_mb': archive_item.get('file_size_mb'),
+                'created_date': archive_item.get('original_created_date')
+            }
+
+        # Ensure uuid is set
+        animation_data['uuid'] = uuid
+        animation_data['folder_id'] = folder_id
+
+        # Update file paths - files use animation name with version: walk_cycle_v001.blend
+        animation_data['blend_file_path'] = str(dest_folder / f"{safe_anim_name}.blend")
+        animation_data['json_file_path'] = str(json_file) if json_file else None
+        animation_data['thumbnail_path'] = str(dest_folder / f"{safe_anim_name}.png")
+        animation_data['preview_path'] = str(dest_folder / f"{safe_anim_name}.webm")
+        return animation_data
 
     def move_to_trash(self, uuid: str) -> Tuple[bool, str]:
         """
@@ -324,60 +418,95 @@ class ArchiveService:
         Returns:
             Tuple of (success, message)
         """
-        try:
-            # Get archive item
-            archive_item = self._db.get_archive_item(uuid)
-            if not archive_item:
-                return False, "Item not found in archive"
-
-            # Get paths
-            trash_folder = get_trash_folder()
-            if not trash_folder:
-                return False, "Library path not configured"
-
-            # Source folder (.deleted/{folder_name}/)
-            source_folder = Path(archive_item['archive_folder_path'])
-            if not source_folder.exists():
-                # Files gone - just clean up database
-                self._db.delete_from_archive(uuid)
-                return False, "Archive files not found"
-
-            # Destination folder - preserve folder name (.trash/{folder_name}/)
-            dest_folder = _get_unique_folder_name(trash_folder, source_folder.name)
-
-            # Move files to trash
-            shutil.move(str(source_folder), str(dest_folder))
-
-            # Update thumbnail path to new location (find any .png file)
-            thumbnail_path = None
-            png_files = list(dest_folder.glob("*.png"))
-            if png_files:
-                thumbnail_path = str(png_files[0])
-
-            # Add to trash table
-            trash_data = {
-                'uuid': uuid,
-                'name': archive_item.get('name', 'Unknown'),
-                'trash_folder_path': str(dest_folder),
-                'thumbnail_path': thumbnail_path,
-                'archived_date': archive_item.get('archived_date')
-            }
+        return self.move_many_to_trash([uuid])[uuid]
 
-            result = self._db.add_to_trash(trash_data)
-            if not result:
-                # Rollback - move files back to archive
-                shutil.move(str(dest_folder), str(source_folder))
-                return False, "Failed to add to trash database"
+    def move_many_to_trash(self, uuids: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Move archived animations to trash as one batch
 
-            # Remove from archive table
-            self._db.delete_from_archive(uuid)
+        Folders are renamed into the trash, then every database change is
+        committed in one transaction. Items whose database change fails are
+        moved back to the archive; if the commit fails, every folder is.
 
-            logger.info(f"Moved '{archive_item.get('name')}' from archive to trash")
-            return True, "Moved to trash"
+        Args:
+            uuids: Animation UUIDs to move to trash
 
-        except Exception as e:
-            logger.error(f"Failed to move to trash: {e}")
-            return False, f"Error: {str(e)}"
+        Returns:
+            Dict mapping UUID to (success, message)
+        """
+        trash_folder = get_trash_folder()
+        if not trash_folder:
+            return {uuid: (False, "Library path not configured") for uuid in uuids}
+
+        results: Dict[str, Tuple[bool, str]] = {}
+        trash_rows = []
+        removed_uuids = []
+        moves = {}  # uuid -> (source_folder, dest_folder, renamed, failed_files)
+
+        for uuid in uuids:
+            move = None
+            try:
+                archive_item = self._db.get_archive_item(uuid)
+                if not archive_item:
+                    results[uuid] = (False, "Item not found in archive")
+                    continue
+
+                # Source folder (.deleted/{folder_name}/)
+                source_folder = Path(archive_item['archive_folder_path'])
+                if not source_folder.exists():
+                    # Files gone - just clean up database
+                    removed_uuids.append(uuid)
+                    results[uuid] = (False, "Archive files not found")
+                    continue
+
+                if self._db.is_uuid_in_trash(uuid):
+                    # Checked before moving, so the conflict cannot fail the batch commit
+                    results[uuid] = (False, "A trashed item with this UUID already exists")
+                    continue
+
+                # Destination folder - preserve folder name (.trash/{folder_name}/)
+                dest_folder = _get_unique_folder_name(trash_folder, source_folder.name)
+                renamed, failed_files = move_folder(source_folder, dest_folder)
+                move = (source_folder, dest_folder, renamed, failed_files)
+
+                # Update thumbnail path to new location (find any .png file)
+                thumbnail = next(iter(get_directory_cache().glob(dest_folder, "*.png")), None)
+
+                trash_rows.append({
+                    'uuid': uuid,
+                    'name': archive_item.get('name', 'Unknown'),
+                    'trash_folder_path': str(dest_folder),
+                    'thumbnail_path': str(thumbnail) if thumbnail else None,
+                    'archived_date': archive_item.get('archived_date')
+                })
+                removed_uuids.append(uuid)
+                moves[uuid] = move
+                results[uuid] = (True, "Moved to trash")
+
+            except Exception as e:
+                logger.error(f"Failed to move to trash: {e}")
+                if move is not None and uuid not in moves:
+                    undo_move_folder(move[0], move[1], move[2])
+                results[uuid] = (False, f"Error: {str(e)}")
+
+        if not removed_uuids:
+            return results
+
+        failed = self._db.trash_archived_animations(trash_rows, removed_uuids)
+        if failed is None:
+            failed = {uuid: "transaction failed" for uuid in removed_uuids}
+        for uuid, error in failed.items():
+            results[uuid] = (False, f"Failed to add to trash database: {error}")
+            if uuid in moves:
+                source_folder, dest_folder, renamed, _ = moves.pop(uuid)
+                undo_move_folder(source_folder, dest_folder, renamed)
+
+        for source_folder, _, renamed, failed_files in moves.values():
+            if not renamed:
+                safe_delete_folder_contents(source_folder, skip_files=failed_files)
+
+        logger.info(f"Moved {len(removed_uuids) - len(failed)} item(s) from archive to trash")
+        return results
 
     def instant_delete(self, uuid: str) -> Tuple[bool, str]:
         """
@@ -411,6 +540,7 @@ class ArchiveService:
                     gc.collect()  # Release any Python file handles
                     try:
                         shutil.rmtree(source_folder)
+                        get_directory_cache().invalidate_tree(source_folder)
                         logger.info(f"Deleted folder: {source_folder}")
                     except PermissionError as e:
                         logger.warning(f"Permission denied deleting folder {source_folder}: {e}")
@@ -38,7 +38,8 @@ class BackupService:
         cls,
         library_path: Path,
         output_path: Path,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_token=None
     ) -> bool:
         """
         Export entire library to .animlib archive
@@ -47,9 +48,11 @@ class BackupService:
             library_path: Path to the animation library
             output_path: Path where .animlib file should be saved
             progress_callback: Optional callback(current, total, message)
+            cancel_token: Optional CancellationToken, checked between files;
+                a cancelled export removes the partial archive
 
         Returns:
-            True if export succeeded
+            True if export succeeded (False if cancelled)
         """
         try:
             # Ensure output has .animlib extension
@@ -87,6 +90,8 @@ class BackupService:
 
                 # Add all files
                 for idx, (file_path, archive_name) in enumerate(files_to_archive):
+                    if cancel_token is not None and cancel_token.is_cancelled:
+                        break
                     if progress_callback:
                         progress_callback(
                             idx + 1,
@@ -96,6 +101,12 @@ class BackupService:
 
                     zipf.write(file_path, archive_name)
 
+            if cancel_token is not None and cancel_token.is_cancelled:
+                output_path.unlink(missing_ok=True)
+                if progress_callback:
+                    progress_callback(0, 0, "Export cancelled")
+                return False
+
             if progress_callback:
                 progress_callback(total_files, total_files, "Export complete!")
 
@@ -111,7 +122,8 @@ class BackupService:
         cls,
         archive_path: Path,
         library_path: Path,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_token=None
     ) -> Dict[str, Any]:
         """
         Import library from .animlib archive
@@ -120,12 +132,15 @@ class BackupService:
             archive_path: Path to .animlib file
             library_path: Path to the animation library
             progress_callback: Optional callback(current, total, message)
+            cancel_token: Optional CancellationToken, checked between files;
+                files already extracted are kept and finalized
 
         Returns:
             Dictionary with import statistics
         """
         stats = {
             'imported': 0,
+            'cancelled': False,
             'metadata_imported': 0,
             'notes_imported': False,
             'drawovers_imported': 0,
@@ -176,6 +191,9 @@ class BackupService:
 
                 # Extract files
                 for idx, file_name in enumerate(file_list):
+                    if cancel_token is not None and cancel_token.is_cancelled:
+                        stats['cancelled'] = True
+                        break
                     if progress_callback:
                         progress_callback(
                             idx + 1,
@@ -25,6 +25,7 @@ from .schema import (
 )
 from .helpers import (
     deserialize_animation,
+    deserialize_version_summary,
     serialize_tags,
     row_to_dict,
     rows_to_list,
@@ -51,6 +52,7 @@ __all__ = [
     'delete_backup',
     # Helpers
     'deserialize_animation',
+    'deserialize_version_summary',
     'serialize_tags',
     'row_to_dict',
     'rows_to_list',
@@ -5,14 +5,16 @@ Handles animation CRUD, search, and filtering.
 """
 
 import json
+import os
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 
 from .connection import DatabaseConnection
-from .helpers import deserialize_animation, serialize_tags, row_to_dict
+from .helpers import deserialize_animation, deserialize_version_summary, serialize_tags, row_to_dict
 from ...config import Config
+from ..directory_cache import get_directory_cache
 
 
 class AnimationRepository:
@@ -46,69 +48,80 @@ class AnimationRepository:
         """
         try:
             with self._conn.transaction() as conn:
-                cursor = conn.cursor()
-
-                tags_json = serialize_tags(animation_data.get('tags', []))
-                now = datetime.now()
+                return self.insert(conn.cursor(), animation_data)
+        except Exception:
+            return None
 
-                # Get UUID for version_group_id default
-                uuid = animation_data.get('uuid')
+    def insert(self, cursor, animation_data: Dict[str, Any]) -> int:
+        """
+        Insert an animation row inside the caller's transaction.
 
-                cursor.execute('''
-                    INSERT INTO animations (
-                        uuid, name, description, folder_id, rig_type, armature_name,
-                        bone_count, frame_start, frame_end, frame_count, duration_seconds,
-                        fps, blend_file_path, json_file_path, preview_path, thumbnail_path,
-                        file_size_mb, tags, author, use_custom_thumbnail_gradient,
-                        thumbnail_gradient_top, thumbnail_gradient_bottom,
-                        created_date, modified_date,
-                        version, version_label, version_group_id, is_latest, status, is_pose, is_partial,
-                        naming_fields, naming_template
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    uuid,
-                    animation_data.get('name'),
-                    animation_data.get('description', ''),
-                    animation_data.get('folder_id'),
-                    animation_data.get('rig_type'),
-                    animation_data.get('armature_name'),
-                    animation_data.get('bone_count'),
-                    animation_data.get('frame_start'),
-                    animation_data.get('frame_end'),
-                    animation_data.get('frame_count'),
-                    animation_data.get('duration_seconds'),
-                    animation_data.get('fps'),
-                    animation_data.get('blend_file_path'),
-                    animation_data.get('json_file_path'),
-                    animation_data.get('preview_path'),
-                    animation_data.get('thumbnail_path'),
-                    animation_data.get('file_size_mb'),
-                    tags_json,
-                    animation_data.get('author', ''),
-                    animation_data.get('use_custom_thumbnail_gradient', 0),
-                    animation_data.get('thumbnail_gradient_top'),
-                    animation_data.get('thumbnail_gradient_bottom'),
-                    now,
-                    now,
-                    # Versioning fields (v5)
-                    animation_data.get('version', 1),
-                    animation_data.get('version_label', 'v001'),
-                    animation_data.get('version_group_id', uuid),  # Default to own UUID
-                    animation_data.get('is_latest', 1),
-                    # Lifecycle status (v6)
-                    animation_data.get('status', 'wip'),
-                    # Pose flag (v7) - 0 for actions, 1 for poses
-                    animation_data.get('is_pose', 0),
-                    # Partial pose flag (v8) - 1 if captured with selected bones only
-                    animation_data.get('is_partial', 0),
-                    # Studio naming fields (v9)
-                    animation_data.get('naming_fields'),
-                    animation_data.get('naming_template')
-                ))
+        Args:
+            cursor: Cursor of an open transaction
+            animation_data: Animation metadata dict
 
-                return cursor.lastrowid
-        except Exception:
-            return None
+        Returns:
+            Animation database ID
+        """
+        tags_json = serialize_tags(animation_data.get('tags', []))
+        now = datetime.now()
+
+        # Get UUID for version_group_id default
+        uuid = animation_data.get('uuid')
+
+        cursor.execute('''
+            INSERT INTO animations (
+                uuid, name, description, folder_id, rig_type, armature_name,
+                bone_count, frame_start, frame_end, frame_count, duration_seconds,
+                fps, blend_file_path, json_file_path, preview_path, thumbnail_path,
+                file_size_mb, tags, author, use_custom_thumbnail_gradient,
+                thumbnail_gradient_top, thumbnail_gradient_bottom,
+                created_date, modified_date,
+                version, version_label, version_group_id, is_latest, status, is_pose, is_partial,
+                naming_fields, naming_template
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            uuid,
+            animation_data.get('name'),
+            animation_data.get('description', ''),
+            animation_data.get('folder_id'),
+            animation_data.get('rig_type'),
+            animation_data.get('armature_name'),
+            animation_data.get('bone_count'),
+            animation_data.get('frame_start'),
+            animation_data.get('frame_end'),
+            animation_data.get('frame_count'),
+            animation_data.get('duration_seconds'),
+            animation_data.get('fps'),
+            animation_data.get('blend_file_path'),
+            animation_data.get('json_file_path'),
+            animation_data.get('preview_path'),
+            animation_data.get('thumbnail_path'),
+            animation_data.get('file_size_mb'),
+            tags_json,
+            animation_data.get('author', ''),
+            animation_data.get('use_custom_thumbnail_gradient', 0),
+            animation_data.get('thumbnail_gradient_top'),
+            animation_data.get('thumbnail_gradient_bottom'),
+            now,
+            now,
+            # Versioning fields (v5)
+            animation_data.get('version', 1),
+            animation_data.get('version_label', 'v001'),
+            animation_data.get('version_group_id', uuid),  # Default to own UUID
+            animation_data.get('is_latest', 1),
+            # Lifecycle status (v6)
+            animation_data.get('status', 'wip'),
+            # Pose flag (v7) - 0 for actions, 1 for poses
+            animation_data.get('is_pose', 0),
+            # Partial pose flag (v8) - 1 if captured with selected bones only
+            animation_data.get('is_partial', 0),
+            # Studio naming fields (v9)
+            animation_data.get('naming_fields'),
+            animation_data.get('naming_template')
+        ))
+
+        return cursor.lastrowid
 
     def get_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
         """
@@ -148,7 +161,37 @@ class AnimationRepository:
         except Exception:
             return None
 
-    def get_all(self, folder_id: Optional[int] = None, include_all_versions: bool = False) -> List[Dict[str, Any]]:
+    def get_uuids_in_folders(self, folders: List[Path]) -> List[str]:
+        """
+        Get animations whose files are stored in any of the given folders.
+
+        One pass over the path columns, so the cost does not depend on how
+        many folders are asked for.
+
+        Args:
+            folders: Animation folder paths
+
+        Returns:
+            List of animation UUIDs
+        """
+        wanted = {os.path.normcase(os.path.normpath(str(folder))) for folder in folders}
+        if not wanted:
+            return []
+        try:
+            conn = self._conn.get_connection()
+            cursor = conn.cursor()
+            cursor.execute('SELECT uuid, json_file_path, blend_file_path FROM animations')
+            uuids = []
+            for uuid, json_path, blend_path in cursor.fetchall():
+                path = json_path or blend_path
+                if path and os.path.normcase(os.path.dirname(os.path.normpath(path))) in wanted:
+                    uuids.append(uuid)
+            return uuids
+        except Exception:
+            return []
+
+    def get_all(self, folder_id: Optional[int] = None, include_all_versions: bool = False,
+                limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all animations, optionally filtered by folder.
         By default only returns latest versions (cold storage behavior).
@@ -157,6 +200,8 @@ class AnimationRepository:
             folder_id: Optional folder ID to filter by
             include_all_versions: If True, return all versions. If False (default),
                                   only return latest versions (is_latest = 1)
+            limit: Optional maximum row count; limited results are the first
+                   rows by case-insensitive name (the grid's default sort)
 
         Returns:
             List of animation dicts
@@ -171,10 +216,22 @@ class AnimationRepository:
             else:
                 latest_filter = " AND (is_latest = 1 OR is_latest IS NULL)"
 
+            params: list = []
+            folder_filter = ""
             if folder_id is not None:
-                cursor.execute(f'SELECT * FROM animations WHERE folder_id = ?{latest_filter} ORDER BY name', (folder_id,))
+                folder_filter = " AND folder_id = ?"
+                params.append(folder_id)
+
+            if limit is not None:
+                order_limit = " ORDER BY name COLLATE NOCASE LIMIT ?"
+                params.append(limit)
             else:
-                cursor.execute(f'SELECT * FROM animations WHERE 1=1{latest_filter} ORDER BY name')
+                order_limit = " ORDER BY name"
+
+            cursor.execute(
+                f'SELECT * FROM animations WHERE 1=1{folder_filter}{latest_filter}{order_limit}',
+                params
+            )
 
             return [deserialize_animation(dict(row)) for row in cursor.fetchall()]
         except Exception:
@@ -232,6 +289,20 @@ class AnimationRepository:
         except Exception:
             return False
 
+    def delete_many(self, cursor, uuids: List[str]) -> int:
+        """
+        Delete animations inside the caller's transaction.
+
+        Args:
+            cursor: Cursor of an open transaction
+            uuids: Animation UUIDs
+
+        Returns:
+            Number of animations deleted
+        """
+        cursor.executemany('DELETE FROM animations WHERE uuid = ?', [(uuid,) for uuid in uuids])
+        return cursor.rowcount
+
     def clear_all(self) -> int:
         """
         Delete all animations from database for rebuild.
@@ -602,6 +673,53 @@ class AnimationRepository:
         except Exception:
             return []
 
+    def get_version_summary(self, version_group_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the maintained summary of a version group.
+
+        Args:
+            version_group_id: Version group UUID
+
+        Returns:
+            Dict with latest_uuid, version_count, max_version, newest_date
+            and version_labels (list, in version order), or None if the
+            group has no animations
+        """
+        try:
+            conn = self._conn.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT * FROM version_groups WHERE version_group_id = ?',
+                (version_group_id,)
+            )
+            result = cursor.fetchone()
+            return deserialize_version_summary(result) if result else None
+        except Exception:
+            return None
+
+    def get_versioned_groups(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get summaries of all version groups with more than one version.
+
+        Served from the partial idx_version_groups_versioned index, so the
+        cost follows the number of versioned groups, not the library size.
+        Groups missing from the result have a single version.
+
+        Returns:
+            Dict mapping version group UUID to its summary
+            (see get_version_summary)
+        """
+        try:
+            conn = self._conn.get_connection()
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM version_groups WHERE version_count > 1')
+            return {
+                row['version_group_id']: deserialize_version_summary(row)
+                for row in cursor.fetchall()
+            }
+        except Exception:
+            return {}
+
     def get_version_count(self, version_group_id: str) -> int:
         """
         Get count of versions in a version group.
@@ -616,7 +734,7 @@ class AnimationRepository:
             conn = self._conn.get_connection()
             cursor = conn.cursor()
             cursor.execute(
-                'SELECT COUNT(*) FROM animations WHERE version_group_id = ?',
+                'SELECT version_count FROM version_groups WHERE version_group_id = ?',
                 (version_group_id,)
             )
             result = cursor.fetchone()
@@ -638,7 +756,7 @@ class AnimationRepository:
             conn = self._conn.get_connection()
             cursor = conn.cursor()
             cursor.execute(
-                'SELECT MAX(version) FROM animations WHERE version_group_id = ?',
+                'SELECT max_version FROM version_groups WHERE version_group_id = ?',
                 (version_group_id,)
             )
             result = cursor.fetchone()
@@ -660,9 +778,9 @@ class AnimationRepository:
             conn = self._conn.get_connection()
             cursor = conn.cursor()
             cursor.execute('''
-                SELECT * FROM animations
-                WHERE version_group_id = ? AND is_latest = 1
-                LIMIT 1
+                SELECT a.* FROM version_groups g
+                JOIN animations a ON a.uuid = g.latest_uuid
+                WHERE g.version_group_id = ?
             ''', (version_group_id,))
             result = cursor.fetchone()
             return deserialize_animation(dict(result)) if result else None
@@ -699,9 +817,10 @@ class AnimationRepository:
             with self._conn.transaction() as conn:
                 cursor = conn.cursor()
 
-                # Mark all existing versions in group as not latest
+                # Mark the current latest version(s) in group as not latest
                 cursor.execute(
-                    'UPDATE animations SET is_latest = 0 WHERE version_group_id = ?',
+                    'UPDATE animations SET is_latest = 0 '
+                    'WHERE version_group_id = ? AND IFNULL(is_latest, 1) = 1',
                     (version_group_id,)
                 )
 
@@ -778,17 +897,15 @@ class AnimationRepository:
             with self._conn.transaction() as conn:
                 cursor = conn.cursor()
 
-                # Clear is_latest on all versions in group
-                cursor.execute(
-                    'UPDATE animations SET is_latest = 0 WHERE version_group_id = ?',
-                    (version_group_id,)
-                )
-
-                # Set this version as latest
-                cursor.execute(
-                    'UPDATE animations SET is_latest = 1, modified_date = ? WHERE uuid = ?',
-                    (datetime.now(), uuid)
-                )
+                # One statement over this version and the current latest
+                # one(s), so the group summary is recomputed once per row
+                # that actually changes instead of once per version
+                cursor.execute('''
+                    UPDATE animations
+                    SET is_latest = (uuid = ?),
+                        modified_date = CASE WHEN uuid = ? THEN ? ELSE modified_date END
+                    WHERE version_group_id = ? AND (uuid = ? OR IFNULL(is_latest, 1) = 1)
+                ''', (uuid, uuid, datetime.now(), version_group_id, uuid))
 
                 return cursor.rowcount > 0
         except Exception:
@@ -877,24 +994,34 @@ class AnimationRepository:
         except Exception:
             return 'none'
 
-    def fix_pose_flags(self) -> int:
+    def fix_pose_flags(self, uuid: Optional[str] = None) -> int:
         """
         Fix is_pose flag for animations that should be poses.
 
         Identifies poses based on frame_count = 1 (single-frame snapshots)
         and updates their is_pose flag to 1.
 
+        Args:
+            uuid: Optional animation UUID to restrict the fix to a single row
+
         Returns:
             Number of animations updated
         """
         try:
             conn = self._conn.get_connection()
             cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE animations
-                SET is_pose = 1
-                WHERE frame_count = 1 AND is_pose = 0
-            ''')
+            if uuid is not None:
+                cursor.execute('''
+                    UPDATE animations
+                    SET is_pose = 1
+                    WHERE uuid = ? AND frame_count = 1 AND is_pose = 0
+                ''', (uuid,))
+            else:
+                cursor.execute('''
+                    UPDATE animations
+                    SET is_pose = 1
+                    WHERE frame_count = 1 AND is_pose = 0
+                ''')
             updated = cursor.rowcount
             conn.commit()
             return updated
@@ -917,11 +1044,12 @@ class AnimationRepository:
         Returns:
             Path to animation folder, or None if paths can't be determined
         """
+        directory_cache = get_directory_cache()
         # First try to derive from stored paths (most reliable)
         blend_path = animation.get('blend_file_path')
         if blend_path:
             path = Path(blend_path)
-            if path.exists():
+            if directory_cache.exists(path):
                 return path.parent
 
         # Generate expected folder path using base name
@@ -937,7 +1065,7 @@ class AnimationRepository:
                 # Cold storage: _versions/{base_name}/{version_label}/
                 versions_folder = Config.get_versions_folder()
                 cold_path = versions_folder / base_name / version_label
-                if cold_path.exists():
+                if directory_cache.is_dir(cold_path):
                     return cold_path
                 # Fallback to hot storage if cold doesn't exist
                 library_folder = Config.get_library_folder()
@@ -961,6 +1089,7 @@ class AnimationRepository:
         Returns:
             Path to blend file, or None if not found
         """
+        directory_cache = get_directory_cache()
         name = animation.get('name', '')
         safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
         safe_name = safe_name.strip(' .') or 'unnamed'
@@ -969,14 +1098,14 @@ class AnimationRepository:
         stored_path = animation.get('blend_file_path')
         if stored_path:
             path = Path(stored_path)
-            if path.exists():
+            if directory_cache.exists(path):
                 return path
 
         # Try hot storage: library/{base_name}/
         folder = self.get_animation_folder(animation)
-        if folder and folder.exists():
+        if folder and directory_cache.is_dir(folder):
             path = folder / f"{safe_name}.blend"
-            if path.exists():
+            if directory_cache.exists(path):
                 return path
 
         # Try cold storage: _versions/{base_name}/{version_label}/
@@ -985,7 +1114,7 @@ class AnimationRepository:
         try:
             versions_folder = Config.get_versions_folder()
             cold_path = versions_folder / base_name / version_label / f"{safe_name}.blend"
-            if cold_path.exists():
+            if directory_cache.exists(cold_path):
                 return cold_path
         except ValueError:
             pass
@@ -1003,6 +1132,7 @@ class AnimationRepository:
         Returns:
             Path to JSON file, or None if not found
         """
+        directory_cache = get_directory_cache()
         name = animation.get('name', '')
         safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
         safe_name = safe_name.strip(' .') or 'unnamed'
@@ -1011,14 +1141,14 @@ class AnimationRepository:
         stored_path = animation.get('json_file_path')
         if stored_path:
             path = Path(stored_path)
-            if path.exists():
+            if directory_cache.exists(path):
                 return path
 
         # Try hot storage: library/{base_name}/
         folder = self.get_animation_folder(animation)
-        if folder and folder.exists():
+        if folder and directory_cache.is_dir(folder):
             path = folder / f"{safe_name}.json"
-            if path.exists():
+            if directory_cache.exists(path):
                 return path
 
         # Try cold storage: _versions/{base_name}/{version_label}/
@@ -1027,7 +1157,7 @@ class AnimationRepository:
         try:
             versions_folder = Config.get_versions_folder()
             cold_path = versions_folder / base_name / version_label / f"{safe_name}.json"
-            if cold_path.exists():
+            if directory_cache.exists(cold_path):
                 return cold_path
         except ValueError:
             pass
@@ -1045,6 +1175,7 @@ class AnimationRepository:
         Returns:
             Path to preview file, or None if not found
         """
+        directory_cache = get_directory_cache()
         name = animation.get('name', '')
         safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
         safe_name = safe_name.strip(' .') or 'unnamed'
@@ -1053,15 +1184,15 @@ class AnimationRepository:
         stored_path = animation.get('preview_path')
         if stored_path:
             path = Path(stored_path)
-            if path.exists():
+            if directory_cache.exists(path):
                 return path
 
         # Try hot storage: library/{base_name}/
         folder = self.get_animation_folder(animation)
-        if folder and folder.exists():
+        if folder and directory_cache.is_dir(folder):
             for ext in ['.webm', '.mp4']:
                 path = folder / f"{safe_name}{ext}"
-                if path.exists():
+                if directory_cache.exists(path):
                     return path
 
         # Try cold storage: _versions/{base_name}/{version_label}/
@@ -1071,7 +1202,7 @@ class AnimationRepository:
             versions_folder = Config.get_versions_folder()
             cold_folder = versions_folder / base_name / version_label
 
-            if cold_folder.exists():
+            if directory_cache.is_dir(cold_folder):
                 # Try multiple filename patterns
                 for ext in ['.webm', '.mp4']:
                     patterns_to_try = [
@@ -1081,12 +1212,12 @@ class AnimationRepository:
                     ]
                     for pattern in patterns_to_try:
                         cold_path = cold_folder / pattern
-                        if cold_path.exists():
+                        if directory_cache.exists(cold_path):
                             return cold_path
 
                 # Last resort: find ANY video file in the folder
                 for ext in ['.webm', '.mp4']:
-                    video_files = list(cold_folder.glob(f"*{ext}"))
+                    video_files = directory_cache.glob(cold_folder, f"*{ext}")
                     if video_files:
                         return video_files[0]
         except ValueError:
@@ -1105,6 +1236,7 @@ class AnimationRepository:
         Returns:
             Path to thumbnail file, or None if not found
         """
+        directory_cache = get_directory_cache()
         name = animation.get('name', '')
         safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
         safe_name = safe_name.strip(' .') or 'unnamed'
@@ -1114,14 +1246,14 @@ class AnimationRepository:
         stored_path = animation.get('thumbnail_path')
         if stored_path:
             path = Path(stored_path)
-            if path.exists():
+            if directory_cache.exists(path):
                 return path
 
         # Try hot storage: library/{base_name}/
         folder = self.get_animation_folder(animation)
-        if folder and folder.exists():
+        if folder and directory_cache.is_dir(folder):
             path = folder / f"{safe_name}.png"
-            if path.exists():
+            if directory_cache.exists(path):
                 return path
 
         # Try cold storage: _versions/{base_name}/{version_label}/
@@ -1130,7 +1262,7 @@ class AnimationRepository:
             versions_folder = Config.get_versions_folder()
             cold_folder = versions_folder / base_name / version_label
 
-            if cold_folder.exists():
+            if directory_cache.is_dir(cold_folder):
                 # Try multiple filename patterns
                 patterns_to_try = [
                     f"{safe_name}.png",                           # Full name with version
@@ -1140,11 +1272,11 @@ class AnimationRepository:
 
                 for pattern in patterns_to_try:
                     cold_path = cold_folder / pattern
-                    if cold_path.exists():
+                    if directory_cache.exists(cold_path):
                         return cold_path
 
                 # Last resort: find ANY .png file in the folder
-                png_files = list(cold_folder.glob("*.png"))
+                png_files = directory_cache.glob(cold_folder, "*.png")
                 if png_files:
                     return png_files[0]
         except ValueError:
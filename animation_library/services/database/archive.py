@@ -46,31 +46,43 @@ class ArchiveRepository:
         """
         try:
             with self._conn.transaction() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO archive (
-                        uuid, name, original_folder_id, original_folder_path,
-                        rig_type, frame_count, duration_seconds, file_size_mb,
-                        archive_folder_path, thumbnail_path,
-                        archived_date, original_created_date
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
-                ''', (
-                    archive_data.get('uuid'),
-                    archive_data.get('name'),
-                    archive_data.get('original_folder_id'),
-                    archive_data.get('original_folder_path'),
-                    archive_data.get('rig_type'),
-                    archive_data.get('frame_count'),
-                    archive_data.get('duration_seconds'),
-                    archive_data.get('file_size_mb'),
-                    archive_data.get('archive_folder_path'),
-                    archive_data.get('thumbnail_path'),
-                    archive_data.get('original_created_date')
-                ))
-                return cursor.lastrowid
+                return self.insert(conn.cursor(), archive_data)
         except Exception:
             return None
 
+    def insert(self, cursor, archive_data: Dict[str, Any]) -> int:
+        """
+        Insert an archive row inside the caller's transaction.
+
+        Args:
+            cursor: Cursor of an open transaction
+            archive_data: Same keys as add()
+
+        Returns:
+            Record ID
+        """
+        cursor.execute('''
+            INSERT INTO archive (
+                uuid, name, original_folder_id, original_folder_path,
+                rig_type, frame_count, duration_seconds, file_size_mb,
+                archive_folder_path, thumbnail_path,
+                archived_date, original_created_date
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+        ''', (
+            archive_data.get('uuid'),
+            archive_data.get('name'),
+            archive_data.get('original_folder_id'),
+            archive_data.get('original_folder_path'),
+            archive_data.get('rig_type'),
+            archive_data.get('frame_count'),
+            archive_data.get('duration_seconds'),
+            archive_data.get('file_size_mb'),
+            archive_data.get('archive_folder_path'),
+            archive_data.get('thumbnail_path'),
+            archive_data.get('original_created_date')
+        ))
+        return cursor.lastrowid
+
     def get_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
         """
         Get archive item by UUID.
@@ -122,6 +134,20 @@ class ArchiveRepository:
         except Exception:
             return False
 
+    def delete_many(self, cursor, uuids: List[str]) -> int:
+        """
+        Remove items from the archive table inside the caller's transaction.
+
+        Args:
+            cursor: Cursor of an open transaction
+            uuids: Animation UUIDs
+
+        Returns:
+            Number of rows removed
+        """
+        cursor.executemany('DELETE FROM archive WHERE uuid = ?', [(uuid,) for uuid in uuids])
+        return cursor.rowcount
+
     def get_count(self) -> int:
         """
         Get number of items in archive.
@@ -2,11 +2,15 @@
 Folder Repository - Database operations for folders
 
 Handles folder CRUD and hierarchy management.
+
+The hierarchy is stored as materialized paths ("Body/Combat"), so subtree
+and ancestor queries are indexed lookups on folders.path and a move
+rewrites a whole subtree with one UPDATE.
 """
 
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 from .connection import DatabaseConnection
 from .helpers import row_to_dict, rows_to_list
@@ -18,8 +22,9 @@ class FolderRepository:
 
     Handles:
     - Folder CRUD operations
-    - Hierarchy management
+    - Hierarchy management (materialized paths)
     - Path resolution
+    - Per-folder animation counts (kept by triggers, see schema v12)
     """
 
     def __init__(self, connection: DatabaseConnection):
@@ -153,6 +158,9 @@ class FolderRepository:
         """
         Get all descendant folder IDs (recursive).
 
+        Uses a range scan on the path index, so cost depends on the size
+        of the subtree, not the number of folders.
+
         Args:
             folder_id: Parent folder ID
 
@@ -163,32 +171,137 @@ class FolderRepository:
             conn = self._conn.get_connection()
             cursor = conn.cursor()
 
-            # Get all folders to build hierarchy
-            cursor.execute('SELECT id, parent_id FROM folders')
-            all_folders = cursor.fetchall()
-
-            # Build parent -> children map
-            children_map = {}
-            for row in all_folders:
-                fid = row['id']
-                parent = row['parent_id']
-                if parent not in children_map:
-                    children_map[parent] = []
-                children_map[parent].append(fid)
-
-            # Recursively collect descendants
-            def collect_descendants(current_id: int) -> List[int]:
-                result = [current_id]
-                if current_id in children_map:
-                    for child_id in children_map[current_id]:
-                        result.extend(collect_descendants(child_id))
-                return result
-
-            return collect_descendants(folder_id)
+            cursor.execute('SELECT parent_id, path FROM folders WHERE id = ?', (folder_id,))
+            folder = cursor.fetchone()
+            if not folder:
+                return [folder_id]
+
+            if folder['parent_id'] is None:
+                # Root: every folder is a descendant
+                cursor.execute('SELECT id FROM folders WHERE id != ?', (folder_id,))
+            else:
+                cursor.execute(
+                    'SELECT id FROM folders WHERE path > ? AND path < ?',
+                    self._subtree_range(folder['path'])
+                )
+
+            return [folder_id] + [row['id'] for row in cursor.fetchall()]
 
         except Exception:
             return [folder_id]  # At least return the folder itself
 
+    def get_ancestors(self, folder_id: int) -> List[int]:
+        """
+        Get ancestor folder IDs, root first.
+
+        Args:
+            folder_id: Folder ID
+
+        Returns:
+            List of ancestor folder IDs (excluding the folder itself)
+        """
+        try:
+            conn = self._conn.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute('SELECT parent_id, path FROM folders WHERE id = ?', (folder_id,))
+            folder = cursor.fetchone()
+            if not folder or folder['parent_id'] is None:
+                return []
+
+            # "A/B/C" -> root (""), "A", "A/B"
+            parts = folder['path'].split('/')
+            prefixes = [''] + ['/'.join(parts[:i]) for i in range(1, len(parts))]
+            placeholders = ','.join('?' * len(prefixes))
+            cursor.execute(
+                f'SELECT id FROM folders WHERE path IN ({placeholders}) ORDER BY length(path)',
+                prefixes
+            )
+            return [row['id'] for row in cursor.fetchall()]
+
+        except Exception:
+            return []
+
+    def is_descendant(self, folder_id: int, ancestor_id: int) -> bool:
+        """
+        Check if a folder is inside another folder's subtree.
+
+        Args:
+            folder_id: Folder to check
+            ancestor_id: Potential ancestor folder
+
+        Returns:
+            True if folder_id is a child/grandchild/etc. of ancestor_id
+        """
+        if folder_id == ancestor_id:
+            return False
+
+        try:
+            conn = self._conn.get_connection()
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, parent_id, path FROM folders WHERE id IN (?, ?)',
+                           (folder_id, ancestor_id))
+            rows = {row['id']: row for row in cursor.fetchall()}
+            folder = rows.get(folder_id)
+            ancestor = rows.get(ancestor_id)
+            if not folder or not ancestor:
+                return False
+            if ancestor['parent_id'] is None:
+                return True
+            return folder['path'].startswith(ancestor['path'] + '/')
+        except Exception:
+            return False
+
+    def get_animation_counts(self) -> Dict[int, int]:
+        """
+        Get the number of animations directly in each folder.
+
+        Counts are maintained by triggers on the animations table and
+        cover latest versions only (what the grid shows).
+
+        Returns:
+            Dict mapping folder ID to animation count (empty folders omitted)
+        """
+        try:
+            conn = self._conn.get_connection()
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, animation_count FROM folders WHERE animation_count > 0')
+            return {row['id']: row['animation_count'] for row in cursor.fetchall()}
+        except Exception:
+            return {}
+
+    def get_subtree_animation_count(self, folder_id: int) -> int:
+        """
+        Get the number of animations in a folder and all its subfolders.
+
+        Args:
+            folder_id: Folder ID
+
+        Returns:
+            Animation count
+        """
+        try:
+            conn = self._conn.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute('SELECT parent_id, path FROM folders WHERE id = ?', (folder_id,))
+            folder = cursor.fetchone()
+            if not folder:
+                return 0
+
+            if folder['parent_id'] is None:
+                cursor.execute('SELECT SUM(animation_count) FROM folders')
+            else:
+                low, high = self._subtree_range(folder['path'])
+                cursor.execute('''
+                    SELECT SUM(animation_count) FROM folders
+                    WHERE id = ? OR (path > ? AND path < ?)
+                ''', (folder_id, low, high))
+            result = cursor.fetchone()
+            return result[0] or 0
+        except Exception:
+            return 0
+
     def delete(self, folder_id: int) -> bool:
         """
         Delete folder (and all contained animations via CASCADE).
@@ -216,7 +329,8 @@ class FolderRepository:
             new_parent_id: New parent folder ID
 
         Returns:
-            True if successful
+            True if successful (False if the move would put the folder
+            inside itself or a same-named folder already exists there)
         """
         try:
             with self._conn.transaction() as conn:
@@ -225,7 +339,7 @@ class FolderRepository:
                 # Get folder info
                 cursor.execute('SELECT name, parent_id, path FROM folders WHERE id = ?', (folder_id,))
                 folder = cursor.fetchone()
-                if not folder:
+                if not folder or folder['parent_id'] is None:
                     return False
 
                 folder_name = folder['name']
@@ -238,6 +352,9 @@ class FolderRepository:
                     return False
 
                 parent_path = parent['path']
+                if parent_path == old_path or parent_path.startswith(old_path + '/'):
+                    return False  # Into itself or its own subfolder
+
                 new_path = f"{parent_path}/{folder_name}" if parent_path else folder_name
 
                 # Update folder
@@ -252,43 +369,46 @@ class FolderRepository:
 
                 parent_updated = cursor.rowcount > 0
 
-                # Update paths of all descendant folders
-                try:
-                    self._update_descendant_paths(cursor, old_path, new_path)
-                except Exception:
-                    pass  # Continue anyway - parent folder was updated
+                # Update paths of all descendant folders (path clashes roll back the move)
+                self._update_descendant_paths(cursor, old_path, new_path)
 
                 return parent_updated
         except Exception:
             return False
 
+    @staticmethod
+    def _subtree_range(path: str) -> Tuple[str, str]:
+        """
+        Get the path bounds of a folder's descendants.
+
+        Every descendant path starts with "path/" and '0' sorts right
+        after '/', so the open range (path + '/', path + '0') matches
+        exactly the subtree with an index range scan (unlike LIKE, which
+        also treats '_' and '%' in folder names as wildcards).
+
+        Args:
+            path: Folder path (not the root)
+
+        Returns:
+            (low, high) exclusive bounds for folders.path
+        """
+        return f"{path}/", f"{path}0"
+
     def _update_descendant_paths(self, cursor, old_path_prefix: str, new_path_prefix: str):
         """
-        Recursively update paths of all descendant folders.
+        Rewrite the paths of all descendant folders in one statement.
 
         Args:
             cursor: Database cursor
             old_path_prefix: Old path prefix
             new_path_prefix: New path prefix
         """
+        low, high = self._subtree_range(old_path_prefix)
         cursor.execute("""
-            SELECT id, path FROM folders
-            WHERE path LIKE ?
-            ORDER BY path
-        """, (f"{old_path_prefix}/%",))
-
-        descendants = cursor.fetchall()
-
-        for row in descendants:
-            folder_id = row['id']
-            old_path = row['path']
-            new_path = old_path.replace(old_path_prefix, new_path_prefix, 1)
-
-            cursor.execute("""
-                UPDATE folders
-                SET path = ?, modified_date = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (new_path, folder_id))
+            UPDATE folders
+            SET path = ? || substr(path, ?), modified_date = CURRENT_TIMESTAMP
+            WHERE path > ? AND path < ?
+        """, (new_path_prefix, len(old_path_prefix) + 1, low, high))
 
     def ensure_exists(self, path: str, description: str = None) -> Optional[int]:
         """
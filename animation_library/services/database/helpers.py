@@ -49,6 +49,24 @@ def deserialize_animation(row_dict: Dict[str, Any]) -> Dict[str, Any]:
     return data
 
 
+def deserialize_version_summary(row_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deserialize a version_groups row from database format.
+
+    Args:
+        row_dict: Raw row data from database
+
+    Returns:
+        Summary dict with version_labels as a list
+    """
+    data = dict(row_dict)
+    try:
+        data['version_labels'] = json.loads(data.get('version_labels') or '[]')
+    except (json.JSONDecodeError, TypeError):
+        data['version_labels'] = []
+    return data
+
+
 def serialize_tags(tags: Any) -> str:
     """
     Serialize tags to JSON string for database storage.
@@ -131,6 +149,7 @@ def parse_json_field(value: str, default: Any = None) -> Any:
 
 __all__ = [
     'deserialize_animation',
+    'deserialize_version_summary',
     'serialize_tags',
     'row_to_dict',
     'rows_to_list',
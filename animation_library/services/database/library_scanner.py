@@ -6,6 +6,7 @@ Handles scanning animation libraries and syncing with database.
 
 import os
 import json
+import logging
 import re
 import uuid as uuid_lib
 from pathlib import Path
@@ -16,6 +17,10 @@ from .animations import AnimationRepository
 from .folders import FolderRepository
 from .helpers import parse_json_field
 from ...config import Config
+from ...utils.logging_config import RateLimitedLogger
+from ..directory_cache import get_directory_cache
+
+logger = RateLimitedLogger(logging.getLogger(__name__))  # Per-item scan messages
 
 
 class LibraryScanner:
@@ -46,6 +51,28 @@ class LibraryScanner:
         self._animations = animations
         self._folders = folders
 
+        # Progress/cancellation of the scan in progress (see scan_folder)
+        self._scan_progress = None
+        self._scan_cancel = None
+        self._scan_count = 0
+
+    def _scan_step(self, name: str) -> bool:
+        """
+        Count one scanned animation folder and report progress.
+
+        Args:
+            name: Folder name (for the progress message)
+
+        Returns:
+            False if the scan was cancelled and should stop
+        """
+        if self._scan_cancel is not None and self._scan_cancel.is_cancelled:
+            return False
+        self._scan_count += 1
+        if self._scan_progress:
+            self._scan_progress(self._scan_count, 0, f"Scanning: {name}")
+        return True
+
     def _is_legacy_animation(self, animation_data: dict) -> bool:
         """
         Detect if animation JSON is from v1.2 (legacy).
@@ -81,8 +108,8 @@ class LibraryScanner:
         old_uuid = animation_data.get('uuid') or animation_data.get('id')
         new_uuid = str(uuid_lib.uuid4())
 
-        print(f"[SCAN] LEGACY v1.2 DETECTED: {animation_data.get('name', 'unknown')}")
-        print(f"[SCAN] Converting {old_uuid[:8] if old_uuid else 'N/A'}... → {new_uuid[:8]}... (fresh v001)")
+        logger.info("[SCAN] LEGACY v1.2 DETECTED: %s", animation_data.get('name', 'unknown'))
+        logger.info("[SCAN] Converting %s... → %s... (fresh v001)", old_uuid[:8] if old_uuid else 'N/A', new_uuid[:8])
 
         # Create fresh animation data - reset all metadata
         fresh_data = {
@@ -135,9 +162,9 @@ class LibraryScanner:
         try:
             with open(json_file_path, 'w', encoding='utf-8') as f:
                 json.dump(fresh_data, f, indent=2)
-            print(f"[SCAN] Updated JSON with fresh UUID")
+            logger.debug("[SCAN] Updated JSON with fresh UUID")
         except Exception as e:
-            print(f"[SCAN] WARNING: Could not update JSON: {e}")
+            logger.warning("[SCAN] Could not update JSON: %s", e)
 
         return fresh_data
 
@@ -166,6 +193,7 @@ class LibraryScanner:
         Returns:
             The (possibly modified) animation_data dict
         """
+        directory_cache = get_directory_cache()
         parent = json_file_path.parent
         name = animation_data.get('name', 'unknown')
         safe_name = self._sanitize_name(name)
@@ -176,16 +204,16 @@ class LibraryScanner:
         # blend_file_path
         computed_blend = parent / f"{safe_name}.blend"
         stored_blend = animation_data.get('blend_file_path', '')
-        if computed_blend.exists():
+        if directory_cache.exists(computed_blend):
             animation_data['blend_file_path'] = str(computed_blend)
-        elif not stored_blend or not Path(stored_blend).exists():
+        elif not stored_blend or not directory_cache.exists(stored_blend):
             # Try directory-name-based fallback (folder may not match asset name)
             dir_blend = parent / f"{parent.name}.blend"
-            if dir_blend.exists():
+            if directory_cache.exists(dir_blend):
                 animation_data['blend_file_path'] = str(dir_blend)
             else:
                 # Last resort: find any .blend file in the folder
-                blend_files = list(parent.glob("*.blend"))
+                blend_files = directory_cache.glob(parent, "*.blend")
                 if blend_files:
                     animation_data['blend_file_path'] = str(blend_files[0])
                 else:
@@ -195,22 +223,22 @@ class LibraryScanner:
         stored_preview = animation_data.get('preview_path', '')
         computed_webm = parent / f"{safe_name}.webm"
         computed_mp4 = parent / f"{safe_name}.mp4"
-        if computed_webm.exists():
+        if directory_cache.exists(computed_webm):
             animation_data['preview_path'] = str(computed_webm)
-        elif computed_mp4.exists():
+        elif directory_cache.exists(computed_mp4):
             animation_data['preview_path'] = str(computed_mp4)
-        elif not stored_preview or not Path(stored_preview).exists():
+        elif not stored_preview or not directory_cache.exists(stored_preview):
             # Directory-name-based fallback
             dir_webm = parent / f"{parent.name}.webm"
             dir_mp4 = parent / f"{parent.name}.mp4"
-            if dir_webm.exists():
+            if directory_cache.exists(dir_webm):
                 animation_data['preview_path'] = str(dir_webm)
-            elif dir_mp4.exists():
+            elif directory_cache.exists(dir_mp4):
                 animation_data['preview_path'] = str(dir_mp4)
             else:
                 # Find any preview file
                 for ext in ('*.webm', '*.mp4'):
-                    previews = list(parent.glob(ext))
+                    previews = directory_cache.glob(parent, ext)
                     if previews:
                         animation_data['preview_path'] = str(previews[0])
                         break
@@ -218,19 +246,42 @@ class LibraryScanner:
         # thumbnail_path
         computed_thumb = parent / f"{safe_name}.png"
         stored_thumb = animation_data.get('thumbnail_path', '')
-        if computed_thumb.exists():
+        if directory_cache.exists(computed_thumb):
             animation_data['thumbnail_path'] = str(computed_thumb)
-        elif not stored_thumb or not Path(stored_thumb).exists():
+        elif not stored_thumb or not directory_cache.exists(stored_thumb):
             dir_thumb = parent / f"{parent.name}.png"
-            if dir_thumb.exists():
+            if directory_cache.exists(dir_thumb):
                 animation_data['thumbnail_path'] = str(dir_thumb)
             else:
-                png_files = list(parent.glob("*.png"))
+                png_files = directory_cache.glob(parent, "*.png")
                 if png_files:
                     animation_data['thumbnail_path'] = str(png_files[0])
 
         return animation_data
 
+    def find_animation_json(self, folder: Path) -> Optional[Path]:
+        """
+        Find the JSON file of one animation folder (same rules as a scan).
+
+        Hot storage folders hold {folder_name}.json, cold storage version
+        folders {animation_name}.json; otherwise the first .json found.
+
+        Args:
+            folder: Animation folder
+
+        Returns:
+            Path to the JSON file, or None if the folder has none
+        """
+        directory_cache = get_directory_cache()
+        is_cold_storage = folder.parent.parent.name == Config.VERSIONS_FOLDER_NAME
+        stem = folder.parent.name if is_cold_storage else folder.name
+
+        json_file = folder / f"{stem}.json"
+        if directory_cache.exists(json_file):
+            return json_file
+        json_files = directory_cache.glob(folder, "*.json")
+        return json_files[0] if json_files else None
+
     def import_from_json(self, json_file_path: Path) -> bool:
         """
         Import animation from JSON file into database.
@@ -258,14 +309,14 @@ class LibraryScanner:
             name = animation_data.get('name', 'unknown')
 
             if not uuid:
-                print(f"[SCAN] SKIP (no UUID): {json_file_path}")
+                logger.warning("[SCAN] SKIP (no UUID): %s", json_file_path)
                 return False
 
             # Check if this is from cold storage (_versions/) - force is_latest = 0
             is_cold_storage = '_versions' in str(json_file_path)
             if is_cold_storage:
                 animation_data['is_latest'] = 0
-                print(f"[SCAN] Cold storage: {name} - forcing is_latest=0")
+                logger.debug("[SCAN] Cold storage: %s - forcing is_latest=0", name)
 
             # Ensure 'uuid' key exists
             if 'uuid' not in animation_data:
@@ -273,7 +324,7 @@ class LibraryScanner:
 
             existing = self._animations.get_by_uuid(uuid)
             if existing:
-                print(f"[SCAN] EXISTS: {name} (UUID: {uuid[:8]}...) - already in DB")
+                logger.debug("[SCAN] EXISTS: %s (UUID: %.8s...) - already in DB", name, uuid)
                 # Update flags and naming fields if they differ (for migrations)
                 updates = {}
                 new_is_pose = animation_data.get('is_pose', 0)
@@ -318,13 +369,13 @@ class LibraryScanner:
 
             result = self._animations.add(animation_data)
             if result:
-                print(f"[SCAN] IMPORTED: {name} (UUID: {uuid[:8]}..., is_latest: {is_latest})")
+                logger.debug("[SCAN] IMPORTED: %s (UUID: %.8s..., is_latest: %s)", name, uuid, is_latest)
             else:
-                print(f"[SCAN] FAILED to add: {name} (UUID: {uuid[:8]}...)")
+                logger.warning("[SCAN] FAILED to add: %s (UUID: %.8s...)", name, uuid)
             return result is not None
 
         except Exception as e:
-            print(f"[SCAN] ERROR importing {json_file_path}: {e}")
+            logger.error("[SCAN] ERROR importing %s: %s", json_file_path, e)
             return False
 
     def _clear_latest_in_group(self, version_group_id: str) -> bool:
@@ -340,8 +391,11 @@ class LibraryScanner:
         try:
             conn = self._conn.get_connection()
             cursor = conn.cursor()
+            # Only the current latest version changes; the others already
+            # have is_latest = 0 and would just re-run the summary triggers
             cursor.execute(
-                'UPDATE animations SET is_latest = 0 WHERE version_group_id = ?',
+                'UPDATE animations SET is_latest = 0 '
+                'WHERE version_group_id = ? AND IFNULL(is_latest, 1) = 1',
                 (version_group_id,)
             )
             conn.commit()
@@ -349,7 +403,12 @@ class LibraryScanner:
         except Exception:
             return False
 
-    def scan_folder(self, library_path: Path) -> Tuple[int, int]:
+    def scan_folder(
+        self,
+        library_path: Path,
+        progress_callback=None,
+        cancel_token=None
+    ) -> Tuple[int, int]:
         """
         Scan library folder for animations and import them.
 
@@ -359,6 +418,10 @@ class LibraryScanner:
 
         Args:
             library_path: Path to animation library root
+            progress_callback: Optional callback(current, total, message);
+                total is 0 (folder count is not known up front)
+            cancel_token: Optional CancellationToken, checked per folder;
+                a cancelled scan returns what it imported so far
 
         Returns:
             Tuple of (total_found, newly_imported)
@@ -369,6 +432,13 @@ class LibraryScanner:
         total_found = 0
         newly_imported = 0
 
+        # A scan must see the disk as it is now, not as it was a few seconds ago
+        get_directory_cache().invalidate_tree(library_path)
+
+        self._scan_progress = progress_callback
+        self._scan_cancel = cancel_token
+        self._scan_count = 0
+
         try:
             # Scan hot storage: library/
             library_dir = library_path / Config.LIBRARY_FOLDER_NAME
@@ -389,6 +459,10 @@ class LibraryScanner:
         except Exception:
             return (total_found, newly_imported)
 
+        finally:
+            self._scan_progress = None
+            self._scan_cancel = None
+
     def _scan_library_folder(self, library_dir: Path) -> Tuple[int, int]:
         """
         Scan library folder for animations (hot storage).
@@ -435,8 +509,10 @@ class LibraryScanner:
         total_found = 0
         newly_imported = 0
         skip_subdirs = skip_subdirs or []
+        # Each animation folder is listed once; _rebase_paths reuses the listing
+        directory_cache = get_directory_cache()
 
-        print(f"[SCAN] Scanning folder: {folder}")
+        logger.info("[SCAN] Scanning folder: %s", folder)
 
         for item in folder.iterdir():
             if not item.is_dir():
@@ -448,26 +524,28 @@ class LibraryScanner:
             if dirname in skip_subdirs:
                 continue
 
+            if not self._scan_step(dirname):
+                break
             total_found += 1
 
             # Try {folder_name}.json
             json_file = item / f"{dirname}.json"
-            if json_file.exists():
-                print(f"[SCAN] Found: {json_file.name} in {dirname}/")
+            if directory_cache.exists(json_file):
+                logger.debug("[SCAN] Found: %s in %s/", json_file.name, dirname)
                 if self.import_from_json(json_file):
                     newly_imported += 1
                 continue
 
             # Try any .json file in the folder
-            json_files = list(item.glob("*.json"))
+            json_files = directory_cache.glob(item, "*.json")
             if json_files:
-                print(f"[SCAN] Found (fallback): {json_files[0].name} in {dirname}/")
+                logger.debug("[SCAN] Found (fallback): %s in %s/", json_files[0].name, dirname)
                 if self.import_from_json(json_files[0]):
                     newly_imported += 1
             else:
-                print(f"[SCAN] WARNING: No JSON found in {dirname}/")
+                logger.warning("[SCAN] No JSON found in %s/", dirname)
 
-        print(f"[SCAN] Folder scan complete: found={total_found}, imported={newly_imported}")
+        logger.info("[SCAN] Folder scan complete: found=%d, imported=%d", total_found, newly_imported)
         return (total_found, newly_imported)
 
     def _scan_versions_folder(self, versions_dir: Path) -> Tuple[int, int]:
@@ -484,6 +562,7 @@ class LibraryScanner:
         """
         total_found = 0
         newly_imported = 0
+        directory_cache = get_directory_cache()
 
         # _versions/{animation_name}/
         for animation_folder in versions_dir.iterdir():
@@ -497,36 +576,45 @@ class LibraryScanner:
                 if not version_folder.is_dir():
                     continue
 
+                if not self._scan_step(animation_name):
+                    break
                 total_found += 1
 
                 # Try {animation_name}.json
                 json_file = version_folder / f"{animation_name}.json"
-                if json_file.exists():
+                if directory_cache.exists(json_file):
                     if self.import_from_json(json_file):
                         newly_imported += 1
                     continue
 
                 # Try any .json file
-                json_files = list(version_folder.glob("*.json"))
+                json_files = directory_cache.glob(version_folder, "*.json")
                 if json_files:
                     if self.import_from_json(json_files[0]):
                         newly_imported += 1
 
         return (total_found, newly_imported)
 
-    def sync_library(self, library_path: Path) -> Tuple[int, int]:
+    def sync_library(
+        self,
+        library_path: Path,
+        progress_callback=None,
+        cancel_token=None
+    ) -> Tuple[int, int]:
         """
         Sync library with database.
 
         Args:
             library_path: Path to animation library
+            progress_callback: Optional callback(current, total, message)
+            cancel_token: Optional CancellationToken
 
         Returns:
             Tuple of (total_found, newly_imported)
         """
         if not library_path:
             return (0, 0)
-        return self.scan_folder(library_path)
+        return self.scan_folder(library_path, progress_callback, cancel_token)
 
     def get_all_metadata(self) -> Dict[str, Dict[str, Any]]:
         """
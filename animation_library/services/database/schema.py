@@ -14,7 +14,7 @@ from .connection import DatabaseConnection
 
 
 # Current schema version
-SCHEMA_VERSION = 11
+SCHEMA_VERSION = 13
 
 # Feature descriptions for each version upgrade
 VERSION_FEATURES: Dict[int, List[str]] = {
@@ -28,8 +28,59 @@ VERSION_FEATURES: Dict[int, List[str]] = {
     9: ["Studio naming engine (naming_fields, naming_template)"],
     10: ["Frame-specific review notes for dailies"],
     11: ["Human-readable folder structure"],
+    12: ["Faster folder hierarchy", "Folder animation counts"],
+    13: ["Version group summaries (faster version badges and history)"],
 }
 
+# version_groups columns, in the order _version_group_summary() selects them
+_VERSION_GROUP_COLUMNS = (
+    'version_group_id, latest_uuid, version_count, max_version, newest_date, version_labels'
+)
+
+
+def _version_group_summary(group: str) -> str:
+    """
+    SQL select list computing one version_groups row from animations.
+
+    Args:
+        group: SQL expression for the version group ID (e.g. 'NEW.version_group_id')
+
+    Returns:
+        Select list matching _VERSION_GROUP_COLUMNS
+    """
+    # IFNULL(is_latest, 1) treats NULL as latest (like the grid) and keeps
+    # SQLite on idx_animations_version_group rather than idx_animations_is_latest
+    return f'''
+        {group},
+        (SELECT uuid FROM animations
+         WHERE version_group_id = {group} AND IFNULL(is_latest, 1) = 1
+         ORDER BY version DESC LIMIT 1),
+        (SELECT COUNT(*) FROM animations WHERE version_group_id = {group}),
+        (SELECT IFNULL(MAX(version), 0) FROM animations WHERE version_group_id = {group}),
+        (SELECT MAX(created_date) FROM animations WHERE version_group_id = {group}),
+        (SELECT json_group_array(version_label) FROM (
+            SELECT version_label FROM animations
+            WHERE version_group_id = {group} ORDER BY version))
+    '''
+
+
+def _refresh_version_group(group: str) -> str:
+    """
+    Trigger statements recomputing (or dropping) one version_groups row.
+
+    Args:
+        group: SQL expression for the version group ID
+
+    Returns:
+        SQL statements for a trigger body
+    """
+    return f'''
+        DELETE FROM version_groups WHERE version_group_id = {group};
+        INSERT INTO version_groups ({_VERSION_GROUP_COLUMNS})
+        SELECT {_version_group_summary(group)}
+        WHERE EXISTS (SELECT 1 FROM animations WHERE version_group_id = {group});
+    '''
+
 
 class SchemaManager:
     """
@@ -99,6 +150,10 @@ class SchemaManager:
                     self._migrate_to_v10(cursor)
                 if current_version < 11:
                     self._migrate_to_v11(cursor)
+                if current_version < 12:
+                    self._migrate_to_v12(cursor)
+                if current_version < 13:
+                    self._migrate_to_v13(cursor)
                 cursor.execute(
                     'INSERT OR REPLACE INTO schema_version (version) VALUES (?)',
                     (SCHEMA_VERSION,)
@@ -115,6 +170,7 @@ class SchemaManager:
                 parent_id INTEGER,
                 path TEXT UNIQUE,
                 description TEXT,
+                animation_count INTEGER DEFAULT 0,
                 created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 modified_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (parent_id) REFERENCES folders (id) ON DELETE CASCADE
@@ -204,8 +260,8 @@ class SchemaManager:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_animations_last_viewed ON animations(last_viewed_date)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_animations_custom_order ON animations(custom_order)')
 
-        # v5 indexes (versioning)
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_animations_version_group ON animations(version_group_id)')
+        # v5 indexes (versioning) - (group, version) since v13 so history needs no sort
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_animations_version_group ON animations(version_group_id, version)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_animations_is_latest ON animations(is_latest)')
 
         # Archive table (v4) - for soft-deleted animations (indefinite retention)
@@ -272,6 +328,12 @@ class SchemaManager:
 
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_review_notes_animation ON review_notes(animation_uuid)')
 
+        # Folder hierarchy index and animation count triggers (v12)
+        self._create_folder_hierarchy(cursor)
+
+        # Version group summary table and triggers (v13)
+        self._create_version_groups(cursor)
+
         # Create root folder if it doesn't exist
         cursor.execute('SELECT id FROM folders WHERE parent_id IS NULL LIMIT 1')
         if not cursor.fetchone():
@@ -503,6 +565,148 @@ class SchemaManager:
         # No schema changes needed - just version bump
         pass
 
+    def _migrate_to_v12(self, cursor: sqlite3.Cursor):
+        """Migrate database from v11 to v12 - folder hierarchy index and animation counts."""
+        try:
+            cursor.execute('ALTER TABLE folders ADD COLUMN animation_count INTEGER DEFAULT 0')
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" not in str(e).lower():
+                raise
+
+        self._create_folder_hierarchy(cursor)
+
+        # Backfill counts (triggers keep them current from here on)
+        cursor.execute('''
+            UPDATE folders SET animation_count = (
+                SELECT COUNT(*) FROM animations a
+                WHERE a.folder_id = folders.id AND (a.is_latest = 1 OR a.is_latest IS NULL)
+            )
+        ''')
+
+    def _migrate_to_v13(self, cursor: sqlite3.Cursor):
+        """Migrate database from v12 to v13 - version group summary table."""
+        # Widen the group index so history is read in version order
+        cursor.execute('DROP INDEX IF EXISTS idx_animations_version_group')
+        cursor.execute('CREATE INDEX idx_animations_version_group ON animations(version_group_id, version)')
+
+        self._create_version_groups(cursor)
+
+        # Backfill (triggers keep the summaries current from here on)
+        cursor.execute('DELETE FROM version_groups')
+        cursor.execute(f'''
+            INSERT INTO version_groups ({_VERSION_GROUP_COLUMNS})
+            SELECT {_version_group_summary('g.version_group_id')}
+            FROM (SELECT DISTINCT version_group_id FROM animations
+                  WHERE version_group_id IS NOT NULL) g
+        ''')
+
+    def _create_folder_hierarchy(self, cursor: sqlite3.Cursor):
+        """
+        Create folder hierarchy indexes and animation count triggers.
+
+        Subtree queries are range scans on idx_folders_path; child lookups
+        use idx_folders_parent. folders.animation_count follows inserts,
+        deletes, moves and version changes of animations (latest versions
+        only, matching what the grid shows).
+        """
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_folders_parent ON folders(parent_id)')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_folder_count_insert
+            AFTER INSERT ON animations
+            WHEN NEW.is_latest = 1 OR NEW.is_latest IS NULL
+            BEGIN
+                UPDATE folders SET animation_count = animation_count + 1 WHERE id = NEW.folder_id;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_folder_count_delete
+            AFTER DELETE ON animations
+            WHEN OLD.is_latest = 1 OR OLD.is_latest IS NULL
+            BEGIN
+                UPDATE folders SET animation_count = animation_count - 1 WHERE id = OLD.folder_id;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_folder_count_update
+            AFTER UPDATE OF folder_id, is_latest ON animations
+            BEGIN
+                UPDATE folders SET animation_count = animation_count - 1
+                WHERE id = OLD.folder_id AND (OLD.is_latest = 1 OR OLD.is_latest IS NULL);
+                UPDATE folders SET animation_count = animation_count + 1
+                WHERE id = NEW.folder_id AND (NEW.is_latest = 1 OR NEW.is_latest IS NULL);
+            END
+        ''')
+
+    def _create_version_groups(self, cursor: sqlite3.Cursor):
+        """
+        Create the version_groups summary table and its triggers.
+
+        One row per version group: latest version's UUID, version count,
+        highest version number, newest created date and the labels in
+        version order. Any insert, delete or version change of an
+        animation recomputes its group from idx_animations_version_group,
+        so reading a group's summary is a single primary key lookup.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS version_groups (
+                version_group_id TEXT PRIMARY KEY,
+                latest_uuid TEXT,
+                version_count INTEGER NOT NULL DEFAULT 0,
+                max_version INTEGER NOT NULL DEFAULT 0,
+                newest_date TIMESTAMP,
+                version_labels TEXT         -- JSON: ["v001", "v002", ...]
+            )
+        ''')
+
+        # Badge lookups only need groups with more than one version
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_version_groups_versioned
+            ON version_groups(version_count) WHERE version_count > 1
+        ''')
+
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_version_groups_insert
+            AFTER INSERT ON animations
+            WHEN NEW.version_group_id IS NOT NULL
+            BEGIN
+                {_refresh_version_group('NEW.version_group_id')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_version_groups_delete
+            AFTER DELETE ON animations
+            WHEN OLD.version_group_id IS NOT NULL
+            BEGIN
+                {_refresh_version_group('OLD.version_group_id')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_version_groups_update
+            AFTER UPDATE OF uuid, version_group_id, version, version_label, is_latest, created_date
+            ON animations
+            WHEN NEW.version_group_id IS NOT NULL AND (
+                OLD.uuid IS NOT NEW.uuid
+                OR OLD.version_group_id IS NOT NEW.version_group_id
+                OR OLD.version IS NOT NEW.version
+                OR OLD.version_label IS NOT NEW.version_label
+                OR OLD.is_latest IS NOT NEW.is_latest
+                OR OLD.created_date IS NOT NEW.created_date
+            )
+            BEGIN
+                {_refresh_version_group('NEW.version_group_id')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_version_groups_regroup
+            AFTER UPDATE OF version_group_id ON animations
+            WHEN OLD.version_group_id IS NOT NULL
+                AND OLD.version_group_id IS NOT NEW.version_group_id
+            BEGIN
+                {_refresh_version_group('OLD.version_group_id')}
+            END
+        ''')
+
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get database statistics for status display.
@@ -43,23 +43,35 @@ class TrashRepository:
         """
         try:
             with self._conn.transaction() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO trash (
-                        uuid, name, trash_folder_path, thumbnail_path,
-                        trashed_date, archived_date
-                    ) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
-                ''', (
-                    trash_data.get('uuid'),
-                    trash_data.get('name'),
-                    trash_data.get('trash_folder_path'),
-                    trash_data.get('thumbnail_path'),
-                    trash_data.get('archived_date')
-                ))
-                return cursor.lastrowid
+                return self.insert(conn.cursor(), trash_data)
         except Exception:
             return None
 
+    def insert(self, cursor, trash_data: Dict[str, Any]) -> int:
+        """
+        Insert a trash row inside the caller's transaction.
+
+        Args:
+            cursor: Cursor of an open transaction
+            trash_data: Same keys as add()
+
+        Returns:
+            Record ID
+        """
+        cursor.execute('''
+            INSERT INTO trash (
+                uuid, name, trash_folder_path, thumbnail_path,
+                trashed_date, archived_date
+            ) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+        ''', (
+            trash_data.get('uuid'),
+            trash_data.get('name'),
+            trash_data.get('trash_folder_path'),
+            trash_data.get('thumbnail_path'),
+            trash_data.get('archived_date')
+        ))
+        return cursor.lastrowid
+
     def get_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
         """
         Get trash item by UUID.
@@ -111,6 +123,20 @@ class TrashRepository:
         except Exception:
             return False
 
+    def delete_many(self, cursor, uuids: List[str]) -> int:
+        """
+        Remove items from the trash table inside the caller's transaction.
+
+        Args:
+            cursor: Cursor of an open transaction
+            uuids: Animation UUIDs
+
+        Returns:
+            Number of rows removed
+        """
+        cursor.executemany('DELETE FROM trash WHERE uuid = ?', [(uuid,) for uuid in uuids])
+        return cursor.rowcount
+
     def get_count(self) -> int:
         """
         Get number of items in trash.
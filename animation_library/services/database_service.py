@@ -14,6 +14,9 @@ from typing import List, Dict, Optional, Any, Tuple
 from contextlib import contextmanager
 
 from ..config import Config
+from ..protocol.constants import FILE_JOURNAL_DIR_NAME
+from ..protocol.file_journal import FileJournal
+from .directory_cache import get_directory_cache
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +125,13 @@ class DatabaseService:
         # Initialize library scanner
         self._scanner = LibraryScanner(self._connection, self.animations, self.folders)
 
+        # Write-ahead journal for multi-file moves (next to the database in .meta)
+        self._journal = FileJournal(
+            self.db_path.parent / FILE_JOURNAL_DIR_NAME,
+            on_path_changed=get_directory_cache().invalidate_tree
+        )
+        self.recover_file_operations()
+
         # Legacy attribute for backwards compatibility
         self.local = self._connection._local
 
@@ -168,6 +178,22 @@ class DatabaseService:
         """Get all descendant folder IDs (recursive)."""
         return self.folders.get_descendants(folder_id)
 
+    def get_folder_ancestors(self, folder_id: int) -> List[int]:
+        """Get ancestor folder IDs, root first."""
+        return self.folders.get_ancestors(folder_id)
+
+    def is_folder_descendant(self, folder_id: int, ancestor_id: int) -> bool:
+        """Check if a folder is inside another folder's subtree."""
+        return self.folders.is_descendant(folder_id, ancestor_id)
+
+    def get_folder_animation_counts(self) -> Dict[int, int]:
+        """Get the number of animations directly in each folder."""
+        return self.folders.get_animation_counts()
+
+    def get_folder_subtree_animation_count(self, folder_id: int) -> int:
+        """Get the number of animations in a folder and all its subfolders."""
+        return self.folders.get_subtree_animation_count(folder_id)
+
     def delete_folder(self, folder_id: int) -> bool:
         """Delete folder (and all contained animations via CASCADE)."""
         return self.folders.delete(folder_id)
@@ -198,9 +224,10 @@ class DatabaseService:
         """Get animation by database ID."""
         return self.animations.get_by_id(animation_id)
 
-    def get_all_animations(self, folder_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get all animations, optionally filtered by folder."""
-        return self.animations.get_all(folder_id)
+    def get_all_animations(self, folder_id: Optional[int] = None,
+                           limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get all animations, optionally filtered by folder and capped at limit rows."""
+        return self.animations.get_all(folder_id, limit=limit)
 
     def update_animation(self, uuid: str, updates: Dict[str, Any]) -> bool:
         """Update animation metadata.
@@ -272,7 +299,10 @@ class DatabaseService:
         1. Renames the folder on disk (if base name changes)
         2. Renames all files inside (.blend, .json, .webm, .png)
         3. Updates database with new name and file paths
-        4. Rolls back file changes if database update fails
+        4. Rolls back file changes if any step fails
+
+        All steps run as one journaled operation, so a crash part-way is
+        finished or undone by recover_file_operations() on next start.
 
         Args:
             uuid: Animation UUID
@@ -284,8 +314,6 @@ class DatabaseService:
             True if successful
         """
         import re
-        import json
-        import time
 
         animation = self.get_animation_by_uuid(uuid)
         if not animation:
@@ -330,150 +358,112 @@ class DatabaseService:
         safe_old = sanitize(old_name)
         safe_new = sanitize(new_name)
 
-        # Helper to rename with retry (handles file lock delays)
-        def rename_with_retry(src: Path, dst: Path, max_retries: int = 3, delay: float = 0.2):
-            for attempt in range(max_retries):
-                try:
-                    src.rename(dst)
-                    return True
-                except PermissionError:
-                    if attempt < max_retries - 1:
-                        time.sleep(delay)
-                    else:
-                        raise
-            return False
-
-        # Track completed operations for rollback
-        completed_renames = []  # List of (new_path, old_path) tuples for rollback
-        folder_renamed = False
-        original_folder = old_folder
-
-        try:
-            # Handle folder rename if base name changed
-            if old_base != new_base:
-                if new_folder.exists():
-                    # Conflict - append number to avoid overwrite
-                    counter = 2
-                    while (parent / f"{new_base}_{counter}").exists():
-                        counter += 1
-                    new_folder = parent / f"{new_base}_{counter}"
-
-                # Rename folder with retry
-                rename_with_retry(old_folder, new_folder)
-                folder_renamed = True
-            else:
-                # Base name same, folder stays the same
-                new_folder = old_folder
-
-            # Rename files inside the folder
-            new_paths = {}
-            for ext, key in [('.blend', 'blend_file_path'), ('.json', 'json_file_path'),
-                             ('.webm', 'preview_path'), ('.png', 'thumbnail_path')]:
-                old_file = new_folder / f"{safe_old}{ext}"
-                new_file = new_folder / f"{safe_new}{ext}"
-                if old_file.exists() and old_file != new_file:
-                    rename_with_retry(old_file, new_file)
-                    completed_renames.append((new_file, old_file))
-                new_paths[key] = str(new_file)
-
-            # Update JSON file content with new name (atomic write)
-            json_path = Path(new_paths.get('json_file_path', ''))
-            original_json_content = None
-            if json_path.exists():
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        original_json_content = f.read()
-                        json_data = json.loads(original_json_content)
-                    json_data['name'] = new_name
-                    if naming_fields:
-                        json_data['naming_fields'] = naming_fields
-                    if naming_template:
-                        json_data['naming_template'] = naming_template
-                    # Use atomic write to prevent corruption
-                    _atomic_json_write(json_path, json_data)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON in {json_path}: {e}")
-                except IOError as e:
-                    logger.warning(f"Could not update JSON content in {json_path}: {e}")
-
-            # Update database with new name and paths
-            updates = {'name': new_name, **new_paths}
+        # Build the operation: folder rename, file renames inside the
+        # (renamed) folder, then the JSON name update at its final path
+        steps = []
+        if old_base != new_base:
+            if new_folder.exists():
+                # Conflict - append number to avoid overwrite
+                counter = 2
+                while (parent / f"{new_base}_{counter}").exists():
+                    counter += 1
+                new_folder = parent / f"{new_base}_{counter}"
+            steps.append(FileJournal.rename(old_folder, new_folder))
+        else:
+            # Base name same, folder stays the same
+            new_folder = old_folder
+
+        new_paths = {}
+        for ext, key in [('.blend', 'blend_file_path'), ('.json', 'json_file_path'),
+                         ('.webm', 'preview_path'), ('.png', 'thumbnail_path')]:
+            old_file = new_folder / f"{safe_old}{ext}"
+            new_file = new_folder / f"{safe_new}{ext}"
+            if (old_folder / old_file.name).exists() and old_file != new_file:
+                steps.append(FileJournal.rename(old_file, new_file))
+            new_paths[key] = str(new_file)
+
+        current_json = old_folder / f"{safe_old}.json"
+        if current_json.exists():
+            json_values = {'name': new_name}
             if naming_fields:
-                updates['naming_fields'] = json.dumps(naming_fields)
+                json_values['naming_fields'] = naming_fields
             if naming_template:
-                updates['naming_template'] = naming_template
+                json_values['naming_template'] = naming_template
+            try:
+                steps.append(FileJournal.update_json(
+                    new_paths['json_file_path'], json_values, current_path=current_json
+                ))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not update JSON content in {current_json}: {e}")
+
+        # Database update, applied in the same journaled operation
+        updates = {'name': new_name, **new_paths}
+        if naming_fields:
+            updates['naming_fields'] = json.dumps(naming_fields)
+        if naming_template:
+            updates['naming_template'] = naming_template
+        previous = {key: animation.get(key) for key in updates}
+
+        return self._journal.run(
+            'rename_animation', steps,
+            db={'animations': {uuid: updates}},
+            db_undo={'animations': {uuid: previous}},
+            apply_db=self._apply_journaled_updates
+        )
 
-            db_success = self.animations.update(uuid, updates)
+    # ==================== FILE OPERATION JOURNAL ====================
 
-            if not db_success:
-                # Database update failed - rollback file operations
-                logger.error("Database update failed, rolling back file renames")
-                self._rollback_renames(
-                    completed_renames, folder_renamed, new_folder, original_folder,
-                    json_path, original_json_content
-                )
-                return False
+    # Columns a journal payload may set (intent files are plain JSON on disk)
+    _JOURNAL_COLUMNS = frozenset({
+        'name', 'blend_file_path', 'json_file_path', 'preview_path',
+        'thumbnail_path', 'naming_fields', 'naming_template', 'is_latest',
+    })
 
-            return True
+    def _apply_journaled_updates(self, payload: Dict[str, Any]):
+        """
+        Apply a journal database payload in one transaction.
 
-        except PermissionError as e:
-            logger.error(f"Permission denied during rename: {e}")
-            self._rollback_renames(
-                completed_renames, folder_renamed, new_folder, original_folder,
-                None, None
-            )
-            return False
-        except OSError as e:
-            logger.error(f"File operation failed during rename: {e}")
-            self._rollback_renames(
-                completed_renames, folder_renamed, new_folder, original_folder,
-                None, None
-            )
-            return False
-        except Exception as e:
-            logger.error(f"Rename animation failed: {e}")
-            self._rollback_renames(
-                completed_renames, folder_renamed, new_folder, original_folder,
-                None, None
-            )
-            return False
+        Args:
+            payload: {'animations': {uuid: {column: value}}}
 
-    def _rollback_renames(self, completed_renames: list, folder_renamed: bool,
-                          new_folder: Path, original_folder: Path,
-                          json_path: Optional[Path], original_json_content: Optional[str]):
+        Raises:
+            ValueError: Payload names a column that journals may not set
+            sqlite3.Error: Database update failed (nothing was changed)
         """
-        Rollback file rename operations after a failure.
+        from datetime import datetime  # Local import, only needed here
 
-        Args:
-            completed_renames: List of (new_path, old_path) tuples to reverse
-            folder_renamed: Whether the folder was renamed
-            new_folder: The new folder path (to rename back)
-            original_folder: The original folder path
-            json_path: Path to JSON file if content was modified
-            original_json_content: Original JSON content to restore
-        """
-        # Restore JSON content first (before file renames)
-        if json_path and original_json_content:
-            try:
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    f.write(original_json_content)
-            except Exception as e:
-                logger.warning(f"Failed to restore JSON content: {e}")
+        with self._connection.transaction() as conn:
+            cursor = conn.cursor()
+            for uuid, updates in payload.get('animations', {}).items():
+                unknown = set(updates) - self._JOURNAL_COLUMNS
+                if unknown:
+                    raise ValueError(f"Journal payload sets unknown columns: {sorted(unknown)}")
+                values = {**updates, 'modified_date': datetime.now()}
+                set_clause = ', '.join(f"{key} = ?" for key in values)
+                cursor.execute(
+                    f'UPDATE animations SET {set_clause} WHERE uuid = ?',
+                    [*values.values(), uuid]
+                )
 
-        # Reverse file renames (in reverse order)
-        for new_path, old_path in reversed(completed_renames):
-            try:
-                if new_path.exists():
-                    new_path.rename(old_path)
-            except Exception as e:
-                logger.warning(f"Failed to rollback rename {new_path} -> {old_path}: {e}")
+    def recover_file_operations(self) -> Dict[str, int]:
+        """
+        Finish or undo file operations interrupted by a crash.
 
-        # Reverse folder rename
-        if folder_renamed and new_folder.exists():
-            try:
-                new_folder.rename(original_folder)
-            except Exception as e:
-                logger.warning(f"Failed to rollback folder rename: {e}")
+        Runs at startup and whenever Blender may have left an operation
+        behind (notifications, library change sets). Only the pending
+        journal entries are read, so the cost does not depend on library
+        size and no sync_library() is needed to repair half-moved folders.
+
+        Returns:
+            Dict with 'completed', 'rolled_back', 'skipped' and 'failed' counts
+        """
+        counts = self._journal.recover(apply_db=self._apply_journaled_updates)
+        if counts['completed'] or counts['rolled_back'] or counts['failed']:
+            logger.info(
+                "File journal recovery: %d completed, %d rolled back, %d unresolved",
+                counts['completed'], counts['rolled_back'], counts['failed']
+            )
+        return counts
 
     def delete_animation(self, uuid: str) -> bool:
         """Delete animation by UUID."""
@@ -619,6 +609,14 @@ class DatabaseService:
         """Get count of versions in a version group."""
         return self.animations.get_version_count(version_group_id)
 
+    def get_version_summary(self, version_group_id: str) -> Optional[Dict[str, Any]]:
+        """Get the maintained summary of a version group (one indexed lookup)."""
+        return self.animations.get_version_summary(version_group_id)
+
+    def get_versioned_groups(self) -> Dict[str, Dict[str, Any]]:
+        """Get summaries of all version groups with more than one version."""
+        return self.animations.get_versioned_groups()
+
     def get_latest_version(self, version_group_id: str) -> Optional[Dict[str, Any]]:
         """Get the latest version in a version group."""
         return self.animations.get_latest_version(version_group_id)
@@ -746,6 +744,125 @@ class DatabaseService:
         """Check if a UUID exists in trash."""
         return self.trash.exists(uuid)
 
+    # ==================== BATCH ARCHIVE / TRASH MOVES ====================
+    #
+    # Each moves a set of records between tables with one commit. Every item
+    # runs in its own savepoint, so a record that cannot be moved (e.g. its
+    # UUID already exists in the destination table) is skipped and reported
+    # without undoing the rest of the batch. Callers roll back the file moves
+    # of the failed items, or of all items if None is returned.
+
+    def _move_records(self, label: str, rows: List[Dict[str, Any]], removed_uuids: List[str],
+                      insert, delete_many) -> Optional[Dict[str, str]]:
+        """
+        Insert destination records and delete source records, item by item.
+
+        Args:
+            label: Operation name for logs
+            rows: Destination records (keyed by their 'uuid')
+            removed_uuids: Source records to delete (one item per UUID)
+            insert: Repository insert(cursor, row)
+            delete_many: Repository delete_many(cursor, uuids)
+
+        Returns:
+            Dict of UUID -> error for items that were skipped (empty if all
+            moved), or None if the transaction could not be committed
+        """
+        rows_by_uuid = {row['uuid']: row for row in rows}
+        failed = {}
+        try:
+            with self._connection.transaction() as conn:
+                cursor = conn.cursor()
+                if not conn.in_transaction:
+                    cursor.execute('BEGIN')
+                for uuid in removed_uuids:
+                    cursor.execute('SAVEPOINT batch_item')
+                    try:
+                        row = rows_by_uuid.get(uuid)
+                        if row is not None:
+                            insert(cursor, row)
+                        delete_many(cursor, [uuid])
+                    except Exception as e:
+                        cursor.execute('ROLLBACK TO batch_item')
+                        failed[uuid] = str(e)
+                    cursor.execute('RELEASE batch_item')
+        except Exception as e:
+            logger.error(f"{label} failed: {e}")
+            return None
+
+        for uuid, error in failed.items():
+            logger.warning(f"{label}: skipped {uuid}: {error}")
+        return failed
+
+    def archive_animations(self, archive_rows: List[Dict[str, Any]],
+                           removed_uuids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Add archive records and remove animations in one transaction.
+
+        Args:
+            archive_rows: Archive records (see add_to_archive)
+            removed_uuids: Animations to remove from the library (archived
+                ones plus any dropped because their files were missing)
+
+        Returns:
+            Dict of UUID -> error for skipped items, or None if nothing was committed
+        """
+        return self._move_records(
+            "Batch archive", archive_rows, removed_uuids,
+            self.archive.insert, self.animations.delete_many
+        )
+
+    def restore_archived_animations(self, animation_rows: List[Dict[str, Any]],
+                                    removed_uuids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Add animations back to the library and remove archive records in one transaction.
+
+        Args:
+            animation_rows: Animation records (see add_animation)
+            removed_uuids: Archive records to remove
+
+        Returns:
+            Dict of UUID -> error for skipped items, or None if nothing was committed
+        """
+        return self._move_records(
+            "Batch restore from archive", animation_rows, removed_uuids,
+            self.animations.insert, self.archive.delete_many
+        )
+
+    def trash_archived_animations(self, trash_rows: List[Dict[str, Any]],
+                                  removed_uuids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Add trash records and remove archive records in one transaction.
+
+        Args:
+            trash_rows: Trash records (see add_to_trash)
+            removed_uuids: Archive records to remove
+
+        Returns:
+            Dict of UUID -> error for skipped items, or None if nothing was committed
+        """
+        return self._move_records(
+            "Batch move to trash", trash_rows, removed_uuids,
+            self.trash.insert, self.archive.delete_many
+        )
+
+    def restore_trashed_animations(self, archive_rows: List[Dict[str, Any]],
+                                   removed_uuids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Add archive records and remove trash records in one transaction.
+
+        Args:
+            archive_rows: Archive records (see add_to_archive)
+            removed_uuids: Trash records to remove
+
+        Returns:
+            Dict of UUID -> error for skipped items, or None if nothing was committed
+        """
+        return self._move_records(
+            "Batch restore from trash", archive_rows, removed_uuids,
+            self.archive.insert, self.trash.delete_many
+        )
+
     # ==================== LIBRARY SCANNING (delegated) ====================
 
     def import_animation_from_json(self, json_file_path: Path) -> bool:
@@ -756,12 +873,23 @@ class DatabaseService:
         """Scan library folder for animations and import them."""
         return self._scanner.scan_folder(library_path)
 
-    def sync_library(self) -> Tuple[int, int]:
-        """Sync library with database (scan configured library path)."""
+    def sync_library(self, progress_callback=None, cancel_token=None) -> Tuple[int, int]:
+        """Sync library with database (scan configured library path).
+
+        Args:
+            progress_callback: Optional callback(current, total, message)
+            cancel_token: Optional CancellationToken; a cancelled sync keeps
+                what it imported and skips the follow-up fixes
+
+        Returns:
+            Tuple of (total_found, newly_imported)
+        """
         library_path = Config.load_library_path()
         if not library_path:
             return (0, 0)
-        result = self._scanner.sync_library(library_path)
+        result = self._scanner.sync_library(library_path, progress_callback, cancel_token)
+        if cancel_token is not None and cancel_token.is_cancelled:
+            return result
 
         # Fix pose flags for existing animations (in case they were imported before is_pose was added)
         self.fix_pose_flags()
@@ -771,6 +899,110 @@ class DatabaseService:
 
         return result
 
+    def import_captured_animation(
+        self,
+        uuid: str,
+        json_file_path: Optional[str],
+        version_group_id: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """
+        Import or refresh exactly one animation after a capture notification.
+
+        Does for a single asset what sync_library() does for the whole
+        library: import the JSON, clear is_latest on older versions of the
+        group and fix the pose flag. Only indexed single-row queries are
+        used, so the cost does not depend on library size.
+
+        Args:
+            uuid: UUID of the captured animation
+            json_file_path: Path to the animation's JSON file
+            version_group_id: Version group of the capture (read from the
+                JSON file when not given)
+
+        Returns:
+            Tuple of (animation dict or None, UUIDs of versions it superseded).
+            None means the targeted import was not possible and the caller
+            should fall back to a full sync.
+        """
+        if not uuid or not json_file_path:
+            return None, []
+
+        json_path = Path(json_file_path)
+        if not json_path.is_file():
+            return None, []
+
+        # Remember the current latest version so the caller can drop its card
+        superseded = []
+        if not version_group_id:
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    version_group_id = json.load(f).get('version_group_id')
+            except (OSError, ValueError):
+                version_group_id = None
+        if version_group_id:
+            previous = self.animations.get_latest_version(version_group_id)
+            if previous and previous.get('uuid') != uuid:
+                superseded.append(previous['uuid'])
+
+        self._scanner.import_from_json(json_path)
+        self.animations.fix_pose_flags(uuid)
+
+        animation = self.get_animation_by_uuid(uuid)
+        if animation is None:
+            return None, []
+        if not animation.get('is_latest', 1):
+            superseded = []  # Cold storage version - the latest card stays
+        return animation, superseded
+
+    def import_library_folders(
+        self,
+        folders: List[Path],
+        cancel_token=None
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Import or refresh the animations in specific folders.
+
+        The targeted counterpart of sync_library() for library watcher
+        change sets: each folder goes through import_captured_animation(),
+        so the cost scales with the number of changed folders rather than
+        the size of the library.
+
+        Args:
+            folders: Added or modified animation folders
+            cancel_token: Optional CancellationToken, checked per folder
+
+        Returns:
+            Tuple of (imported/refreshed animation dicts, UUIDs of versions
+            they superseded)
+        """
+        animations = []
+        superseded = []
+        for folder in folders:
+            if cancel_token is not None and cancel_token.is_cancelled:
+                break
+            json_path = self._scanner.find_animation_json(folder)
+            if json_path is None:
+                continue  # Still being written, or not an animation folder
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Skipping {json_path}: {e}")
+                continue
+            animation, replaced = self.import_captured_animation(
+                data.get('uuid') or data.get('id'),
+                str(json_path),
+                data.get('version_group_id')
+            )
+            if animation is not None:
+                animations.append(animation)
+                superseded.extend(replaced)
+        return animations, superseded
+
+    def get_animation_uuids_in_folders(self, folders: List[Path]) -> List[str]:
+        """Get animations whose files are stored in any of the given folders."""
+        return self.animations.get_uuids_in_folders(folders)
+
     def fix_pose_flags(self) -> int:
         """Fix is_pose flag for animations that should be poses (frame_count = 1)."""
         return self.animations.fix_pose_flags()
@@ -796,11 +1028,13 @@ class DatabaseService:
         2. Moves them to library/actions/{name}/ or library/poses/{name}/
         3. Updates database paths
 
+        Each move is one journaled operation (folder rename + database
+        paths), so an interrupted migration never leaves rows pointing at
+        a folder that moved.
+
         Returns:
             Number of animations migrated
         """
-        import shutil
-
         migrated_count = 0
 
         try:
@@ -853,42 +1087,38 @@ class DatabaseService:
             if target_folder.exists():
                 continue
 
-            try:
-                # Move the folder
-                shutil.move(str(current_folder), str(target_folder))
-
-                # Update database paths
-                self._update_animation_paths_after_move(anim['uuid'], target_folder)
-                migrated_count += 1
-                logger.info(f"Moved {current_folder.name} to {'poses' if is_pose else 'actions'}/")
-
-            except PermissionError as e:
-                logger.warning(f"Permission denied migrating {current_folder.name}: {e}")
-                continue
-            except OSError as e:
-                logger.warning(f"Failed to migrate {current_folder.name}: {e}")
+            # Move the folder and update database paths together
+            new_paths = self._animation_paths_in_folder(anim, target_folder)
+            moved = self._journal.run(
+                'migrate_folder',
+                [FileJournal.rename(current_folder, target_folder)],
+                db={'animations': {anim['uuid']: new_paths}},
+                db_undo={'animations': {anim['uuid']: {key: anim.get(key) for key in new_paths}}},
+                apply_db=self._apply_journaled_updates
+            )
+            if not moved:
+                logger.warning(f"Failed to migrate {current_folder.name}")
                 continue
 
+            migrated_count += 1
+            logger.info(f"Moved {current_folder.name} to {'poses' if is_pose else 'actions'}/")
+
         if migrated_count > 0:
             logger.info(f"Migrated {migrated_count} animations to new folder structure")
 
         return migrated_count
 
-    def _update_animation_paths_after_move(self, uuid: str, new_folder: Path) -> bool:
+    def _animation_paths_in_folder(self, animation: Dict[str, Any], new_folder: Path) -> Dict[str, str]:
         """
-        Update database paths after moving an animation folder.
+        Compute an animation's file paths after moving its folder.
 
         Args:
-            uuid: Animation UUID
+            animation: Animation data dict
             new_folder: New folder path
 
         Returns:
-            True if successful
+            Dict of path columns to new values
         """
-        animation = self.get_animation_by_uuid(uuid)
-        if not animation:
-            return False
-
         name = animation.get('name', '')
         import re
         safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
@@ -903,7 +1133,7 @@ class DatabaseService:
             'thumbnail_path': str(new_folder / f"{safe_name}.png"),
         }
 
-        return self.animations.update(uuid, new_paths)
+        return new_paths
 
     def get_database_stats(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,260 @@
+"""
+DirectoryCache - Cached folder listings for path resolution
+
+Pattern: Module-level singleton
+Features:
+- One scandir per folder answers every exists()/glob() lookup inside it,
+  so resolving blend/preview/thumbnail paths costs O(folders) filesystem
+  calls instead of O(lookups) - on SMB/NFS each saved call is a round trip
+- Missing folders are cached too (negative entries)
+- Listings are trusted for Config.FS_CACHE_REVALIDATE_SECONDS, then
+  revalidated with a single stat of the folder: unchanged mtime keeps the
+  listing, a changed mtime re-lists it
+- The library watcher and the app's own file operations invalidate the
+  folders they touch, so changes show up without waiting for revalidation
+
+Only answers "which names are in this folder". Anything that needs file
+contents, sizes or a definitive check right before a write should still go
+to the filesystem directly.
+
+Usage:
+    cache = get_directory_cache()
+    if cache.exists(folder / "clip.webm"):
+        ...
+    cache.invalidate(folder)  # after writing into folder
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# A folder modified this close to when it was listed may change again within
+# the same mtime tick (coarse on SMB/FAT), so its mtime is not trusted
+_RACY_MTIME_SECONDS = 2.0
+
+
+class _Listing:
+    """Cached state of one folder (names is None if the folder is missing)"""
+
+    __slots__ = ('names', 'mtime_ns', 'checked_at', 'racy')
+
+    def __init__(self, names: Optional[Dict[str, str]], mtime_ns: Optional[int],
+                 checked_at: float, racy: bool):
+        self.names = names  # normcase(name) -> name, in scandir order
+        self.mtime_ns = mtime_ns
+        self.checked_at = checked_at  # time.monotonic() of the last validation
+        self.racy = racy
+
+
+class DirectoryCache:
+    """
+    Thread-safe LRU of folder listings keyed by normalized folder path
+
+    Lookups may come from the GUI thread (model data roles) and from
+    workers (thumbnail/details loaders, library scan) at the same time.
+    The lock only guards the dict; listing a folder happens outside it.
+    """
+
+    def __init__(self, revalidate_seconds: float = Config.FS_CACHE_REVALIDATE_SECONDS,
+                 max_folders: int = Config.FS_CACHE_MAX_FOLDERS):
+        self._revalidate_seconds = revalidate_seconds
+        self._max_folders = max_folders
+        self._lock = threading.Lock()
+        self._listings: 'OrderedDict[str, _Listing]' = OrderedDict()
+
+        # Performance monitoring (filesystem calls actually made)
+        self.listings: int = 0
+        self.stats: int = 0
+        self.cache_hits: int = 0
+
+    @staticmethod
+    def _key(folder: PathLike) -> str:
+        """Normalize a folder path into a cache key"""
+        return os.path.normcase(os.path.normpath(os.fspath(folder)))
+
+    def _read_folder(self, folder: str) -> _Listing:
+        """List a folder from disk"""
+        now = time.monotonic()
+        try:
+            # stat first: a change made while listing then shows up as a newer mtime
+            st = os.stat(folder)
+            with os.scandir(folder) as entries:
+                names = {os.path.normcase(entry.name): entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            self.listings += 1
+            return _Listing(None, None, now, False)
+        except OSError as e:
+            # Permission/network errors: treat as missing but re-check next time
+            logger.debug("Could not list %s: %s", folder, e)
+            self.listings += 1
+            return _Listing(None, None, now - self._revalidate_seconds, False)
+
+        self.listings += 1
+        racy = time.time() - st.st_mtime < _RACY_MTIME_SECONDS
+        return _Listing(names, st.st_mtime_ns, now, racy)
+
+    def _revalidate(self, folder: str, listing: _Listing) -> Optional[_Listing]:
+        """
+        Check a stale listing with one stat
+
+        Returns:
+            The refreshed listing if it is still valid, None if it must be re-read
+        """
+        if listing.racy:
+            return None
+        self.stats += 1
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns != listing.mtime_ns:
+            return None
+        listing.checked_at = time.monotonic()
+        return listing
+
+    def _get_listing(self, folder: PathLike) -> _Listing:
+        """Get the (valid) listing of a folder, reading it if needed"""
+        key = self._key(folder)
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is not None:
+                self._listings.move_to_end(key)
+
+        if listing is not None:
+            if time.monotonic() - listing.checked_at < self._revalidate_seconds:
+                self.cache_hits += 1
+                return listing
+            if self._revalidate(key, listing) is not None:
+                return listing
+
+        listing = self._read_folder(key)
+        with self._lock:
+            self._listings[key] = listing
+            self._listings.move_to_end(key)
+            while len(self._listings) > self._max_folders:
+                self._listings.popitem(last=False)
+        return listing
+
+    def list_dir(self, folder: PathLike) -> Optional[List[str]]:
+        """
+        Get the names in a folder
+
+        Args:
+            folder: Folder path
+
+        Returns:
+            Entry names in directory order, or None if the folder does not exist
+        """
+        names = self._get_listing(folder).names
+        return None if names is None else list(names.values())
+
+    def is_dir(self, folder: PathLike) -> bool:
+        """
+        Check whether a folder exists
+
+        Args:
+            folder: Folder path
+
+        Returns:
+            True if the folder exists and can be listed
+        """
+        return self._get_listing(folder).names is not None
+
+    def exists(self, path: PathLike) -> bool:
+        """
+        Check whether a file or folder exists (via its parent's listing)
+
+        Args:
+            path: File or folder path
+
+        Returns:
+            True if the parent folder lists the name
+        """
+        parent, name = os.path.split(os.path.normpath(os.fspath(path)))
+        if not name or not parent:
+            # Filesystem root or bare relative name: nothing useful to cache
+            return os.path.exists(path)
+        names = self._get_listing(parent).names
+        return names is not None and os.path.normcase(name) in names
+
+    def glob(self, folder: PathLike, pattern: str) -> List[Path]:
+        """
+        Match a single-level pattern in a folder (like Path.glob('*.png'))
+
+        Args:
+            folder: Folder path
+            pattern: fnmatch pattern for entry names
+
+        Returns:
+            Matching paths in directory order (empty if the folder is missing)
+        """
+        names = self._get_listing(folder).names
+        if not names:
+            return []
+        folder = Path(folder)
+        return [folder / name for name in fnmatch.filter(names.values(), pattern)]
+
+    def invalidate(self, path: PathLike):
+        """
+        Forget a path and its parent folder (after creating, deleting or
+        renaming it)
+
+        Args:
+            path: File or folder that changed
+        """
+        key = self._key(path)
+        parent = os.path.dirname(key)
+        with self._lock:
+            self._listings.pop(key, None)
+            self._listings.pop(parent, None)
+
+    def invalidate_tree(self, path: PathLike):
+        """
+        Forget a folder, everything cached below it, and its parent
+
+        Args:
+            path: Folder whose contents changed (e.g. moved or deleted)
+        """
+        key = self._key(path)
+        prefix = os.path.join(key, '')
+        parent = os.path.dirname(key)
+        with self._lock:
+            for cached in [k for k in self._listings if k == key or k.startswith(prefix)]:
+                del self._listings[cached]
+            self._listings.pop(parent, None)
+
+    def clear(self):
+        """Forget every listing (e.g. when the library path changes)"""
+        with self._lock:
+            self._listings.clear()
+
+
+# Singleton instance
+_directory_cache_instance: Optional[DirectoryCache] = None
+
+
+def get_directory_cache() -> DirectoryCache:
+    """
+    Get global DirectoryCache singleton
+
+    Returns:
+        Global DirectoryCache instance
+    """
+    global _directory_cache_instance
+    if _directory_cache_instance is None:
+        _directory_cache_instance = DirectoryCache()
+    return _directory_cache_instance
+
+
+__all__ = ['DirectoryCache', 'get_directory_cache']
@@ -4,6 +4,7 @@ DrawoverStorage - File storage management for frame annotations
 Handles saving/loading drawover JSON files and PNG cache generation.
 """
 
+import bisect
 import json
 import logging
 import os
@@ -501,6 +502,31 @@ class DrawoverStorage:
             )
             return None
 
+    def render_to_image(
+        self,
+        animation_uuid: str,
+        version: str,
+        frame: int,
+        size: Tuple[int, int]
+    ) -> Optional[QImage]:
+        """
+        Render drawover in memory, without touching the PNG cache.
+
+        Returns:
+            Premultiplied ARGB32 image, or None if no drawover exists
+        """
+        data = self.load_drawover(animation_uuid, version, frame)
+        if not data or not data.get('strokes'):
+            return None
+
+        try:
+            return self._render_strokes_to_image(data, size)
+        except Exception:
+            logger.warning(
+                "Failed to render image for %s frame %d", version, frame, exc_info=True,
+            )
+            return None
+
     def _render_strokes_to_png(
         self,
         data: Dict,
@@ -508,8 +534,18 @@ class DrawoverStorage:
         size: Tuple[int, int]
     ):
         """Render strokes to PNG file with transparency."""
+        image = self._render_strokes_to_image(data, size, QImage.Format.Format_ARGB32)
+        image.save(str(output_path), 'PNG')
+
+    def _render_strokes_to_image(
+        self,
+        data: Dict,
+        size: Tuple[int, int],
+        image_format: QImage.Format = QImage.Format.Format_ARGB32_Premultiplied
+    ) -> QImage:
+        """Render strokes onto a transparent image of the given size."""
         width, height = size
-        image = QImage(width, height, QImage.Format.Format_ARGB32)
+        image = QImage(width, height, image_format)
         image.fill(QColor(0, 0, 0, 0))  # Transparent
 
         painter = QPainter(image)
@@ -531,7 +567,7 @@ class DrawoverStorage:
                 self._render_stroke(painter, stroke, scale_x, scale_y)
 
         painter.end()
-        image.save(str(output_path), 'PNG')
+        return image
 
     def _render_stroke(
         self,
@@ -892,6 +928,155 @@ class DrawoverCache:
             self._cache.clear()
 
 
+class AnnotationTimelineIndex:
+    """
+    Sorted index of annotated frames for one version, with stroke payloads.
+
+    Built once per version from the drawover folder, then kept current by
+    the editor as frames are saved or cleared, so prev/next navigation,
+    Hold and ghost lookups are bisects instead of scans, and frames without
+    annotations never touch the disk. Not thread-safe (GUI thread only).
+    """
+
+    def __init__(
+        self,
+        storage: DrawoverStorage,
+        animation_uuid: str,
+        version: str,
+        max_payloads: int = 200
+    ):
+        self._storage = storage
+        self._animation_uuid = animation_uuid
+        self._version = version
+        self._max_payloads = max_payloads
+        self._frames: List[int] = []
+        # frame -> (strokes, canvas_size)
+        self._payloads: OrderedDict[int, Tuple[List[Dict], Optional[List[int]]]] = OrderedDict()
+        self.rebuild()
+
+    def matches(self, animation_uuid: str, version: str) -> bool:
+        """Check the index belongs to this animation version."""
+        return self._animation_uuid == animation_uuid and self._version == version
+
+    @property
+    def frames(self) -> List[int]:
+        """Annotated frames, ascending."""
+        return list(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, frame: int) -> bool:
+        i = bisect.bisect_left(self._frames, frame)
+        return i < len(self._frames) and self._frames[i] == frame
+
+    def rebuild(self):
+        """Re-read annotated frames from disk and drop cached payloads."""
+        self._frames = self._storage.list_frames_with_drawovers(self._animation_uuid, self._version)
+        self._payloads.clear()
+
+    # ==================== Lookups ====================
+
+    def previous(self, frame: int) -> Optional[int]:
+        """Nearest annotated frame before frame, or None."""
+        i = bisect.bisect_left(self._frames, frame)
+        return self._frames[i - 1] if i > 0 else None
+
+    def next(self, frame: int) -> Optional[int]:
+        """Nearest annotated frame after frame, or None."""
+        i = bisect.bisect_right(self._frames, frame)
+        return self._frames[i] if i < len(self._frames) else None
+
+    def hold_frame(self, frame: int) -> Optional[int]:
+        """Annotated frame whose strokes are held on frame (itself, else the previous one)."""
+        i = bisect.bisect_right(self._frames, frame)
+        return self._frames[i - 1] if i > 0 else None
+
+    def before(self, frame: int, count: int) -> List[int]:
+        """Up to count annotated frames before frame, nearest first."""
+        i = bisect.bisect_left(self._frames, frame)
+        return self._frames[max(0, i - count):i][::-1] if count > 0 else []
+
+    def after(self, frame: int, count: int) -> List[int]:
+        """Up to count annotated frames after frame, nearest first."""
+        i = bisect.bisect_right(self._frames, frame)
+        return self._frames[i:i + count] if count > 0 else []
+
+    def get_strokes(self, frame: int) -> Tuple[List[Dict], Optional[List[int]]]:
+        """
+        Get strokes for an annotated frame, loading them once.
+
+        Args:
+            frame: Frame number
+
+        Returns:
+            (strokes, canvas_size) tuple; ([], None) for frames without annotations
+        """
+        if frame not in self:
+            return [], None
+
+        payload = self._payloads.get(frame)
+        if payload is not None:
+            self._payloads.move_to_end(frame)
+            return payload
+
+        data = self._storage.load_drawover(self._animation_uuid, self._version, frame)
+        payload = (data.get('strokes', []), data.get('canvas_size')) if data else ([], None)
+        self._store_payload(frame, payload)
+        return payload
+
+    # ==================== Updates ====================
+
+    def update_frame(
+        self,
+        frame: int,
+        strokes: List[Dict],
+        canvas_size: Optional[Tuple[int, int]] = None
+    ) -> bool:
+        """
+        Record strokes just saved for a frame (empty strokes un-index it).
+
+        Args:
+            frame: Frame number
+            strokes: Saved strokes
+            canvas_size: Canvas size the strokes were saved with
+
+        Returns:
+            True if the frame's strokes changed (or weren't cached to compare)
+        """
+        indexed = frame in self
+        if not strokes:
+            self.remove_frame(frame)
+            return indexed
+
+        cached = self._payloads.get(frame) if indexed else None
+        changed = cached is None or cached[0] != strokes
+
+        if not indexed:
+            bisect.insort(self._frames, frame)
+        self._store_payload(frame, (list(strokes), list(canvas_size) if canvas_size else None))
+        return changed
+
+    def remove_frame(self, frame: int):
+        """
+        Un-index a frame whose annotations were cleared or deleted.
+
+        Args:
+            frame: Frame number
+        """
+        i = bisect.bisect_left(self._frames, frame)
+        if i < len(self._frames) and self._frames[i] == frame:
+            del self._frames[i]
+        self._payloads.pop(frame, None)
+
+    def _store_payload(self, frame: int, payload: Tuple[List[Dict], Optional[List[int]]]):
+        """Cache a payload, evicting the least recently used beyond max_payloads"""
+        self._payloads[frame] = payload
+        self._payloads.move_to_end(frame)
+        while len(self._payloads) > self._max_payloads:
+            self._payloads.popitem(last=False)
+
+
 # ==================== Singleton ====================
 
 _storage_instance: Optional[DrawoverStorage] = None
@@ -917,6 +1102,7 @@ def get_drawover_cache() -> DrawoverCache:
 __all__ = [
     'DrawoverStorage',
     'DrawoverCache',
+    'AnnotationTimelineIndex',
     'get_drawover_storage',
     'get_drawover_cache'
 ]
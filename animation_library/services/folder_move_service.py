@@ -155,9 +155,6 @@ class FolderMoveService:
         """
         Check if folder_id is a descendant of ancestor_id
 
-        This walks up the parent chain from folder_id to check if
-        ancestor_id appears anywhere in the hierarchy.
-
         Args:
             folder_id: Folder to check
             ancestor_id: Potential ancestor folder
@@ -165,30 +162,7 @@ class FolderMoveService:
         Returns:
             True if folder_id is a child/grandchild/etc. of ancestor_id
         """
-        # Get folder info
-        folder = self._db_service.get_folder_by_id(folder_id)
-        if not folder:
-            return False
-
-        # Walk up parent chain
-        current_id = folder.get('parent_id')
-        visited = set()
-
-        while current_id:
-            if current_id == ancestor_id:
-                return True
-
-            if current_id in visited:
-                break  # Circular ref detected
-            visited.add(current_id)
-
-            parent = self._db_service.get_folder_by_id(current_id)
-            if not parent:
-                break
-
-            current_id = parent.get('parent_id')
-
-        return False
+        return self._db_service.is_folder_descendant(folder_id, ancestor_id)
 
 
 __all__ = ['FolderMoveService']
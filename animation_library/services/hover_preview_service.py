@@ -0,0 +1,410 @@
+"""
+HoverPreviewService - Sprite-strip proxies for hover video previews
+
+Pattern: Background building with QRunnable workers
+Features:
+- Decodes each preview once, in a worker thread, into a small sprite strip
+  (a fixed number of downscaled frames tiled into one JPEG)
+- Strips are cached on disk, keyed by preview path, mtime and size, so a
+  changed preview is rebuilt and an unchanged one is never decoded again
+- Hovers play from the in-memory strip: no codec work on the GUI thread,
+  so hover start cost does not depend on preview resolution or codec
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union, TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QRect, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from ..config import Config
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SpriteStrip:
+    """
+    Downscaled frames of one preview, tiled row-major into a single pixmap.
+
+    Usage:
+        strip = service.get_strip(video_path)
+        if strip:
+            label.setPixmap(strip.frame(i % strip.frame_count))
+    """
+
+    def __init__(self, pixmap: QPixmap, frame_count: int, frame_width: int,
+                 frame_height: int, columns: int, interval_ms: int):
+        self.pixmap = pixmap
+        self.frame_count = frame_count
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.columns = columns
+        self.interval_ms = interval_ms
+
+    def frame_rect(self, index: int) -> QRect:
+        """Get the strip rectangle holding a frame"""
+        index = max(0, min(index, self.frame_count - 1))
+        row, col = divmod(index, self.columns)
+        return QRect(col * self.frame_width, row * self.frame_height,
+                     self.frame_width, self.frame_height)
+
+    def frame(self, index: int) -> QPixmap:
+        """
+        Get one frame of the strip
+
+        Args:
+            index: Frame index (clamped to the strip)
+
+        Returns:
+            QPixmap of the frame (shallow copy of the strip region)
+        """
+        return self.pixmap.copy(self.frame_rect(index))
+
+
+class SpriteStripBuildSignals(QObject):
+    """Signals for SpriteStripTask"""
+
+    build_complete = pyqtSignal(str, QImage, dict, float)  # cache_key, strip image, layout, elapsed_ms
+    build_failed = pyqtSignal(str, str)  # cache_key, error_message
+
+
+class SpriteStripTask(QRunnable):
+    """
+    Background task that loads a cached sprite strip or builds it from the preview
+
+    Frames are sampled evenly across the clip. The clip is read
+    sequentially with grab() for skipped frames, which is cheaper than
+    seeking for every sample on long-GOP codecs.
+
+    Usage:
+        task = SpriteStripTask(video_path, cache_key, strip_path)
+        threadpool.start(task)
+    """
+
+    JPEG_QUALITY = 85
+
+    def __init__(self, video_path: Path, cache_key: str, strip_path: Path,
+                 frame_count: int = Config.HOVER_STRIP_FRAMES,
+                 frame_size: int = Config.HOVER_VIDEO_SIZE,
+                 columns: int = Config.HOVER_STRIP_COLUMNS):
+        super().__init__()
+        self.video_path = video_path
+        self.cache_key = cache_key
+        self.strip_path = strip_path
+        self.layout_path = strip_path.with_suffix('.json')
+        self.frame_count = frame_count
+        self.frame_size = frame_size
+        self.columns = columns
+        self.signals = SpriteStripBuildSignals()
+        self.start_time = time.time()
+
+    def run(self):
+        """Execute strip load/build task"""
+        try:
+            result = self._load_cached()
+            if result is None:
+                result = self._build()
+            if result is None:
+                self.signals.build_failed.emit(
+                    self.cache_key, f"No frames decoded from: {self.video_path}"
+                )
+                return
+
+            image, layout = result
+            elapsed_ms = (time.time() - self.start_time) * 1000
+            self.signals.build_complete.emit(self.cache_key, image, layout, elapsed_ms)
+
+        except Exception as e:
+            self.signals.build_failed.emit(self.cache_key, f"Sprite strip error: {e}")
+
+    def _load_cached(self) -> Optional[Tuple[QImage, dict]]:
+        """Load strip from the disk cache (layout file is written last, so it marks a complete strip)"""
+        if not self.layout_path.exists():
+            return None
+        try:
+            with open(self.layout_path, 'r', encoding='utf-8') as f:
+                layout = json.load(f)
+            image = QImage(str(self.strip_path))
+            if image.isNull():
+                return None
+            return image, layout
+        except (OSError, ValueError):
+            return None
+
+    def _build(self) -> Optional[Tuple[QImage, dict]]:
+        """Decode sampled frames, tile them and write the strip to the cache"""
+        # cv2/numpy are imported on the worker, keeping them off the startup path
+        import cv2
+        import numpy as np
+
+        cap = cv2.VideoCapture(str(self.video_path))
+        if not cap.isOpened():
+            return None
+
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            if fps <= 0:
+                fps = Config.PREVIEW_VIDEO_FPS
+            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            if total <= 0 or width <= 0 or height <= 0:
+                return None
+
+            samples = min(self.frame_count, total)
+            wanted = [int(i * total / samples) for i in range(samples)]
+
+            scale = min(self.frame_size / width, self.frame_size / height, 1.0)
+            tile_w = max(1, int(width * scale))
+            tile_h = max(1, int(height * scale))
+            columns = min(self.columns, samples)
+            rows = (samples + columns - 1) // columns
+            strip = np.zeros((rows * tile_h, columns * tile_w, 3), dtype=np.uint8)
+
+            count = 0
+            position = 0
+            for target in wanted:
+                while position < target:
+                    if not cap.grab():
+                        break
+                    position += 1
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                position += 1
+
+                if frame.shape[1] != tile_w or frame.shape[0] != tile_h:
+                    frame = cv2.resize(frame, (tile_w, tile_h), interpolation=cv2.INTER_AREA)
+                row, col = divmod(count, columns)
+                strip[row * tile_h:(row + 1) * tile_h, col * tile_w:(col + 1) * tile_w] = frame
+                count += 1
+        finally:
+            cap.release()
+
+        if count == 0:
+            return None
+
+        # Drop unused rows if the clip ended early
+        rows = (count + columns - 1) // columns
+        strip = strip[:rows * tile_h]
+
+        layout = {
+            'frame_count': count,
+            'frame_width': tile_w,
+            'frame_height': tile_h,
+            'columns': columns,
+            'interval_ms': max(1, int(round(total / fps * 1000 / count))),
+        }
+        self._write_cache(strip, layout)
+
+        rgb = cv2.cvtColor(strip, cv2.COLOR_BGR2RGB)
+        h, w = rgb.shape[:2]
+        image = QImage(rgb.data, w, h, 3 * w, QImage.Format.Format_RGB888).copy()
+        return image, layout
+
+    def _write_cache(self, strip: 'np.ndarray', layout: dict):
+        """Write strip JPEG then layout file, each atomically"""
+        import cv2
+
+        try:
+            ok, encoded = cv2.imencode('.jpg', strip, [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY])
+            if not ok:
+                return
+            self.strip_path.parent.mkdir(parents=True, exist_ok=True)
+
+            temp_strip = self.strip_path.with_suffix('.jpg.tmp')
+            temp_strip.write_bytes(encoded.tobytes())
+            os.replace(temp_strip, self.strip_path)
+
+            temp_layout = self.layout_path.with_suffix('.json.tmp')
+            with open(temp_layout, 'w', encoding='utf-8') as f:
+                json.dump(layout, f)
+            os.replace(temp_layout, self.layout_path)
+        except OSError as e:
+            logger.debug(f"Could not cache sprite strip for {self.video_path}: {e}")
+
+
+class HoverPreviewService(QObject):
+    """
+    Provides sprite strips for hover previews
+
+    Features:
+    - Dedicated worker pool (does not compete with thumbnail loading)
+    - Most recent request is built first, so the card under the cursor
+      wins over cards the cursor merely passed over
+    - Load deduplication
+    - Small in-memory LRU of ready strips
+
+    Usage:
+        service = get_hover_preview_service()
+        service.strip_ready.connect(on_strip_ready)
+        strip = service.get_strip(video_path)  # None while building
+    """
+
+    # Signals
+    strip_ready = pyqtSignal(str)  # video_path
+    strip_failed = pyqtSignal(str, str)  # video_path, error_message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(Config.HOVER_STRIP_THREAD_COUNT)
+
+        # cache_key -> SpriteStrip
+        self._strips: OrderedDict[str, SpriteStrip] = OrderedDict()
+        # cache_key -> video path (str) for in-flight tasks
+        self._pending: Dict[str, str] = {}
+        self._request_serial = 0
+
+        # Performance monitoring
+        self.build_times: list[float] = []
+        self.memory_hits: int = 0
+        self.total_requests: int = 0
+
+    def get_strip(self, video_path: Union[str, Path]) -> Optional[SpriteStrip]:
+        """
+        Get the sprite strip for a preview (from memory or async)
+
+        Args:
+            video_path: Path to preview video file
+
+        Returns:
+            SpriteStrip if ready, None if building in background
+            (strip_ready or strip_failed follows)
+        """
+        self.total_requests += 1
+
+        cache_key = self._generate_cache_key(video_path)
+        if cache_key is None:
+            return None
+
+        strip = self._strips.get(cache_key)
+        if strip is not None:
+            self._strips.move_to_end(cache_key)
+            self.memory_hits += 1
+            return strip
+
+        # Newer requests get higher priority
+        self._request_serial += 1
+        if cache_key in self._pending:
+            return None
+
+        self._pending[cache_key] = str(video_path)
+        task = SpriteStripTask(Path(video_path), cache_key, self._strip_path(cache_key))
+        task.signals.build_complete.connect(self._on_build_complete)
+        task.signals.build_failed.connect(self._on_build_failed)
+        self.thread_pool.start(task, self._request_serial)
+        return None
+
+    def prefetch(self, video_path: Union[str, Path]):
+        """
+        Start building a strip ahead of the hover (no-op if ready or pending)
+
+        Args:
+            video_path: Path to preview video file
+        """
+        self.get_strip(video_path)
+
+    def _on_build_complete(self, cache_key: str, image: QImage, layout: dict, elapsed_ms: float):
+        """Store the finished strip and notify listeners"""
+        video_path = self._pending.pop(cache_key, None)
+        self.build_times.append(elapsed_ms)
+
+        self._strips[cache_key] = SpriteStrip(
+            QPixmap.fromImage(image),
+            layout['frame_count'],
+            layout['frame_width'],
+            layout['frame_height'],
+            layout['columns'],
+            layout['interval_ms'],
+        )
+        while len(self._strips) > Config.HOVER_STRIP_MEMORY_COUNT:
+            self._strips.popitem(last=False)
+
+        if video_path is not None:
+            self.strip_ready.emit(video_path)
+
+    def _on_build_failed(self, cache_key: str, error_message: str):
+        """Handle failed strip build"""
+        video_path = self._pending.pop(cache_key, None)
+        logger.debug(error_message)
+        if video_path is not None:
+            self.strip_failed.emit(video_path, error_message)
+
+    def _generate_cache_key(self, video_path: Union[str, Path]) -> Optional[str]:
+        """
+        Generate cache key for a preview
+
+        Args:
+            video_path: Path to preview video file
+
+        Returns:
+            Key covering path, mtime, size and strip settings, or None if the file is missing
+        """
+        try:
+            stat = os.stat(video_path)
+        except OSError:
+            return None
+
+        key = (
+            f"{os.path.normcase(os.path.abspath(video_path))}|{stat.st_mtime_ns}|{stat.st_size}|"
+            f"{Config.HOVER_STRIP_FRAMES}|{Config.HOVER_VIDEO_SIZE}|{Config.HOVER_STRIP_COLUMNS}"
+        )
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _strip_path(self, cache_key: str) -> Path:
+        """Get disk cache path for a strip"""
+        return Config.get_hover_strips_dir() / f"{cache_key}.jpg"
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get performance statistics
+
+        Returns:
+            Dict with cache statistics
+        """
+        avg_build_time = (sum(self.build_times) / len(self.build_times)) if self.build_times else 0
+        hit_rate = (self.memory_hits / self.total_requests * 100) if self.total_requests > 0 else 0
+
+        return {
+            'total_requests': self.total_requests,
+            'memory_hits': self.memory_hits,
+            'memory_hit_rate': hit_rate,
+            'avg_build_time_ms': avg_build_time,
+            'strips_in_memory': len(self._strips),
+            'pending_count': len(self._pending),
+        }
+
+    def clear_cache(self):
+        """Drop in-memory strips (disk cache is kept)"""
+        self._strips.clear()
+
+
+# Singleton instance
+_hover_preview_service_instance: Optional[HoverPreviewService] = None
+
+
+def get_hover_preview_service() -> HoverPreviewService:
+    """
+    Get global HoverPreviewService singleton
+
+    Returns:
+        Global HoverPreviewService instance
+    """
+    global _hover_preview_service_instance
+    if _hover_preview_service_instance is None:
+        _hover_preview_service_instance = HoverPreviewService()
+    return _hover_preview_service_instance
+
+
+__all__ = ['HoverPreviewService', 'SpriteStrip', 'SpriteStripTask', 'get_hover_preview_service']
@@ -0,0 +1,473 @@
+"""
+JobManager - Background execution of long library operations
+
+Pattern: QRunnable workers on a dedicated QThreadPool
+Features:
+- Typed jobs (sync, backup export/import, empty trash, optimize, bulk edit)
+  with thread pool priorities
+- Cooperative cancellation: the job function polls a CancellationToken
+  between steps, nothing is ever terminated mid-write
+- Progress throttled per job (Config.JOB_PROGRESS_INTERVAL_MS) and
+  reported on the EventBus, so a job reporting every file cannot flood
+  the GUI thread
+- Mutual-exclusion groups: jobs in the same group run one at a time, the
+  rest wait their turn (e.g. no sync while an import is restoring files)
+- Completion callbacks run on the GUI thread, skipped if their owner
+  widget has been deleted meanwhile
+
+Usage:
+    manager = get_job_manager()
+    manager.submit(
+        JobKind.SYNC, "Scanning library",
+        lambda ctx: db_service.sync_library(ctx.report, ctx.token),
+        group=JobManager.GROUP_LIBRARY,
+        on_finished=on_sync_finished,
+    )
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class JobKind:
+    """Job types (used for display, coalescing and is_active())"""
+
+    SYNC = 'sync'
+    BACKUP_EXPORT = 'backup_export'
+    BACKUP_IMPORT = 'backup_import'
+    EMPTY_TRASH = 'empty_trash'
+    OPTIMIZE = 'optimize'
+    REBUILD = 'rebuild'
+    BULK_EDIT = 'bulk_edit'
+    LOAD = 'load'
+    LIBRARY_CHANGES = 'library_changes'
+
+
+class JobState:
+    """Job lifecycle states"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+
+class JobCancelled(Exception):
+    """Raised inside a job (via JobContext.check) to stop at a safe point"""
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag shared by the GUI and a running job
+
+    Plain Python, so services can accept one without depending on Qt.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation (the job stops at its next check)"""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if cancellation was requested"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Raise JobCancelled if cancellation was requested"""
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+class JobContext:
+    """
+    Handed to the job function on the worker thread
+
+    Gives access to the job's cancellation token and a throttled progress
+    reporter whose signature matches the progress_callback(current, total,
+    message) convention used by the services.
+    """
+
+    def __init__(self, job_id: int, token: CancellationToken, progress_signal, interval_ms: int):
+        self._job_id = job_id
+        self._token = token
+        self._progress_signal = progress_signal
+        self._interval = interval_ms / 1000.0
+        self._last_report = 0.0
+
+    @property
+    def token(self) -> CancellationToken:
+        """Cancellation token (pass to services accepting cancel_token)"""
+        return self._token
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if cancellation was requested"""
+        return self._token.is_cancelled
+
+    def check(self):
+        """Raise JobCancelled if cancellation was requested"""
+        self._token.raise_if_cancelled()
+
+    def report(self, current: int, total: int = 0, message: str = ""):
+        """
+        Report progress (dropped if the last report was too recent)
+
+        Args:
+            current: Items done
+            total: Total items, 0 if unknown
+            message: Short status text
+        """
+        now = time.monotonic()
+        done = total > 0 and current >= total
+        if not done and now - self._last_report < self._interval:
+            return
+        self._last_report = now
+        self._progress_signal.emit(self._job_id, current, total, message)
+
+
+class JobSignals(QObject):
+    """Signals for JobTask"""
+
+    started = pyqtSignal(int)  # job_id
+    progress = pyqtSignal(int, int, int, str)  # job_id, current, total, message
+    finished = pyqtSignal(int, object)  # job_id, result
+    failed = pyqtSignal(int, str)  # job_id, error_message
+    cancelled = pyqtSignal(int)  # job_id
+
+
+class JobTask(QRunnable):
+    """
+    Background task running one job function
+
+    A job that returns normally after its token was cancelled (e.g. a
+    loop that breaks on is_cancelled) is reported as cancelled, not
+    finished.
+    """
+
+    def __init__(self, job_id: int, fn: Callable[[JobContext], Any], token: CancellationToken):
+        super().__init__()
+        self.job_id = job_id
+        self._fn = fn
+        self.signals = JobSignals()
+        self.context = JobContext(job_id, token, self.signals.progress, Config.JOB_PROGRESS_INTERVAL_MS)
+
+    def run(self):
+        """Execute the job function"""
+        self.signals.started.emit(self.job_id)
+        try:
+            self.context.check()
+            result = self._fn(self.context)
+        except JobCancelled:
+            self.signals.cancelled.emit(self.job_id)
+            return
+        except Exception as e:
+            logger.exception(f"Job {self.job_id} failed")
+            self.signals.failed.emit(self.job_id, str(e))
+            return
+
+        if self.context.is_cancelled:
+            self.signals.cancelled.emit(self.job_id)
+        else:
+            self.signals.finished.emit(self.job_id, result)
+
+
+class Job:
+    """Bookkeeping for one submitted job (GUI thread only)"""
+
+    def __init__(self, job_id: int, kind: str, title: str, fn: Callable[[JobContext], Any],
+                 priority: int, group: Optional[str], cancellable: bool, owner: Optional[QObject],
+                 on_finished: Optional[Callable[[Any], None]],
+                 on_failed: Optional[Callable[[str], None]],
+                 on_cancelled: Optional[Callable[[], None]]):
+        self.id = job_id
+        self.kind = kind
+        self.title = title
+        self.fn = fn
+        self.priority = priority
+        self.group = group
+        self.cancellable = cancellable
+        self.owner = owner
+        self.on_finished = on_finished
+        self.on_failed = on_failed
+        self.on_cancelled = on_cancelled
+
+        self.token = CancellationToken()
+        self.state = JobState.QUEUED
+        self.dispatched = False  # Handed to the thread pool
+        self.current = 0
+        self.total = 0
+        self.message = ""
+
+
+class JobManager(QObject):
+    """
+    Central runner for long operations
+
+    Features:
+    - Dedicated worker pool, so jobs never compete with thumbnail loading
+    - Per-group mutual exclusion with priority-ordered waiting
+    - Coalescing of repeated requests (e.g. watcher-triggered syncs)
+    - EventBus reporting: job_added / job_started / job_progress / job_finished
+
+    Usage:
+        manager = get_job_manager()
+        job_id = manager.submit(JobKind.OPTIMIZE, "Optimizing database", fn)
+        manager.cancel(job_id)
+    """
+
+    # Thread pool priorities
+    PRIORITY_LOW = -1
+    PRIORITY_NORMAL = 0
+    PRIORITY_HIGH = 1
+
+    # Jobs that rewrite library files or the database wholesale
+    GROUP_LIBRARY = 'library'
+
+    def __init__(self, parent=None, event_bus=None):
+        super().__init__(parent)
+
+        if event_bus is None:
+            from ..events.event_bus import get_event_bus
+            event_bus = get_event_bus()
+        self._event_bus = event_bus
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(Config.JOB_THREAD_COUNT)
+
+        # job_id -> queued or running job
+        self._jobs: Dict[int, Job] = {}
+        # group -> job_id of the job holding it
+        self._group_owner: Dict[str, int] = {}
+        self._next_job_id = 0
+
+    def submit(
+        self,
+        kind: str,
+        title: str,
+        fn: Callable[[JobContext], Any],
+        priority: int = PRIORITY_NORMAL,
+        group: Optional[str] = None,
+        cancellable: bool = True,
+        coalesce: bool = False,
+        owner: Optional[QObject] = None,
+        on_finished: Optional[Callable[[Any], None]] = None,
+        on_failed: Optional[Callable[[str], None]] = None,
+        on_cancelled: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """
+        Queue a job
+
+        Args:
+            kind: JobKind value
+            title: Display title for the jobs panel
+            fn: Job function, called on a worker thread with a JobContext;
+                its return value is passed to on_finished
+            priority: PRIORITY_* value
+            group: Mutual-exclusion group (jobs in one group run one at a time)
+            cancellable: Whether the jobs panel offers cancel
+            coalesce: Reuse a still-queued job of the same kind instead of
+                adding another (a running one does not count - it may have
+                already passed the changes the new request is about)
+            owner: Widget the callbacks belong to; they are skipped once it is deleted
+            on_finished: Called on the GUI thread with the result
+            on_failed: Called on the GUI thread with the error message
+                (default: reported through EventBus.report_error)
+            on_cancelled: Called on the GUI thread after cancellation
+
+        Returns:
+            Job ID
+        """
+        if coalesce:
+            for job in self._jobs.values():
+                if job.kind == kind and job.state == JobState.QUEUED and not job.token.is_cancelled:
+                    return job.id
+
+        self._next_job_id += 1
+        job = Job(self._next_job_id, kind, title, fn, priority, group, cancellable, owner,
+                  on_finished, on_failed, on_cancelled)
+        self._jobs[job.id] = job
+
+        self._event_bus.job_added.emit(job.id, kind, title)
+        self._dispatch()
+        return job.id
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Request cancellation of a job
+
+        A job still waiting for its group is dropped at once; a queued or
+        running one stops at its next cancellation check.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            True if the job was active and cancellable
+        """
+        job = self._jobs.get(job_id)
+        if job is None or not job.cancellable:
+            return False
+
+        job.token.cancel()
+        if not job.dispatched:
+            # Still waiting for its group - never handed to the pool
+            self._complete(job, JobState.CANCELLED)
+        return True
+
+    def cancel_all(self):
+        """Request cancellation of every active cancellable job"""
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+
+    def get_job(self, job_id: int) -> Optional[Job]:
+        """Get an active job by ID"""
+        return self._jobs.get(job_id)
+
+    def get_jobs(self) -> List[Job]:
+        """Get active (queued or running) jobs in submission order"""
+        return list(self._jobs.values())
+
+    def is_active(self, kind: str) -> bool:
+        """Check if a job of the given kind is queued or running"""
+        return any(job.kind == kind for job in self._jobs.values())
+
+    def shutdown(self, timeout_ms: int = 5000) -> bool:
+        """
+        Cancel all jobs and wait for running ones to stop (app exit)
+
+        Args:
+            timeout_ms: Max time to wait
+
+        Returns:
+            True if all workers stopped in time
+        """
+        self.cancel_all()
+        return self.thread_pool.waitForDone(timeout_ms)
+
+    def _dispatch(self):
+        """Hand queued jobs to the pool, highest priority first, respecting groups"""
+        waiting = sorted(
+            (job for job in self._jobs.values() if job.state == JobState.QUEUED),
+            key=lambda job: (-job.priority, job.id)
+        )
+        for job in waiting:
+            if job.dispatched:
+                continue
+            if job.group:
+                if job.group in self._group_owner:
+                    continue
+                self._group_owner[job.group] = job.id
+            self._start(job)
+
+    def _start(self, job: Job):
+        """Queue a job's task on the pool"""
+        job.dispatched = True
+        task = JobTask(job.id, job.fn, job.token)
+        task.signals.started.connect(self._on_started)
+        task.signals.progress.connect(self._on_progress)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        task.signals.cancelled.connect(self._on_cancelled)
+        self.thread_pool.start(task, job.priority)
+
+    def _on_started(self, job_id: int):
+        """Mark job running"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.state = JobState.RUNNING
+        self._event_bus.job_started.emit(job_id)
+
+    def _on_progress(self, job_id: int, current: int, total: int, message: str):
+        """Record and forward progress"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.current, job.total, job.message = current, total, message
+        self._event_bus.job_progress.emit(job_id, current, total, message)
+
+    def _on_finished(self, job_id: int, result: Any):
+        """Handle job completion"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._complete(job, JobState.FINISHED, result)
+
+    def _on_failed(self, job_id: int, error_message: str):
+        """Handle job failure"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._complete(job, JobState.FAILED, error_message)
+
+    def _on_cancelled(self, job_id: int):
+        """Handle job cancellation"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._complete(job, JobState.CANCELLED)
+
+    def _complete(self, job: Job, state: str, payload: Any = None):
+        """Retire a job, run its callback and start whatever was waiting on it"""
+        del self._jobs[job.id]
+        if job.group and self._group_owner.get(job.group) == job.id:
+            del self._group_owner[job.group]
+        job.state = state
+
+        self._event_bus.job_finished.emit(job.id, state)
+        logger.debug(f"Job {job.id} '{job.title}' {state}")
+
+        owner_alive = job.owner is None or not sip.isdeleted(job.owner)
+        try:
+            if state == JobState.FINISHED:
+                if job.on_finished and owner_alive:
+                    job.on_finished(payload)
+            elif state == JobState.FAILED:
+                if job.on_failed and owner_alive:
+                    job.on_failed(payload)
+                elif not job.on_failed:
+                    self._event_bus.report_error("job", f"{job.title} failed: {payload}")
+            elif job.on_cancelled and owner_alive:
+                job.on_cancelled()
+        except Exception:
+            logger.exception(f"Callback for job '{job.title}' failed")
+
+        self._dispatch()
+
+
+# Singleton instance
+_job_manager_instance: Optional[JobManager] = None
+
+
+def get_job_manager() -> JobManager:
+    """
+    Get global JobManager singleton
+
+    Returns:
+        Global JobManager instance
+    """
+    global _job_manager_instance
+    if _job_manager_instance is None:
+        _job_manager_instance = JobManager()
+    return _job_manager_instance
+
+
+__all__ = [
+    'JobKind',
+    'JobState',
+    'JobCancelled',
+    'CancellationToken',
+    'JobContext',
+    'JobManager',
+    'get_job_manager',
+]
@@ -0,0 +1,614 @@
+"""
+LibraryWatcher - Library change detection without a directory cap
+
+Pattern: Module-level singleton with pluggable backends
+Features:
+- InotifyBackend (Linux, local disks): one kernel watch per animation
+  folder, events delivered as they happen
+- PollingBackend (network shares, other platforms, or when the inotify
+  watch limit is reached): periodic snapshot of animation folder mtimes,
+  diffed against the previous one
+- Raw events are mapped to animation folders and coalesced into one
+  LibraryChangeSet (added / modified / removed folders) per burst, so a
+  Blender save writing five files is one change, not five refreshes
+- Watched folders' DirectoryCache listings are invalidated as events arrive
+
+Usage:
+    watcher = get_library_watcher()
+    watcher.changes_available.connect(on_changes)
+    watcher.start(library_path)
+    ...
+    changes = watcher.take_changes()  # any thread
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from ..config import Config
+from .directory_cache import get_directory_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeKind:
+    """Kinds of change to an animation folder"""
+
+    ADDED = 'added'
+    MODIFIED = 'modified'
+    REMOVED = 'removed'
+
+
+class LibraryChangeSet:
+    """
+    Coalesced changes to animation folders
+
+    Repeated events for one folder are merged: added then modified is
+    added, added then removed cancels out, removed then added is modified
+    (the folder was replaced). overflow means events were lost and only a
+    full sync is reliable.
+    """
+
+    def __init__(self):
+        self._changes: Dict[Path, str] = {}
+        self.overflow = False
+
+    def add(self, folder: Path, kind: str):
+        """
+        Record a change, merging it with earlier changes to the same folder
+
+        Args:
+            folder: Animation folder
+            kind: ChangeKind value
+        """
+        previous = self._changes.get(folder)
+        if previous is None or previous == kind:
+            self._changes[folder] = kind
+        elif previous == ChangeKind.ADDED:
+            if kind == ChangeKind.REMOVED:
+                del self._changes[folder]  # Created and deleted within one burst
+        elif previous == ChangeKind.REMOVED:
+            self._changes[folder] = ChangeKind.MODIFIED  # Replaced
+        elif kind == ChangeKind.REMOVED:
+            self._changes[folder] = ChangeKind.REMOVED
+
+    def merge(self, other: 'LibraryChangeSet'):
+        """Fold a later change set into this one"""
+        for folder, kind in other._changes.items():
+            self.add(folder, kind)
+        self.overflow = self.overflow or other.overflow
+
+    def get_folders(self, kind: str) -> List[Path]:
+        """
+        Get folders with a given kind of change
+
+        Args:
+            kind: ChangeKind value
+
+        Returns:
+            Folder paths
+        """
+        return [folder for folder, folder_kind in self._changes.items() if folder_kind == kind]
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __bool__(self) -> bool:
+        return bool(self._changes) or self.overflow
+
+
+class LibraryLayout:
+    """
+    Where animation folders live under a library root
+
+    Animation folders are library/actions/{name}/, library/poses/{name}/,
+    legacy library/{name}/, and cold storage _versions/{name}/{version}/.
+    Every folder above them is a container.
+    """
+
+    CATEGORY_FOLDERS = (Config.ACTIONS_FOLDER_NAME, Config.POSES_FOLDER_NAME)
+
+    def __init__(self, library_path: Path):
+        self.root = Path(library_path)
+        self.library_dir = self.root / Config.LIBRARY_FOLDER_NAME
+        self.versions_dir = self.root / Config.VERSIONS_FOLDER_NAME
+
+    def classify(self, path: Path) -> Tuple[Optional[Path], bool]:
+        """
+        Find what a path belongs to
+
+        Args:
+            path: Any path under the library root
+
+        Returns:
+            Tuple of (animation folder containing or equal to path, or None;
+            True if path itself is a container)
+        """
+        try:
+            parts = path.relative_to(self.root).parts
+        except ValueError:
+            return None, False
+        if not parts or any(part.startswith('.') for part in parts[:3]):
+            return None, False
+
+        if parts[0] == Config.LIBRARY_FOLDER_NAME:
+            if len(parts) == 1:
+                return None, True
+            if parts[1] in self.CATEGORY_FOLDERS:
+                if len(parts) == 2:
+                    return None, True
+                return self.library_dir / parts[1] / parts[2], False
+            return self.library_dir / parts[1], False
+
+        if parts[0] == Config.VERSIONS_FOLDER_NAME:
+            if len(parts) <= 2:
+                return None, True
+            return self.versions_dir / parts[1] / parts[2], False
+
+        return None, False
+
+    def get_root_containers(self) -> List[Path]:
+        """Top-level containers watched from the start"""
+        return [self.library_dir, self.versions_dir]
+
+    def iter_folders(self, container: Path) -> Iterator[Tuple[Path, bool, os.DirEntry]]:
+        """
+        Walk a container down to its animation folders
+
+        Args:
+            container: Container folder
+
+        Yields:
+            (path, True for a container / False for an animation folder, DirEntry);
+            containers are yielded before their contents
+        """
+        try:
+            with os.scandir(container) as entries:
+                children = [entry for entry in entries
+                            if not entry.name.startswith('.') and entry.is_dir()]
+        except OSError:
+            return
+        for entry in children:
+            path = Path(entry.path)
+            _, is_container = self.classify(path)
+            yield path, is_container, entry
+            if is_container:
+                yield from self.iter_folders(path)
+
+
+class WatchBackend:
+    """
+    Base class for change detection backends
+
+    Backends run on their own thread and report through callbacks:
+    on_change(folder, kind) per animation folder change, on_overflow()
+    when events were lost, on_failed(reason) when the backend cannot keep
+    watching (the service then falls back to polling).
+    """
+
+    name = 'base'
+
+    def __init__(self, layout: LibraryLayout,
+                 on_change: Callable[[Path, str], None],
+                 on_overflow: Callable[[], None],
+                 on_failed: Callable[[str], None]):
+        self._layout = layout
+        self._on_change = on_change
+        self._on_overflow = on_overflow
+        self._on_failed = on_failed
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start watching on a background thread"""
+        self._thread = threading.Thread(target=self._run, name=f"LibraryWatcher-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching and wait for the thread"""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def _run(self):
+        raise NotImplementedError
+
+
+class PollingBackend(WatchBackend):
+    """
+    Snapshot-diff backend
+
+    Every Config.LIBRARY_POLL_INTERVAL_SECONDS the mtime of each animation
+    folder is read (from the listing on Windows, one stat each elsewhere)
+    and compared with the previous snapshot. A folder's mtime changes when
+    files in it are created, deleted or replaced by rename - how Blender
+    and the app write - but not when a file is rewritten in place.
+    """
+
+    name = 'poll'
+
+    def __init__(self, *args, interval: float = Config.LIBRARY_POLL_INTERVAL_SECONDS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._interval = interval
+
+    def take_snapshot(self) -> Dict[Path, int]:
+        """
+        Read the mtime of every animation folder
+
+        Returns:
+            Dict of animation folder -> mtime in ns
+        """
+        snapshot = {}
+        for container in self._layout.get_root_containers():
+            for path, is_container, entry in self._layout.iter_folders(container):
+                if is_container:
+                    continue
+                try:
+                    snapshot[path] = entry.stat().st_mtime_ns
+                except OSError:
+                    pass
+        return snapshot
+
+    def _run(self):
+        previous = self.take_snapshot()
+        while not self._stop_event.wait(self._interval):
+            current = self.take_snapshot()
+            for folder, mtime_ns in current.items():
+                old = previous.get(folder)
+                if old is None:
+                    self._on_change(folder, ChangeKind.ADDED)
+                elif old != mtime_ns:
+                    self._on_change(folder, ChangeKind.MODIFIED)
+            for folder in previous.keys() - current.keys():
+                self._on_change(folder, ChangeKind.REMOVED)
+            previous = current
+
+
+class InotifyBackend(WatchBackend):
+    """
+    Linux inotify backend (via libc, no extra dependency)
+
+    Containers are watched for folders appearing and disappearing;
+    animation folders for files written, created, deleted or renamed.
+    Needs one watch per folder - if fs.inotify.max_user_watches is too
+    low for the library, on_failed() is reported so the service can
+    switch to polling instead of silently missing changes.
+    """
+
+    name = 'inotify'
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+
+    CONTAINER_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+    FOLDER_MASK = CONTAINER_MASK | IN_CLOSE_WRITE
+
+    _EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, name length
+    _libc = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check whether inotify can be used on this system"""
+        if not sys.platform.startswith('linux'):
+            return False
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            except OSError:
+                return False
+            if not (hasattr(libc, 'inotify_init1') and hasattr(libc, 'inotify_add_watch')):
+                return False
+            cls._libc = libc
+        return True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fd = -1
+        self._wake_read, self._wake_write = os.pipe()
+        self._watches: Dict[int, Tuple[Path, bool]] = {}  # wd -> (path, is_container)
+
+    def stop(self):
+        """Stop watching (wakes the reader thread)"""
+        self._stop_event.set()
+        if self._wake_write >= 0:
+            try:
+                os.write(self._wake_write, b'x')
+            except OSError:
+                pass
+        super().stop()
+
+    def _add_watch(self, path: Path, is_container: bool):
+        """Add a kernel watch; raises OSError (ENOSPC at the watch limit)"""
+        mask = self.CONTAINER_MASK if is_container else self.FOLDER_MASK
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return  # Gone again before it could be watched
+            raise OSError(error, os.strerror(error), str(path))
+        self._watches[wd] = (path, is_container)
+
+    def _watch_tree(self, container: Path, report_added: bool):
+        """Watch a container and everything below it"""
+        self._add_watch(container, True)
+        for path, is_container, _ in self._layout.iter_folders(container):
+            self._add_watch(path, is_container)
+            if report_added and not is_container:
+                self._on_change(path, ChangeKind.ADDED)
+
+    def _run(self):
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            os.close(self._wake_read)
+            os.close(self._wake_write)
+            self._wake_read = self._wake_write = -1
+            self._on_failed(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+            return
+
+        try:
+            for container in self._layout.get_root_containers():
+                if container.is_dir():
+                    self._watch_tree(container, report_added=False)
+            logger.info("Library watcher: %d inotify watches", len(self._watches))
+
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([self._fd, self._wake_read], [], [])
+                if self._fd in readable:
+                    self._handle_events(os.read(self._fd, 256 * 1024))
+        except OSError as e:
+            if not self._stop_event.is_set():
+                self._on_failed(f"inotify: {e}")
+        finally:
+            wake_write, self._wake_write = self._wake_write, -1
+            for fd in (self._fd, self._wake_read, wake_write):
+                os.close(fd)
+            self._fd = self._wake_read = -1
+            self._watches.clear()
+
+    def _handle_events(self, data: bytes):
+        """Map a buffer of inotify events to animation folder changes"""
+        header = self._EVENT_HEADER
+        offset = 0
+        while offset + header.size <= len(data):
+            wd, mask, _, name_len = header.unpack_from(data, offset)
+            offset += header.size
+            name = data[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+
+            if mask & self.IN_Q_OVERFLOW:
+                self._on_overflow()
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            watch = self._watches.get(wd)
+            if watch is None or not name:
+                continue
+            path, is_container = watch
+
+            if not is_container:
+                self._on_change(path, ChangeKind.MODIFIED)
+                continue
+
+            if not mask & self.IN_ISDIR:
+                continue  # Loose files next to animation folders
+            child = path / os.fsdecode(name)
+            folder, child_is_container = self._layout.classify(child)
+            if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                if child_is_container:
+                    self._watch_tree(child, report_added=True)
+                elif folder is not None:
+                    self._add_watch(folder, False)
+                    self._on_change(folder, ChangeKind.ADDED)
+            elif folder is not None and not child_is_container:
+                # Its watch is dropped by the kernel (IN_IGNORED)
+                self._on_change(folder, ChangeKind.REMOVED)
+
+
+def _is_network_path(path: Path) -> bool:
+    """Check whether a path is on a network filesystem (Linux /proc/mounts)"""
+    network_types = ('nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', '9p', 'afs', 'ceph', 'glusterfs')
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            mounts = [line.split()[:3] for line in f]
+    except OSError:
+        return False
+
+    resolved = os.path.realpath(path)
+    best, best_type = '', ''
+    for _, mount_point, fs_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        if (resolved == mount_point or resolved.startswith(mount_point.rstrip('/') + '/')) \
+                and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type in network_types
+
+
+class LibraryWatcher(QObject):
+    """
+    Watches a library and publishes coalesced change sets
+
+    Backends report from their own thread; the debounce timer runs on the
+    GUI thread. changes_available is emitted once a burst has been quiet
+    for Config.LIBRARY_WATCH_DEBOUNCE_MS (or has lasted
+    Config.LIBRARY_WATCH_MAX_LATENCY_MS); take_changes() then returns
+    everything collected so far.
+    """
+
+    changes_available = pyqtSignal()
+    _events_pending = pyqtSignal()  # backend thread -> GUI thread
+    _backend_failed = pyqtSignal(str)  # backend thread -> GUI thread
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pending = LibraryChangeSet()
+        self._ready = LibraryChangeSet()
+        self._first_event_at = 0.0
+        self._last_event_at = 0.0
+
+        self._backend: Optional[WatchBackend] = None
+        self._layout: Optional[LibraryLayout] = None
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._on_debounce_timeout)
+        self._events_pending.connect(self._on_events_pending)
+        self._backend_failed.connect(self._on_backend_failed)
+
+    def start(self, library_path: Path, backend: str = Config.LIBRARY_WATCH_BACKEND):
+        """
+        Start watching a library (restarts if already watching)
+
+        Args:
+            library_path: Library root
+            backend: "auto", "inotify" or "poll"
+        """
+        self.stop()
+        self._layout = LibraryLayout(library_path)
+
+        use_inotify = backend == 'inotify' or (
+            backend == 'auto' and not _is_network_path(self._layout.root))
+        if use_inotify and InotifyBackend.is_available():
+            self._start_backend(InotifyBackend)
+        else:
+            self._start_backend(PollingBackend)
+
+    def _start_backend(self, backend_class):
+        """Create and start a backend for the current layout"""
+        self._backend = backend_class(
+            self._layout, self._record, self._record_overflow, self._backend_failed.emit
+        )
+        self._backend.start()
+        logger.info("Library watcher started (%s): %s", self._backend.name, self._layout.root)
+
+    def stop(self):
+        """Stop watching (pending changes are kept)"""
+        if self._backend is not None:
+            self._backend.stop()
+            self._backend = None
+        self._debounce_timer.stop()
+
+    def get_backend_name(self) -> Optional[str]:
+        """Get the active backend's name, or None when not watching"""
+        return self._backend.name if self._backend is not None else None
+
+    def take_changes(self) -> LibraryChangeSet:
+        """
+        Take the published changes (thread-safe)
+
+        Returns:
+            Changes since the last call (empty if none)
+        """
+        with self._lock:
+            changes, self._ready = self._ready, LibraryChangeSet()
+        return changes
+
+    def _record(self, folder: Path, kind: str):
+        """Collect one folder change (backend thread)"""
+        get_directory_cache().invalidate_tree(folder)
+        now = time.monotonic()
+        with self._lock:
+            was_idle = not self._pending
+            self._pending.add(folder, kind)
+            if was_idle:
+                self._first_event_at = now
+            self._last_event_at = now
+        if was_idle:
+            self._events_pending.emit()
+
+    def _record_overflow(self):
+        """Note that events were lost (backend thread)"""
+        get_directory_cache().clear()
+        now = time.monotonic()
+        with self._lock:
+            was_idle = not self._pending
+            self._pending.overflow = True
+            if was_idle:
+                self._first_event_at = now
+            self._last_event_at = now
+        if was_idle:
+            self._events_pending.emit()
+
+    def _on_events_pending(self):
+        """Start the debounce window for a new burst"""
+        if not self._debounce_timer.isActive():
+            self._debounce_timer.start(Config.LIBRARY_WATCH_DEBOUNCE_MS)
+
+    def _on_debounce_timeout(self):
+        """Publish the burst once quiet (or overdue), else wait for the rest"""
+        now = time.monotonic()
+        with self._lock:
+            if not self._pending:
+                return
+            quiet_ms = (now - self._last_event_at) * 1000
+            age_ms = (now - self._first_event_at) * 1000
+            if quiet_ms < Config.LIBRARY_WATCH_DEBOUNCE_MS and age_ms < Config.LIBRARY_WATCH_MAX_LATENCY_MS:
+                wait_ms = min(Config.LIBRARY_WATCH_DEBOUNCE_MS - quiet_ms,
+                              Config.LIBRARY_WATCH_MAX_LATENCY_MS - age_ms)
+                self._debounce_timer.start(max(1, int(wait_ms)))
+                return
+            self._ready.merge(self._pending)
+            self._pending = LibraryChangeSet()
+        self.changes_available.emit()
+
+    def _on_backend_failed(self, reason: str):
+        """Fall back to polling when the event backend cannot keep up"""
+        if self._backend is None or isinstance(self._backend, PollingBackend):
+            logger.error("Library watcher stopped: %s", reason)
+            return
+        logger.warning(
+            "Library watcher: %s - falling back to polling every %.0f s "
+            "(raise fs.inotify.max_user_watches for instant updates)",
+            reason, Config.LIBRARY_POLL_INTERVAL_SECONDS
+        )
+        self._backend.stop()
+        self._start_backend(PollingBackend)
+
+
+# Singleton instance
+_library_watcher_instance: Optional[LibraryWatcher] = None
+
+
+def get_library_watcher() -> LibraryWatcher:
+    """
+    Get global LibraryWatcher singleton
+
+    Returns:
+        Global LibraryWatcher instance
+    """
+    global _library_watcher_instance
+    if _library_watcher_instance is None:
+        _library_watcher_instance = LibraryWatcher()
+    return _library_watcher_instance
+
+
+__all__ = [
+    'ChangeKind',
+    'LibraryChangeSet',
+    'LibraryLayout',
+    'WatchBackend',
+    'PollingBackend',
+    'InotifyBackend',
+    'LibraryWatcher',
+    'get_library_watcher',
+]
@@ -17,6 +17,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from ..config import Config
+from .database.connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
@@ -32,15 +33,22 @@ class NotesDatabase:
     - User management for Studio Mode
     - App settings storage
     - Drawover metadata tracking (v3)
+    - Thread-local WAL connections, so reads never wait behind note writes
+    - Batch badge counts for many animations in one query
     """
 
     SCHEMA_VERSION = 3
     DB_NAME = "notes.db"
 
     def __init__(self):
-        self._connection: Optional[sqlite3.Connection] = None
+        self._db: Optional[DatabaseConnection] = None
         self._db_path: Optional[Path] = None
 
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Connection for the calling thread (each thread gets its own)"""
+        return self._db.get_connection()
+
     def initialize(self) -> bool:
         """
         Initialize the notes database.
@@ -53,15 +61,8 @@ class NotesDatabase:
             db_folder = Config.get_database_folder()
             self._db_path = db_folder / self.DB_NAME
 
-            # Connect and create schema
-            self._connection = sqlite3.connect(
-                str(self._db_path),
-                check_same_thread=False
-            )
-            self._connection.row_factory = sqlite3.Row
-
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
+            # Thread-local connections in WAL mode (foreign keys, Row factory)
+            self._db = DatabaseConnection(self._db_path)
 
             # Create/migrate schema
             self._create_schema()
@@ -264,6 +265,8 @@ class NotesDatabase:
         if current_version < 3:
             self._migrate_v2_to_v3()
 
+        self._create_count_indexes()
+
     def _migrate_v1_to_v2(self):
         """Migrate from schema v1 to v2 (add soft delete, audit, users)."""
         cursor = self._connection.cursor()
@@ -403,11 +406,43 @@ class NotesDatabase:
         cursor.execute('UPDATE schema_version SET version = 3')
         self._connection.commit()
 
+    def _create_count_indexes(self):
+        """
+        Create covering indexes for badge counts.
+
+        Runs after migrations (the columns only exist from v2/v3) and is
+        idempotent, so existing databases pick them up on next start.
+        Once the indexes and their statistics exist it only reads the
+        schema, so a normal start does not write to notes.db.
+        """
+        cursor = self._connection.cursor()
+        cursor.execute('''
+            SELECT name FROM sqlite_master
+            WHERE name IN ('idx_notes_session_counts', 'idx_drawover_uuid_strokes', 'sqlite_stat1')
+        ''')
+        if len(cursor.fetchall()) == 3:
+            return
+
+        # Session lookup by uuid already covers id (rowid is in every index)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_notes_session_counts
+            ON review_notes(session_id, deleted, resolved)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_drawover_uuid_strokes
+            ON drawover_metadata(animation_uuid, stroke_count)
+        ''')
+        # Without statistics the planner picks idx_notes_deleted (nearly
+        # every row matches) over the uuid lookup and scans all notes.
+        # A sampled ANALYZE keeps this cheap on large databases.
+        cursor.execute('PRAGMA analysis_limit = 1000')
+        cursor.execute('ANALYZE')
+        self._connection.commit()
+
     def close(self):
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the calling thread's database connection."""
+        if self._db:
+            self._db.close()
 
     # ==================== App Settings ====================
 
@@ -990,6 +1025,67 @@ class NotesDatabase:
 
         return counts
 
+    def get_note_counts(self, animation_uuids: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Get badge counts for many animations in one query.
+
+        The uuid list is passed as a single JSON parameter, so any number
+        of uuids costs one round trip (no per-uuid queries, no host
+        parameter limit).
+
+        Args:
+            animation_uuids: Animations to count, or None for all
+
+        Returns:
+            Dict mapping animation UUID to {'total', 'unresolved', 'drawovers'}
+            (non-deleted notes, unresolved notes, frames with strokes).
+            Animations with no notes and no drawovers are omitted.
+        """
+        counts = {}
+        try:
+            cursor = self._connection.cursor()
+
+            if animation_uuids is None:
+                note_filter = drawover_filter = ''
+                params = ()
+            else:
+                note_filter = 'AND s.animation_uuid IN (SELECT value FROM json_each(?))'
+                drawover_filter = 'AND animation_uuid IN (SELECT value FROM json_each(?))'
+                uuids_json = json.dumps(list(animation_uuids))
+                params = (uuids_json, uuids_json)
+
+            cursor.execute(f'''
+                SELECT animation_uuid,
+                       SUM(total), SUM(unresolved), SUM(drawovers)
+                FROM (
+                    SELECT s.animation_uuid AS animation_uuid,
+                           COUNT(*) AS total,
+                           SUM(n.resolved = 0) AS unresolved,
+                           0 AS drawovers
+                    FROM review_sessions s
+                    JOIN review_notes n ON n.session_id = s.id
+                    WHERE n.deleted = 0 {note_filter}
+                    GROUP BY s.animation_uuid
+                    UNION ALL
+                    SELECT animation_uuid, 0, 0, COUNT(*)
+                    FROM drawover_metadata
+                    WHERE stroke_count > 0 {drawover_filter}
+                    GROUP BY animation_uuid
+                )
+                GROUP BY animation_uuid
+            ''', params)
+            for row in cursor.fetchall():
+                counts[row[0]] = {
+                    'total': row[1],
+                    'unresolved': row[2],
+                    'drawovers': row[3],
+                }
+
+        except Exception as e:
+            logger.warning(f"Failed to get note counts: {e}")
+
+        return counts
+
     def get_unresolved_count(self, animation_uuid: str) -> int:
         """
         Get unresolved comment count for a specific animation.
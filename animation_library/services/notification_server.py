@@ -0,0 +1,233 @@
+"""
+NotificationServer - Real-time Blender→Desktop notification channel
+
+Counterpart to the Blender socket server: Blender connects to this local
+TCP server and pushes notifications (animation captured, preview updating,
+preview updated) directly, instead of dropping JSON files into the queue
+directory for the desktop app to discover by polling.
+
+Architecture:
+    [ Blender Addon ]  ─── TCP Socket ───▶  [ Desktop NotificationServer ]
+         Client                                   QTcpServer (main thread)
+
+Protocol:
+    - Newline-delimited JSON, same message schema as the file queue
+      (see protocol.schema 'blender_to_desktop' message types)
+    - Each notification is acknowledged with a standard response dict
+
+The bound port is advertised in {queue_dir}/notify_endpoint.json so the
+addon can find the server even when the default port was taken. The
+file-based queue remains the fallback when the server is not reachable.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Dict
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QTcpServer, QTcpSocket, QHostAddress
+
+from ..protocol import (
+    get_message_def,
+    validate_message,
+    build_success_response,
+    build_error_response,
+    SOCKET_HOST,
+    DEFAULT_NOTIFY_PORT,
+    NOTIFY_PORT_ENV_VAR,
+    NOTIFY_ENDPOINT_FILE,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationServer(QObject):
+    """
+    Local TCP server receiving notifications from the Blender addon.
+
+    Runs entirely on the Qt event loop (no polling, no extra threads):
+    readyRead fires as soon as Blender writes a message, so a capture
+    reaches the UI within milliseconds.
+
+    Signals:
+        notification_received(dict): Validated notification message
+
+    Usage:
+        server = get_notification_server()
+        server.notification_received.connect(handler)
+        server.start(queue_dir)
+    """
+
+    notification_received = pyqtSignal(dict)
+
+    # Number of consecutive ports to try if the preferred one is taken
+    PORT_SEARCH_RANGE = 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._server = QTcpServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers: Dict[QTcpSocket, bytes] = {}
+        self._endpoint_file: Optional[Path] = None
+
+    @property
+    def is_listening(self) -> bool:
+        """Check if the server is accepting notifications"""
+        return self._server.isListening()
+
+    @property
+    def port(self) -> int:
+        """Port the server is bound to (0 if not listening)"""
+        return self._server.serverPort() if self._server.isListening() else 0
+
+    def start(self, queue_dir: Optional[Path] = None) -> bool:
+        """
+        Start listening and advertise the endpoint in the queue directory.
+
+        Args:
+            queue_dir: Queue directory shared with Blender (for endpoint file)
+
+        Returns:
+            True if the server is listening
+        """
+        if not self._server.isListening():
+            preferred = self._get_preferred_port()
+            for port in range(preferred, preferred + self.PORT_SEARCH_RANGE):
+                if self._server.listen(QHostAddress(SOCKET_HOST), port):
+                    logger.info(f"Notification server listening on {SOCKET_HOST}:{port}")
+                    break
+            else:
+                logger.warning(
+                    f"Notification server could not bind: {self._server.errorString()}"
+                )
+                return False
+
+        if queue_dir is not None:
+            self._write_endpoint_file(Path(queue_dir))
+        return True
+
+    def stop(self):
+        """Stop listening and remove the endpoint file"""
+        for client in list(self._buffers):
+            client.disconnectFromHost()
+        self._buffers.clear()
+
+        if self._server.isListening():
+            self._server.close()
+            logger.debug("Notification server stopped")
+
+        self._remove_endpoint_file()
+
+    def _get_preferred_port(self) -> int:
+        """Get port from environment override or protocol default"""
+        env_port = os.environ.get(NOTIFY_PORT_ENV_VAR)
+        if env_port:
+            try:
+                return int(env_port)
+            except ValueError:
+                pass
+        return DEFAULT_NOTIFY_PORT
+
+    def _write_endpoint_file(self, queue_dir: Path):
+        """Advertise bound port so the addon can connect"""
+        self._remove_endpoint_file()
+        try:
+            queue_dir.mkdir(parents=True, exist_ok=True)
+            endpoint_file = queue_dir / NOTIFY_ENDPOINT_FILE
+            temp_file = endpoint_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'host': SOCKET_HOST,
+                    'port': self.port,
+                    'pid': os.getpid(),
+                }, f)
+            os.replace(temp_file, endpoint_file)
+            self._endpoint_file = endpoint_file
+        except Exception as e:
+            logger.debug(f"Could not write notification endpoint file: {e}")
+
+    def _remove_endpoint_file(self):
+        """Remove the endpoint file if this process wrote it"""
+        if self._endpoint_file is None:
+            return
+        try:
+            with open(self._endpoint_file, 'r', encoding='utf-8') as f:
+                owner_pid = json.load(f).get('pid')
+            if owner_pid == os.getpid():
+                self._endpoint_file.unlink()
+        except Exception:
+            pass
+        self._endpoint_file = None
+
+    def _on_new_connection(self):
+        """Accept pending client connections"""
+        while self._server.hasPendingConnections():
+            client = self._server.nextPendingConnection()
+            if client is None:
+                break
+            self._buffers[client] = b''
+            client.readyRead.connect(lambda c=client: self._on_ready_read(c))
+            client.disconnected.connect(lambda c=client: self._on_disconnected(c))
+
+    def _on_disconnected(self, client: QTcpSocket):
+        """Drop client state on disconnect"""
+        self._buffers.pop(client, None)
+        client.deleteLater()
+
+    def _on_ready_read(self, client: QTcpSocket):
+        """Read newline-delimited JSON messages from a client"""
+        buffer = self._buffers.get(client, b'') + bytes(client.readAll())
+
+        while b'\n' in buffer:
+            line, buffer = buffer.split(b'\n', 1)
+            line = line.strip()
+            if line:
+                response = self._handle_line(line)
+                client.write((json.dumps(response) + '\n').encode('utf-8'))
+
+        self._buffers[client] = buffer
+
+    def _handle_line(self, line: bytes) -> dict:
+        """Parse, validate and dispatch a single message"""
+        try:
+            message = json.loads(line.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            return build_error_response(f"Invalid JSON: {e}")
+
+        if not isinstance(message, dict):
+            return build_error_response("Notification must be a JSON object")
+
+        msg_def = get_message_def(message.get('type', ''))
+        if msg_def is None or msg_def.direction != 'blender_to_desktop':
+            return build_error_response(f"Unsupported notification type: {message.get('type')}")
+
+        is_valid, error = validate_message(message)
+        if not is_valid:
+            logger.warning(f"Rejected notification: {error}")
+            return build_error_response(error)
+
+        self.notification_received.emit(message)
+        return build_success_response("received")
+
+
+# Singleton instance
+_notification_server_instance: Optional[NotificationServer] = None
+
+
+def get_notification_server() -> NotificationServer:
+    """
+    Get global NotificationServer singleton
+
+    Returns:
+        Global NotificationServer instance
+    """
+    global _notification_server_instance
+    if _notification_server_instance is None:
+        _notification_server_instance = NotificationServer()
+    return _notification_server_instance
+
+
+__all__ = ['NotificationServer', 'get_notification_server']
@@ -0,0 +1,304 @@
+"""
+SelectionDetailsLoader - Async per-animation details for the metadata panel
+
+Pattern: Background loading with QRunnable workers
+Features:
+- Collects the facts the metadata panel needs beyond the animation dict
+  (resolved preview file, version count, unresolved note count) on a
+  worker, so selection changes never wait on SQLite or the filesystem
+- Cancels stale requests when the selection moves on
+- Prefetches neighbours of the selection into a small LRU, so stepping
+  through the grid with the arrow keys is served from memory
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from ..config import Config
+from .directory_cache import get_directory_cache
+
+logger = logging.getLogger(__name__)
+
+
+class SelectionDetailsSignals(QObject):
+    """Signals for SelectionDetailsTask"""
+
+    load_complete = pyqtSignal(str, int, dict)  # uuid, request_id, details
+    load_failed = pyqtSignal(str, int, str)  # uuid, request_id, error_message
+
+
+class SelectionDetailsTask(QRunnable):
+    """
+    Background task collecting details for one animation
+
+    Checks for cancellation between steps, so a request the selection has
+    already moved past stops at the next query instead of finishing.
+
+    Usage:
+        task = SelectionDetailsTask(animation, request_id)
+        threadpool.start(task)
+    """
+
+    # Thread pool priorities: the selected item is loaded before neighbours
+    PRIORITY_SELECTED = 1
+    PRIORITY_PREFETCH = 0
+
+    def __init__(self, animation: Dict[str, Any], request_id: int):
+        super().__init__()
+        self.animation = dict(animation)
+        self.uuid = animation.get('uuid', '')
+        self.request_id = request_id
+        self.signals = SelectionDetailsSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop at the next step (results of a cancelled task are never emitted)"""
+        self._cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if the task was cancelled"""
+        return self._cancelled.is_set()
+
+    def run(self):
+        """Execute details loading task"""
+        try:
+            details = self._load()
+            if details is not None:
+                self.signals.load_complete.emit(self.uuid, self.request_id, details)
+        except Exception as e:
+            if not self.is_cancelled:
+                self.signals.load_failed.emit(self.uuid, self.request_id, f"Details load error: {e}")
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Collect details, returning None if cancelled part-way"""
+        from .database_service import get_database_service
+        from .notes_database import get_notes_database
+
+        animation = self.animation
+        db_service = get_database_service()
+
+        # Preview file - stored path, else hot/cold storage lookup
+        preview_path = animation.get('preview_path') or ''
+        if preview_path and not get_directory_cache().exists(preview_path):
+            resolved = db_service.animations.resolve_preview_file(animation)
+            if resolved:
+                preview_path = str(resolved)
+
+        if self.is_cancelled:
+            return None
+
+        # Version count (poses are not versioned)
+        version_count = 1
+        group_id = animation.get('version_group_id') or self.uuid
+        if group_id and not animation.get('is_pose'):
+            version_count = db_service.get_version_count(group_id)
+
+        if self.is_cancelled:
+            return None
+
+        unresolved_count = get_notes_database().get_unresolved_count(self.uuid) if self.uuid else 0
+
+        if self.is_cancelled:
+            return None
+
+        return {
+            'preview_path': preview_path,
+            'version_count': version_count,
+            'unresolved_count': unresolved_count,
+        }
+
+
+class SelectionDetailsLoader(QObject):
+    """
+    Manages async selection details with QThreadPool
+
+    Features:
+    - Background loading with a dedicated worker pool
+    - Stale request cancellation (queued tasks are dropped, running ones stop early)
+    - Neighbour prefetch into an LRU cache
+    - Load deduplication
+
+    Usage:
+        loader = get_selection_details_loader()
+        loader.details_ready.connect(on_details_ready)
+        details = loader.get_details(animation)  # None while loading
+        loader.prefetch(neighbour_animations)
+    """
+
+    # Signals
+    details_ready = pyqtSignal(str, dict)  # uuid, details
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(Config.SELECTION_DETAILS_THREAD_COUNT)
+
+        # uuid -> details
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # uuid -> in-flight task
+        self._pending: Dict[str, SelectionDetailsTask] = {}
+        self._next_request_id = 0
+
+        # Performance monitoring
+        self.cache_hits: int = 0
+        self.total_requests: int = 0
+        self.cancelled_count: int = 0
+
+    def get_details(self, animation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get details for the selected animation (from cache or async)
+
+        Requests for anything else still queued are cancelled, since the
+        selection has moved on.
+
+        Args:
+            animation: Animation data dict
+
+        Returns:
+            Details dict if cached, None if loading in background
+            (details_ready follows)
+        """
+        uuid = animation.get('uuid')
+        if not uuid:
+            return None
+
+        self.total_requests += 1
+        self._cancel_pending(keep={uuid})
+
+        details = self._cache.get(uuid)
+        if details is not None:
+            self._cache.move_to_end(uuid)
+            self.cache_hits += 1
+            return details
+
+        if uuid not in self._pending:
+            self._start(animation, SelectionDetailsTask.PRIORITY_SELECTED)
+        return None
+
+    def prefetch(self, animations: Iterable[Dict[str, Any]]):
+        """
+        Load details for animations likely to be selected next
+
+        Args:
+            animations: Animation data dicts (e.g. neighbours of the selection)
+        """
+        for animation in animations:
+            uuid = animation.get('uuid')
+            if uuid and uuid not in self._cache and uuid not in self._pending:
+                self._start(animation, SelectionDetailsTask.PRIORITY_PREFETCH)
+
+    def invalidate(self, uuid: Optional[str] = None):
+        """
+        Drop cached details
+
+        Args:
+            uuid: Animation to invalidate, or None for all
+        """
+        if uuid is None:
+            self._cache.clear()
+            self._cancel_pending(keep=set())
+            return
+
+        self._cache.pop(uuid, None)
+        task = self._pending.pop(uuid, None)
+        if task is not None:
+            self._cancel_task(task)
+
+    def _start(self, animation: Dict[str, Any], priority: int):
+        """Queue a details task"""
+        self._next_request_id += 1
+        task = SelectionDetailsTask(animation, self._next_request_id)
+        task.signals.load_complete.connect(self._on_load_complete)
+        task.signals.load_failed.connect(self._on_load_failed)
+        self._pending[task.uuid] = task
+        self.thread_pool.start(task, priority)
+
+    def _cancel_pending(self, keep: set):
+        """Cancel in-flight tasks for animations not in keep"""
+        for uuid in [u for u in self._pending if u not in keep]:
+            self._cancel_task(self._pending.pop(uuid))
+
+    def _cancel_task(self, task: SelectionDetailsTask):
+        """Remove a queued task from the pool, or stop a running one early"""
+        # A finished task is deleted by the pool; its queued result is ignored by _is_current
+        if sip.isdeleted(task):
+            return
+        if not self.thread_pool.tryTake(task):
+            task.cancel()
+        self.cancelled_count += 1
+
+    def _is_current(self, uuid: str, request_id: int) -> bool:
+        """Check a result belongs to the live request for uuid (not a cancelled/stale one)"""
+        task = self._pending.get(uuid)
+        return task is not None and task.request_id == request_id
+
+    def _on_load_complete(self, uuid: str, request_id: int, details: dict):
+        """Cache details and notify listeners"""
+        if not self._is_current(uuid, request_id):
+            return
+        del self._pending[uuid]
+
+        self._cache[uuid] = details
+        self._cache.move_to_end(uuid)
+        while len(self._cache) > Config.SELECTION_DETAILS_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+        self.details_ready.emit(uuid, details)
+
+    def _on_load_failed(self, uuid: str, request_id: int, error_message: str):
+        """Handle failed details load - report uncached fallback details so the panel still fills in"""
+        logger.warning(error_message)
+        if not self._is_current(uuid, request_id):
+            return
+        task = self._pending.pop(uuid)
+
+        self.details_ready.emit(uuid, {
+            'preview_path': task.animation.get('preview_path') or '',
+            'version_count': 1,
+            'unresolved_count': 0,
+        })
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get performance statistics
+
+        Returns:
+            Dict with cache statistics
+        """
+        hit_rate = (self.cache_hits / self.total_requests * 100) if self.total_requests > 0 else 0
+
+        return {
+            'total_requests': self.total_requests,
+            'cache_hits': self.cache_hits,
+            'cache_hit_rate': hit_rate,
+            'cancelled_count': self.cancelled_count,
+            'cached_count': len(self._cache),
+            'pending_count': len(self._pending),
+        }
+
+
+# Singleton instance
+_selection_details_loader_instance: Optional[SelectionDetailsLoader] = None
+
+
+def get_selection_details_loader() -> SelectionDetailsLoader:
+    """
+    Get global SelectionDetailsLoader singleton
+
+    Returns:
+        Global SelectionDetailsLoader instance
+    """
+    global _selection_details_loader_instance
+    if _selection_details_loader_instance is None:
+        _selection_details_loader_instance = SelectionDetailsLoader()
+    return _selection_details_loader_instance
+
+
+__all__ = ['SelectionDetailsLoader', 'SelectionDetailsTask', 'get_selection_details_loader']
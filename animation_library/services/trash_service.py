@@ -15,7 +15,9 @@ from typing import List, Dict, Any, Optional, Tuple
 
 from ..config import Config
 from .database_service import get_database_service, DatabaseService
+from .directory_cache import get_directory_cache
 from .utils.path_utils import get_archive_folder, get_trash_folder
+from .utils.file_operations import move_folder, undo_move_folder, safe_delete_folder_contents
 
 
 logger = logging.getLogger(__name__)
@@ -82,62 +84,98 @@ class TrashService:
         Returns:
             Tuple of (success, message)
         """
-        try:
-            # Get trash item
-            trash_item = self._db.get_trash_item(uuid)
-            if not trash_item:
-                return False, "Item not found in trash"
+        return self.restore_many_to_archive([uuid])[uuid]
 
-            # Get paths
-            archive_folder = get_archive_folder()
-            if not archive_folder:
-                return False, "Library path not configured"
-
-            # Source folder (.trash/{folder_name}/)
-            source_folder = Path(trash_item['trash_folder_path'])
-            if not source_folder.exists():
-                # Files gone - just clean up database
-                self._db.delete_from_trash(uuid)
-                return False, "Trash files not found"
-
-            # Destination folder - preserve folder name (.deleted/{folder_name}/)
-            dest_folder = _get_unique_folder_name(archive_folder, source_folder.name)
-
-            # Move files back to archive
-            shutil.move(str(source_folder), str(dest_folder))
-
-            # Update thumbnail path to new location (find any .png file)
-            thumbnail_path = None
-            png_files = list(dest_folder.glob("*.png"))
-            if png_files:
-                thumbnail_path = str(png_files[0])
-
-            # Add to archive table
-            # Note: We only have minimal data from trash, so we reconstruct what we can
-            archive_data = {
-                'uuid': uuid,
-                'name': trash_item.get('name', 'Unknown'),
-                'archive_folder_path': str(dest_folder),
-                'thumbnail_path': thumbnail_path,
-                # Preserve original archived_date if available
-                'original_created_date': trash_item.get('archived_date')
-            }
-
-            result = self._db.add_to_archive(archive_data)
-            if not result:
-                # Rollback - move files back to trash
-                shutil.move(str(dest_folder), str(source_folder))
-                return False, "Failed to add to archive database"
+    def restore_many_to_archive(self, uuids: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Restore animations from trash back to archive as one batch
 
-            # Remove from trash table
-            self._db.delete_from_trash(uuid)
+        Folders are renamed back into the archive, then every database
+        change is committed in one transaction. Items whose database change
+        fails are moved back to the trash; if the commit fails, every
+        folder is.
 
-            logger.info(f"Restored '{trash_item.get('name')}' from trash to archive")
-            return True, "Restored to archive"
+        Args:
+            uuids: Animation UUIDs to restore
 
-        except Exception as e:
-            logger.error(f"Failed to restore to archive: {e}")
-            return False, f"Error: {str(e)}"
+        Returns:
+            Dict mapping UUID to (success, message)
+        """
+        archive_folder = get_archive_folder()
+        if not archive_folder:
+            return {uuid: (False, "Library path not configured") for uuid in uuids}
+
+        results: Dict[str, Tuple[bool, str]] = {}
+        archive_rows = []
+        removed_uuids = []
+        moves = {}  # uuid -> (source_folder, dest_folder, renamed, failed_files)
+
+        for uuid in uuids:
+            move = None
+            try:
+                trash_item = self._db.get_trash_item(uuid)
+                if not trash_item:
+                    results[uuid] = (False, "Item not found in trash")
+                    continue
+
+                # Source folder (.trash/{folder_name}/)
+                source_folder = Path(trash_item['trash_folder_path'])
+                if not source_folder.exists():
+                    # Files gone - just clean up database
+                    removed_uuids.append(uuid)
+                    results[uuid] = (False, "Trash files not found")
+                    continue
+
+                if self._db.is_uuid_in_archive(uuid):
+                    # Checked before moving, so the conflict cannot fail the batch commit
+                    results[uuid] = (False, "An archived item with this UUID already exists")
+                    continue
+
+                # Destination folder - preserve folder name (.deleted/{folder_name}/)
+                dest_folder = _get_unique_folder_name(archive_folder, source_folder.name)
+                renamed, failed_files = move_folder(source_folder, dest_folder)
+                move = (source_folder, dest_folder, renamed, failed_files)
+
+                # Update thumbnail path to new location (find any .png file)
+                thumbnail = next(dest_folder.glob("*.png"), None)
+
+                # Note: We only have minimal data from trash, so we reconstruct what we can
+                archive_rows.append({
+                    'uuid': uuid,
+                    'name': trash_item.get('name', 'Unknown'),
+                    'archive_folder_path': str(dest_folder),
+                    'thumbnail_path': str(thumbnail) if thumbnail else None,
+                    # Preserve original archived_date if available
+                    'original_created_date': trash_item.get('archived_date')
+                })
+                removed_uuids.append(uuid)
+                moves[uuid] = move
+                results[uuid] = (True, "Restored to archive")
+
+            except Exception as e:
+                logger.error(f"Failed to restore to archive: {e}")
+                if move is not None and uuid not in moves:
+                    undo_move_folder(move[0], move[1], move[2])
+                results[uuid] = (False, f"Error: {str(e)}")
+
+        if not removed_uuids:
+            return results
+
+        failed = self._db.restore_trashed_animations(archive_rows, removed_uuids)
+        if failed is None:
+            failed = {uuid: "transaction failed" for uuid in removed_uuids}
+        for uuid, error in failed.items():
+            results[uuid] = (False, f"Failed to add to archive database: {error}")
+            if uuid in moves:
+                source_folder, dest_folder, renamed, _ = moves.pop(uuid)
+                undo_move_folder(source_folder, dest_folder, renamed)
+
+        for source_folder, _, renamed, failed_files in moves.values():
+            if not renamed:
+                safe_delete_folder_contents(source_folder, skip_files=failed_files)
+
+        logger.info(f"Restored {len(removed_uuids) - len(failed)} item(s) from trash to archive")
+        return results
 
     def permanently_delete(self, uuid: str, force: bool = False) -> Tuple[bool, str]:
         """
@@ -164,6 +202,7 @@ class TrashService:
             trash_folder = Path(trash_item['trash_folder_path'])
             if trash_folder.exists():
                 shutil.rmtree(trash_folder)
+                get_directory_cache().invalidate_tree(trash_folder)
 
             # Remove from trash table
             self._db.delete_from_trash(uuid)
@@ -175,12 +214,15 @@ class TrashService:
             logger.error(f"Failed to permanently delete: {e}")
             return False, f"Error: {str(e)}"
 
-    def empty_trash(self, force: bool = False) -> Tuple[int, int, str]:
+    def empty_trash(self, force: bool = False, progress_callback=None,
+                    cancel_token=None) -> Tuple[int, int, str]:
         """
         Delete all items in trash permanently
 
         Args:
             force: If True, skip the ALLOW_HARD_DELETE check
+            progress_callback: Optional callback(current, total, message)
+            cancel_token: Optional CancellationToken, checked between items
 
         Returns:
             Tuple of (deleted_count, error_count, message)
@@ -193,7 +235,12 @@ class TrashService:
         errors = 0
 
         trash_items = self._db.get_all_trash_items()
-        for item in trash_items:
+        total = len(trash_items)
+        for index, item in enumerate(trash_items):
+            if cancel_token is not None and cancel_token.is_cancelled:
+                break
+            if progress_callback:
+                progress_callback(index, total, f"Deleting: {item.get('name', '')}")
             success, _ = self.permanently_delete(item['uuid'], force=True)
             if success:
                 deleted += 1
@@ -14,6 +14,8 @@ from .path_utils import (
 from .file_operations import (
     safe_copy_file,
     safe_copy_folder_contents,
+    move_folder,
+    undo_move_folder,
     safe_delete_file,
     safe_delete_folder_contents,
 )
@@ -28,6 +30,8 @@ __all__ = [
     # File operations
     'safe_copy_file',
     'safe_copy_folder_contents',
+    'move_folder',
+    'undo_move_folder',
     'safe_delete_file',
     'safe_delete_folder_contents',
 ]
@@ -3,15 +3,19 @@ File Operations - Safe file copy/delete utilities with retry logic
 
 Centralizes file operations that were duplicated in archive_service.py.
 Uses retry logic and gc.collect() to handle locked files on Windows.
+Every operation invalidates the folders it touched in the DirectoryCache.
 """
 
 import gc
+import os
 import shutil
 import time
 import logging
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from ..directory_cache import get_directory_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +41,7 @@ def safe_copy_file(
         try:
             gc.collect()  # Release Python file handles
             shutil.copy2(str(source), str(dest))
+            get_directory_cache().invalidate(dest)
             return True, ""
         except PermissionError as e:
             if attempt < max_retries - 1:
@@ -95,9 +100,65 @@ def safe_copy_folder_contents(
             logger.warning(f"Failed to copy {file_path.name}: {e}")
             failed_files.append(file_path.name)
 
+    get_directory_cache().invalidate_tree(dest_folder)
     return len(failed_files) == 0, failed_files
 
 
+def move_folder(source: Path, dest: Path) -> Tuple[bool, List[str]]:
+    """
+    Move a folder, renaming it in place when possible
+
+    On the same volume this is a single rename - nothing is copied, however
+    large the folder. Across volumes, or if the rename is refused (a file
+    held open on Windows), the contents are copied instead and the source
+    is left in place, so the caller can commit its database changes before
+    deleting it with safe_delete_folder_contents().
+
+    Args:
+        source: Folder to move
+        dest: Destination folder path (must not exist)
+
+    Returns:
+        Tuple of (renamed, list of filenames that failed to copy)
+    """
+    try:
+        os.rename(source, dest)
+        get_directory_cache().invalidate_tree(source)
+        get_directory_cache().invalidate_tree(dest)
+        return True, []
+    except OSError as e:
+        logger.debug(f"Rename {source} -> {dest} failed ({e}), copying instead")
+
+    _, failed_files = safe_copy_folder_contents(source, dest)
+    return False, failed_files
+
+
+def undo_move_folder(source: Path, dest: Path, renamed: bool) -> bool:
+    """
+    Reverse a move_folder() call (e.g. when the database update failed)
+
+    Args:
+        source: Original folder path
+        dest: Folder path it was moved to
+        renamed: First value returned by move_folder()
+
+    Returns:
+        True if the source folder is back in its original state
+    """
+    try:
+        if renamed:
+            os.rename(dest, source)
+        else:
+            # Source was never touched - drop the copy
+            shutil.rmtree(dest, ignore_errors=True)
+        get_directory_cache().invalidate_tree(source)
+        get_directory_cache().invalidate_tree(dest)
+        return True
+    except OSError as e:
+        logger.error(f"Failed to move {dest} back to {source}: {e}")
+        return False
+
+
 def safe_delete_file(
     file_path: Path,
     max_retries: int = 3,
@@ -118,6 +179,7 @@ def safe_delete_file(
         try:
             gc.collect()  # Release Python file handles
             file_path.unlink()
+            get_directory_cache().invalidate(file_path)
             return True, ""
         except PermissionError as e:
             if attempt < max_retries - 1:
@@ -175,6 +237,7 @@ def safe_delete_folder_contents(
         except OSError:
             pass  # Not empty or locked
 
+    get_directory_cache().invalidate_tree(folder)
     return still_locked
 
 
@@ -194,6 +257,7 @@ def safe_delete_folder(folder: Path, max_retries: int = 3) -> Tuple[bool, str]:
             gc.collect()
             if folder.exists():
                 shutil.rmtree(folder)
+                get_directory_cache().invalidate_tree(folder)
             return True, ""
         except PermissionError as e:
             if attempt < max_retries - 1:
@@ -209,6 +273,8 @@ def safe_delete_folder(folder: Path, max_retries: int = 3) -> Tuple[bool, str]:
 __all__ = [
     'safe_copy_file',
     'safe_copy_folder_contents',
+    'move_folder',
+    'undo_move_folder',
     'safe_delete_file',
     'safe_delete_folder_contents',
     'safe_delete_folder',
@@ -0,0 +1,435 @@
+"""
+VideoFrameDecoder - Background decoding with a read-ahead frame buffer
+
+Pattern: One decoder thread per open video, GUI thread only blits
+Moves cv2 decode, resize and color conversion off the GUI thread. Frames
+are stored already scaled to the display size, so showing a frame is a
+dictionary lookup plus QPixmap.fromImage().
+
+Two buffering modes:
+    - Clip cache: short previews that fit the memory budget are decoded
+      completely, making scrubbing, stepping and reverse play instant.
+    - Ring buffer: longer videos keep a bounded window of frames ahead of
+      the playhead (in the playback direction). Reverse play decodes the
+      window in forward chunks, so it costs one seek per chunk instead of
+      one seek per frame.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Tuple, Any, List
+
+import cv2
+from PyQt6.QtGui import QImage
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class VideoFrameDecoder:
+    """
+    Decodes one video on a worker thread into a buffer of display-ready QImages.
+
+    Usage:
+        decoder = VideoFrameDecoder(video_path)
+        if decoder.is_opened:
+            decoder.start((width, height))
+            image = decoder.get_frame(0, wait_ms=1000)
+        ...
+        decoder.stop()
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        read_ahead: int = Config.VIDEO_READ_AHEAD_FRAMES,
+        clip_cache_mb: int = Config.VIDEO_CLIP_CACHE_MAX_MB
+    ):
+        self._video_path = video_path
+        self._read_ahead = max(1, read_ahead)
+        self._clip_cache_bytes = clip_cache_mb * 1024 * 1024
+
+        self._cap = cv2.VideoCapture(video_path)
+        self._is_opened = self._cap.isOpened()
+        if self._is_opened:
+            self._fps = self._cap.get(cv2.CAP_PROP_FPS) or 24
+            self._total_frames = max(0, int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+            self._native_size = (
+                int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            )
+        else:
+            self._fps = 24
+            self._total_frames = 0
+            self._native_size = (0, 0)
+
+        # Shared state (guarded by _cond)
+        self._cond = threading.Condition()
+        self._frames: Dict[int, QImage] = {}
+        self._target_size: Optional[Tuple[int, int]] = None
+        self._playhead = 0
+        self._direction = 1  # 1 = forward, -1 = reverse
+        self._generation = 0  # Bumped when buffered frames become invalid
+        self._end_frame: Optional[int] = None  # First unreadable frame, once known
+        self._cache_all = False
+        self._stopped = False
+
+        # Decoder-thread state
+        self._next_read = 0  # Frame index the capture returns on next read()
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self._decode_times: deque = deque(maxlen=120)
+        self._decoded_count = 0
+        self._dropped_count = 0
+        self._seek_count = 0
+
+    # ==================== PROPERTIES ====================
+
+    @property
+    def is_opened(self) -> bool:
+        """Check if the video could be opened"""
+        return self._is_opened
+
+    @property
+    def fps(self) -> float:
+        """Video frame rate"""
+        return self._fps
+
+    @property
+    def total_frames(self) -> int:
+        """Frame count reported by the container"""
+        return self._total_frames
+
+    @property
+    def native_size(self) -> Tuple[int, int]:
+        """Native video resolution (width, height)"""
+        return self._native_size
+
+    @property
+    def frame_limit(self) -> int:
+        """Number of frames that can actually be shown"""
+        with self._cond:
+            return self._frame_limit()
+
+    @property
+    def is_clip_cached(self) -> bool:
+        """True if the whole clip is kept in memory"""
+        return self._cache_all
+
+    # ==================== PUBLIC API ====================
+
+    def start(self, target_size: Tuple[int, int]):
+        """
+        Start the decoder thread.
+
+        Args:
+            target_size: Display size (width, height) frames are scaled to
+        """
+        if not self._is_opened or self._thread is not None:
+            return
+
+        self.set_target_size(target_size)
+        self._thread = threading.Thread(
+            target=self._run, name="VideoFrameDecoder", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the decoder thread and release the video file."""
+        with self._cond:
+            self._stopped = True
+            self._frames.clear()
+            self._cond.notify_all()
+
+        if self._thread is not None:
+            # The thread releases the capture on exit
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        elif self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+    def set_target_size(self, target_size: Tuple[int, int]):
+        """
+        Change the display size; buffered frames are re-decoded.
+
+        Args:
+            target_size: Display size (width, height)
+        """
+        width, height = max(1, int(target_size[0])), max(1, int(target_size[1]))
+        with self._cond:
+            if self._target_size == (width, height):
+                return
+            self._target_size = (width, height)
+            self._generation += 1
+            self._frames.clear()
+
+            frame_bytes = width * height * 3
+            self._cache_all = (
+                self._total_frames > 0 and
+                self._total_frames * frame_bytes <= self._clip_cache_bytes
+            )
+            self._cond.notify_all()
+
+    def set_direction(self, direction: int):
+        """
+        Set playback direction, which decides where read-ahead goes.
+
+        Args:
+            direction: 1 for forward, -1 for reverse
+        """
+        with self._cond:
+            direction = -1 if direction < 0 else 1
+            if direction != self._direction:
+                self._direction = direction
+                self._cond.notify_all()
+
+    def get_frame(self, frame: int, wait_ms: int = 0) -> Optional[QImage]:
+        """
+        Get a decoded frame and move the playhead to it.
+
+        Args:
+            frame: Frame index
+            wait_ms: How long to block for the frame if it is not buffered
+
+        Returns:
+            Display-ready QImage, or None if not available in time
+        """
+        with self._cond:
+            if self._playhead != frame:
+                self._playhead = frame
+                self._cond.notify_all()
+
+            image = self._frames.get(frame)
+            if image is None and wait_ms > 0:
+                deadline = time.monotonic() + wait_ms / 1000.0
+                while image is None and not self._stopped and frame < self._frame_limit():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                    image = self._frames.get(frame)
+            return image
+
+    def request_frame(self, frame: int) -> bool:
+        """
+        Move the playhead to a frame without blocking.
+
+        Lets several decoders work towards the same frame in parallel before
+        any of them is waited on.
+
+        Args:
+            frame: Frame index
+
+        Returns:
+            True if the frame is already buffered
+        """
+        with self._cond:
+            if self._playhead != frame:
+                self._playhead = frame
+                self._cond.notify_all()
+            return frame in self._frames
+
+    def record_dropped_frame(self):
+        """Count a frame that was due for display but not decoded in time."""
+        self._dropped_count += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get decoding statistics
+
+        Returns:
+            Dict with decode time, buffer and dropped frame metrics
+        """
+        times = list(self._decode_times)
+        with self._cond:
+            buffered = len(self._frames)
+        return {
+            'mode': 'clip_cache' if self._cache_all else 'ring_buffer',
+            'buffered_frames': buffered,
+            'decoded_frames': self._decoded_count,
+            'dropped_frames': self._dropped_count,
+            'seeks': self._seek_count,
+            'avg_decode_ms': (sum(times) / len(times)) if times else 0.0,
+            'max_decode_ms': max(times) if times else 0.0,
+        }
+
+    def reset_stats(self):
+        """Reset dropped-frame and decode-time counters."""
+        self._decode_times.clear()
+        self._decoded_count = 0
+        self._dropped_count = 0
+        self._seek_count = 0
+
+    # ==================== SCHEDULING (call with _cond held) ====================
+
+    def _frame_limit(self) -> int:
+        """Number of decodable frames (caller holds _cond)"""
+        if self._end_frame is not None:
+            return self._end_frame
+        if self._total_frames > 0:
+            return self._total_frames
+        return 1 << 30  # Unknown length: decode until read() fails
+
+    def _window(self, count: int) -> List[int]:
+        """Up to count frames from the playhead in playback direction"""
+        limit = self._frame_limit()
+        wrap = limit < (1 << 30)
+        count = min(count, limit)
+
+        window = []
+        for offset in range(count):
+            index = self._playhead + offset * self._direction
+            if wrap:
+                index %= limit
+            elif index < 0:
+                break
+            window.append(index)
+        return window
+
+    def _next_job(self) -> Optional[Tuple[int, int, int, Tuple[int, int]]]:
+        """
+        Pick the next contiguous run of frames to decode.
+
+        Frames within read_ahead of the playhead must be buffered; runs may
+        extend up to twice that, so reverse play decodes a whole chunk per
+        seek and forward play reads sequentially.
+
+        Returns:
+            (start, end, generation, size) for range [start, end), or None if idle
+        """
+        if self._target_size is None:
+            return None
+
+        if self._cache_all:
+            needed = keep = self._window(self._frame_limit())
+        else:
+            needed = self._window(self._read_ahead)
+            keep = self._window(self._read_ahead * 2)
+
+        keep_set = set(keep)
+
+        # Ring buffer: drop frames that fell out of the window
+        if not self._cache_all and len(self._frames) > len(keep):
+            for index in [i for i in self._frames if i not in keep_set]:
+                del self._frames[index]
+
+        for index in needed:
+            if index in self._frames:
+                continue
+
+            # Grow into a run of missing frames (decode is always forward)
+            start = end = index
+            if self._direction < 0:
+                while (start - 1 in keep_set and start - 1 not in self._frames
+                       and index - start + 1 < self._read_ahead):
+                    start -= 1
+            while (end + 1 in keep_set and end + 1 not in self._frames
+                   and end - start + 1 < self._read_ahead):
+                end += 1
+            return start, end + 1, self._generation, self._target_size
+
+        return None
+
+    # ==================== DECODER THREAD ====================
+
+    def _run(self):
+        """Decoder thread main loop"""
+        while True:
+            with self._cond:
+                job = None
+                while not self._stopped:
+                    job = self._next_job()
+                    if job is not None:
+                        break
+                    self._cond.wait()
+                if self._stopped:
+                    break
+
+            try:
+                self._decode_range(*job)
+            except Exception:
+                logger.warning("Video decode failed: %s", self._video_path, exc_info=True)
+                with self._cond:
+                    # Treat as end of stream so the scheduler does not spin
+                    self._end_frame = job[0]
+                    self._cond.notify_all()
+
+        # Thread owns the capture once started
+        self._cap.release()
+        self._cap = None
+
+    def _decode_range(self, start: int, end: int, generation: int, size: Tuple[int, int]):
+        """Decode frames [start, end) sequentially into the buffer"""
+        if self._next_read != start:
+            self._seek(start)
+
+        for index in range(start, end):
+            t0 = time.perf_counter()
+            ret, frame = self._cap.read()
+            if not ret:
+                with self._cond:
+                    self._end_frame = index
+                    self._cond.notify_all()
+                return
+            self._next_read = index + 1
+
+            image = self._to_display_image(frame, size)
+            self._decode_times.append((time.perf_counter() - t0) * 1000)
+            self._decoded_count += 1
+
+            with self._cond:
+                if self._stopped or generation != self._generation:
+                    return
+                self._frames[index] = image
+                self._cond.notify_all()
+
+                # Playhead jumped elsewhere - reschedule instead of finishing this run
+                if (self._playhead not in self._frames and
+                        not index < self._playhead < end):
+                    return
+
+    def _seek(self, frame: int):
+        """
+        Position the capture so the next read() returns the given frame.
+
+        Uses timestamp-based seeking, then grabs forward to the exact frame
+        (keyframe seeking may land before the target).
+        """
+        self._seek_count += 1
+        if frame == 0:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        elif self._fps > 0:
+            self._cap.set(cv2.CAP_PROP_POS_MSEC, (frame / self._fps) * 1000.0)
+        else:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
+
+        actual_pos = int(self._cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if actual_pos > frame:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
+            actual_pos = frame
+        while actual_pos < frame:
+            if not self._cap.grab():  # grab() is faster than read()
+                break
+            actual_pos += 1
+        self._next_read = frame
+
+    @staticmethod
+    def _to_display_image(frame, size: Tuple[int, int]) -> QImage:
+        """Scale a BGR frame to display size and convert to an owned QImage"""
+        width, height = size
+        src_h, src_w = frame.shape[:2]
+        if (src_w, src_h) != (width, height):
+            interpolation = cv2.INTER_AREA if width < src_w else cv2.INTER_LINEAR
+            frame = cv2.resize(frame, (width, height), interpolation=interpolation)
+
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        image = QImage(frame_rgb.data, width, height, 3 * width, QImage.Format.Format_RGB888)
+        return image.copy()  # Detach from the numpy buffer
+
+
+__all__ = ['VideoFrameDecoder']
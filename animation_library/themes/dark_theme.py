@@ -4,7 +4,7 @@ Dark theme implementation
 Inspired by current animation_library dark mode
 """
 
-from .theme_manager import Theme, ColorPalette
+from .theme_manager import Theme, ColorPalette, build_role_stylesheet
 from .fonts import Fonts
 
 
@@ -77,9 +77,19 @@ class DarkTheme(Theme):
 
     def get_stylesheet(self) -> str:
         """Generate QSS stylesheet for dark theme"""
+        return self.build_stylesheet(self.palette)
 
-        p = self.palette
+    @staticmethod
+    def build_stylesheet(p: ColorPalette) -> str:
+        """
+        Generate the dark QSS template for any palette
 
+        Args:
+            p: Color palette
+
+        Returns:
+            Complete QSS stylesheet string
+        """
         return f"""
 /* ===== GLOBAL STYLES ===== */
 QWidget {{
@@ -662,7 +672,7 @@ QHeaderView::section {{
 QHeaderView::section:hover {{
     background-color: {p.button_background};
 }}
-"""
+""" + build_role_stylesheet(p)
 
 
 __all__ = ['DarkTheme']
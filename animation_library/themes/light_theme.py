@@ -4,7 +4,7 @@ Light theme implementation
 Professional light color palette
 """
 
-from .theme_manager import Theme, ColorPalette
+from .theme_manager import Theme, ColorPalette, build_role_stylesheet
 from .fonts import Fonts
 
 
@@ -416,7 +416,7 @@ QToolTip {{
     border: 1px solid {p.border};
     padding: 4px;
 }}
-"""
+""" + build_role_stylesheet(p)
 
 
 __all__ = ['LightTheme']
@@ -6,6 +6,7 @@ Inspired by: Current animation_library with improvements
 """
 
 from typing import Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 import json
@@ -91,6 +92,152 @@ class ColorPalette:
     folder_text_size: int = 13  # Folder tree text size (8-20pt)
 
 
+def palette_key(palette: ColorPalette) -> tuple:
+    """
+    Get a hashable key of every value in a palette
+
+    Args:
+        palette: Color palette
+
+    Returns:
+        Tuple of field values, equal for palettes with identical values
+    """
+    return tuple(palette.__dict__.values())
+
+
+def adjust_color(hex_color: str, percent: int) -> str:
+    """
+    Lighten (positive percent) or darken (negative percent) a hex color
+
+    Args:
+        hex_color: Color as "#RRGGBB"
+        percent: Change per channel, relative to the channel value
+
+    Returns:
+        Adjusted color as "#rrggbb"
+    """
+    hex_color = hex_color.lstrip('#')
+    channels = [int(hex_color[i:i + 2], 16) for i in (0, 2, 4)]
+    channels = [max(0, min(255, c + int(c * percent / 100))) for c in channels]
+    return '#{:02x}{:02x}{:02x}'.format(*channels)
+
+
+def build_role_stylesheet(p: ColorPalette) -> str:
+    """
+    Generate QSS for widgets tagged with a role property or object name
+
+    Widgets that used to restyle themselves on every theme change set a
+    dynamic property (or object name) instead and are colored from here,
+    so a theme change costs one application-wide polish pass.
+
+    Args:
+        p: Color palette
+
+    Returns:
+        QSS fragment appended to every theme template
+    """
+    return f"""
+/* ===== APPLY PANEL ===== */
+QPushButton[applyRole="primary"], QPushButton[applyRole="secondary"] {{
+    color: white;
+    font-size: 13px;
+    font-weight: bold;
+    border: 0px;
+    border-radius: 0px;
+    padding: 8px;
+    outline: none;
+}}
+
+QPushButton[applyRole="primary"] {{
+    background-color: {p.accent};
+}}
+
+QPushButton[applyRole="primary"]:hover {{
+    background-color: {adjust_color(p.accent, 15)};
+}}
+
+QPushButton[applyRole="primary"]:pressed {{
+    background-color: {adjust_color(p.accent, -15)};
+}}
+
+QPushButton[applyRole="primary"]:disabled {{
+    background-color: #666666;
+    color: #999999;
+}}
+
+QPushButton[applyRole="secondary"] {{
+    background-color: #555555;
+}}
+
+QPushButton[applyRole="secondary"]:hover {{
+    background-color: #666666;
+}}
+
+QPushButton[applyRole="secondary"]:pressed {{
+    background-color: #444444;
+}}
+
+QPushButton[applyRole="secondary"]:disabled {{
+    background-color: #444444;
+    color: #777777;
+}}
+
+QCheckBox[applyRole="option"] {{
+    color: {p.text_primary};
+    spacing: 8px;
+    background: transparent;
+}}
+
+QCheckBox[applyRole="option"]::indicator {{
+    width: 14px;
+    height: 14px;
+    border: 0px;
+    border-radius: 0px;
+}}
+
+QCheckBox[applyRole="option"]::indicator:unchecked {{
+    background-color: #555555;
+}}
+
+QCheckBox[applyRole="option"]::indicator:unchecked:hover {{
+    background-color: #666666;
+}}
+
+QCheckBox[applyRole="option"]::indicator:checked {{
+    background-color: {p.accent};
+}}
+
+QCheckBox[applyRole="option"]::indicator:checked:hover {{
+    background-color: {adjust_color(p.accent, 15)};
+}}
+
+/* ===== SETTINGS SIDEBAR ===== */
+QListWidget#settingsSidebar {{
+    background: {p.background_secondary};
+    border: none;
+    border-right: 1px solid {p.border};
+    outline: 0;
+    padding-top: 6px;
+    color: {p.text_primary};
+}}
+
+QListWidget#settingsSidebar::item {{
+    padding: 6px 14px;
+    border: none;
+    color: {p.text_primary};
+}}
+
+QListWidget#settingsSidebar::item:hover {{
+    background: {p.list_item_hover};
+}}
+
+QListWidget#settingsSidebar::item:selected {{
+    background: {p.list_item_selected};
+    color: {p.selection_text};
+}}
+"""
+
+
 class Theme:
     """Base theme class"""
 
@@ -104,10 +251,13 @@ class Theme:
         """
         Generate Qt stylesheet for this theme
 
+        Themes loaded from JSON share the dark theme's QSS template.
+
         Returns:
             Complete QSS stylesheet string
         """
-        raise NotImplementedError("Subclasses must implement get_stylesheet()")
+        from .dark_theme import DarkTheme  # Import here to avoid circular dependency
+        return DarkTheme.build_stylesheet(self.palette)
 
     def get_gradient_colors(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
         """
@@ -254,18 +404,7 @@ class Theme:
             default_dict.update(palette_dict)
             palette = ColorPalette(**default_dict)
 
-        theme = cls(name, palette, author, description)
-
-        # Create a get_stylesheet method that uses the theme's current palette
-        # This ensures live preview works when palette is modified
-        def get_stylesheet_dynamic():
-            """Generate stylesheet using current theme palette"""
-            dark_theme = DarkTheme()
-            dark_theme.palette = theme.palette  # Use current palette
-            return dark_theme.get_stylesheet()
-
-        theme.get_stylesheet = get_stylesheet_dynamic
-        return theme
+        return cls(name, palette, author, description)
 
     def to_json_file(self, filepath: Path):
         """
@@ -387,12 +526,19 @@ class ThemeManager(QObject):
     """
     Manages application themes and style switching
 
+    Compiled stylesheets are cached per (template, palette values), and
+    re-selecting a theme whose palette is unchanged is a no-op, so only a
+    real color change costs an application-wide polish pass.
+
     Usage:
         theme_manager = ThemeManager()
         theme_manager.set_theme("dark")
-        stylesheet = theme_manager.get_current_stylesheet()
+        theme_manager.apply_stylesheet(app)
     """
 
+    # Compiled stylesheets kept (covers switching back and forth and live preview undo)
+    STYLESHEET_CACHE_SIZE = 8
+
     # Signals
     theme_changed = pyqtSignal(str)  # Emits theme name when theme changes
     folder_text_size_changed = pyqtSignal(int)  # Emits when folder text size changes
@@ -401,6 +547,8 @@ class ThemeManager(QObject):
         super().__init__()
         self._themes = {}
         self._current_theme: Optional[Theme] = None
+        self._current_state: Optional[tuple] = None  # (name, palette key) last announced
+        self._stylesheet_cache: OrderedDict = OrderedDict()  # (template, palette key) -> QSS
         self._load_builtin_themes()
         self._load_custom_themes()
 
@@ -433,6 +581,12 @@ class ThemeManager(QObject):
         settings = QSettings(Config.APP_AUTHOR, Config.APP_NAME)
         settings.setValue("theme/current", theme_name)
 
+        # Re-selecting the same theme with the same colors changes nothing
+        state = (theme_name, palette_key(self._current_theme.palette))
+        if state == self._current_state:
+            return
+        self._current_state = state
+
         self.theme_changed.emit(theme_name)  # Emit signal when theme changes
 
     def get_current_theme(self) -> Optional[Theme]:
@@ -448,7 +602,47 @@ class ThemeManager(QObject):
         """
         if self._current_theme is None:
             return ""
-        return self._current_theme.get_stylesheet()
+        return self.get_stylesheet(self._current_theme)
+
+    def get_stylesheet(self, theme: Theme) -> str:
+        """
+        Get a theme's compiled stylesheet (cached per template and palette)
+
+        Args:
+            theme: Theme to compile
+
+        Returns:
+            QSS stylesheet string
+        """
+        key = (type(theme), palette_key(theme.palette))
+        stylesheet = self._stylesheet_cache.get(key)
+        if stylesheet is None:
+            stylesheet = theme.get_stylesheet()
+            self._stylesheet_cache[key] = stylesheet
+            while len(self._stylesheet_cache) > self.STYLESHEET_CACHE_SIZE:
+                self._stylesheet_cache.popitem(last=False)
+        else:
+            self._stylesheet_cache.move_to_end(key)
+        return stylesheet
+
+    def apply_stylesheet(self, app) -> bool:
+        """
+        Apply the current theme's stylesheet to the application
+
+        Setting the application stylesheet re-polishes every widget, so it
+        is skipped when the compiled stylesheet is already in place.
+
+        Args:
+            app: QApplication instance
+
+        Returns:
+            True if the stylesheet was changed
+        """
+        stylesheet = self.get_current_stylesheet()
+        if app.styleSheet() == stylesheet:
+            return False
+        app.setStyleSheet(stylesheet)
+        return True
 
     def get_gradient_colors(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
         """
@@ -693,4 +887,7 @@ def get_theme_manager() -> ThemeManager:
     return _theme_manager_instance
 
 
-__all__ = ['Theme', 'ColorPalette', 'ThemeManager', 'get_theme_manager']
+__all__ = [
+    'Theme', 'ColorPalette', 'ThemeManager', 'get_theme_manager',
+    'palette_key', 'adjust_color', 'build_role_stylesheet',
+]
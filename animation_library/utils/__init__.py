@@ -5,6 +5,7 @@ from .image_utils import load_image_as_pixmap, get_image_size
 from .color_utils import hex_to_rgb, rgb_to_hex, hsl_to_rgb, rgb_to_hsl
 from .icon_loader import IconLoader
 from .icon_utils import colorize_white_svg
+from .icon_registry import IconRegistry, get_icon_registry
 from .color_presets import GRADIENT_PRESETS, get_preset_by_name, get_preset_gradient
 from .dialog_helper import DialogHelper
 from .layout_utils import clear_layout, clear_grid, add_grid_row, set_layout_margins, set_layout_spacing
@@ -38,6 +39,9 @@ from .file_utils import (
 # Coordinate utilities
 from .coordinate_utils import CoordinateConverter
 
+# Startup timing
+from .startup_timer import StartupTimer, get_startup_timer
+
 __all__ = [
     'composite_image_on_gradient_colors',
     'create_vertical_gradient',
@@ -49,6 +53,8 @@ __all__ = [
     'rgb_to_hsl',
     'IconLoader',
     'colorize_white_svg',
+    'IconRegistry',
+    'get_icon_registry',
     'GRADIENT_PRESETS',
     'get_preset_by_name',
     'get_preset_gradient',
@@ -79,4 +85,7 @@ __all__ = [
     'get_unique_path',
     # Coordinate utilities
     'CoordinateConverter',
+    # Startup timing
+    'StartupTimer',
+    'get_startup_timer',
 ]
@@ -5,7 +5,6 @@ Pattern: Image processing helpers
 Inspired by: Current animation_library + hybrid plan
 """
 
-import numpy as np
 from typing import Tuple
 from PyQt6.QtGui import QImage, QPixmap, QPainter
 from PyQt6.QtCore import Qt
@@ -29,6 +28,8 @@ def create_vertical_gradient(
     Returns:
         QImage with gradient
     """
+    import numpy as np  # Deferred: keeps numpy off the startup path
+
     # Create numpy array for gradient
     gradient = np.zeros((height, width, 3), dtype=np.uint8)
 
@@ -69,6 +70,8 @@ def composite_image_on_gradient_colors(
     Returns:
         Composited QImage
     """
+    import numpy as np  # Deferred: keeps numpy off the startup path
+
     # Create gradient background
     gradient = create_vertical_gradient(canvas_size, canvas_size, top_color, bottom_color)
 
@@ -6,9 +6,9 @@ Provides easy access to SVG icons by name with automatic colorization.
 import os
 import re
 from pathlib import Path
-from PyQt6.QtGui import QIcon, QPixmap
-from PyQt6.QtCore import QByteArray
+from PyQt6.QtGui import QIcon
 from .color_utils import hex_to_rgb, rgb_to_hex, rgb_to_hsl, hsl_to_rgb
+from .icon_registry import get_icon_registry
 
 
 class IconLoader:
@@ -172,11 +172,56 @@ class IconLoader:
         new_r, new_g, new_b = hsl_to_rgb(h, new_saturation, new_lightness)
         return rgb_to_hex((new_r, new_g, new_b))
 
+    @staticmethod
+    def colorize_svg_content(svg_content: str, hex_color: str, use_saturation_variations: bool = True) -> str:
+        """
+        Rewrite the colors of SVG text to a theme color
+
+        Args:
+            svg_content: SVG source text
+            hex_color: Target color as hex string (e.g., '#D4AF37')
+            use_saturation_variations: If True, maps gray values to saturation variations
+
+        Returns:
+            Colorized SVG text
+        """
+        # Normalize hex color (ensure it has #)
+        if not hex_color.startswith('#'):
+            hex_color = '#' + hex_color
+
+        if use_saturation_variations:
+            # Saturation-based variation system
+            def replace_color_with_variation(match):
+                """Replace matched color with saturation-varied version"""
+                original_color = match.group(1)
+                brightness = IconLoader.calculate_brightness(original_color)
+                new_color = IconLoader.apply_saturation_variation(hex_color, brightness)
+                prefix = match.group(0).split(original_color)[0]
+                suffix = match.group(0).split(original_color)[1] if len(match.group(0).split(original_color)) > 1 else ''
+                return f'{prefix}{new_color}{suffix}'
+
+            # Replace various SVG color patterns
+            svg_content = re.sub(r'fill:\s*(#[0-9a-fA-F]{3,6})\b', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
+            svg_content = re.sub(r'stroke:\s*(#[0-9a-fA-F]{3,6})\b', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
+            svg_content = re.sub(r'fill="(#[0-9a-fA-F]{3,6})"', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
+            svg_content = re.sub(r'stroke="(#[0-9a-fA-F]{3,6})"', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
+
+            # Handle named color "white"
+            white_replacement = IconLoader.apply_saturation_variation(hex_color, 95.0)
+            svg_content = re.sub(r'fill:\s*white\b', f'fill: {white_replacement}', svg_content, flags=re.IGNORECASE)
+            svg_content = re.sub(r'stroke:\s*white\b', f'stroke: {white_replacement}', svg_content, flags=re.IGNORECASE)
+            svg_content = re.sub(r'fill="white"', f'fill="{white_replacement}"', svg_content, flags=re.IGNORECASE)
+            svg_content = re.sub(r'stroke="white"', f'stroke="{white_replacement}"', svg_content, flags=re.IGNORECASE)
+
+        return svg_content
+
     @staticmethod
     def colorize_icon(svg_path: str, hex_color: str, use_saturation_variations: bool = True) -> QIcon:
         """
         Colorize an SVG icon with custom color and saturation variations
 
+        Cached by the shared IconRegistry (no disk read or render on repeat calls).
+
         Args:
             svg_path: Path to the SVG file
             hex_color: Target color as hex string (e.g., '#D4AF37')
@@ -185,54 +230,9 @@ class IconLoader:
         Returns:
             QIcon with the colorized SVG
         """
-        if not os.path.exists(svg_path):
-            print(f"Warning: SVG icon not found: {svg_path}")
-            return QIcon()
-
-        try:
-            # Read SVG file as text
-            with open(svg_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
-
-            # Normalize hex color (ensure it has #)
-            if not hex_color.startswith('#'):
-                hex_color = '#' + hex_color
-
-            if use_saturation_variations:
-                # Saturation-based variation system
-                def replace_color_with_variation(match):
-                    """Replace matched color with saturation-varied version"""
-                    original_color = match.group(1)
-                    brightness = IconLoader.calculate_brightness(original_color)
-                    new_color = IconLoader.apply_saturation_variation(hex_color, brightness)
-                    prefix = match.group(0).split(original_color)[0]
-                    suffix = match.group(0).split(original_color)[1] if len(match.group(0).split(original_color)) > 1 else ''
-                    return f'{prefix}{new_color}{suffix}'
-
-                # Replace various SVG color patterns
-                svg_content = re.sub(r'fill:\s*(#[0-9a-fA-F]{3,6})\b', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
-                svg_content = re.sub(r'stroke:\s*(#[0-9a-fA-F]{3,6})\b', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
-                svg_content = re.sub(r'fill="(#[0-9a-fA-F]{3,6})"', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
-                svg_content = re.sub(r'stroke="(#[0-9a-fA-F]{3,6})"', replace_color_with_variation, svg_content, flags=re.IGNORECASE)
-
-                # Handle named color "white"
-                white_replacement = IconLoader.apply_saturation_variation(hex_color, 95.0)
-                svg_content = re.sub(r'fill:\s*white\b', f'fill: {white_replacement}', svg_content, flags=re.IGNORECASE)
-                svg_content = re.sub(r'stroke:\s*white\b', f'stroke: {white_replacement}', svg_content, flags=re.IGNORECASE)
-                svg_content = re.sub(r'fill="white"', f'fill="{white_replacement}"', svg_content, flags=re.IGNORECASE)
-                svg_content = re.sub(r'stroke="white"', f'stroke="{white_replacement}"', svg_content, flags=re.IGNORECASE)
-
-            # Convert to QByteArray and create QIcon
-            svg_bytes = QByteArray(svg_content.encode('utf-8'))
-            pixmap = QPixmap()
-            pixmap.loadFromData(svg_bytes, 'SVG')
-
-            return QIcon(pixmap)
-
-        except Exception as e:
-            print(f"Error colorizing SVG {svg_path}: {e}")
-            # Fallback to loading original icon
-            return QIcon(svg_path)
+        return get_icon_registry().get_icon(
+            svg_path, hex_color, IconLoader.colorize_svg_content, use_saturation_variations
+        )
 
     @classmethod
     def get_themed_icon(cls, name: str, color: str = None) -> QIcon:
@@ -0,0 +1,272 @@
+"""
+IconRegistry - Shared cache of colorized SVG icons
+
+Pattern: Module-level singleton with QRunnable pre-warming
+Features:
+- SVG sources are read from disk once per path
+- Colorized icons are cached by (svg path, color, colorizer, variations);
+  the SVGs render at their native size, so size/DPR never vary the key
+- Theme changes only miss icons whose color actually changed; old colors
+  stay until pushed out of the LRU, so switching back is free
+- Common icons for every installed theme are rendered off-thread (QImage)
+  and turned into QIcons on the GUI thread when first requested
+
+Usage:
+    registry = get_icon_registry()
+    icon = registry.get_icon(svg_path, "#D4AF37", colorize_svg_content)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import QByteArray, QRunnable, QThreadPool
+from PyQt6.QtGui import QIcon, QImage, QPixmap
+
+logger = logging.getLogger(__name__)
+
+# colorizer(svg_content, hex_color, use_saturation_variations) -> svg_content
+Colorizer = Callable[[str, str, bool], str]
+IconKey = Tuple[str, str, Hashable, bool]
+
+
+def _render_svg(svg_content: str) -> QImage:
+    """Render SVG text at its native size (safe off the GUI thread)"""
+    image = QImage()
+    image.loadFromData(QByteArray(svg_content.encode('utf-8')), 'SVG')
+    return image
+
+
+class IconPrewarmTask(QRunnable):
+    """Render a batch of colorized icons into QImages on a worker thread"""
+
+    def __init__(self, registry: 'IconRegistry', requests: List[Tuple[str, str, Colorizer, bool]]):
+        super().__init__()
+        self._registry = registry
+        self._requests = requests
+
+    def run(self):
+        """Colorize and render each request that is not cached yet"""
+        for svg_path, hex_color, colorizer, use_saturation_variations in self._requests:
+            try:
+                self._registry._prewarm_one(svg_path, hex_color, colorizer, use_saturation_variations)
+            except Exception as e:
+                logger.debug(f"Icon pre-warm failed for {svg_path}: {e}")
+
+
+class IconRegistry:
+    """
+    Cache of colorized SVG icons shared by every widget
+
+    QIcons are only created on the GUI thread; pre-warm workers hand over
+    rendered QImages, which get_icon() converts on first use.
+    """
+
+    CACHE_SIZE = 512  # Colorized icons kept (LRU)
+
+    # Icons rendered ahead of time for every theme:
+    # (icon name, palette color attribute, True for the folder tree colorizer)
+    THEME_ICONS = (
+        # Header toolbar and preview controls
+        ("refresh", "header_icon_color", False),
+        ("add", "header_icon_color", False),
+        ("view_mode", "header_icon_color", False),
+        ("resize_grid", "header_icon_color", False),
+        ("edit", "header_icon_color", False),
+        ("al_icon", "header_icon_color", False),
+        ("console", "header_icon_color", False),
+        ("settings", "header_icon_color", False),
+        ("delete", "header_icon_color", False),
+        ("archive_icon", "header_icon_color", False),
+        ("play", "header_icon_color", False),
+        ("pause", "header_icon_color", False),
+        ("loop", "header_icon_color", False),
+        # Folder tree
+        ("folder_closed", "folder_icon_color", True),
+        ("folder_open", "folder_icon_color", True),
+        ("root_icon", "folder_icon_color", True),
+        ("animation_icon", "folder_icon_color", True),
+        ("pose_icon", "folder_icon_color", True),
+        ("favorite_icon", "folder_icon_color", True),
+        ("recent_icon", "folder_icon_color", True),
+        ("archive_icon", "folder_icon_color", True),
+        ("trash_icon", "folder_icon_color", True),
+        ("folder_default", "folder_icon_color", True),
+        ("folder_body", "folder_icon_color", True),
+        ("folder_face", "folder_icon_color", True),
+        ("folder_hand", "folder_icon_color", True),
+        ("folder_locomotion", "folder_icon_color", True),
+        ("folder_combat", "folder_icon_color", True),
+        ("folder_idle", "folder_icon_color", True),
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._svg_sources: Dict[str, Optional[str]] = {}  # path -> SVG text (None if missing)
+        self._images: Dict[IconKey, QImage] = {}  # Pre-warmed renders awaiting the GUI thread
+        self._icons: 'OrderedDict[IconKey, QIcon]' = OrderedDict()
+
+        # Performance monitoring
+        self.disk_reads: int = 0
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    @staticmethod
+    def _make_key(svg_path: str, hex_color: str, colorizer: Colorizer,
+                  use_saturation_variations: bool) -> IconKey:
+        """Build the cache key (color normalized to lowercase '#rrggbb' form)"""
+        if not hex_color.startswith('#'):
+            hex_color = '#' + hex_color
+        return (svg_path, hex_color.lower(), colorizer, use_saturation_variations)
+
+    def read_svg(self, svg_path: str) -> Optional[str]:
+        """
+        Get SVG source text, reading the file only the first time
+
+        A missing file is remembered too, so it is reported once per path.
+
+        Args:
+            svg_path: Path to the SVG file
+
+        Returns:
+            SVG text, or None if the file does not exist
+        """
+        with self._lock:
+            if svg_path in self._svg_sources:
+                return self._svg_sources[svg_path]
+
+        try:
+            with open(svg_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            logger.warning("SVG icon not found: %s", svg_path)
+            content = None
+
+        with self._lock:
+            self.disk_reads += 1
+            self._svg_sources[svg_path] = content
+        return content
+
+    def get_icon(self, svg_path: str, hex_color: str, colorizer: Colorizer,
+                 use_saturation_variations: bool = True) -> QIcon:
+        """
+        Get a colorized icon (GUI thread only)
+
+        Args:
+            svg_path: Path to the SVG file
+            hex_color: Target color as hex string
+            colorizer: Function rewriting the SVG colors
+            use_saturation_variations: Passed through to the colorizer
+
+        Returns:
+            Cached or newly rendered QIcon (empty if the file is missing)
+        """
+        key = self._make_key(svg_path, hex_color, colorizer, use_saturation_variations)
+
+        with self._lock:
+            icon = self._icons.get(key)
+            if icon is not None:
+                self._icons.move_to_end(key)
+                self.cache_hits += 1
+                return icon
+            image = self._images.pop(key, None)
+            self.cache_misses += 1
+
+        if image is not None:
+            icon = QIcon(QPixmap.fromImage(image))
+        else:
+            svg_content = self.read_svg(svg_path)
+            if svg_content is None:
+                icon = QIcon()  # Cached like any other icon (reported by read_svg)
+            else:
+                try:
+                    icon = QIcon(QPixmap.fromImage(
+                        _render_svg(colorizer(svg_content, key[1], use_saturation_variations))
+                    ))
+                except Exception as e:
+                    logger.warning("Error colorizing SVG %s: %s", svg_path, e)
+                    # Fallback to loading original icon
+                    icon = QIcon(svg_path)
+
+        with self._lock:
+            self._icons[key] = icon
+            while len(self._icons) > self.CACHE_SIZE:
+                self._icons.popitem(last=False)
+        return icon
+
+    def _prewarm_one(self, svg_path: str, hex_color: str, colorizer: Colorizer,
+                     use_saturation_variations: bool):
+        """Render one icon into the hand-over map (worker thread)"""
+        key = self._make_key(svg_path, hex_color, colorizer, use_saturation_variations)
+        with self._lock:
+            if key in self._icons or key in self._images:
+                return
+
+        svg_content = self.read_svg(svg_path)
+        if svg_content is None:
+            return
+        image = _render_svg(colorizer(svg_content, key[1], use_saturation_variations))
+
+        with self._lock:
+            if key not in self._icons and len(self._images) < self.CACHE_SIZE:
+                self._images[key] = image
+
+    def prewarm(self, requests: Iterable[Tuple[str, str, Colorizer, bool]]):
+        """
+        Render icons on a worker thread ahead of their first use
+
+        Args:
+            requests: (svg path, hex color, colorizer, use_saturation_variations)
+        """
+        requests = list(requests)
+        if requests:
+            QThreadPool.globalInstance().start(IconPrewarmTask(self, requests))
+
+    def prewarm_themes(self, themes: Iterable):
+        """
+        Pre-warm THEME_ICONS in the colors of the given themes
+
+        Args:
+            themes: Theme instances (e.g. ThemeManager.get_all_themes())
+        """
+        # Lazy imports: both modules route their colorization through this registry
+        from .icon_loader import IconLoader
+        from .icon_utils import colorize_svg_content
+
+        requests = []
+        for theme in themes:
+            for name, color_attr, folder_style in self.THEME_ICONS:
+                hex_color = getattr(theme.palette, color_attr, None)
+                if not hex_color:
+                    continue
+                colorizer = IconLoader.colorize_svg_content if folder_style else colorize_svg_content
+                requests.append((IconLoader.get(name), hex_color, colorizer, True))
+        self.prewarm(requests)
+
+    def clear(self):
+        """Drop all cached sources and icons (e.g. after icon files change on disk)"""
+        with self._lock:
+            self._svg_sources.clear()
+            self._images.clear()
+            self._icons.clear()
+
+
+# Singleton instance
+_icon_registry_instance: Optional[IconRegistry] = None
+
+
+def get_icon_registry() -> IconRegistry:
+    """
+    Get global IconRegistry singleton
+
+    Returns:
+        Global IconRegistry instance
+    """
+    global _icon_registry_instance
+    if _icon_registry_instance is None:
+        _icon_registry_instance = IconRegistry()
+    return _icon_registry_instance
+
+
+__all__ = ['IconRegistry', 'IconPrewarmTask', 'get_icon_registry']
@@ -1,12 +1,29 @@
 """
 Centralized logging configuration for Animation Library v2
+
+Pipeline:
+- File and terminal output are written by a QueueListener thread, so a
+  logging call only costs a queue put on the calling thread
+- The log console reads from a bounded ring buffer that is appended to
+  without locks and flushed into the widget at a fixed rate
+- Console levels can be set per subsystem (logger name prefix)
+- Hot loops log through a RateLimitedLogger so per-item messages cannot
+  flood the pipeline
 """
+import atexit
+import itertools
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import QPlainTextEdit
-from PyQt6.QtCore import QObject, pyqtSignal, Qt
+from PyQt6.QtCore import QObject, QTimer
+
+from ..config import Config
 
 
 class LoggingConfig:
@@ -15,6 +32,7 @@ class LoggingConfig:
     _initialized = False
     _log_file_path = None
     _widget_handler = None
+    _queue_listener: Optional[QueueListener] = None
 
     @classmethod
     def setup_logging(cls, log_dir: Path):
@@ -42,21 +60,35 @@ class LoggingConfig:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
 
         # Console handler (for terminal output)
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_formatter = logging.Formatter('[%(levelname)s] %(message)s')
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+
+        # Both are written on the listener thread; callers only enqueue
+        log_queue = queue.SimpleQueue()
+        cls._queue_listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        cls._queue_listener.start()
+        atexit.register(cls.shutdown)
+        logger.addHandler(QueueHandler(log_queue))
 
         cls._initialized = True
         logger.info("Logging system initialized")
 
+    @classmethod
+    def shutdown(cls):
+        """Flush queued records to the file/terminal and stop the listener thread"""
+        if cls._queue_listener is not None:
+            cls._queue_listener.stop()
+            cls._queue_listener = None
+
     @classmethod
     def add_widget_handler(cls, text_widget: QPlainTextEdit, log_level="DEBUG"):
-        """Add a QPlainTextEdit as a log handler"""
+        """Add a QPlainTextEdit as a (buffered) log handler"""
         handler = QtLogHandler(text_widget)
         handler.setLevel(getattr(logging, log_level))
         formatter = logging.Formatter('[%(levelname)s] %(message)s')
@@ -74,6 +106,7 @@ class LoggingConfig:
         if cls._widget_handler:
             logger = logging.getLogger()
             logger.removeHandler(cls._widget_handler)
+            cls._widget_handler.stop()
             cls._widget_handler = None
 
     @classmethod
@@ -87,29 +120,210 @@ class LoggingConfig:
         return cls._log_file_path
 
 
+class LogRingBuffer:
+    """
+    Bounded record buffer written from any thread without locks
+
+    deque.append and deque.popleft are atomic, and the sequence counter is
+    an itertools.count, so producers never block. When full, the oldest
+    records are dropped; drain() reports how many were lost.
+    """
+
+    def __init__(self, capacity: int = Config.LOG_BUFFER_CAPACITY):
+        self._records = deque(maxlen=capacity)
+        self._sequence = itertools.count()
+        self._next_expected = 0
+
+    def append(self, record: logging.LogRecord):
+        """Add a record (drops the oldest if full)"""
+        self._records.append((next(self._sequence), record))
+
+    def drain(self) -> Tuple[List[logging.LogRecord], int]:
+        """
+        Remove all buffered records (single consumer)
+
+        Returns:
+            Tuple of (records in order, number dropped since the last drain)
+        """
+        records = []
+        dropped = 0
+        while True:
+            try:
+                sequence, record = self._records.popleft()
+            except IndexError:
+                break
+            if sequence > self._next_expected:
+                dropped += sequence - self._next_expected
+            self._next_expected = sequence + 1
+            records.append(record)
+        return records, dropped
+
+
+class SubsystemLevelFilter(logging.Filter):
+    """
+    Minimum level per subsystem (logger name prefix, longest match wins)
+
+    Loggers without a configured prefix fall through to the handler level.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._levels: Dict[str, int] = {}
+        self._resolved: Dict[str, int] = {}  # logger name -> effective minimum level
+
+    def set_level(self, prefix: str, level: int):
+        """
+        Set the minimum level for a subsystem
+
+        Args:
+            prefix: Logger name prefix (e.g. 'animation_library.services')
+            level: Minimum logging level; NOTSET removes the override
+        """
+        if level == logging.NOTSET:
+            self._levels.pop(prefix, None)
+        else:
+            self._levels[prefix] = level
+        self._resolved.clear()
+
+    def get_level(self, prefix: str) -> int:
+        """Get the configured level for a subsystem (NOTSET if none)"""
+        return self._levels.get(prefix, logging.NOTSET)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check a record against its subsystem level"""
+        name = record.name
+        level = self._resolved.get(name)
+        if level is None:
+            level = logging.NOTSET
+            best = -1
+            for prefix, prefix_level in self._levels.items():
+                if (name == prefix or name.startswith(prefix + '.')) and len(prefix) > best:
+                    best = len(prefix)
+                    level = prefix_level
+            self._resolved[name] = level
+        return record.levelno >= level
+
+
+class RateLimitedLogger:
+    """
+    Logger wrapper that drops repeats from the same call site beyond a
+    per-second budget
+
+    Use in hot loops instead of a plain logger. The check runs before a
+    LogRecord is built, so a dropped call costs about a microsecond.
+    ERROR and above always pass; the first record let through after
+    throttling notes how many were skipped.
+
+    Usage:
+        logger = RateLimitedLogger(logging.getLogger(__name__))
+        logger.debug("Imported %s", name)
+    """
+
+    def __init__(self, logger: logging.Logger, per_second: int = Config.LOG_RATE_LIMIT_PER_SECOND):
+        self.logger = logger
+        self._per_second = per_second
+        self._sites: Dict[Tuple[Any, int], List] = {}  # (code, line) -> [window start, count, suppressed]
+
+    def debug(self, msg, *args):
+        """Log at DEBUG (rate limited)"""
+        self._log(logging.DEBUG, msg, args)
+
+    def info(self, msg, *args):
+        """Log at INFO (rate limited)"""
+        self._log(logging.INFO, msg, args)
+
+    def warning(self, msg, *args):
+        """Log at WARNING (rate limited)"""
+        self._log(logging.WARNING, msg, args)
+
+    def error(self, msg, *args):
+        """Log at ERROR (never dropped)"""
+        self._log(logging.ERROR, msg, args)
+
+    def _log(self, level: int, msg, args: tuple):
+        """Check the call site's budget, then log through the wrapped logger"""
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if level < logging.ERROR:
+            frame = sys._getframe(2)
+            key = (frame.f_code, frame.f_lineno)
+            now = time.monotonic()
+            site = self._sites.get(key)
+            if site is None:
+                self._sites[key] = [now, 1, 0]
+            elif now - site[0] >= 1.0:
+                if site[2]:
+                    msg = f"{msg} (+{site[2]} similar suppressed)"
+                site[0], site[1], site[2] = now, 1, 0
+            elif site[1] < self._per_second:
+                site[1] += 1
+            else:
+                site[2] += 1
+                return
+
+        # stacklevel skips this wrapper so records carry the real call site
+        self.logger.log(level, msg, *args, stacklevel=3)
+
+
 class QtLogHandler(logging.Handler, QObject):
-    """Custom logging handler that emits to a Qt text widget"""
+    """
+    Logging handler that feeds a Qt text widget in batches
 
-    log_signal = pyqtSignal(str)
+    emit() only appends the record to a LogRingBuffer; a GUI-thread timer
+    formats and appends everything buffered in one call every
+    Config.LOG_CONSOLE_FLUSH_INTERVAL_MS, keeping at most
+    Config.LOG_CONSOLE_MAX_BLOCKS lines.
+    """
 
     def __init__(self, text_widget: QPlainTextEdit):
         logging.Handler.__init__(self)
         QObject.__init__(self)
 
         self.text_widget = text_widget
-        self.log_signal.connect(self.append_log, Qt.ConnectionType.QueuedConnection)
+        self.text_widget.setMaximumBlockCount(Config.LOG_CONSOLE_MAX_BLOCKS)
+        self.buffer = LogRingBuffer()
+        self.subsystem_filter = SubsystemLevelFilter()
+        self.addFilter(self.subsystem_filter)
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self.flush_to_widget)
+        self._flush_timer.start(Config.LOG_CONSOLE_FLUSH_INTERVAL_MS)
+
+    def handle(self, record):
+        """Filter and buffer a record without taking the handler lock"""
+        rv = self.filter(record)
+        if rv:
+            self.emit(rv if isinstance(rv, logging.LogRecord) else record)
+        return rv
 
     def emit(self, record):
-        """Emit a log record"""
-        try:
-            msg = self.format(record)
-            self.log_signal.emit(msg)
-        except Exception:
-            self.handleError(record)
+        """Buffer a log record (any thread)"""
+        self.buffer.append(record)
+
+    def flush_to_widget(self):
+        """Append buffered records to the widget (GUI thread)"""
+        records, dropped = self.buffer.drain()
+        if not records and not dropped:
+            return
+
+        # Only the last MAX_BLOCKS lines would survive anyway
+        records = records[-Config.LOG_CONSOLE_MAX_BLOCKS:]
+        lines = []
+        if dropped:
+            lines.append(f"[INFO] ... {dropped} messages skipped (console buffer full)")
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if lines:
+            self.text_widget.appendPlainText("\n".join(lines))
 
-    def append_log(self, message: str):
-        """Append log message to widget (thread-safe)"""
-        self.text_widget.appendPlainText(message)
+    def stop(self):
+        """Flush what is buffered and stop the timer"""
+        self._flush_timer.stop()
+        self.flush_to_widget()
 
 
-__all__ = ['LoggingConfig']
+__all__ = ['LoggingConfig', 'LogRingBuffer', 'SubsystemLevelFilter', 'RateLimitedLogger', 'QtLogHandler']
@@ -0,0 +1,123 @@
+"""
+StartupTimer - Named checkpoints from launch to a usable window
+
+Pattern: Module-level singleton
+Features:
+- Stages are marked in order as startup progresses (imports, application,
+  main window, first paint, deferred services)
+- One report per run, logged with per-stage and cumulative times, with a
+  warning when first paint exceeds Config.STARTUP_BUDGET_MS
+
+Usage:
+    timer = get_startup_timer()
+    timer.mark("Application created")
+    ...
+    timer.report()
+"""
+
+import logging
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    Records startup stages relative to the timer's creation
+
+    The singleton is created when main.py is imported, so times exclude
+    interpreter start-up only.
+    """
+
+    FIRST_PAINT = "First paint"
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._marks: List[Tuple[str, float]] = []
+        self._reported = False
+
+    def mark(self, stage: str):
+        """
+        Record the end of a startup stage
+
+        Args:
+            stage: Stage name (shown in the report)
+        """
+        self._marks.append((stage, time.perf_counter()))
+
+    def elapsed_ms(self, stage: Optional[str] = None) -> Optional[float]:
+        """
+        Get time from start to a stage (or to now)
+
+        Args:
+            stage: Stage name, or None for the current time
+
+        Returns:
+            Milliseconds since start, or None if the stage was not marked
+        """
+        if stage is None:
+            return (time.perf_counter() - self._start) * 1000
+        for name, timestamp in self._marks:
+            if name == stage:
+                return (timestamp - self._start) * 1000
+        return None
+
+    def get_marks(self) -> List[Tuple[str, float]]:
+        """
+        Get recorded stages
+
+        Returns:
+            List of (stage, milliseconds since start), in order
+        """
+        return [(name, (timestamp - self._start) * 1000) for name, timestamp in self._marks]
+
+    def report(self, budget_ms: Optional[int] = None) -> Optional[float]:
+        """
+        Log the startup timing report (once per run)
+
+        Args:
+            budget_ms: First paint budget (defaults to Config.STARTUP_BUDGET_MS)
+
+        Returns:
+            Time to first paint in ms, or None if it was not marked
+        """
+        if self._reported:
+            return self.elapsed_ms(self.FIRST_PAINT)
+        self._reported = True
+
+        if budget_ms is None:
+            from ..config import Config
+            budget_ms = Config.STARTUP_BUDGET_MS
+
+        lines = []
+        previous = 0.0
+        for name, elapsed in self.get_marks():
+            lines.append(f"  {name:<28} +{elapsed - previous:7.0f} ms  ({elapsed:7.0f} ms)")
+            previous = elapsed
+        logger.info("Startup timing:\n" + "\n".join(lines))
+
+        first_paint = self.elapsed_ms(self.FIRST_PAINT)
+        if first_paint is not None and first_paint > budget_ms:
+            logger.warning(f"Startup took {first_paint:.0f} ms to first paint (budget {budget_ms} ms)")
+        return first_paint
+
+
+# Singleton instance
+_startup_timer_instance: Optional[StartupTimer] = None
+
+
+def get_startup_timer() -> StartupTimer:
+    """
+    Get global StartupTimer singleton
+
+    Returns:
+        Global StartupTimer instance
+    """
+    global _startup_timer_instance
+    if _startup_timer_instance is None:
+        _startup_timer_instance = StartupTimer()
+    return _startup_timer_instance
+
+
+__all__ = ['StartupTimer', 'get_startup_timer']
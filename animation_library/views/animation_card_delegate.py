@@ -219,10 +219,12 @@ class AnimationCardDelegate(QStyledItemDelegate):
         if not is_pose:
             version_label = index.data(AnimationRole.VersionLabelRole)
             if version_label:
+                version_count = index.data(AnimationRole.VersionCountRole) or 1
                 badge_rect = QRect(
-                    rect.x() + 5, rect.y() + self._card_size - 25, 40, 20
+                    rect.x() + 5, rect.y() + self._card_size - 25,
+                    40 if version_count <= 1 else 58, 20
                 )
-                BadgeRenderer.draw_version_badge(painter, badge_rect, version_label)
+                BadgeRenderer.draw_version_badge(painter, badge_rect, version_label, version_count)
 
         # Draw status badge or partial indicator
         if not is_pose:
@@ -327,8 +329,12 @@ class AnimationCardDelegate(QStyledItemDelegate):
         if not is_pose:
             version_label = index.data(AnimationRole.VersionLabelRole)
             if version_label:
-                badge_rect = QRect(thumbnail_rect.x() + 2, thumbnail_rect.bottom() - 14, 30, 12)
-                BadgeRenderer.draw_version_badge(painter, badge_rect, version_label)
+                version_count = index.data(AnimationRole.VersionCountRole) or 1
+                badge_rect = QRect(
+                    thumbnail_rect.x() + 2, thumbnail_rect.bottom() - 14,
+                    30 if version_count <= 1 else 46, 12
+                )
+                BadgeRenderer.draw_version_badge(painter, badge_rect, version_label, version_count)
 
         # Calculate text area
         status = index.data(AnimationRole.StatusRole)
@@ -5,6 +5,7 @@ Pattern: QListView with Model/View architecture
 Inspired by: Hybrid plan + Maya Studio Library
 """
 
+import logging
 import os
 from typing import Optional
 from PyQt6.QtWidgets import QListView, QAbstractItemView
@@ -15,9 +16,13 @@ from .animation_card_delegate import AnimationCardDelegate
 from ..models.animation_list_model import AnimationRole
 from ..services.database_service import get_database_service
 from ..services.socket_client import get_socket_client
+from ..services.hover_preview_service import get_hover_preview_service
 from ..events.event_bus import get_event_bus
 from ..widgets.hover_video_popup import HoverVideoPopup
 from ..config import Config
+from ..utils.logging_config import RateLimitedLogger
+
+logger = RateLimitedLogger(logging.getLogger(__name__))  # Blend updates fire on every mouse move
 
 
 class AnimationView(QListView):
@@ -264,6 +269,7 @@ class AnimationView(QListView):
                 # New item hovered
                 self._hover_index = index
                 self._last_hover_pos = event.pos()
+                self._prefetch_hover_strip(index)
                 self._hover_timer.start(Config.HOVER_VIDEO_DELAY_MS)
         else:
             # No item under mouse
@@ -322,7 +328,7 @@ class AnimationView(QListView):
         response = client.blend_pose_start(uuid, name, blend_path)
 
         if response.get('status') != 'success':
-            print(f"[AnimationView] Failed to start blend: {response.get('message')}")
+            logger.warning("Failed to start blend: %s", response.get('message'))
             return False
 
         # Initialize blend state
@@ -335,7 +341,7 @@ class AnimationView(QListView):
         # Grab focus for keyboard (Escape key)
         self.setFocus()
 
-        print(f"[AnimationView] Blend started: {name}, start_x={pos.x()}")
+        logger.debug("Blend started: %s, start_x=%d", name, pos.x())
 
         # Force repaint to show overlay
         self.viewport().update()
@@ -352,7 +358,8 @@ class AnimationView(QListView):
         # Calculate blend factor from horizontal mouse movement
         delta_x = pos.x() - self._blend_start_x
         self._blend_factor = max(0.0, min(1.0, delta_x / self._blend_sensitivity))
-        print(f"[AnimationView] Blend update: pos.x={pos.x()}, start_x={self._blend_start_x}, delta={delta_x}, factor={self._blend_factor:.2f}")
+        logger.debug("Blend update: pos.x=%d, start_x=%d, delta=%d, factor=%.2f",
+                     pos.x(), self._blend_start_x, delta_x, self._blend_factor)
 
         # Check for Ctrl modifier for mirror
         modifiers = self.cursor().pos()  # Dummy call to get modifiers working
@@ -384,7 +391,7 @@ class AnimationView(QListView):
         self._blend_mirror = False
         self._blend_pose_name = ""
 
-        print(f"[AnimationView] Blend ended")
+        logger.debug("Blend ended")
 
         # Force repaint to remove overlay
         self.viewport().update()
@@ -394,7 +401,7 @@ class AnimationView(QListView):
         if not self._blend_active:
             return
 
-        print(f"[AnimationView] Blend cancelled")
+        logger.debug("Blend cancelled")
 
         # Send cancel to Blender (cancelled=True restores original)
         client = get_socket_client()
@@ -634,6 +641,33 @@ class AnimationView(QListView):
 
         return uuids
 
+    def get_neighbour_indexes(self, index: QModelIndex) -> list[QModelIndex]:
+        """
+        Get items reachable from index with one arrow key press
+
+        Args:
+            index: Model index of the current item
+
+        Returns:
+            Valid neighbour indexes (left/right, and up/down rows in grid mode)
+        """
+        model = self.model()
+        if not model or not index.isValid():
+            return []
+
+        steps = [1, -1]
+        if self._view_mode == "grid" and self.gridSize().width() > 0:
+            columns = max(1, self.viewport().width() // self.gridSize().width())
+            if columns > 1:
+                steps += [columns, -columns]
+
+        row_count = model.rowCount()
+        return [
+            model.index(index.row() + step, 0)
+            for step in steps
+            if 0 <= index.row() + step < row_count
+        ]
+
     # Hover video popup methods
 
     def _ensure_hover_popup(self):
@@ -642,6 +676,12 @@ class AnimationView(QListView):
             self._hover_popup = HoverVideoPopup(self)
             self._hover_popup.set_size(Config.HOVER_VIDEO_SIZE)
 
+    def _prefetch_hover_strip(self, index: QModelIndex):
+        """Start building the hover strip while the hover delay runs"""
+        video_path = index.data(AnimationRole.PreviewPathRole)
+        if video_path:
+            get_hover_preview_service().prefetch(video_path)
+
     def _show_hover_video_popup(self):
         """Show hover video popup with animation preview"""
         if not self._hover_index or not self._hover_index.isValid():
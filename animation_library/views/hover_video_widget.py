@@ -1,18 +1,18 @@
 """
 HoverVideoWidget - Preview video playback on hover
 
-Pattern: QWidget with OpenCV video playback
+Pattern: QWidget playing a sprite-strip proxy
 Inspired by: Current animation_library hover preview
 """
 
-import cv2
 from pathlib import Path
 from typing import Optional, Tuple
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt6.QtCore import QTimer, Qt, QPoint
-from PyQt6.QtGui import QImage, QPixmap, QPainter
+from PyQt6.QtGui import QPixmap
 
 from ..config import Config
+from ..services.hover_preview_service import get_hover_preview_service, SpriteStrip
 from ..utils.gradient_utils import composite_image_on_gradient_colors
 from ..themes.theme_manager import get_theme_manager
 
@@ -22,7 +22,7 @@ class HoverVideoWidget(QWidget):
     Popup widget for playing preview videos on hover
 
     Features:
-    - OpenCV video playback
+    - Sprite-strip playback (decoded off the GUI thread)
     - Looping playback
     - Gradient compositing
     - Automatic resource cleanup
@@ -37,11 +37,17 @@ class HoverVideoWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Video playback
-        self._video_capture: Optional[cv2.VideoCapture] = None
+        # Strip playback
+        self._strip: Optional[SpriteStrip] = None
+        self._current_frame = 0
         self._playback_timer = QTimer(self)
         self._playback_timer.timeout.connect(self._update_frame)
         self._current_video_path: Optional[Path] = None
+        self._pending_video_path: Optional[str] = None
+        self._pending_position = QPoint()
+
+        self._hover_service = get_hover_preview_service()
+        self._hover_service.strip_ready.connect(self._on_strip_ready)
 
         # Gradient colors
         self._gradient_top: Optional[Tuple[float, float, float]] = None
@@ -108,23 +114,24 @@ class HoverVideoWidget(QWidget):
             # Use theme gradient
             self._gradient_top, self._gradient_bottom = self._theme_manager.get_gradient_colors()
 
-        # Open video
-        self._video_capture = cv2.VideoCapture(str(video_path))
-        if not self._video_capture.isOpened():
-            print(f"[HoverVideoWidget] Failed to open video: {video_path}")
-            self._video_capture = None
+        strip = self._hover_service.get_strip(video_path)
+        if strip is None:
+            # Building in background - start once ready (unless stopped first)
+            self._pending_video_path = str(video_path)
+            self._pending_position = position
             return
 
-        self._current_video_path = video_path
+        self._start_strip(video_path, strip, position)
 
-        # Get video properties
-        fps = self._video_capture.get(cv2.CAP_PROP_FPS)
-        if fps <= 0:
-            fps = Config.PREVIEW_VIDEO_FPS
+    def _start_strip(self, video_path: Path, strip: SpriteStrip, position: QPoint):
+        """Show widget and start playing a ready strip"""
+        self._strip = strip
+        self._current_frame = 0
+        self._current_video_path = video_path
 
         # Start playback timer
-        interval_ms = int(1000 / fps)
-        self._playback_timer.start(interval_ms)
+        self._playback_timer.start(strip.interval_ms)
+        self._update_frame()
 
         # Position widget near cursor (offset to not block)
         offset_x = 20
@@ -135,89 +142,54 @@ class HoverVideoWidget(QWidget):
         self.show()
         self.raise_()
 
+    def _on_strip_ready(self, video_path: str):
+        """Start the pending video once its strip is built"""
+        if video_path != self._pending_video_path:
+            return
+        self._pending_video_path = None
+
+        strip = self._hover_service.get_strip(video_path)
+        if strip is not None:
+            self._start_strip(Path(video_path), strip, self._pending_position)
+
     def stop(self):
         """Stop playback and cleanup"""
 
         self._playback_timer.stop()
 
-        if self._video_capture:
-            self._video_capture.release()
-            self._video_capture = None
-
+        self._strip = None
+        self._pending_video_path = None
         self._current_video_path = None
         self.hide()
 
     def _update_frame(self):
         """Update to next frame"""
 
-        if not self._video_capture:
+        if not self._strip:
             return
 
-        # Read frame
-        ret, frame = self._video_capture.read()
-
-        if not ret:
-            # End of video - loop back to start
-            self._video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = self._video_capture.read()
+        # End of strip - loop back to start
+        if self._current_frame >= self._strip.frame_count:
+            self._current_frame = 0
 
-            if not ret:
-                # Failed to loop
-                self.stop()
-                return
-
-        # Convert frame to QImage
-        qimage = self._opencv_to_qimage(frame)
-        if not qimage:
-            return
+        frame = self._strip.frame(self._current_frame)
+        self._current_frame += 1
 
         # Composite on gradient
         if self._gradient_top and self._gradient_bottom:
             composited = composite_image_on_gradient_colors(
-                qimage,
+                frame.toImage(),
                 self._gradient_top,
                 self._gradient_bottom,
                 Config.THUMBNAIL_SIZE
             )
             pixmap = QPixmap.fromImage(composited)
         else:
-            pixmap = QPixmap.fromImage(qimage)
+            pixmap = frame
 
         # Display frame
         self._video_label.setPixmap(pixmap)
 
-    def _opencv_to_qimage(self, cv_image) -> Optional[QImage]:
-        """
-        Convert OpenCV image to QImage
-
-        Args:
-            cv_image: OpenCV image (numpy array)
-
-        Returns:
-            QImage or None
-        """
-        try:
-            # OpenCV uses BGR, convert to RGB
-            rgb_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB)
-
-            height, width, channels = rgb_image.shape
-            bytes_per_line = channels * width
-
-            qimage = QImage(
-                rgb_image.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888
-            )
-
-            # Make a copy so numpy array can be garbage collected
-            return qimage.copy()
-
-        except Exception as e:
-            print(f"[HoverVideoWidget] Error converting frame: {e}")
-            return None
-
     def closeEvent(self, event):
         """Handle widget close"""
         self.stop()
@@ -101,14 +101,17 @@ class BadgeRenderer:
         painter.drawPolygon(star_polygon)
 
     @staticmethod
-    def draw_version_badge(painter: QPainter, rect: QRect, version_label: str) -> None:
+    def draw_version_badge(painter: QPainter, rect: QRect, version_label: str,
+                           version_count: int = 1) -> None:
         """
-        Draw version badge (e.g., v001) on thumbnail.
+        Draw version badge (e.g., v001, or v003·3 when the group has
+        several versions) on thumbnail.
 
         Args:
             painter: QPainter instance
             rect: Rectangle for badge
             version_label: Version string to display
+            version_count: Number of versions in the group
         """
         # Disable antialiasing for sharp edges
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
@@ -122,7 +125,8 @@ class BadgeRenderer:
         font = QFont(Fonts.SHOT_CARD_BADGE.family, 9, QFont.Weight.Bold)
         painter.setFont(font)
         painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, version_label)
+        text = f"{version_label}·{version_count}" if version_count > 1 else version_label
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
 
     @staticmethod
     def draw_status_badge(painter: QPainter, rect: QRect, status: str) -> None:
@@ -6,6 +6,7 @@ from .folder_tree import FolderTree
 from .metadata_panel import MetadataPanel
 from .bulk_edit_toolbar import BulkEditToolbar
 from .help_overlay import HelpOverlay
+from .jobs_panel import JobsPanel
 
 __all__ = [
     'MainWindow',
@@ -14,4 +15,5 @@ __all__ = [
     'MetadataPanel',
     'BulkEditToolbar',
     'HelpOverlay',
+    'JobsPanel',
 ]
@@ -22,7 +22,6 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QSettings
 
 from ..config import Config
-from ..themes.theme_manager import get_theme_manager
 
 
 class ApplyPanel(QWidget):
@@ -60,9 +59,6 @@ class ApplyPanel(QWidget):
         self._current_animation: Optional[Dict[str, Any]] = None
         self._is_pose: bool = False
 
-        # Theme manager
-        self._theme_manager = get_theme_manager()
-
         # Create UI
         self._create_widgets()
         self._create_layout()
@@ -71,9 +67,12 @@ class ApplyPanel(QWidget):
         # Load saved options
         self._load_options()
 
-        # Apply theme
-        self._apply_theme()
-        self._theme_manager.theme_changed.connect(self._apply_theme)
+        # Colors come from the application stylesheet (applyRole selectors)
+        self._new_action_button.setProperty("applyRole", "primary")
+        self._playhead_button.setProperty("applyRole", "secondary")
+        self._pose_button.setProperty("applyRole", "primary")
+        for check in (self._mirror_check, self._reverse_check, self._bones_check, self._slots_check):
+            check.setProperty("applyRole", "option")
 
     def _create_widgets(self):
         """Create panel widgets"""
@@ -173,137 +172,6 @@ class ApplyPanel(QWidget):
         self._bones_check.stateChanged.connect(self._save_options)
         self._slots_check.stateChanged.connect(self._save_options)
 
-    def _apply_theme(self, theme_name: str = None):
-        """Apply theme colors to widgets"""
-
-        theme = self._theme_manager.get_current_theme()
-        if not theme:
-            return
-
-        accent = theme.palette.accent
-        text_color = theme.palette.text_primary
-
-        # Style for main action buttons (Apply New Action, Apply Pose)
-        primary_button_style = f"""
-            QPushButton {{
-                background-color: {accent};
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-                border: 0px;
-                border-radius: 0px;
-                padding: 8px;
-                outline: none;
-            }}
-            QPushButton:hover {{
-                background-color: {self._lighten_color(accent, 15)};
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QPushButton:pressed {{
-                background-color: {self._darken_color(accent, 15)};
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QPushButton:disabled {{
-                background-color: #666666;
-                color: #999999;
-                border: 0px;
-                border-radius: 0px;
-            }}
-        """
-
-        # Style for secondary button (At Playhead) - slightly muted
-        secondary_button_style = f"""
-            QPushButton {{
-                background-color: #555555;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-                border: 0px;
-                border-radius: 0px;
-                padding: 8px;
-                outline: none;
-            }}
-            QPushButton:hover {{
-                background-color: #666666;
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QPushButton:pressed {{
-                background-color: #444444;
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QPushButton:disabled {{
-                background-color: #444444;
-                color: #777777;
-                border: 0px;
-                border-radius: 0px;
-            }}
-        """
-
-        self._new_action_button.setStyleSheet(primary_button_style)
-        self._playhead_button.setStyleSheet(secondary_button_style)
-        self._pose_button.setStyleSheet(primary_button_style)
-
-        # Style checkboxes - gray unchecked, accent when checked (sharp, no bevels)
-        checkbox_style = f"""
-            QCheckBox {{
-                color: {text_color};
-                spacing: 8px;
-                background: transparent;
-            }}
-            QCheckBox::indicator {{
-                width: 14px;
-                height: 14px;
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QCheckBox::indicator:unchecked {{
-                background-color: #555555;
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QCheckBox::indicator:unchecked:hover {{
-                background-color: #666666;
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {accent};
-                border: 0px;
-                border-radius: 0px;
-            }}
-            QCheckBox::indicator:checked:hover {{
-                background-color: {self._lighten_color(accent, 15)};
-                border: 0px;
-                border-radius: 0px;
-            }}
-        """
-        self._mirror_check.setStyleSheet(checkbox_style)
-        self._reverse_check.setStyleSheet(checkbox_style)
-        self._bones_check.setStyleSheet(checkbox_style)
-        self._slots_check.setStyleSheet(checkbox_style)
-
-    def _lighten_color(self, hex_color: str, percent: int) -> str:
-        """Lighten a hex color by percentage"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        r = min(255, r + int(r * percent / 100))
-        g = min(255, g + int(g * percent / 100))
-        b = min(255, b + int(b * percent / 100))
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    def _darken_color(self, hex_color: str, percent: int) -> str:
-        """Darken a hex color by percentage"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        r = max(0, r - int(r * percent / 100))
-        g = max(0, g - int(g * percent / 100))
-        b = max(0, b - int(b * percent / 100))
-        return f"#{r:02x}{g:02x}{b:02x}"
-
     # ==================== PUBLIC API ====================
 
     def set_animation(self, animation: Optional[Dict[str, Any]]):
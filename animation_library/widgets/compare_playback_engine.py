@@ -0,0 +1,234 @@
+"""
+ComparePlaybackEngine - Master-clock playback for side-by-side compare
+
+Drives any number of VideoPreviewWidgets from one clock:
+- Each video decodes on its own VideoFrameDecoder thread, so sources
+  decode in parallel instead of one slow decode stalling the rest
+- The playhead is derived from elapsed wall time, not from counting
+  timer ticks, so timer jitter never accumulates into drift
+- A frame is presented only when every source has it buffered; frames
+  skipped while waiting are dropped for all sources alike, so columns
+  never show different frames
+"""
+
+import logging
+from typing import List, Dict, Any
+
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, Qt, pyqtSignal
+
+from .video_preview_widget import VideoPreviewWidget
+
+logger = logging.getLogger(__name__)
+
+
+class ComparePlaybackEngine(QObject):
+    """
+    Synchronized playback of several videos against a shared master clock.
+
+    Signals:
+        frame_presented(int): Master frame shown on all sources
+        playback_stopped(): Playback ended (end reached without loop, or stop())
+
+    Usage:
+        engine = ComparePlaybackEngine()
+        engine.set_sources([video_a, video_b], total_frames, fps)
+        engine.frame_presented.connect(on_frame)
+        engine.start(current_frame)
+    """
+
+    frame_presented = pyqtSignal(int)
+    playback_stopped = pyqtSignal()
+
+    # Waiting longer than this for a slow source re-anchors the clock
+    # (playback slows down briefly instead of skipping a long stretch)
+    MAX_STALL_MS = 250
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sources: List[VideoPreviewWidget] = []
+        self._total_frames = 0
+        self._fps = 24.0
+        self._speed = 1.0
+        self._loop = True
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_tick)
+        self._clock = QElapsedTimer()
+
+        self._anchor_frame = 0  # Frame at clock start
+        self._presented_frame = 0
+        self._stall_started_ms = -1
+
+        # Stats
+        self._presented_count = 0
+        self._dropped_count = 0
+        self._reanchor_count = 0
+
+    # ==================== CONFIGURATION ====================
+
+    def set_sources(self, sources: List[VideoPreviewWidget], total_frames: int, fps: float):
+        """
+        Set the videos to drive.
+
+        Args:
+            sources: Video widgets, one per compared version
+            total_frames: Length of the longest source (shorter ones hold their last frame)
+            fps: Master frame rate
+        """
+        self.stop()
+        self._sources = list(sources)
+        self._total_frames = total_frames
+        self._fps = fps or 24.0
+        self._presented_frame = 0
+        self.reset_stats()
+
+    def set_speed(self, speed: float):
+        """Set playback speed multiplier (keeps the current position)."""
+        self._speed = speed
+        if self.is_playing:
+            self._restart_clock(self._presented_frame)
+            self._timer.setInterval(self._tick_interval())
+
+    def set_loop(self, enabled: bool):
+        """Enable or disable looping at the end."""
+        self._loop = enabled
+
+    @property
+    def is_playing(self) -> bool:
+        """Check if the master clock is running."""
+        return self._timer.isActive()
+
+    @property
+    def current_frame(self) -> int:
+        """Last frame presented on all sources."""
+        return self._presented_frame
+
+    # ==================== PLAYBACK ====================
+
+    def start(self, from_frame: int = 0):
+        """
+        Start the master clock.
+
+        Args:
+            from_frame: Frame to start from (restarts at 0 if at the end)
+        """
+        if self._total_frames <= 0 or not self._sources:
+            return
+
+        if from_frame >= self._total_frames - 1:
+            from_frame = 0
+        self._presented_frame = from_frame
+        self._restart_clock(from_frame)
+
+        self._timer.start(self._tick_interval())
+
+    def stop(self):
+        """Stop the master clock."""
+        if not self._timer.isActive():
+            return
+        self._timer.stop()
+        logger.debug(f"Compare playback stats: {self.get_stats()}")
+        self.playback_stopped.emit()
+
+    def seek(self, frame: int):
+        """
+        Show a frame on all sources, waiting until each has decoded it.
+
+        Decoders are pointed at the frame first so they work in parallel,
+        then each is waited on in turn.
+
+        Args:
+            frame: Master frame number
+        """
+        frame = max(0, min(frame, self._total_frames - 1)) if self._total_frames > 0 else 0
+        for source in self._sources:
+            source.prepare_frame(self._source_frame(source, frame))
+        for source in self._sources:
+            source.show_frame(self._source_frame(source, frame), wait=True)
+
+        self._presented_frame = frame
+        if self.is_playing:
+            self._restart_clock(frame)
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get playback statistics
+
+        Returns:
+            Dict with presented, dropped and re-anchored frame counts
+        """
+        return {
+            'sources': len(self._sources),
+            'presented_frames': self._presented_count,
+            'dropped_frames': self._dropped_count,
+            'clock_reanchors': self._reanchor_count,
+        }
+
+    def reset_stats(self):
+        """Reset playback statistics."""
+        self._presented_count = 0
+        self._dropped_count = 0
+        self._reanchor_count = 0
+
+    # ==================== INTERNAL ====================
+
+    def _tick_interval(self) -> int:
+        """Tick at twice the frame rate so presentation lags the clock by < 1/2 frame"""
+        return max(1, int(1000 / (self._fps * self._speed) / 2))
+
+    def _restart_clock(self, frame: int):
+        """Anchor the master clock so that 'now' corresponds to frame"""
+        self._anchor_frame = frame
+        self._stall_started_ms = -1
+        self._clock.restart()
+
+    def _source_frame(self, source: VideoPreviewWidget, frame: int) -> int:
+        """Map master frame to a source frame (shorter sources hold their last frame)"""
+        if source.total_frames > 0:
+            return min(frame, source.total_frames - 1)
+        return frame
+
+    def _on_tick(self):
+        """Advance to the frame the master clock points at, if all sources have it"""
+        elapsed_ms = self._clock.elapsed()
+        target = self._anchor_frame + int(elapsed_ms * self._fps * self._speed / 1000.0)
+
+        if target >= self._total_frames:
+            if not self._loop:
+                self.stop()
+                return
+            target = 0
+            self._restart_clock(0)
+            elapsed_ms = 0
+
+        if target == self._presented_frame:
+            return
+
+        # Point every decoder at the target before checking, so all work in parallel
+        ready = [source.prepare_frame(self._source_frame(source, target))
+                 for source in self._sources]
+
+        if not all(ready):
+            if self._stall_started_ms < 0:
+                self._stall_started_ms = elapsed_ms
+            elif elapsed_ms - self._stall_started_ms > self.MAX_STALL_MS:
+                # Hold the clock at the next frame instead of racing ahead
+                self._reanchor_count += 1
+                self._restart_clock(self._presented_frame + 1)
+            return
+
+        for source in self._sources:
+            source.show_frame(self._source_frame(source, target))
+
+        if target > self._presented_frame:
+            self._dropped_count += target - self._presented_frame - 1
+        self._presented_count += 1
+        self._presented_frame = target
+        self._stall_started_ms = -1
+        self.frame_presented.emit(target)
+
+
+__all__ = ['ComparePlaybackEngine']
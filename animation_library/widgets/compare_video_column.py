@@ -7,10 +7,11 @@ Contains:
 - FrameRulerTimeline with note markers
 - CompactNotesPanel for notes
 
-Used by ComparisonWidget to show two versions side-by-side.
+Used by ComparisonWidget to show versions side-by-side.
 """
 
-from typing import Optional, List, Dict
+from bisect import bisect_left
+from typing import Optional, List, Dict, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 )
@@ -21,7 +22,11 @@ from .video_preview_widget import VideoPreviewWidget
 from .drawover_canvas import DrawoverCanvas, DrawingTool
 from .frame_ruler_timeline import FrameRulerTimeline
 from .compact_notes_panel import CompactNotesPanel
+from .drawover.overlay_cache import (
+    DrawoverOverlayCache, build_overlay_layers, make_overlay_key, get_drawover_overlay_cache
+)
 from ..services.drawover_storage import DrawoverStorage
+from ..config import Config
 
 
 class CompareVideoColumn(QWidget):
@@ -46,7 +51,10 @@ class CompareVideoColumn(QWidget):
         self._total_frames: int = 0
         self._current_frame: int = 0
         self._notes: List[Dict] = []
-        self._annotation_frames: List[int] = []  # Frames with annotations
+        self._annotation_frames: List[int] = []  # Frames with annotations (sorted)
+        self._drawover_data: Dict[int, Dict] = {}  # Prefetched drawovers by frame
+        self._displayed_drawover_key: Optional[Tuple] = None  # What the canvas shows now
+        self._overlay_lookahead_from: int = -1  # Frame the last overlay lookahead started at
         self._annotations_hidden: bool = False  # Hide annotations flag
         self._hold_enabled: bool = False  # Hold mode flag
         self._ghost_enabled: bool = False  # Ghost mode flag
@@ -61,6 +69,10 @@ class CompareVideoColumn(QWidget):
         # Drawover storage for loading annotations
         self._drawover_storage = DrawoverStorage()
 
+        # Pre-rendered overlays for playback
+        self._overlay_cache = get_drawover_overlay_cache()
+        self._overlay_cache.overlay_ready.connect(self._on_overlay_ready)
+
         self._setup_ui()
         self._connect_signals()
 
@@ -189,17 +201,38 @@ class CompareVideoColumn(QWidget):
         QTimer.singleShot(100, self._position_canvas)
 
     def _load_annotation_frames(self):
-        """Load frames with annotations for timeline display."""
+        """
+        Load frames with annotations for timeline display.
+
+        Also prefetches every drawover of the version once, so playback
+        never touches storage per frame.
+        """
+        self._drawover_data = {}
+        self._displayed_drawover_key = None
+        self._overlay_lookahead_from = -1
+
         if not self._version_uuid or not self._version_label_text:
             self._annotation_frames = []
             self._timeline.set_annotation_frames([])
             return
 
-        self._annotation_frames = self._drawover_storage.list_frames_with_drawovers(
+        frames = self._drawover_storage.list_frames_with_drawovers(
             self._version_uuid, self._version_label_text
         )
+        for frame in frames:
+            data = self._drawover_storage.load_drawover(
+                self._version_uuid, self._version_label_text, frame
+            )
+            if data and data.get('strokes'):
+                self._drawover_data[frame] = data
+
+        self._annotation_frames = sorted(frames)
         self._timeline.set_annotation_frames(self._annotation_frames)
 
+    def set_notes_panel_visible(self, visible: bool):
+        """Show or hide the compact notes panel (hidden when many columns share the width)."""
+        self._notes_panel.setVisible(visible)
+
     def _position_canvas(self):
         """Position drawover canvas over video content."""
         video_label = self._video.video_label
@@ -236,125 +269,180 @@ class CompareVideoColumn(QWidget):
         """Load and display annotations for a frame with hold/ghost support."""
         if not self._version_uuid or not self._version_label_text:
             self._canvas.hide()
+            self._displayed_drawover_key = None
             return
 
         # If annotations are hidden, don't show canvas
         if self._annotations_hidden:
             self._canvas.hide()
+            self._displayed_drawover_key = None
             return
 
+        # Resolve which drawovers this frame shows; skip if the canvas already has them
+        key = self._get_drawover_composition(frame)
+        if key == self._displayed_drawover_key:
+            self._prefetch_overlays(frame)
+            return
+        self._displayed_drawover_key = key
+
         # Position canvas first
         self._position_canvas()
 
-        # Clear ghost strokes
-        self._canvas.clear_ghost_strokes()
-
-        # Get strokes for current frame (with hold mode support)
-        strokes, canvas_size, from_hold = self._get_strokes_for_frame(frame)
+        layers = self._get_overlay_layers(key)
+        if not layers:
+            self._canvas.clear()
+            self._canvas.hide()
+            return
 
-        if strokes:
-            # Import strokes
-            source_size = tuple(canvas_size) if canvas_size else None
-            self._canvas.import_strokes(strokes, source_size)
+        # Paint the pre-rendered overlay if ready, else build items and render one for next time
+        overlay_key = self._get_overlay_key(key)
+        pixmap = self._overlay_cache.get(overlay_key)
+        if pixmap is not None:
+            self._canvas.show_overlay_pixmap(pixmap)
+        else:
+            source_frame, before_frames, after_frames = key
+            data = self._drawover_data.get(source_frame) if source_frame is not None else None
+            if data:
+                canvas_size = data.get('canvas_size')
+                source_size = tuple(canvas_size) if canvas_size else None
+                self._canvas.import_strokes(data['strokes'], source_size)
+            else:
+                self._canvas.clear()
 
             # Add ghost strokes if enabled
             if self._ghost_enabled:
-                self._add_ghost_strokes(frame)
+                self._add_ghost_strokes(before_frames, after_frames)
 
-            self._canvas.show()
-        else:
-            self._canvas.clear()
-            # Add ghost strokes even if no current strokes
-            if self._ghost_enabled:
-                self._add_ghost_strokes(frame)
-                if self._canvas.has_ghost_strokes():
-                    self._canvas.show()
-                else:
-                    self._canvas.hide()
-            else:
-                self._canvas.hide()
+            self._overlay_cache.request(overlay_key, layers, self._canvas.get_overlay_geometry())
 
-    def _get_strokes_for_frame(self, frame: int):
-        """Get strokes for a frame with hold mode support.
+        self._canvas.show()
+        self._prefetch_overlays(frame)
 
-        Returns:
-            (strokes, canvas_size, from_hold) tuple
-        """
-        # Load from storage
-        data = self._drawover_storage.load_drawover(
-            self._version_uuid,
-            self._version_label_text,
-            frame
+    def _get_drawover_composition(self, frame: int) -> Tuple:
+        """Get (source_frame, before_frames, after_frames) shown at frame."""
+        source_frame = self._resolve_drawover_frame(frame)
+        before_frames, after_frames = (
+            self._get_ghost_frames(frame) if self._ghost_enabled else ([], [])
+        )
+        return (source_frame, tuple(before_frames), tuple(after_frames))
+
+    def _get_overlay_layers(self, composition: Tuple) -> list:
+        """Get overlay layers for a composition (empty if it shows nothing)."""
+        source_frame, before_frames, after_frames = composition
+
+        def payload(frame):
+            data = self._drawover_data.get(frame)
+            return (data['strokes'], data.get('canvas_size')) if data else ([], None)
+
+        return build_overlay_layers(
+            payload(source_frame) if source_frame is not None else None,
+            [payload(f) for f in before_frames],
+            [payload(f) for f in after_frames],
+            self._ghost_settings.get('before_color', QColor("#FF5555")),
+            self._ghost_settings.get('after_color', QColor("#55FF55"))
         )
 
-        if data and data.get('strokes'):
-            return data.get('strokes', []), data.get('canvas_size'), False
+    def _get_overlay_key(self, composition: Tuple, geometry=None) -> Tuple:
+        """Get the overlay cache key for a composition (at the canvas's current geometry by default)."""
+        return make_overlay_key(
+            self._version_uuid, self._version_label_text, composition,
+            self._ghost_settings.get('before_color', QColor("#FF5555")),
+            self._ghost_settings.get('after_color', QColor("#55FF55")),
+            geometry or self._canvas.get_overlay_geometry()
+        )
 
-        # If hold enabled and no strokes, search backwards
+    def _prefetch_overlays(self, frame: int):
+        """Render overlays for the playhead frame and the frames just ahead of it."""
+        lookahead = Config.DRAWOVER_OVERLAY_LOOKAHEAD_FRAMES
+        start = self._overlay_lookahead_from
+        if start >= 0 and start <= frame <= start + lookahead // 2:
+            return
+        self._overlay_lookahead_from = frame
+
+        wanted = []
+        geometry = self._canvas.get_overlay_geometry()
+        seen = set()
+        for ahead in range(frame, min(frame + 1 + lookahead, self._total_frames)):
+            composition = self._get_drawover_composition(ahead)
+            if composition in seen:
+                continue
+            seen.add(composition)
+            layers = self._get_overlay_layers(composition)
+            if not layers:
+                continue
+            overlay_key = self._get_overlay_key(composition, geometry)
+            wanted.append(overlay_key)
+            self._overlay_cache.request(
+                overlay_key, layers, geometry, DrawoverOverlayCache.PRIORITY_PREFETCH
+            )
+        self._overlay_cache.retain_pending(self._version_uuid, self._version_label_text, wanted)
+
+    def _on_overlay_ready(self, overlay_key: Tuple):
+        """Swap the canvas to a just-rendered overlay of the frame it shows."""
+        if self._displayed_drawover_key is None or self._canvas.has_overlay_pixmap():
+            return
+        if not self._canvas.isVisible() or overlay_key != self._get_overlay_key(self._displayed_drawover_key):
+            return
+        pixmap = self._overlay_cache.get(overlay_key)
+        if pixmap is not None:
+            self._canvas.show_overlay_pixmap(pixmap)
+
+    def _resolve_drawover_frame(self, frame: int) -> Optional[int]:
+        """
+        Get the frame whose drawover is shown at frame (hold mode aware).
+
+        Returns:
+            Annotated frame number, or None if nothing is shown
+        """
+        if frame in self._drawover_data:
+            return frame
+
+        # If hold enabled and no strokes, use the nearest previous annotation
         if self._hold_enabled and self._annotation_frames:
-            prev_frames = [f for f in self._annotation_frames if f < frame]
-            if prev_frames:
-                held_frame = max(prev_frames)
-                data = self._drawover_storage.load_drawover(
-                    self._version_uuid,
-                    self._version_label_text,
-                    held_frame
-                )
-                if data and data.get('strokes'):
-                    return data.get('strokes', []), data.get('canvas_size'), True
-
-        return [], None, False
-
-    def _add_ghost_strokes(self, frame: int):
-        """Add ghost/onion skin strokes from neighboring frames."""
+            index = bisect_left(self._annotation_frames, frame)
+            while index > 0:
+                index -= 1
+                held_frame = self._annotation_frames[index]
+                if held_frame in self._drawover_data:
+                    return held_frame
+
+        return None
+
+    def _get_ghost_frames(self, frame: int) -> Tuple[List[int], List[int]]:
+        """Get (before, after) ghost frames for frame, nearest first."""
         before_count = self._ghost_settings.get('before_frames', 2)
         after_count = self._ghost_settings.get('after_frames', 2)
-        before_color = self._ghost_settings.get('before_color', QColor("#FF5555"))
-        after_color = self._ghost_settings.get('after_color', QColor("#55FF55"))
         sketches_only = self._ghost_settings.get('sketches_only', True)
 
         if sketches_only:
             if not self._annotation_frames:
-                return
-            before_frames = sorted([f for f in self._annotation_frames if f < frame], reverse=True)
-            before_frames = before_frames[:before_count]
-            after_frames = sorted([f for f in self._annotation_frames if f > frame])
-            after_frames = after_frames[:after_count]
+                return [], []
+            index = bisect_left(self._annotation_frames, frame)
+            before_frames = self._annotation_frames[max(0, index - before_count):index][::-1]
+            if index < len(self._annotation_frames) and self._annotation_frames[index] == frame:
+                index += 1
+            after_frames = self._annotation_frames[index:index + after_count]
         else:
             before_frames = [frame - i for i in range(1, before_count + 1) if frame - i >= 0]
             after_frames = [frame + i for i in range(1, after_count + 1) if frame + i < self._total_frames]
+        return before_frames, after_frames
 
-        # Add ghost strokes for "before" frames
-        for idx, ghost_frame in enumerate(before_frames):
-            data = self._drawover_storage.load_drawover(
-                self._version_uuid,
-                self._version_label_text,
-                ghost_frame
-            )
-            if data and data.get('strokes'):
-                distance = idx + 1
-                opacity = 0.5 / distance
-                canvas_size = data.get('canvas_size')
-                self._canvas.add_ghost_strokes(
-                    data['strokes'], before_color, opacity,
-                    tuple(canvas_size) if canvas_size else None
-                )
+    def _add_ghost_strokes(self, before_frames: List[int], after_frames: List[int]):
+        """Add ghost/onion skin strokes from neighboring frames."""
+        before_color = self._ghost_settings.get('before_color', QColor("#FF5555"))
+        after_color = self._ghost_settings.get('after_color', QColor("#55FF55"))
 
-        # Add ghost strokes for "after" frames
-        for idx, ghost_frame in enumerate(after_frames):
-            data = self._drawover_storage.load_drawover(
-                self._version_uuid,
-                self._version_label_text,
-                ghost_frame
-            )
-            if data and data.get('strokes'):
-                distance = idx + 1
-                opacity = 0.5 / distance
-                canvas_size = data.get('canvas_size')
-                self._canvas.add_ghost_strokes(
-                    data['strokes'], after_color, opacity,
-                    tuple(canvas_size) if canvas_size else None
-                )
+        for ghost_frames, color in ((before_frames, before_color), (after_frames, after_color)):
+            for idx, ghost_frame in enumerate(ghost_frames):
+                data = self._drawover_data.get(ghost_frame)
+                if data:
+                    distance = idx + 1
+                    opacity = 0.5 / distance
+                    canvas_size = data.get('canvas_size')
+                    self._canvas.add_ghost_strokes(
+                        data['strokes'], color, opacity,
+                        tuple(canvas_size) if canvas_size else None
+                    )
 
     def _on_timeline_clicked(self, frame: int):
         """Handle timeline click - emit for sync."""
@@ -386,6 +474,10 @@ class CompareVideoColumn(QWidget):
         self._version_uuid = None
         self._version_label_text = None
         self._total_frames = 0
+        self._annotation_frames = []
+        self._drawover_data = {}
+        self._displayed_drawover_key = None
+        self._overlay_lookahead_from = -1
 
     @property
     def video_widget(self) -> VideoPreviewWidget:
@@ -410,6 +502,8 @@ class CompareVideoColumn(QWidget):
     def set_canvas_visible(self, visible: bool):
         """Show or hide the annotation canvas."""
         self._annotations_hidden = not visible
+        self._displayed_drawover_key = None
+        self._overlay_lookahead_from = -1
         if visible:
             # Reload annotations for current frame
             self._load_drawover_for_frame(self._current_frame)
@@ -419,18 +513,24 @@ class CompareVideoColumn(QWidget):
     def set_hold_enabled(self, enabled: bool):
         """Enable or disable hold mode."""
         self._hold_enabled = enabled
+        self._displayed_drawover_key = None
+        self._overlay_lookahead_from = -1
         # Reload annotations to apply hold mode
         self._load_drawover_for_frame(self._current_frame)
 
     def set_ghost_enabled(self, enabled: bool):
         """Enable or disable ghost mode."""
         self._ghost_enabled = enabled
+        self._displayed_drawover_key = None
+        self._overlay_lookahead_from = -1
         # Reload annotations to apply ghost mode
         self._load_drawover_for_frame(self._current_frame)
 
     def set_ghost_settings(self, settings: Dict):
         """Set ghost mode settings."""
         self._ghost_settings = settings
+        self._displayed_drawover_key = None
+        self._overlay_lookahead_from = -1
         if self._ghost_enabled:
             # Reload annotations to apply new settings
             self._load_drawover_for_frame(self._current_frame)
@@ -438,5 +538,12 @@ class CompareVideoColumn(QWidget):
     def resizeEvent(self, event):
         """Handle resize - reposition canvas."""
         super().resizeEvent(event)
+        self._displayed_drawover_key = None
+        self._overlay_lookahead_from = -1
         if self._canvas.isVisible():
-            QTimer.singleShot(50, self._position_canvas)
+            # Reload so strokes (or the overlay) follow the new canvas geometry
+            QTimer.singleShot(50, self._reload_drawover)
+
+    def _reload_drawover(self):
+        """Reload annotations for the current frame."""
+        self._load_drawover_for_frame(self._current_frame)
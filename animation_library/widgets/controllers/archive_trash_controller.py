@@ -8,6 +8,8 @@ import logging
 from typing import List, Dict, Any, Optional, Callable
 from PyQt6.QtWidgets import QMessageBox, QWidget
 
+from ...services.job_manager import JobKind, JobManager, get_job_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -166,17 +168,15 @@ class ArchiveTrashController:
         # Clear metadata panel to release video file handles
         self._metadata_panel.clear()
 
-        # Move to archive
-        archived = 0
-        errors = []
-        for uuid in selected_uuids:
-            success, message = self._archive_service.move_to_archive(uuid)
-            if success:
-                self._animation_model.remove_animation(uuid)
-                self._event_bus.animation_archived.emit(uuid)
-                archived += 1
-            else:
-                errors.append(message)
+        # Move to archive (one batch - model and listeners are updated once)
+        results = self._archive_service.move_many_to_archive(selected_uuids)
+        archived_uuids = [uuid for uuid, (success, _) in results.items() if success]
+        errors = [message for success, message in results.values() if not success]
+        archived = len(archived_uuids)
+
+        if archived_uuids:
+            self._animation_model.remove_animations(archived_uuids)
+            self._event_bus.animations_archived.emit(archived_uuids)
 
         # Update archive count
         archive_count = self._archive_service.get_archive_count()
@@ -201,18 +201,19 @@ class ArchiveTrashController:
 
         logger.info(f"Restoring {len(selected_uuids)} items from archive: {selected_uuids}")
 
-        restored = 0
+        results = self._archive_service.restore_many_from_archive(selected_uuids)
+        restored_uuids = []
         errors = []
-        for uuid in selected_uuids:
-            logger.debug(f"Restoring UUID: {uuid}")
-            success, message = self._archive_service.restore_from_archive(uuid)
+        for uuid, (success, message) in results.items():
             if success:
-                restored += 1
-                logger.info(f"Restored {uuid}")
-                self._event_bus.animation_restored_from_archive.emit(uuid)
+                restored_uuids.append(uuid)
             else:
                 logger.warning(f"Failed to restore {uuid}: {message}")
                 errors.append(f"{uuid}: {message}")
+        restored = len(restored_uuids)
+
+        if restored_uuids:
+            self._event_bus.animations_restored_from_archive.emit(restored_uuids)
 
         # Update archive count
         archive_count = self._archive_service.get_archive_count()
@@ -253,15 +254,13 @@ class ArchiveTrashController:
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        moved = 0
-        errors = []
-        for uuid in selected_uuids:
-            success, message = self._archive_service.move_to_trash(uuid)
-            if success:
-                moved += 1
-                self._event_bus.animation_moved_to_trash.emit(uuid)
-            else:
-                errors.append(message)
+        results = self._archive_service.move_many_to_trash(selected_uuids)
+        moved_uuids = [uuid for uuid, (success, _) in results.items() if success]
+        errors = [message for success, message in results.values() if not success]
+        moved = len(moved_uuids)
+
+        if moved_uuids:
+            self._event_bus.animations_moved_to_trash.emit(moved_uuids)
 
         # Update counts
         archive_count = self._archive_service.get_archive_count()
@@ -307,11 +306,12 @@ class ArchiveTrashController:
 
         # Move all archive items to trash
         archive_items = self._archive_service.get_archive_items()
-        moved = 0
-        for item in archive_items:
-            success, _ = self._archive_service.move_to_trash(item['uuid'])
-            if success:
-                moved += 1
+        results = self._archive_service.move_many_to_trash([item['uuid'] for item in archive_items])
+        moved_uuids = [uuid for uuid, (success, _) in results.items() if success]
+        moved = len(moved_uuids)
+
+        if moved_uuids:
+            self._event_bus.animations_moved_to_trash.emit(moved_uuids)
 
         # Update counts
         self._event_bus.archive_count_changed.emit(0)
@@ -383,15 +383,13 @@ class ArchiveTrashController:
         if not selected_uuids:
             return
 
-        restored = 0
-        errors = []
-        for uuid in selected_uuids:
-            success, message = self._trash_service.restore_to_archive(uuid)
-            if success:
-                restored += 1
-                self._event_bus.animation_restored_to_archive.emit(uuid)
-            else:
-                errors.append(message)
+        results = self._trash_service.restore_many_to_archive(selected_uuids)
+        restored_uuids = [uuid for uuid, (success, _) in results.items() if success]
+        errors = [message for success, message in results.values() if not success]
+        restored = len(restored_uuids)
+
+        if restored_uuids:
+            self._event_bus.animations_restored_to_archive.emit(restored_uuids)
 
         # Update counts
         trash_count = self._trash_service.get_trash_count()
@@ -496,10 +494,26 @@ class ArchiveTrashController:
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        deleted, errors, message = self._trash_service.empty_trash()
+        # Delete in the background (files can take a while to remove)
+        get_job_manager().submit(
+            JobKind.EMPTY_TRASH,
+            "Emptying trash",
+            lambda ctx: self._trash_service.empty_trash(
+                progress_callback=ctx.report, cancel_token=ctx.token
+            ),
+            group=JobManager.GROUP_LIBRARY,
+            owner=self._parent,
+            on_finished=self._on_trash_emptied,
+            on_cancelled=self._on_empty_trash_cancelled,
+        )
+        self._status_bar.showMessage("Emptying trash...")
+
+    def _on_trash_emptied(self, result) -> None:
+        """Update counts and view after the empty trash job finished."""
+        deleted, errors, message = result
 
         # Update trash count
-        self._event_bus.trash_count_changed.emit(0)
+        self._event_bus.trash_count_changed.emit(self._trash_service.get_trash_count())
         self._event_bus.trash_emptied.emit()
 
         # Refresh trash view if active
@@ -508,6 +522,13 @@ class ArchiveTrashController:
 
         self._status_bar.showMessage(message)
 
+    def _on_empty_trash_cancelled(self) -> None:
+        """Update counts and view after emptying the trash was cancelled part-way."""
+        self._event_bus.trash_count_changed.emit(self._trash_service.get_trash_count())
+        if self._in_trash_view:
+            self.show_trash_view()
+        self._status_bar.showMessage("Emptying trash cancelled")
+
     # ==================== CONTEXT-AWARE DELETE HANDLER ====================
 
     def handle_delete_action(self) -> None:
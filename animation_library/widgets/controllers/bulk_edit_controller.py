@@ -8,6 +8,8 @@ import json
 from typing import List, Tuple, Callable, Optional
 from PyQt6.QtWidgets import QWidget, QMessageBox, QInputDialog
 
+from ...services.job_manager import JobKind, JobManager, get_job_manager
+
 
 class BulkEditController:
     """
@@ -54,6 +56,46 @@ class BulkEditController:
         """Get selected animation UUIDs from view."""
         return self._animation_view.get_selected_uuids()
 
+    def _run_bulk_job(
+        self,
+        title: str,
+        uuids: List[str],
+        operation: Callable[[str], bool],
+        on_done: Callable[[Optional[int]], None]
+    ) -> None:
+        """
+        Apply an operation to each UUID on a background job.
+
+        Args:
+            title: Job title for the jobs panel
+            uuids: Animations to edit
+            operation: Function run on the worker for each UUID, returns success
+                (must only touch the database, never the model)
+            on_done: Called on the GUI thread with the success count,
+                or None if the job was cancelled or failed part-way
+        """
+        def run(ctx):
+            success_count = 0
+            total = len(uuids)
+            for index, uuid in enumerate(uuids):
+                ctx.check()
+                ctx.report(index, total, title)
+                if operation(uuid):
+                    success_count += 1
+            return success_count
+
+        get_job_manager().submit(
+            JobKind.BULK_EDIT,
+            title,
+            run,
+            priority=JobManager.PRIORITY_HIGH,
+            group=JobManager.GROUP_LIBRARY,
+            owner=self._parent,
+            on_finished=on_done,
+            on_failed=lambda error: on_done(None),
+            on_cancelled=lambda: on_done(None),
+        )
+
     def _check_selection(self) -> Optional[List[str]]:
         """Check if there's a selection and return UUIDs or show warning."""
         selected_uuids = self._get_selected_uuids()
@@ -108,28 +150,29 @@ class BulkEditController:
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Remove tag from each selected animation
-        success_count = 0
+        # New tag lists are computed here; the job only writes them
+        new_tags = {}
         for uuid in selected_uuids:
             animation = self._animation_model.get_animation_by_uuid(uuid)
-            if not animation:
-                continue
-
-            current_tags = animation.get('tags', [])
-            if tag in current_tags:
-                current_tags.remove(tag)
-
-                if self._db_service.update_animation(uuid, {'tags': current_tags}):
-                    success_count += 1
+            if animation and tag in animation.get('tags', []):
+                new_tags[uuid] = [t for t in animation['tags'] if t != tag]
 
-        # Reload animations
-        if success_count > 0:
+        def on_done(success_count: Optional[int]) -> None:
+            # Reload animations
             self._reload_animations()
-            self._status_bar.showMessage(
-                f"Removed tag '{tag}' from {success_count} animation(s)"
-            )
-        else:
-            QMessageBox.warning(self._parent, "Error", "Failed to remove tags")
+            if success_count:
+                self._status_bar.showMessage(
+                    f"Removed tag '{tag}' from {success_count} animation(s)"
+                )
+            elif success_count == 0:
+                QMessageBox.warning(self._parent, "Error", "Failed to remove tags")
+
+        self._run_bulk_job(
+            f"Removing tag '{tag}'",
+            list(new_tags),
+            lambda uuid: self._db_service.update_animation(uuid, {'tags': new_tags[uuid]}),
+            on_done
+        )
 
     def move_to_folder(self) -> None:
         """Move selected animations to a folder."""
@@ -171,20 +214,23 @@ class BulkEditController:
         if not folder_id:
             return
 
-        # Move animations
-        success_count = 0
-        for uuid in selected_uuids:
-            if self._db_service.move_animation_to_folder(uuid, folder_id):
-                success_count += 1
-
-        # Reload animations
-        if success_count > 0:
+        def on_done(success_count: Optional[int]) -> None:
+            # Reload animations
             self._reload_animations()
-            self._status_bar.showMessage(
-                f"Moved {success_count} animation(s) to '{folder_name}'"
-            )
-        else:
-            QMessageBox.warning(self._parent, "Error", "Failed to move animations")
+            if success_count:
+                self._status_bar.showMessage(
+                    f"Moved {success_count} animation(s) to '{folder_name}'"
+                )
+            elif success_count == 0:
+                QMessageBox.warning(self._parent, "Error", "Failed to move animations")
+
+        # Move animations
+        self._run_bulk_job(
+            f"Moving to '{folder_name}'",
+            selected_uuids,
+            lambda uuid: self._db_service.move_animation_to_folder(uuid, folder_id),
+            on_done
+        )
 
     def apply_gradient_preset(self, name: str, top_color: tuple, bottom_color: tuple) -> None:
         """
@@ -225,32 +271,37 @@ class BulkEditController:
         if not selected_uuids:
             return
 
-        success_count = 0
-        for uuid in selected_uuids:
-            updates = {
-                'use_custom_thumbnail_gradient': 1,
-                'thumbnail_gradient_top': json.dumps(list(top_color)),
-                'thumbnail_gradient_bottom': json.dumps(list(bottom_color))
-            }
-
-            if self._db_service.update_animation(uuid, updates):
-                success_count += 1
+        updates = {
+            'use_custom_thumbnail_gradient': 1,
+            'thumbnail_gradient_top': json.dumps(list(top_color)),
+            'thumbnail_gradient_bottom': json.dumps(list(bottom_color))
+        }
 
-        if success_count > 0:
+        def on_done(success_count: Optional[int]) -> None:
             # Reload animations
             self._reload_animations()
+            if success_count == 0:
+                QMessageBox.warning(self._parent, "Error", "Failed to apply gradient")
+                return
 
-            # Clear thumbnail cache and refresh view
+            # Clear thumbnail cache and refresh view (also after a cancelled
+            # job - part of the selection may already be updated)
             from ...services.thumbnail_loader import get_thumbnail_loader
             thumbnail_loader = get_thumbnail_loader()
             thumbnail_loader.clear_cache()
             self._animation_view.viewport().update()
 
-            self._status_bar.showMessage(
-                f"Applied '{preset_name}' gradient to {success_count} animation(s)"
-            )
-        else:
-            QMessageBox.warning(self._parent, "Error", "Failed to apply gradient")
+            if success_count:
+                self._status_bar.showMessage(
+                    f"Applied '{preset_name}' gradient to {success_count} animation(s)"
+                )
+
+        self._run_bulk_job(
+            f"Applying '{preset_name}' gradient",
+            selected_uuids,
+            lambda uuid: self._db_service.update_animation(uuid, updates),
+            on_done
+        )
 
     def execute_bulk_operation(
         self,
@@ -7,21 +7,21 @@ Uses CompareVideoColumn for each version, showing:
 - Frame ruler timeline with note markers
 - Compact notes panel
 
-Shared controls at bottom sync both videos.
+Shared controls at bottom sync all videos through a ComparePlaybackEngine
+(master clock, parallel decoders). Two to MAX_COLUMNS versions are supported.
 """
 
-from pathlib import Path
-from typing import Optional, Dict, Any, List
-import cv2
+from typing import Dict, Any, List
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QSlider, QFrame, QStyleOptionSlider, QStyle
 )
-from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QMouseEvent, QKeyEvent
 
 from ..compare_video_column import CompareVideoColumn
+from ..compare_playback_engine import ComparePlaybackEngine
 from ...utils.icon_loader import IconLoader
 from ...utils.icon_utils import colorize_white_svg
 from ...themes.theme_manager import get_theme_manager
@@ -74,19 +74,24 @@ class ComparisonWidget(QWidget):
     Side-by-side video comparison widget with synchronized playback.
 
     Features:
-    - Two CompareVideoColumn widgets with video, timeline, and notes
-    - Shared progress slider that syncs both videos
+    - One CompareVideoColumn per version with video, timeline, and notes
+    - Shared progress slider that syncs all videos
     - Shared play/pause and loop controls
     - Read-only annotation display for each version
     """
 
+    # Maximum number of versions shown side by side
+    MAX_COLUMNS = 4
+
+    # Notes panels are hidden above this many columns to leave room for video
+    NOTES_PANEL_MAX_COLUMNS = 2
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self._version_a: Optional[Dict[str, Any]] = None
-        self._version_b: Optional[Dict[str, Any]] = None
-        self._notes_a: List[Dict] = []
-        self._notes_b: List[Dict] = []
+        self._versions: List[Dict[str, Any]] = []
+        self._columns: List[CompareVideoColumn] = []
+        self._separators: List[QFrame] = []
 
         # Playback state
         self._is_playing = False
@@ -95,9 +100,10 @@ class ComparisonWidget(QWidget):
         self._current_frame = 0
         self._total_frames = 0
 
-        # Sync timer for frame updates
-        self._sync_timer = QTimer(self)
-        self._sync_timer.timeout.connect(self._sync_frame_update)
+        # Master-clock playback engine driving all columns
+        self._engine = ComparePlaybackEngine(self)
+        self._engine.frame_presented.connect(self._on_frame_presented)
+        self._engine.playback_stopped.connect(self._on_engine_stopped)
         self._fps = 24
 
         # Playback speed
@@ -105,7 +111,6 @@ class ComparisonWidget(QWidget):
 
         self._load_icons()
         self._build_ui()
-        self._connect_signals()
 
         # Enable keyboard focus for shortcuts
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -127,25 +132,12 @@ class ComparisonWidget(QWidget):
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(8)
 
-        # Two columns side by side
-        columns_layout = QHBoxLayout()
-        columns_layout.setSpacing(16)
-
-        # Column A
-        self._column_a = CompareVideoColumn()
-        columns_layout.addWidget(self._column_a, 1)
+        # Columns side by side (two up front, more created on demand)
+        self._columns_layout = QHBoxLayout()
+        self._columns_layout.setSpacing(16)
+        self._ensure_columns(2)
 
-        # Separator
-        separator = QFrame()
-        separator.setFrameShape(QFrame.Shape.VLine)
-        separator.setStyleSheet("color: #404040;")
-        columns_layout.addWidget(separator)
-
-        # Column B
-        self._column_b = CompareVideoColumn()
-        columns_layout.addWidget(self._column_b, 1)
-
-        layout.addLayout(columns_layout, 1)
+        layout.addLayout(self._columns_layout, 1)
 
         # Shared controls at bottom
         controls_layout = QHBoxLayout()
@@ -257,10 +249,25 @@ class ComparisonWidget(QWidget):
 
         layout.addLayout(controls_layout)
 
-    def _connect_signals(self):
-        """Connect column signals for sync."""
-        self._column_a.frame_clicked.connect(self._on_column_frame_clicked)
-        self._column_b.frame_clicked.connect(self._on_column_frame_clicked)
+    def _ensure_columns(self, count: int):
+        """Create columns (with separators) until at least count exist."""
+        while len(self._columns) < count:
+            if self._columns:
+                separator = QFrame()
+                separator.setFrameShape(QFrame.Shape.VLine)
+                separator.setStyleSheet("color: #404040;")
+                self._columns_layout.addWidget(separator)
+                self._separators.append(separator)
+
+            column = CompareVideoColumn()
+            column.frame_clicked.connect(self._on_column_frame_clicked)
+            self._columns_layout.addWidget(column, 1)
+            self._columns.append(column)
+
+    @property
+    def _active_columns(self) -> List[CompareVideoColumn]:
+        """Columns showing a version"""
+        return self._columns[:len(self._versions)]
 
     def set_versions(
         self,
@@ -278,30 +285,57 @@ class ComparisonWidget(QWidget):
             notes_a: Optional notes for version A
             notes_b: Optional notes for version B
         """
-        self._version_a = version_a
-        self._version_b = version_b
-        self._notes_a = notes_a or []
-        self._notes_b = notes_b or []
+        self.set_version_list([version_a, version_b], [notes_a or [], notes_b or []])
+
+    def set_version_list(
+        self,
+        versions: List[Dict[str, Any]],
+        notes: List[List[Dict]] = None
+    ):
+        """
+        Set the versions to compare side by side.
+
+        Args:
+            versions: Version data dicts (2 to MAX_COLUMNS)
+            notes: Optional notes list per version
+        """
+        versions = versions[:self.MAX_COLUMNS]
+        notes = list(notes or [])
+        notes += [[]] * (len(versions) - len(notes))
 
         # Stop any current playback
         self._stop_playback()
 
-        # Set up columns
-        self._column_a.set_version(version_a, self._notes_a)
-        self._column_b.set_version(version_b, self._notes_b)
+        self._versions = versions
+        self._ensure_columns(len(versions))
+
+        # Set up columns; unused ones are cleared and hidden
+        show_notes = len(versions) <= self.NOTES_PANEL_MAX_COLUMNS
+        for index, column in enumerate(self._columns):
+            active = index < len(versions)
+            if active:
+                column.set_notes_panel_visible(show_notes)
+                column.set_version(versions[index], notes[index] or [])
+            else:
+                column.clear()
+            column.setVisible(active)
+            if index > 0:
+                self._separators[index - 1].setVisible(active)
 
         # Calculate total frames from longest video
-        self._fps = max(self._column_a.fps, self._column_b.fps, 24)
-        self._total_frames = max(self._column_a.total_frames, self._column_b.total_frames)
+        columns = self._active_columns
+        self._fps = max([c.fps for c in columns] + [24])
+        self._total_frames = max([c.total_frames for c in columns] + [0])
+        self._engine.set_sources([c.video_widget for c in columns], self._total_frames, self._fps)
 
         # Reset state
         self._current_frame = 0
         self._progress_slider.setValue(0)
         self._frame_label.setText(f"0 / {self._total_frames}")
 
-        # Sync both columns to frame 0 and load initial annotations
-        self._column_a.set_current_frame(0, load_drawover=True)
-        self._column_b.set_current_frame(0, load_drawover=True)
+        # Sync all columns to frame 0 and load initial annotations
+        for column in columns:
+            column.set_current_frame(0, load_drawover=True)
 
     def _on_column_frame_clicked(self, frame: int):
         """Handle frame click from either column - sync both."""
@@ -322,50 +356,32 @@ class ComparisonWidget(QWidget):
         self._is_playing = True
         self._play_btn.setIcon(self._pause_icon)
 
-        # Start sync timer with speed adjustment
-        frame_interval = int(1000 / (self._fps * self._playback_speed))
-        self._sync_timer.start(frame_interval)
+        self._engine.set_speed(self._playback_speed)
+        self._engine.set_loop(self._loop_enabled)
+        self._engine.start(self._current_frame)
 
     def _stop_playback(self):
         """Stop synced playback."""
-        self._sync_timer.stop()
+        self._engine.stop()
         self._is_playing = False
         self._play_btn.setIcon(self._play_icon)
 
         # Load annotations for current frame now that playback stopped
-        self._column_a.set_current_frame(self._current_frame, load_drawover=True)
-        self._column_b.set_current_frame(self._current_frame, load_drawover=True)
-
-    def _sync_frame_update(self):
-        """Update both videos in sync."""
-        self._current_frame += 1
-
-        # Check if we've reached the end of the longest video
-        if self._current_frame >= self._total_frames:
-            if self._loop_enabled:
-                self._seek_both(0)
-            else:
-                self._stop_playback()
-            return
+        for column in self._active_columns:
+            column.set_current_frame(self._current_frame, load_drawover=True)
 
-        # Update both columns' internal video widgets
-        video_a = self._column_a.video_widget
-        video_b = self._column_b.video_widget
-
-        # Update video A - stay on last frame if shorter
-        if video_a._cv_cap and self._current_frame < self._column_a.total_frames:
-            video_a._show_current_frame()
-            video_a._cv_frame_count += 1
+    def _on_engine_stopped(self):
+        """Engine stopped on its own (end reached without loop)."""
+        if self._is_playing:
+            self._stop_playback()
 
-        # Update video B - stay on last frame if shorter
-        if video_b._cv_cap and self._current_frame < self._column_b.total_frames:
-            video_b._show_current_frame()
-            video_b._cv_frame_count += 1
+    def _on_frame_presented(self, frame: int):
+        """All videos now show frame - update timelines, annotations and slider."""
+        self._current_frame = frame
 
-        # Update playhead positions on both timelines AND reload annotations
-        # so per-frame drawovers stay in sync during playback.
-        self._column_a.set_current_frame(self._current_frame, load_drawover=True)
-        self._column_b.set_current_frame(self._current_frame, load_drawover=True)
+        # Annotations are prefetched per version, so this is cheap per tick
+        for column in self._active_columns:
+            column.set_current_frame(frame, load_drawover=True)
 
         # Update slider
         if not self._is_seeking and self._total_frames > 0:
@@ -376,6 +392,7 @@ class ComparisonWidget(QWidget):
     def _toggle_loop(self):
         """Toggle loop mode."""
         self._loop_enabled = self._loop_btn.isChecked()
+        self._engine.set_loop(self._loop_enabled)
 
     def _on_slider_pressed(self):
         """Handle slider drag start."""
@@ -407,12 +424,13 @@ class ComparisonWidget(QWidget):
             self._seek_both(target_frame)
 
     def _seek_both(self, frame: int):
-        """Seek both videos to the same frame (clamped to each video's length)."""
+        """Seek all videos to the same frame (clamped to each video's length)."""
         self._current_frame = frame
 
-        # Seek both columns (they handle clamping internally)
-        self._column_a.seek_to_frame(frame)
-        self._column_b.seek_to_frame(frame)
+        # Decoders seek in parallel; then each column refreshes its timeline/annotations
+        self._engine.seek(frame)
+        for column in self._active_columns:
+            column.set_current_frame(min(frame, max(0, column.total_frames - 1)), load_drawover=True)
 
         # Update slider and frame label (block signals to prevent infinite loop)
         # Don't update slider during seeking - user is controlling it via drag
@@ -439,11 +457,8 @@ class ComparisonWidget(QWidget):
         speed_text = f"{int(speed)}x" if speed == int(speed) else f"{speed}x"
         self._speed_btn.setText(speed_text)
 
-        # Update timer if playing
-        if self._is_playing:
-            self._sync_timer.stop()
-            frame_interval = int(1000 / (self._fps * self._playback_speed))
-            self._sync_timer.start(frame_interval)
+        # Update clock if playing
+        self._engine.set_speed(self._playback_speed)
 
     def step_forward(self):
         """Step forward one frame."""
@@ -458,10 +473,11 @@ class ComparisonWidget(QWidget):
             self._seek_both(self._current_frame - 1)
 
     def _get_union_annotation_frames(self) -> list:
-        """Get sorted union of annotation frames from both videos."""
-        frames_a = set(self._column_a.annotation_frames)
-        frames_b = set(self._column_b.annotation_frames)
-        return sorted(frames_a | frames_b)
+        """Get sorted union of annotation frames from all videos."""
+        frames = set()
+        for column in self._active_columns:
+            frames.update(column.annotation_frames)
+        return sorted(frames)
 
     def _navigate_to_prev_annotation(self):
         """Navigate to previous annotated frame (union of both videos)."""
@@ -544,10 +560,12 @@ class ComparisonWidget(QWidget):
         super().keyPressEvent(event)
 
     def clear(self):
-        """Clear both columns."""
+        """Clear all columns."""
         self._stop_playback()
-        self._column_a.clear()
-        self._column_b.clear()
+        for column in self._columns:
+            column.clear()
+        self._versions = []
+        self._engine.set_sources([], 0, self._fps)
         self._current_frame = 0
         self._total_frames = 0
         self._progress_slider.setValue(0)
@@ -564,35 +582,27 @@ class ComparisonWidget(QWidget):
         self._navigate_to_next_annotation()
 
     def set_annotations_visible(self, visible: bool):
-        """Show or hide annotations on both columns."""
-        if self._column_a:
-            self._column_a.set_canvas_visible(visible)
-        if self._column_b:
-            self._column_b.set_canvas_visible(visible)
+        """Show or hide annotations on all columns."""
+        for column in self._active_columns:
+            column.set_canvas_visible(visible)
 
     def set_hold_enabled(self, enabled: bool):
-        """Enable or disable hold mode on both columns."""
-        if self._column_a:
-            self._column_a.set_hold_enabled(enabled)
-        if self._column_b:
-            self._column_b.set_hold_enabled(enabled)
+        """Enable or disable hold mode on all columns."""
+        for column in self._active_columns:
+            column.set_hold_enabled(enabled)
 
     def set_ghost_enabled(self, enabled: bool):
-        """Enable or disable ghost mode on both columns."""
-        if self._column_a:
-            self._column_a.set_ghost_enabled(enabled)
-        if self._column_b:
-            self._column_b.set_ghost_enabled(enabled)
+        """Enable or disable ghost mode on all columns."""
+        for column in self._active_columns:
+            column.set_ghost_enabled(enabled)
 
     def set_ghost_settings(self, settings: dict):
-        """Set ghost settings on both columns."""
-        if self._column_a:
-            self._column_a.set_ghost_settings(settings)
-        if self._column_b:
-            self._column_b.set_ghost_settings(settings)
+        """Set ghost settings on all columns."""
+        for column in self._active_columns:
+            column.set_ghost_settings(settings)
 
     def get_annotation_frames(self) -> list:
-        """Get union of all annotation frames from both columns."""
+        """Get union of all annotation frames from all columns."""
         return self._get_union_annotation_frames()
 
 
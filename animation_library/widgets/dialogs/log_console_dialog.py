@@ -43,6 +43,18 @@ class LogConsoleDialog(QDialog):
         toolbar = QHBoxLayout()
         toolbar.setSpacing(8)
 
+        # Subsystem selector (level applies to this subsystem, or everything)
+        subsystem_label = QLabel("Subsystem:")
+        toolbar.addWidget(subsystem_label)
+
+        self.subsystem_combo = QComboBox()
+        self.subsystem_combo.addItem("All", None)
+        for name, prefix in Config.LOG_SUBSYSTEMS.items():
+            self.subsystem_combo.addItem(name, prefix)
+        self.subsystem_combo.setFixedWidth(130)
+        self.subsystem_combo.currentIndexChanged.connect(self.on_subsystem_changed)
+        toolbar.addWidget(self.subsystem_combo)
+
         # Log level filter
         level_label = QLabel("Log Level:")
         toolbar.addWidget(level_label)
@@ -87,7 +99,7 @@ class LogConsoleDialog(QDialog):
         # Log viewer
         self.log_viewer = QPlainTextEdit()
         self.log_viewer.setReadOnly(True)
-        self.log_viewer.setMaximumBlockCount(1000)  # Limit to 1000 lines
+        self.log_viewer.setMaximumBlockCount(Config.LOG_CONSOLE_MAX_BLOCKS)
         self.log_viewer.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
 
         # Monospace font
@@ -183,17 +195,40 @@ class LogConsoleDialog(QDialog):
         logger.info("Log console opened")
 
     def on_level_changed(self, level: str):
-        """Handle log level filter change"""
+        """Handle log level filter change (for the selected subsystem)"""
+        if not self.log_handler:
+            return
+
+        prefix = self.subsystem_combo.currentData()
+        if prefix is None:
+            if level == "ALL":
+                self.log_handler.setLevel(logging.DEBUG)
+            else:
+                numeric_level = getattr(logging, level, logging.INFO)
+                self.log_handler.setLevel(numeric_level)
+            self.status_label.setText(f"Filtering: {level}")
+        else:
+            # "ALL" clears the override so the subsystem follows the global level
+            numeric_level = logging.NOTSET if level == "ALL" else getattr(logging, level, logging.INFO)
+            self.log_handler.subsystem_filter.set_level(prefix, numeric_level)
+            self.status_label.setText(f"Filtering {self.subsystem_combo.currentText()}: {level}")
+
+    def on_subsystem_changed(self, index: int):
+        """Show the selected subsystem's current level"""
         if not self.log_handler:
             return
 
-        if level == "ALL":
-            self.log_handler.setLevel(logging.DEBUG)
+        prefix = self.subsystem_combo.itemData(index)
+        if prefix is None:
+            level = self.log_handler.level
+            text = "ALL" if level <= logging.DEBUG else logging.getLevelName(level)
         else:
-            numeric_level = getattr(logging, level, logging.INFO)
-            self.log_handler.setLevel(numeric_level)
+            level = self.log_handler.subsystem_filter.get_level(prefix)
+            text = "ALL" if level == logging.NOTSET else logging.getLevelName(level)
 
-        self.status_label.setText(f"Filtering: {level}")
+        self.level_combo.blockSignals(True)
+        self.level_combo.setCurrentText(text)
+        self.level_combo.blockSignals(False)
 
     def clear_logs(self):
         """Clear the log viewer"""
@@ -30,6 +30,7 @@ class AnnotatedExportWorker(QThread):
         animation_uuid: str,
         version_label: str,
         fps: int = 24,
+        hold_frames: bool = False,
         parent=None
     ):
         super().__init__(parent)
@@ -38,6 +39,7 @@ class AnnotatedExportWorker(QThread):
         self._animation_uuid = animation_uuid
         self._version_label = version_label
         self._fps = fps
+        self._hold_frames = hold_frames
         self._cancelled = False
 
     def run(self):
@@ -50,6 +52,7 @@ class AnnotatedExportWorker(QThread):
             animation_uuid=self._animation_uuid,
             version_label=self._version_label,
             fps=self._fps,
+            hold_frames=self._hold_frames,
             progress_callback=self._on_progress,
             cancelled_check=self._is_cancelled
         )
@@ -97,7 +100,8 @@ class AnnotatedExportManager:
         animation_uuid: str,
         version_label: str,
         animation_name: str,
-        fps: int = 24
+        fps: int = 24,
+        hold_frames: bool = False
     ) -> bool:
         """
         Start exporting video with annotations.
@@ -108,6 +112,7 @@ class AnnotatedExportManager:
             version_label: Version label (e.g., 'v001')
             animation_name: Animation name for output filename
             fps: Frames per second
+            hold_frames: Keep annotations visible until the next annotated frame
 
         Returns:
             True if export started successfully
@@ -158,6 +163,7 @@ class AnnotatedExportManager:
             animation_uuid=animation_uuid,
             version_label=version_label,
             fps=fps,
+            hold_frames=hold_frames,
             parent=self._parent
         )
         self._worker.progress.connect(self._on_progress)
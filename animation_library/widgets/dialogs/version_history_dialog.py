@@ -23,11 +23,12 @@ from PyQt6.QtGui import QColor, QPixmap, QImage, QIcon
 
 from ...config import Config
 from ...services.database_service import get_database_service
+from ...services.directory_cache import get_directory_cache
 from ...services.notes_database import get_notes_database
 # Permissions module removed (Option B Phase 4) — drawover clear gate
 # replaced with cross-author confirmation; soft/hard-delete decision is
 # now `self._is_studio_mode` directly.
-from ...services.drawover_storage import get_drawover_storage, get_drawover_cache
+from ...services.drawover_storage import get_drawover_storage, AnnotationTimelineIndex
 from ...services.annotated_export_service import (
     find_ffmpeg, get_reviews_folder, generate_export_filename
 )
@@ -38,6 +39,9 @@ from ...themes.theme_manager import get_theme_manager
 from ..video_preview_widget import VideoPreviewWidget
 from ..frame_ruler_timeline import FrameRulerTimeline
 from ..drawover_canvas import DrawoverCanvas, DrawingTool
+from ..drawover.overlay_cache import (
+    DrawoverOverlayCache, build_overlay_layers, make_overlay_key, get_drawover_overlay_cache
+)
 from ..review_notes_panel import ReviewNotesPanel
 from .comparison_widget import ComparisonWidget
 
@@ -124,9 +128,11 @@ class VersionHistoryDialog(QDialog):
 
         # Drawover state (always-on mode - no toggle needed)
         self._drawover_storage = get_drawover_storage()
-        self._drawover_cache = get_drawover_cache()
         self._current_drawover_frame: int = -1
         self._annotation_frames: List[int] = []  # Cached list of frames with annotations
+        self._annotation_index: Optional[AnnotationTimelineIndex] = None  # Built once per version
+        self._overlay_cache = get_drawover_overlay_cache()  # Pre-rendered annotations for playback
+        self._overlay_lookahead_from: int = -1  # Frame the last overlay lookahead started at
 
         # Display mode state
         self._hide_annotations = False
@@ -659,7 +665,7 @@ class VersionHistoryDialog(QDialog):
 
             # Enable export button if preview video exists
             preview_path = self._versions[row].get('preview_path', '')
-            has_preview = preview_path and Path(preview_path).exists()
+            has_preview = preview_path and get_directory_cache().exists(preview_path)
             self._export_annotations_btn.setEnabled(has_preview)
 
             self._update_preview(row)
@@ -681,6 +687,7 @@ class VersionHistoryDialog(QDialog):
             # Display options are in bottom bar now
             self._current_drawover_frame = -1
             self._annotation_frames = []
+            self._annotation_index = None
             self._strokes_from_hold = False
 
     def _update_preview(self, row: int):
@@ -703,7 +710,7 @@ class VersionHistoryDialog(QDialog):
 
         # Load video
         preview_path = version.get('preview_path', '')
-        if preview_path and Path(preview_path).exists():
+        if preview_path and get_directory_cache().exists(preview_path):
             self._video_preview.load_video(preview_path)
         else:
             self._video_preview.clear()
@@ -730,11 +737,13 @@ class VersionHistoryDialog(QDialog):
 
         self._position_drawover_canvas()
         self._drawover_canvas.show()
+
+        # Index this version's annotations before the first frame loads (Hold/Ghost use it)
+        self._load_annotation_markers()
         self._load_drawover_for_frame(0)
 
-        # Load review notes and annotation markers
+        # Load review notes
         self._load_review_notes()
-        self._load_annotation_markers()
 
     def _build_display_options_buttons(self, layout: QHBoxLayout):
         """Add display options buttons to the bottom bar: Prev | Next | Hide | Hold | Ghost."""
@@ -835,8 +844,9 @@ class VersionHistoryDialog(QDialog):
             self._next_ann_btn.setEnabled(False)
             return
 
-        has_prev = any(f < current for f in annotation_frames)
-        has_next = any(f > current for f in annotation_frames)
+        # Both lists are sorted ascending
+        has_prev = annotation_frames[0] < current
+        has_next = annotation_frames[-1] > current
 
         self._prev_ann_btn.setEnabled(has_prev)
         self._next_ann_btn.setEnabled(has_next)
@@ -883,6 +893,9 @@ class VersionHistoryDialog(QDialog):
             self._drawover_canvas.set_tool(DrawingTool.NONE)
         else:
             self._play_btn.setIcon(self._play_icon)
+            # Swap a pre-rendered playback overlay back to editable strokes
+            if self._drawover_canvas.has_overlay_pixmap():
+                self._load_drawover_for_frame(self._current_drawover_frame)
             # Re-enable drawing when paused - restore toolbar's current tool
             self._drawover_canvas.read_only = False
             current_tool = self._annotation_toolbar.current_tool
@@ -919,21 +932,33 @@ class VersionHistoryDialog(QDialog):
         self._load_drawover_for_frame(frame)
 
     def _load_annotation_markers(self):
-        """Load frames with annotations for timeline display and navigation."""
-        if not self._selected_uuid or not self._selected_version_label:
-            self._frame_timeline.set_annotation_frames([])
-            self._annotation_frames = []
-            self._update_nav_buttons()
-            return
-
-        frames = self._drawover_storage.list_frames_with_drawovers(
-            self._selected_uuid, self._selected_version_label
-        )
+        """Index the selected version's annotations from disk and show them on the timeline."""
+        self._annotation_index = None
+        self._overlay_lookahead_from = -1
+        self._refresh_annotation_markers()
+
+    def _refresh_annotation_markers(self):
+        """Show the annotation index's frames on the timeline and navigation buttons."""
+        index = self._get_annotation_index()
+        frames = index.frames if index else []
         self._annotation_frames = frames
         self._frame_timeline.set_annotation_frames(frames)
         # Update navigation buttons
         self._update_nav_buttons()
 
+    def _get_annotation_index(self) -> Optional[AnnotationTimelineIndex]:
+        """Get the annotation index for the selected version, building it on first use."""
+        if not self._selected_uuid or not self._selected_version_label:
+            return None
+
+        index = self._annotation_index
+        if index is None or not index.matches(self._selected_uuid, self._selected_version_label):
+            index = AnnotationTimelineIndex(
+                self._drawover_storage, self._selected_uuid, self._selected_version_label
+            )
+            self._annotation_index = index
+        return index
+
     # ==================== Review Notes ====================
 
     def _on_show_deleted_toggled(self, checked: bool):
@@ -1007,10 +1032,10 @@ class VersionHistoryDialog(QDialog):
             self._update_nav_buttons()
             return
 
+        index = self._get_annotation_index()
         current = self._video_preview.current_frame if hasattr(self._video_preview, 'current_frame') else 0
-        prev_frames = [f for f in self._annotation_frames if f < current]
-        if prev_frames:
-            prev_frame = max(prev_frames)
+        prev_frame = index.previous(current) if index else None
+        if prev_frame is not None:
             self._video_preview.seek_to_frame(prev_frame)
             self._frame_timeline.set_current_frame(prev_frame)
 
@@ -1022,10 +1047,10 @@ class VersionHistoryDialog(QDialog):
             self._update_nav_buttons()
             return
 
+        index = self._get_annotation_index()
         current = self._video_preview.current_frame if hasattr(self._video_preview, 'current_frame') else 0
-        next_frames = [f for f in self._annotation_frames if f > current]
-        if next_frames:
-            next_frame = min(next_frames)
+        next_frame = index.next(current) if index else None
+        if next_frame is not None:
             self._video_preview.seek_to_frame(next_frame)
             self._frame_timeline.set_current_frame(next_frame)
 
@@ -1191,7 +1216,9 @@ class VersionHistoryDialog(QDialog):
         self._set_latest_btn.setEnabled(False)
         self._apply_btn.setEnabled(False)
 
-        self._preview_info_label.setText("Select 2 versions to compare")
+        self._preview_info_label.setText(
+            f"Select 2-{ComparisonWidget.MAX_COLUMNS} versions to compare"
+        )
 
         # Hide notes panel and shrink table
         self._notes_panel.hide()
@@ -1235,20 +1262,21 @@ class VersionHistoryDialog(QDialog):
                     if uuid:
                         selected_rows.append((row, uuid))
 
-            if len(selected_rows) > 2:
+            max_columns = ComparisonWidget.MAX_COLUMNS
+            if len(selected_rows) > max_columns:
                 self._table.blockSignals(True)
                 self._table.clearSelection()
-                for row, uuid in selected_rows[:2]:
+                for row, uuid in selected_rows[:max_columns]:
                     for col in range(self._table.columnCount()):
                         item = self._table.item(row, col)
                         if item:
                             item.setSelected(True)
                 self._table.blockSignals(False)
-                self._compare_selections = [uuid for _, uuid in selected_rows[:2]]
+                self._compare_selections = [uuid for _, uuid in selected_rows[:max_columns]]
             else:
                 self._compare_selections = [uuid for _, uuid in selected_rows]
 
-            if len(self._compare_selections) == 2:
+            if len(self._compare_selections) >= 2:
                 self._show_comparison()
             else:
                 self._comparison_widget.hide()
@@ -1259,32 +1287,30 @@ class VersionHistoryDialog(QDialog):
             pass  # Silent fail for compare mode selection changes
 
     def _show_comparison(self):
-        if len(self._compare_selections) != 2:
+        if len(self._compare_selections) < 2:
             return
 
-        version_a = next((v for v in self._versions if v.get('uuid') == self._compare_selections[0]), None)
-        version_b = next((v for v in self._versions if v.get('uuid') == self._compare_selections[1]), None)
-
-        if version_a and version_b:
-            # Load notes for each version
-            notes_a = []
-            notes_b = []
-
-            if self._notes_db:
-                label_a = version_a.get('version_label', '')
-                label_b = version_b.get('version_label', '')
-                uuid_a = version_a.get('uuid', '')
-                uuid_b = version_b.get('uuid', '')
+        versions = []
+        for uuid in self._compare_selections:
+            version = next((v for v in self._versions if v.get('uuid') == uuid), None)
+            if not version:
+                return
+            versions.append(version)
 
-                if uuid_a and label_a:
-                    notes_a = self._notes_db.get_notes_for_version(uuid_a, label_a)
-                if uuid_b and label_b:
-                    notes_b = self._notes_db.get_notes_for_version(uuid_b, label_b)
+        # Load notes for each version
+        notes = []
+        for version in versions:
+            label = version.get('version_label', '')
+            uuid = version.get('uuid', '')
+            if self._notes_db and uuid and label:
+                notes.append(self._notes_db.get_notes_for_version(uuid, label))
+            else:
+                notes.append([])
 
-            self._center_widget.hide()
-            self._comparison_widget.show()
-            self._comparison_widget.set_versions(version_a, version_b, notes_a, notes_b)
-            self._update_nav_buttons()
+        self._center_widget.hide()
+        self._comparison_widget.show()
+        self._comparison_widget.set_version_list(versions, notes)
+        self._update_nav_buttons()
 
     # ==================== Drawover Canvas Positioning ====================
 
@@ -1328,6 +1354,11 @@ class VersionHistoryDialog(QDialog):
     def _on_resize_complete(self):
         """Called after resize to update canvas position."""
         self._position_drawover_canvas()
+        if self._drawover_canvas.has_overlay_pixmap():
+            # Overlay was rendered for the old size - reload the frame at the new one
+            self._overlay_lookahead_from = -1
+            self._load_drawover_for_frame(self._current_drawover_frame)
+            return
         # Refresh strokes to recalculate screen positions from UV
         self._drawover_canvas.refresh_strokes()
 
@@ -1355,6 +1386,13 @@ class VersionHistoryDialog(QDialog):
         # Reposition canvas to match current video rect
         self._position_drawover_canvas()
 
+        # During playback, paint the pre-rendered overlay when it is ready
+        if self._video_preview.is_playing and self._show_overlay_for_frame(frame):
+            self._drawover_canvas.show()
+            self._drawover_canvas.read_only = True
+            self._drawover_canvas.set_tool(DrawingTool.NONE)
+            return
+
         # Clear ghost strokes first
         self._drawover_canvas.clear_ghost_strokes()
 
@@ -1393,94 +1431,29 @@ class VersionHistoryDialog(QDialog):
         Returns (strokes, canvas_size, from_hold) tuple.
         from_hold is True if strokes came from a previous frame via Hold mode.
         """
-        # Check cache first for current frame
-        cached = self._drawover_cache.get(
-            self._selected_uuid,
-            self._selected_version_label,
-            frame
-        )
-
-        if cached:
-            strokes = cached.get('strokes', [])
-            canvas_size = cached.get('canvas_size')
-            if strokes:
-                return strokes, canvas_size, False  # Not from hold
-
-        # Load from storage
-        data = self._drawover_storage.load_drawover(
-            self._selected_uuid,
-            self._selected_version_label,
-            frame
-        )
-        if data:
-            strokes = data.get('strokes', [])
-            canvas_size = data.get('canvas_size')
-            self._drawover_cache.put(
-                self._selected_uuid,
-                self._selected_version_label,
-                frame,
-                data
-            )
-            if strokes:
-                return strokes, canvas_size, False  # Not from hold
-
-        # If Hold enabled and no strokes for current frame, search backwards
-        if self._hold_enabled and self._annotation_frames:
-            # Find the nearest previous frame with annotations
-            prev_frames = [f for f in self._annotation_frames if f < frame]
-            if prev_frames:
-                held_frame = max(prev_frames)
-                cached = self._drawover_cache.get(
-                    self._selected_uuid,
-                    self._selected_version_label,
-                    held_frame
-                )
-                if cached:
-                    return cached.get('strokes', []), cached.get('canvas_size'), True  # From hold
-
-                data = self._drawover_storage.load_drawover(
-                    self._selected_uuid,
-                    self._selected_version_label,
-                    held_frame
-                )
-                if data:
-                    strokes = data.get('strokes', [])
-                    canvas_size = data.get('canvas_size')
-                    self._drawover_cache.put(
-                        self._selected_uuid,
-                        self._selected_version_label,
-                        held_frame,
-                        data
-                    )
+        index = self._get_annotation_index()
+        if index is None:
+            return [], None, False
+
+        strokes, canvas_size = index.get_strokes(frame)
+        if strokes:
+            return strokes, canvas_size, False  # Not from hold
+
+        # If Hold enabled and no strokes for current frame, use the nearest previous annotation
+        if self._hold_enabled:
+            held_frame = index.previous(frame)
+            if held_frame is not None:
+                strokes, canvas_size = index.get_strokes(held_frame)
+                if strokes:
                     return strokes, canvas_size, True  # From hold
 
         return [], None, False
 
     def _add_ghost_strokes_for_frame(self, frame: int):
         """Add ghost/onion skin strokes from neighboring frames."""
-        before_count = self._ghost_settings.get('before_frames', 2)
-        after_count = self._ghost_settings.get('after_frames', 2)
         before_color = self._ghost_settings.get('before_color', QColor("#FF5555"))
         after_color = self._ghost_settings.get('after_color', QColor("#55FF55"))
-        sketches_only = self._ghost_settings.get('sketches_only', True)
-
-        if sketches_only:
-            # "Consider only sketches" mode - only show ghost from frames that have annotations
-            if not self._annotation_frames:
-                return
-
-            # Find annotation frames before current frame
-            before_frames = sorted([f for f in self._annotation_frames if f < frame], reverse=True)
-            before_frames = before_frames[:before_count]
-
-            # Find annotation frames after current frame
-            after_frames = sorted([f for f in self._annotation_frames if f > frame])
-            after_frames = after_frames[:after_count]
-        else:
-            # "Consider all frames" mode - show ghost from exactly N frames before/after
-            # even if those frames don't have annotations
-            before_frames = [frame - i for i in range(1, before_count + 1) if frame - i >= 0]
-            after_frames = [frame + i for i in range(1, after_count + 1) if frame + i < self._total_frames]
+        before_frames, after_frames = self._get_ghost_frames(frame)
 
         # Add ghost strokes for "before" frames (red tint)
         for idx, ghost_frame in enumerate(before_frames):
@@ -1506,31 +1479,119 @@ class VersionHistoryDialog(QDialog):
                     tuple(canvas_size) if canvas_size else None
                 )
 
-    def _load_strokes_from_storage(self, frame: int) -> tuple:
-        """Load strokes from storage (with caching)."""
-        cached = self._drawover_cache.get(
-            self._selected_uuid,
-            self._selected_version_label,
-            frame
+    def _get_ghost_frames(self, frame: int) -> tuple:
+        """Get (before_frames, after_frames) ghosted on frame, nearest first."""
+        before_count = self._ghost_settings.get('before_frames', 2)
+        after_count = self._ghost_settings.get('after_frames', 2)
+        sketches_only = self._ghost_settings.get('sketches_only', True)
+
+        if sketches_only:
+            # "Consider only sketches" mode - only show ghost from frames that have annotations
+            index = self._get_annotation_index()
+            if not index:
+                return [], []
+            return index.before(frame, before_count), index.after(frame, after_count)
+
+        # "Consider all frames" mode - show ghost from exactly N frames before/after
+        # even if those frames don't have annotations
+        before_frames = [frame - i for i in range(1, before_count + 1) if frame - i >= 0]
+        after_frames = [frame + i for i in range(1, after_count + 1) if frame + i < self._total_frames]
+        return before_frames, after_frames
+
+    # ==================== Playback Overlays ====================
+
+    def _get_drawover_composition(self, index: AnnotationTimelineIndex, frame: int) -> tuple:
+        """Get (source_frame, before_frames, after_frames) shown at frame (Hold/Ghost aware)."""
+        if frame in index:
+            source_frame = frame
+        elif self._hold_enabled:
+            source_frame = index.previous(frame)
+        else:
+            source_frame = None
+
+        before_frames, after_frames = self._get_ghost_frames(frame) if self._ghost_enabled else ([], [])
+        return (source_frame, tuple(before_frames), tuple(after_frames))
+
+    def _get_overlay_layers(self, index: AnnotationTimelineIndex, composition: tuple) -> list:
+        """Get overlay layers for a composition (empty if it shows nothing)."""
+        source_frame, before_frames, after_frames = composition
+        return build_overlay_layers(
+            index.get_strokes(source_frame) if source_frame is not None else None,
+            [index.get_strokes(f) for f in before_frames],
+            [index.get_strokes(f) for f in after_frames],
+            self._ghost_settings.get('before_color', QColor("#FF5555")),
+            self._ghost_settings.get('after_color', QColor("#55FF55"))
         )
-        if cached:
-            return cached.get('strokes', []), cached.get('canvas_size')
 
-        data = self._drawover_storage.load_drawover(
-            self._selected_uuid,
-            self._selected_version_label,
-            frame
+    def _get_overlay_key(self, composition: tuple, geometry) -> tuple:
+        """Get the overlay cache key for a composition."""
+        return make_overlay_key(
+            self._selected_uuid, self._selected_version_label, composition,
+            self._ghost_settings.get('before_color', QColor("#FF5555")),
+            self._ghost_settings.get('after_color', QColor("#55FF55")),
+            geometry
         )
-        if data:
-            self._drawover_cache.put(
-                self._selected_uuid,
-                self._selected_version_label,
-                frame,
-                data
-            )
-            return data.get('strokes', []), data.get('canvas_size')
 
-        return [], None
+    def _show_overlay_for_frame(self, frame: int) -> bool:
+        """
+        Paint the pre-rendered overlay for frame, queueing renders ahead of the playhead.
+
+        Returns:
+            True if the overlay was ready and is shown; False to build stroke items instead
+        """
+        index = self._get_annotation_index()
+        if index is None:
+            return False
+
+        geometry = self._drawover_canvas.get_overlay_geometry()
+        composition = self._get_drawover_composition(index, frame)
+        overlay_key = self._get_overlay_key(composition, geometry)
+        self._prefetch_overlays(index, frame, geometry)
+
+        pixmap = self._overlay_cache.get(overlay_key)
+        if pixmap is None:
+            return False
+
+        self._drawover_canvas.show_overlay_pixmap(pixmap)
+        self._strokes_from_hold = composition[0] is not None and composition[0] != frame
+        return True
+
+    def _prefetch_overlays(self, index: AnnotationTimelineIndex, frame: int, geometry):
+        """Render overlays for the playhead frame and the frames just ahead of it."""
+        lookahead = Config.DRAWOVER_OVERLAY_LOOKAHEAD_FRAMES
+        start = self._overlay_lookahead_from
+        if start >= 0 and start <= frame <= start + lookahead // 2:
+            return
+        self._overlay_lookahead_from = frame
+
+        wanted = []
+        seen = set()
+        for ahead in range(frame, min(frame + 1 + lookahead, self._total_frames)):
+            composition = self._get_drawover_composition(index, ahead)
+            if composition in seen:
+                continue
+            seen.add(composition)
+            layers = self._get_overlay_layers(index, composition)
+            if not layers:
+                continue
+            overlay_key = self._get_overlay_key(composition, geometry)
+            wanted.append(overlay_key)
+            priority = (DrawoverOverlayCache.PRIORITY_CURRENT if ahead == frame
+                        else DrawoverOverlayCache.PRIORITY_PREFETCH)
+            self._overlay_cache.request(overlay_key, layers, geometry, priority)
+        self._overlay_cache.retain_pending(self._selected_uuid, self._selected_version_label, wanted)
+
+    def _invalidate_overlays(self):
+        """Drop pre-rendered overlays of the selected version after its drawovers change."""
+        self._overlay_lookahead_from = -1
+        self._overlay_cache.invalidate(self._selected_uuid, self._selected_version_label)
+
+    def _load_strokes_from_storage(self, frame: int) -> tuple:
+        """Load strokes from storage (cached in the annotation index)."""
+        index = self._get_annotation_index()
+        if index is None:
+            return [], None
+        return index.get_strokes(frame)
 
     def _save_current_drawover(self):
         """Save current frame's drawover to storage."""
@@ -1541,6 +1602,10 @@ class VersionHistoryDialog(QDialog):
         if self._strokes_from_hold:
             return
 
+        # A pre-rendered playback overlay leaves the canvas without strokes - nothing to save
+        if self._drawover_canvas.has_overlay_pixmap():
+            return
+
         strokes = self._drawover_canvas.export_strokes()
 
         # Persist the empty state too, but only if the frame previously had
@@ -1573,12 +1638,10 @@ class VersionHistoryDialog(QDialog):
             )
 
             if success:
-                # Update cache
-                self._drawover_cache.invalidate(
-                    self._selected_uuid,
-                    self._selected_version_label,
-                    self._current_drawover_frame
-                )
+                # Update annotation index (and playback overlays if the strokes changed)
+                index = self._get_annotation_index()
+                if not index or index.update_frame(self._current_drawover_frame, strokes, canvas_size):
+                    self._invalidate_overlays()
 
                 # Log action + update metadata atomically so the audit trail
                 # and per-frame metadata can't drift out of sync.
@@ -1605,7 +1668,7 @@ class VersionHistoryDialog(QDialog):
                     )
 
                 # Update annotation markers on timeline
-                self._load_annotation_markers()
+                self._refresh_annotation_markers()
 
     def _on_drawing_started(self):
         """Handle drawing start - clear held strokes if drawing on a held frame."""
@@ -1625,7 +1688,7 @@ class VersionHistoryDialog(QDialog):
         self._save_current_drawover()
 
         # Update timeline markers to show the new annotation
-        self._load_annotation_markers()
+        self._refresh_annotation_markers()
 
     def _on_tool_selected(self, tool: DrawingTool):
         """Handle tool selection from compact toolbar."""
@@ -1700,12 +1763,11 @@ class VersionHistoryDialog(QDialog):
             )
 
             if success:
-                # Invalidate cache for this frame
-                self._drawover_cache.invalidate(
-                    self._selected_uuid,
-                    self._selected_version_label,
-                    self._current_drawover_frame
-                )
+                # Drop this frame from the annotation index
+                index = self._get_annotation_index()
+                if index:
+                    index.remove_frame(self._current_drawover_frame)
+                self._invalidate_overlays()
 
                 # Log action
                 if self._is_studio_mode:
@@ -1719,7 +1781,7 @@ class VersionHistoryDialog(QDialog):
                     )
 
                 # Update annotation markers on timeline
-                self._load_annotation_markers()
+                self._refresh_annotation_markers()
 
         # Clear canvas
         self._drawover_canvas.clear()
@@ -1799,12 +1861,6 @@ class VersionHistoryDialog(QDialog):
             )
             if success:
                 deleted_count += 1
-                # Invalidate cache
-                self._drawover_cache.invalidate(
-                    self._selected_uuid,
-                    self._selected_version_label,
-                    frame
-                )
             else:
                 failed_count += 1
 
@@ -1813,6 +1869,7 @@ class VersionHistoryDialog(QDialog):
         self._update_drawover_buttons()
 
         # Update timeline markers
+        self._invalidate_overlays()
         self._load_annotation_markers()
 
         # Show result
@@ -1988,6 +2045,7 @@ class VersionHistoryDialog(QDialog):
             animation_uuid=self._selected_uuid,
             version_label=self._selected_version_label,
             fps=fps,
+            hold_frames=self._hold_enabled,
             parent=self
         )
         self._export_worker.progress.connect(self._on_export_progress)
@@ -6,16 +6,30 @@ Provides modular components for the drawover annotation system:
 - stroke_renderer: Graphics item creation from stroke data
 - stroke_serializer: UV/screen coordinate conversion and serialization
 - ghost_renderer: Ghost/onion skin rendering
+- spatial_index: Grid index of stroke bounds for hit-testing
+- overlay_cache: Pre-rendered annotation pixmaps for playback
 """
 
 from .undo_commands import AddStrokeCommand, RemoveStrokeCommand, ClearFrameCommand
 from .stroke_renderer import (
+    BrushStrokeItem,
     add_arrow_head_to_path,
+    make_brush_stamp,
+    create_brush_stroke_item,
     render_brush_stroke_to_group,
     create_item_from_stroke
 )
-from .stroke_serializer import simplify_points, scale_stroke, uv_stroke_to_screen
+from .stroke_serializer import simplify_points, scale_stroke, uv_stroke_to_screen, stroke_to_screen
 from .ghost_renderer import GhostRenderer
+from .spatial_index import StrokeSpatialIndex
+from .overlay_cache import (
+    OverlayGeometry,
+    DrawoverOverlayCache,
+    build_overlay_layers,
+    make_overlay_key,
+    render_overlay_image,
+    get_drawover_overlay_cache
+)
 
 __all__ = [
     # Undo commands
@@ -23,13 +37,26 @@ __all__ = [
     'RemoveStrokeCommand',
     'ClearFrameCommand',
     # Stroke rendering
+    'BrushStrokeItem',
     'add_arrow_head_to_path',
+    'make_brush_stamp',
+    'create_brush_stroke_item',
     'render_brush_stroke_to_group',
     'create_item_from_stroke',
     # Serialization
     'simplify_points',
     'scale_stroke',
     'uv_stroke_to_screen',
+    'stroke_to_screen',
     # Ghost rendering
     'GhostRenderer',
+    # Hit testing
+    'StrokeSpatialIndex',
+    # Playback overlays
+    'OverlayGeometry',
+    'DrawoverOverlayCache',
+    'build_overlay_layers',
+    'make_overlay_key',
+    'render_overlay_image',
+    'get_drawover_overlay_cache',
 ]
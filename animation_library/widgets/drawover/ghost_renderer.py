@@ -8,14 +8,13 @@ from typing import Optional, List, Dict, Tuple, Callable
 
 from PyQt6.QtWidgets import (
     QGraphicsScene, QGraphicsItem, QGraphicsPathItem, QGraphicsLineItem,
-    QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsTextItem,
-    QGraphicsItemGroup
+    QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsTextItem
 )
 from PyQt6.QtCore import Qt, QPointF
 from PyQt6.QtGui import QPen, QColor, QPainterPath, QFont
 
-from .stroke_renderer import add_arrow_head_to_path, render_brush_stroke_to_group
-from .stroke_serializer import scale_stroke, uv_stroke_to_screen
+from .stroke_renderer import add_arrow_head_to_path, create_brush_stroke_item
+from .stroke_serializer import stroke_to_screen
 
 
 class GhostRenderer:
@@ -68,17 +67,10 @@ class GhostRenderer:
             rect_size: Size of effective rect for scaling
         """
         for stroke in strokes:
-            # Check if stroke uses UV format or legacy
-            if stroke.get('format') == 'uv':
-                screen_stroke = uv_stroke_to_screen(stroke, uv_to_screen, rect_size)
-            else:
-                if source_canvas_size and source_canvas_size[0] > 0 and source_canvas_size[1] > 0:
-                    scale_x = canvas_width / source_canvas_size[0]
-                    scale_y = canvas_height / source_canvas_size[1]
-                else:
-                    scale_x = 1.0
-                    scale_y = 1.0
-                screen_stroke = scale_stroke(stroke, scale_x, scale_y)
+            screen_stroke = stroke_to_screen(
+                stroke, uv_to_screen, rect_size,
+                canvas_width, canvas_height, source_canvas_size
+            )
 
             # Create ghost item with tint
             item = self._create_ghost_item(screen_stroke, tint_color, opacity)
@@ -131,11 +123,9 @@ class GhostRenderer:
             # Ghost rendering for pressure-sensitive brush strokes
             points_with_pressure = stroke.get('points_with_pressure', [])
             if len(points_with_pressure) >= 1:
-                group = QGraphicsItemGroup()
-                render_brush_stroke_to_group(
-                    points_with_pressure, width, tint_color, opacity, group
+                return create_brush_stroke_item(
+                    points_with_pressure, width, tint_color, opacity
                 )
-                return group
 
         elif stroke_type == 'line':
             start = stroke.get('start', [0, 0])
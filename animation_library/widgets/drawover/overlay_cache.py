@@ -0,0 +1,412 @@
+"""
+Composited overlay cache for drawover playback.
+
+Renders everything a frame shows on the drawover canvas (its strokes plus
+ghost strokes) into one premultiplied image at display resolution on a
+worker thread, and keeps the results as pixmaps under a memory budget.
+During playback the canvas paints the ready pixmap instead of rebuilding
+graphics items for every frame.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Optional, List, Dict, Tuple, Hashable, NamedTuple, Iterable
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QRectF, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QPixmap, QColor
+from PyQt6.QtWidgets import QGraphicsScene
+
+from ...config import Config
+from ...utils.coordinate_utils import CoordinateConverter
+from .stroke_renderer import create_item_from_stroke
+from .stroke_serializer import stroke_to_screen
+from .ghost_renderer import GhostRenderer
+
+logger = logging.getLogger(__name__)
+
+
+# (strokes, source canvas size, ghost tint or None for the frame's own strokes, opacity)
+OverlayLayer = Tuple[List[Dict], Optional[Tuple[int, int]], Optional[QColor], float]
+
+
+class OverlayGeometry(NamedTuple):
+    """Where a canvas shows its scene, captured so overlays can be rendered offscreen."""
+
+    width: int  # Viewport size (logical pixels)
+    height: int
+    device_pixel_ratio: float
+    scene_rect: Tuple[float, float, float, float]  # Scene area visible in the viewport
+    video_rect: Tuple[float, float, float, float]  # Video content rect (UV reference)
+
+
+def build_overlay_layers(
+    main: Optional[Tuple[List[Dict], Optional[List[int]]]],
+    before: Iterable[Tuple[List[Dict], Optional[List[int]]]],
+    after: Iterable[Tuple[List[Dict], Optional[List[int]]]],
+    before_color: QColor,
+    after_color: QColor
+) -> List[OverlayLayer]:
+    """
+    Assemble overlay layers the way the canvas stacks them.
+
+    Args:
+        main: (strokes, canvas_size) shown on the frame, or None
+        before: (strokes, canvas_size) of "before" ghost frames, nearest first
+        after: (strokes, canvas_size) of "after" ghost frames, nearest first
+        before_color: Tint for "before" ghosts
+        after_color: Tint for "after" ghosts
+
+    Returns:
+        Layers for render_overlay_image (ghost opacity fades with distance)
+    """
+    layers: List[OverlayLayer] = []
+    for payloads, color in ((before, before_color), (after, after_color)):
+        for distance, (strokes, canvas_size) in enumerate(payloads, 1):
+            if strokes:
+                layers.append((strokes, tuple(canvas_size) if canvas_size else None, color, 0.5 / distance))
+
+    if main and main[0]:
+        strokes, canvas_size = main
+        layers.append((strokes, tuple(canvas_size) if canvas_size else None, None, 1.0))
+    return layers
+
+
+def make_overlay_key(
+    animation_uuid: str,
+    version: str,
+    composition: Tuple[Optional[int], Tuple[int, ...], Tuple[int, ...]],
+    before_color: QColor,
+    after_color: QColor,
+    geometry: OverlayGeometry
+) -> Tuple:
+    """
+    Build the cache key for what a canvas shows.
+
+    Args:
+        animation_uuid: Animation UUID
+        version: Version label
+        composition: (source_frame, before_frames, after_frames) after Hold/Ghost resolution
+        before_color: Tint for "before" ghosts
+        after_color: Tint for "after" ghosts
+        geometry: Canvas geometry from DrawoverCanvas.get_overlay_geometry()
+
+    Returns:
+        Hashable key starting with (animation_uuid, version)
+    """
+    source_frame, before_frames, after_frames = composition
+    ghost_style = None
+    if before_frames or after_frames:
+        ghost_style = (
+            QColor(before_color).name(QColor.NameFormat.HexArgb),
+            QColor(after_color).name(QColor.NameFormat.HexArgb),
+        )
+    return (animation_uuid, version, source_frame, tuple(before_frames), tuple(after_frames), ghost_style, geometry)
+
+
+def render_overlay_image(layers: List[OverlayLayer], geometry: OverlayGeometry) -> QImage:
+    """
+    Render overlay layers into a transparent image matching a canvas viewport.
+
+    Uses the canvas's own item builders in a private scene, so the result
+    looks exactly like the live canvas. Safe to call off the GUI thread.
+
+    Args:
+        layers: Layers from build_overlay_layers
+        geometry: Canvas geometry from DrawoverCanvas.get_overlay_geometry()
+
+    Returns:
+        Premultiplied ARGB32 image at device resolution
+    """
+    width, height = geometry.width, geometry.height
+
+    coord = CoordinateConverter()
+    coord.set_video_rect(QRectF(*geometry.video_rect))
+    rect_size = coord.get_rect_size(width, height)
+
+    def uv_to_screen(uv):
+        return coord.uv_to_screen(uv, width, height)
+
+    scene = QGraphicsScene()
+    ghosts = GhostRenderer(scene)
+    for strokes, source_size, tint, opacity in layers:
+        if tint is not None:
+            ghosts.add_strokes(strokes, tint, opacity, width, height, source_size, uv_to_screen, rect_size)
+            continue
+        for stroke in strokes:
+            item = create_item_from_stroke(
+                stroke_to_screen(stroke, uv_to_screen, rect_size, width, height, source_size)
+            )
+            if item:
+                scene.addItem(item)
+
+    ratio = geometry.device_pixel_ratio
+    image = QImage(round(width * ratio), round(height * ratio), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    scene.render(
+        painter,
+        QRectF(0, 0, image.width(), image.height()),
+        QRectF(*geometry.scene_rect),
+        Qt.AspectRatioMode.IgnoreAspectRatio
+    )
+    painter.end()
+    scene.clear()
+
+    image.setDevicePixelRatio(ratio)
+    return image
+
+
+class OverlayRenderSignals(QObject):
+    """Signals for OverlayRenderTask"""
+
+    render_complete = pyqtSignal(object, int, QImage)  # key, generation, image
+    render_failed = pyqtSignal(object, int, str)  # key, generation, error_message
+
+
+class OverlayRenderTask(QRunnable):
+    """
+    Background task rendering one composited overlay
+
+    Usage:
+        task = OverlayRenderTask(key, layers, geometry, generation)
+        threadpool.start(task)
+    """
+
+    def __init__(self, key: Hashable, layers: List[OverlayLayer], geometry: OverlayGeometry, generation: int):
+        super().__init__()
+        self.key = key
+        self.layers = layers
+        self.geometry = geometry
+        self.generation = generation
+        self.signals = OverlayRenderSignals()
+
+    def run(self):
+        """Execute overlay rendering task"""
+        try:
+            image = render_overlay_image(self.layers, self.geometry)
+            self.signals.render_complete.emit(self.key, self.generation, image)
+        except Exception as e:
+            self.signals.render_failed.emit(self.key, self.generation, f"Overlay render error: {e}")
+
+
+class DrawoverOverlayCache(QObject):
+    """
+    Composited overlay pixmaps for annotated playback
+
+    Keys are chosen by the caller and must start with (animation_uuid,
+    version, ...) so a version can be invalidated when its drawovers
+    change. Include everything that changes the picture: the frames shown
+    (after Hold), ghost frames and tints, and the canvas geometry. Frames
+    that resolve to the same composition (e.g. held frames) share one entry.
+
+    Features:
+    - Background rendering with a dedicated worker pool
+    - LRU eviction by a memory budget (Config.DRAWOVER_OVERLAY_CACHE_MB)
+    - Stale prefetch cancellation when the playhead jumps
+
+    Usage:
+        cache = get_drawover_overlay_cache()
+        cache.overlay_ready.connect(on_overlay_ready)
+        pixmap = cache.get(key)  # None if not rendered yet
+        cache.request(key, layers, geometry)
+    """
+
+    # Thread pool priorities: the frame on screen is rendered before lookahead
+    PRIORITY_CURRENT = 1
+    PRIORITY_PREFETCH = 0
+
+    # Signals
+    overlay_ready = pyqtSignal(object)  # key
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(Config.DRAWOVER_OVERLAY_THREAD_COUNT)
+
+        # key -> (pixmap, bytes)
+        self._cache: OrderedDict[Hashable, Tuple[QPixmap, int]] = OrderedDict()
+        self._cache_bytes = 0
+        self._max_bytes = Config.DRAWOVER_OVERLAY_CACHE_MB * 1024 * 1024
+        # key -> in-flight task
+        self._pending: Dict[Hashable, OverlayRenderTask] = {}
+        # Bumped by invalidate() so renders of outdated drawovers are dropped
+        self._generation = 0
+
+        # Performance monitoring
+        self.cache_hits: int = 0
+        self.total_requests: int = 0
+        self.rendered_count: int = 0
+        self.evicted_count: int = 0
+
+    def get(self, key: Hashable) -> Optional[QPixmap]:
+        """
+        Get a rendered overlay
+
+        Args:
+            key: Overlay key
+
+        Returns:
+            Pixmap if rendered, None otherwise
+        """
+        self.total_requests += 1
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return entry[0]
+
+    def contains(self, key: Hashable) -> bool:
+        """Check if an overlay is rendered or being rendered"""
+        return key in self._cache or key in self._pending
+
+    def request(
+        self,
+        key: Hashable,
+        layers: List[OverlayLayer],
+        geometry: OverlayGeometry,
+        priority: int = PRIORITY_CURRENT
+    ):
+        """
+        Render an overlay in the background (no-op if cached or in flight)
+
+        Args:
+            key: Overlay key
+            layers: Layers from build_overlay_layers
+            geometry: Canvas geometry from DrawoverCanvas.get_overlay_geometry()
+            priority: PRIORITY_CURRENT or PRIORITY_PREFETCH
+        """
+        if self.contains(key) or not layers:
+            return
+
+        task = OverlayRenderTask(key, layers, geometry, self._generation)
+        task.signals.render_complete.connect(self._on_render_complete)
+        task.signals.render_failed.connect(self._on_render_failed)
+        self._pending[key] = task
+        self.thread_pool.start(task, priority)
+
+    def retain_pending(self, animation_uuid: str, version: str, keys: Iterable[Hashable]):
+        """
+        Drop a version's queued renders not in keys (e.g. lookahead past an old playhead)
+
+        Args:
+            animation_uuid: Animation whose renders to prune
+            version: Version whose renders to prune
+            keys: Keys still wanted
+        """
+        keep = set(keys)
+        stale = [k for k in self._pending if k[0] == animation_uuid and k[1] == version and k not in keep]
+        for key in stale:
+            task = self._pending.pop(key)
+            # A finished task is deleted by the pool; its queued result is still cached
+            if not sip.isdeleted(task):
+                self.thread_pool.tryTake(task)
+
+    def invalidate(self, animation_uuid: Optional[str] = None, version: Optional[str] = None):
+        """
+        Drop overlays whose drawovers changed
+
+        Args:
+            animation_uuid: Animation to invalidate, or None for all
+            version: Version to invalidate, or None for every version of the animation
+        """
+        self._generation += 1
+
+        def matches(key) -> bool:
+            if animation_uuid is None:
+                return True
+            return key[0] == animation_uuid and (version is None or key[1] == version)
+
+        for key in [k for k in self._cache if matches(k)]:
+            self._cache_bytes -= self._cache.pop(key)[1]
+        for key in [k for k in self._pending if matches(k)]:
+            task = self._pending.pop(key)
+            if not sip.isdeleted(task):
+                self.thread_pool.tryTake(task)
+
+    def clear(self):
+        """Drop all overlays"""
+        self.invalidate()
+
+    def _on_render_complete(self, key: Hashable, generation: int, image: QImage):
+        """Cache a rendered overlay and notify listeners"""
+        self._pending.pop(key, None)
+        if generation != self._generation:
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        cost = image.sizeInBytes()
+
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._cache_bytes -= old[1]
+        self._cache[key] = (pixmap, cost)
+        self._cache_bytes += cost
+        self.rendered_count += 1
+
+        # Evict least recently used over budget (always keep the newest)
+        while self._cache_bytes > self._max_bytes and len(self._cache) > 1:
+            _, (_, evicted_cost) = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted_cost
+            self.evicted_count += 1
+
+        self.overlay_ready.emit(key)
+
+    def _on_render_failed(self, key: Hashable, generation: int, error_message: str):
+        """Handle failed render - the canvas keeps drawing items for this frame"""
+        self._pending.pop(key, None)
+        logger.warning(error_message)
+
+    def get_cache_stats(self) -> Dict[str, float]:
+        """
+        Get performance statistics
+
+        Returns:
+            Dict with cache statistics
+        """
+        hit_rate = (self.cache_hits / self.total_requests * 100) if self.total_requests > 0 else 0
+
+        return {
+            'total_requests': self.total_requests,
+            'cache_hits': self.cache_hits,
+            'cache_hit_rate': hit_rate,
+            'rendered_count': self.rendered_count,
+            'evicted_count': self.evicted_count,
+            'cached_count': len(self._cache),
+            'cached_mb': self._cache_bytes / (1024 * 1024),
+            'pending_count': len(self._pending),
+        }
+
+
+# Singleton instance
+_overlay_cache_instance: Optional[DrawoverOverlayCache] = None
+
+
+def get_drawover_overlay_cache() -> DrawoverOverlayCache:
+    """
+    Get global DrawoverOverlayCache singleton
+
+    Returns:
+        Global DrawoverOverlayCache instance
+    """
+    global _overlay_cache_instance
+    if _overlay_cache_instance is None:
+        _overlay_cache_instance = DrawoverOverlayCache()
+    return _overlay_cache_instance
+
+
+__all__ = [
+    'OverlayLayer',
+    'OverlayGeometry',
+    'build_overlay_layers',
+    'make_overlay_key',
+    'render_overlay_image',
+    'OverlayRenderTask',
+    'DrawoverOverlayCache',
+    'get_drawover_overlay_cache',
+]
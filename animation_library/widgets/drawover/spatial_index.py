@@ -0,0 +1,153 @@
+"""
+Spatial index for drawover stroke hit-testing.
+
+Provides a uniform grid over stroke bounding boxes so eraser and hit tests
+only look at strokes near the cursor instead of every stroke on the frame.
+"""
+
+import math
+from typing import Dict, Hashable, List, Set, Tuple
+
+from PyQt6.QtCore import QPointF, QRectF
+
+
+Cell = Tuple[int, int]
+
+
+class StrokeSpatialIndex:
+    """
+    Uniform grid of stroke bounding boxes.
+
+    Each stroke is registered in every cell its bounding box overlaps.
+    Queries return candidate keys (bounding-box hits) ordered topmost
+    first, i.e. most recently inserted first, matching scene stacking
+    order for items added at the same Z value. Callers do the exact
+    shape test on the few candidates.
+    """
+
+    DEFAULT_CELL_SIZE = 64.0
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Initialize spatial index.
+
+        Args:
+            cell_size: Grid cell size in scene units
+        """
+        self._cell_size = cell_size
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._entries: Dict[Hashable, Tuple[QRectF, List[Cell], int]] = {}  # key -> (rect, cells, order)
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def insert(self, key: Hashable, rect: QRectF):
+        """
+        Add or re-add a stroke. Re-adding moves it to the top of the order.
+
+        Args:
+            key: Stroke key (e.g. stroke id)
+            rect: Stroke bounding box in scene coordinates
+        """
+        self.remove(key)
+
+        cells = self._cells_for_rect(rect)
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+
+        self._entries[key] = (QRectF(rect), cells, self._next_order)
+        self._next_order += 1
+
+    def remove(self, key: Hashable):
+        """
+        Remove a stroke (no-op if not indexed).
+
+        Args:
+            key: Stroke key
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for cell in entry[1]:
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._cells[cell]
+
+    def clear(self):
+        """Remove all strokes."""
+        self._cells.clear()
+        self._entries.clear()
+
+    def query_point(self, pos: QPointF, radius: float = 0.0) -> List[Hashable]:
+        """
+        Get strokes whose bounding box contains a point (or is within radius of it).
+
+        Args:
+            pos: Point in scene coordinates
+            radius: Extra tolerance around the point
+
+        Returns:
+            Candidate keys, topmost first
+        """
+        if radius > 0:
+            return self.query_rect(QRectF(pos.x() - radius, pos.y() - radius, radius * 2, radius * 2))
+
+        bucket = self._cells.get(self._cell_at(pos.x(), pos.y()))
+        if not bucket:
+            return []
+
+        hits = []
+        for key in bucket:
+            rect, _, order = self._entries[key]
+            if rect.contains(pos):
+                hits.append((order, key))
+        return self._topmost_first(hits)
+
+    def query_rect(self, rect: QRectF) -> List[Hashable]:
+        """
+        Get strokes whose bounding box intersects a rectangle.
+
+        Args:
+            rect: Rectangle in scene coordinates
+
+        Returns:
+            Candidate keys, topmost first
+        """
+        seen = set()
+        hits = []
+        for cell in self._cells_for_rect(rect):
+            for key in self._cells.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                entry_rect, _, order = self._entries[key]
+                if entry_rect.intersects(rect) or rect.contains(entry_rect.topLeft()):
+                    hits.append((order, key))
+        return self._topmost_first(hits)
+
+    def _cell_at(self, x: float, y: float) -> Cell:
+        """Get the cell containing a point."""
+        return (math.floor(x / self._cell_size), math.floor(y / self._cell_size))
+
+    def _cells_for_rect(self, rect: QRectF) -> List[Cell]:
+        """Get all cells a rectangle overlaps."""
+        rect = rect.normalized()
+        x0, y0 = self._cell_at(rect.left(), rect.top())
+        x1, y1 = self._cell_at(rect.right(), rect.bottom())
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    @staticmethod
+    def _topmost_first(hits: List[Tuple[int, Hashable]]) -> List[Hashable]:
+        """Sort (order, key) hits so the most recently inserted come first."""
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return [key for _, key in hits]
+
+
+__all__ = ['StrokeSpatialIndex']
@@ -5,17 +5,21 @@ Provides functions to convert stroke dictionaries to QGraphicsItem objects.
 """
 
 import math
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 from PyQt6.QtWidgets import (
     QGraphicsItem, QGraphicsPathItem, QGraphicsLineItem,
     QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsTextItem,
     QGraphicsItemGroup, QGraphicsPolygonItem
 )
-from PyQt6.QtCore import Qt, QPointF, QLineF
+from PyQt6.QtCore import Qt, QPointF, QLineF, QRectF
 from PyQt6.QtGui import QPen, QBrush, QColor, QPainterPath, QFont, QPolygonF
 
 
+# A brush stamp: circle bounds and fill color
+BrushStamp = Tuple[QRectF, QColor]
+
+
 def add_arrow_head_to_path(
     path: QPainterPath,
     start: QPointF,
@@ -48,38 +52,62 @@ def add_arrow_head_to_path(
         path.lineTo(p2)
 
 
-def render_brush_stroke_to_group(
+def make_brush_stamp(x: float, y: float, pressure: float, brush_size: float,
+                     color: QColor, base_opacity: float) -> BrushStamp:
+    """
+    Create one pressure-sensitive brush stamp.
+
+    Args:
+        x: Stamp center X
+        y: Stamp center Y
+        pressure: Pen pressure (0-1), scales size and opacity
+        brush_size: Base brush size in pixels
+        color: Stroke color
+        base_opacity: Base opacity (0-1)
+
+    Returns:
+        (circle bounds, fill color) tuple
+    """
+    diameter = max(1.0, brush_size * pressure)
+    radius = diameter / 2.0
+    stamp_color = QColor(color)
+    stamp_color.setAlphaF(max(0.05, base_opacity * pressure))
+    return QRectF(x - radius, y - radius, diameter, diameter), stamp_color
+
+
+def compute_brush_stamps(
     points_with_pressure: List,
     brush_size: float,
     color: QColor,
-    base_opacity: float,
-    group: QGraphicsItemGroup
-):
+    base_opacity: float
+) -> List[BrushStamp]:
     """
-    Render pressure-sensitive brush stroke using circle stamping.
+    Compute the circle stamps of a pressure-sensitive brush stroke.
 
-    Both size and opacity are pressure-sensitive.
+    Stamps are interpolated between points at a quarter of the
+    (pressure-scaled) diameter.
 
     Args:
         points_with_pressure: List of [x, y, pressure] points
         brush_size: Base brush size in pixels
         color: Stroke color
         base_opacity: Base opacity (0-1)
-        group: QGraphicsItemGroup to add circles to
+
+    Returns:
+        List of (circle bounds, fill color) stamps in paint order
     """
-    no_pen = QPen(Qt.PenStyle.NoPen)
-    last_point = None
+    stamps = []
+    last_x = last_y = None
     last_pressure = 1.0
 
     for point_data in points_with_pressure:
         x, y = point_data[0], point_data[1]
         pressure = point_data[2] if len(point_data) > 2 else 1.0
-        current_point = QPointF(x, y)
 
-        if last_point is not None:
+        if last_x is not None:
             # Interpolate between points
-            dx = x - last_point.x()
-            dy = y - last_point.y()
+            dx = x - last_x
+            dy = y - last_y
             distance = math.sqrt(dx * dx + dy * dy)
 
             avg_pressure = (last_pressure + pressure) / 2.0
@@ -90,35 +118,108 @@ def render_brush_stroke_to_group(
                 num_stamps = max(1, int(distance / spacing))
                 for i in range(1, num_stamps + 1):
                     t = i / num_stamps
-                    ix = last_point.x() + dx * t
-                    iy = last_point.y() + dy * t
                     ip = last_pressure + (pressure - last_pressure) * t
-                    diameter = max(1.0, brush_size * ip)
-                    radius = diameter / 2.0
-                    ellipse = QGraphicsEllipseItem(
-                        ix - radius, iy - radius, diameter, diameter
-                    )
-                    stamp_color = QColor(color)
-                    stamp_color.setAlphaF(max(0.05, base_opacity * ip))
-                    ellipse.setBrush(QBrush(stamp_color))
-                    ellipse.setPen(no_pen)
-                    group.addToGroup(ellipse)
+                    stamps.append(make_brush_stamp(
+                        last_x + dx * t, last_y + dy * t, ip,
+                        brush_size, color, base_opacity
+                    ))
         else:
             # First point - stamp a circle
-            diameter = max(1.0, brush_size * pressure)
-            radius = diameter / 2.0
-            ellipse = QGraphicsEllipseItem(
-                x - radius, y - radius, diameter, diameter
-            )
-            stamp_color = QColor(color)
-            stamp_color.setAlphaF(max(0.05, base_opacity * pressure))
-            ellipse.setBrush(QBrush(stamp_color))
-            ellipse.setPen(no_pen)
-            group.addToGroup(ellipse)
+            stamps.append(make_brush_stamp(x, y, pressure, brush_size, color, base_opacity))
 
-        last_point = current_point
+        last_x, last_y = x, y
         last_pressure = pressure
 
+    return stamps
+
+
+class BrushStrokeItem(QGraphicsItem):
+    """
+    A finished brush stroke as a single scene item.
+
+    Paints all of its stamps itself instead of holding one ellipse item per
+    stamp. Device-coordinate caching means the stamps are painted once into
+    a pixmap and then blitted, so scene item counts scale with strokes, not
+    stamps. Output matches the equivalent group of ellipse items.
+    """
+
+    def __init__(self, stamps: List[BrushStamp], parent: Optional[QGraphicsItem] = None):
+        super().__init__(parent)
+        self._stamps = stamps
+
+        bounds = QRectF()
+        for rect, _ in stamps:
+            bounds = bounds.united(rect)
+        self._bounds = bounds
+
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    @property
+    def stamp_count(self) -> int:
+        """Number of brush stamps in the stroke"""
+        return len(self._stamps)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        painter.setPen(Qt.PenStyle.NoPen)
+        for rect, color in self._stamps:
+            painter.setBrush(color)
+            painter.drawEllipse(rect)
+
+
+def create_brush_stroke_item(
+    points_with_pressure: List,
+    brush_size: float,
+    color: QColor,
+    base_opacity: float
+) -> BrushStrokeItem:
+    """
+    Create a single cached item for a pressure-sensitive brush stroke.
+
+    Args:
+        points_with_pressure: List of [x, y, pressure] points
+        brush_size: Base brush size in pixels
+        color: Stroke color
+        base_opacity: Base opacity (0-1)
+
+    Returns:
+        BrushStrokeItem
+    """
+    return BrushStrokeItem(
+        compute_brush_stamps(points_with_pressure, brush_size, color, base_opacity)
+    )
+
+
+def render_brush_stroke_to_group(
+    points_with_pressure: List,
+    brush_size: float,
+    color: QColor,
+    base_opacity: float,
+    group: QGraphicsItemGroup
+):
+    """
+    Render pressure-sensitive brush stroke using circle stamping.
+
+    Both size and opacity are pressure-sensitive. Adds one ellipse item per
+    stamp; prefer create_brush_stroke_item() for finished strokes.
+
+    Args:
+        points_with_pressure: List of [x, y, pressure] points
+        brush_size: Base brush size in pixels
+        color: Stroke color
+        base_opacity: Base opacity (0-1)
+        group: QGraphicsItemGroup to add circles to
+    """
+    no_pen = QPen(Qt.PenStyle.NoPen)
+    for rect, stamp_color in compute_brush_stamps(
+            points_with_pressure, brush_size, color, base_opacity):
+        ellipse = QGraphicsEllipseItem(rect)
+        ellipse.setBrush(QBrush(stamp_color))
+        ellipse.setPen(no_pen)
+        group.addToGroup(ellipse)
+
 
 def create_item_from_stroke(stroke: Dict) -> Optional[QGraphicsItem]:
     """
@@ -155,13 +256,11 @@ def create_item_from_stroke(stroke: Dict) -> Optional[QGraphicsItem]:
         # Pressure-sensitive brush stroke - render with circle stamping
         points_with_pressure = stroke.get('points_with_pressure', [])
         if len(points_with_pressure) >= 1:
-            group = QGraphicsItemGroup()
             # Use original color (without opacity applied) for pressure-based opacity
             base_color = QColor(stroke.get('color', '#FF5722'))
-            render_brush_stroke_to_group(
-                points_with_pressure, width, base_color, opacity, group
+            return create_brush_stroke_item(
+                points_with_pressure, width, base_color, opacity
             )
-            return group
 
     elif stroke_type == 'line':
         start = stroke.get('start', [0, 0])
@@ -240,7 +339,12 @@ def create_item_from_stroke(stroke: Dict) -> Optional[QGraphicsItem]:
 
 
 __all__ = [
+    'BrushStamp',
+    'BrushStrokeItem',
     'add_arrow_head_to_path',
+    'make_brush_stamp',
+    'compute_brush_stamps',
+    'create_brush_stroke_item',
     'render_brush_stroke_to_group',
     'create_item_from_stroke'
 ]
@@ -8,7 +8,9 @@ Provides functions for:
 """
 
 import math
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional, Tuple
+
+import numpy as np
 from PyQt6.QtCore import QPointF
 
 
@@ -16,6 +18,11 @@ def simplify_points(points: List[List[float]], epsilon: float = 1.5) -> List[Lis
     """
     Simplify path using Ramer-Douglas-Peucker algorithm.
 
+    Iterative (explicit stack, no recursion limit on long tablet strokes)
+    with numpy point-to-line distances over array views instead of list
+    slices. Output is identical to the classic recursive formulation:
+    same distances, same first-maximum split point, same point objects.
+
     Args:
         points: List of [x, y] points
         epsilon: Simplification threshold (higher = more simplified)
@@ -26,31 +33,40 @@ def simplify_points(points: List[List[float]], epsilon: float = 1.5) -> List[Lis
     if len(points) < 3:
         return points
 
-    def perpendicular_distance(point, start, end):
-        if start == end:
-            return math.sqrt((point[0] - start[0])**2 + (point[1] - start[1])**2)
-
-        n = abs((end[1] - start[1]) * point[0] - (end[0] - start[0]) * point[1] +
-               end[0] * start[1] - end[1] * start[0])
-        d = math.sqrt((end[1] - start[1])**2 + (end[0] - start[0])**2)
-        return n / d if d > 0 else 0
-
-    start, end = points[0], points[-1]
-    max_dist = 0
-    max_idx = 0
-
-    for i in range(1, len(points) - 1):
-        dist = perpendicular_distance(points[i], start, end)
-        if dist > max_dist:
-            max_dist = dist
-            max_idx = i
-
-    if max_dist > epsilon:
-        left = simplify_points(points[:max_idx + 1], epsilon)
-        right = simplify_points(points[max_idx:], epsilon)
-        return left[:-1] + right
-    else:
-        return [start, end]
+    coords = np.array([(p[0], p[1]) for p in points], dtype=np.float64)
+    xs, ys = coords[:, 0], coords[:, 1]
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        px = xs[first + 1:last]
+        py = ys[first + 1:last]
+        sx, sy = xs[first], ys[first]
+        ex, ey = xs[last], ys[last]
+
+        if points[first] == points[last]:
+            dists = np.sqrt((px - sx) ** 2 + (py - sy) ** 2)
+        else:
+            n = np.abs((ey - sy) * px - (ex - sx) * py + ex * sy - ey * sx)
+            d = math.sqrt((ey - sy) ** 2 + (ex - sx) ** 2)
+            dists = n / d if d > 0 else np.zeros_like(n)
+
+        # NaN distances never win (matches a strict '>' scan from 0)
+        dists = np.where(np.isnan(dists), 0.0, dists)
+        offset = int(np.argmax(dists))
+        if dists[offset] > epsilon:
+            split = first + 1 + offset
+            keep[split] = True
+            stack.append((split, last))
+            stack.append((first, split))
+
+    return [points[i] for i in np.flatnonzero(keep)]
 
 
 def scale_stroke(stroke: Dict, scale_x: float, scale_y: float) -> Dict:
@@ -214,8 +230,43 @@ def uv_stroke_to_screen(
     return screen_stroke
 
 
+def stroke_to_screen(
+    stroke: Dict,
+    uv_to_screen: Callable[[List[float]], QPointF],
+    rect_size: float,
+    canvas_width: int,
+    canvas_height: int,
+    source_canvas_size: Optional[Tuple[int, int]] = None
+) -> Dict:
+    """
+    Convert a stored stroke (UV or legacy pixel format) to screen coordinates.
+
+    Args:
+        stroke: Stroke data as stored
+        uv_to_screen: Function to convert UV to screen coordinates
+        rect_size: Size of the effective rect (for width conversion)
+        canvas_width: Current canvas width
+        canvas_height: Current canvas height
+        source_canvas_size: Canvas size legacy strokes were drawn at
+
+    Returns:
+        Stroke data with screen coordinates
+    """
+    if stroke.get('format') == 'uv':
+        return uv_stroke_to_screen(stroke, uv_to_screen, rect_size)
+
+    if source_canvas_size and source_canvas_size[0] > 0 and source_canvas_size[1] > 0:
+        scale_x = canvas_width / source_canvas_size[0]
+        scale_y = canvas_height / source_canvas_size[1]
+    else:
+        scale_x = 1.0
+        scale_y = 1.0
+    return scale_stroke(stroke, scale_x, scale_y)
+
+
 __all__ = [
     'simplify_points',
     'scale_stroke',
-    'uv_stroke_to_screen'
+    'uv_stroke_to_screen',
+    'stroke_to_screen'
 ]
@@ -2,6 +2,8 @@
 Undo commands for drawover canvas operations.
 
 Provides QUndoCommand subclasses for stroke add/remove/clear operations.
+Commands go through the canvas so its stroke registry and spatial index
+stay in sync with what is in the scene.
 """
 
 from typing import TYPE_CHECKING, List, Dict, Tuple
@@ -23,12 +25,10 @@ class AddStrokeCommand(QUndoCommand):
         self._stroke_data = stroke_data
 
     def redo(self):
-        if self._item.scene() is None:
-            self._canvas._scene.addItem(self._item)
+        self._canvas._attach_stroke(self._item, self._stroke_data)
 
     def undo(self):
-        if self._item.scene() is not None:
-            self._canvas._scene.removeItem(self._item)
+        self._canvas._detach_stroke(self._item, self._stroke_data)
 
 
 class RemoveStrokeCommand(QUndoCommand):
@@ -41,12 +41,10 @@ class RemoveStrokeCommand(QUndoCommand):
         self._stroke_data = stroke_data
 
     def redo(self):
-        if self._item.scene() is not None:
-            self._canvas._scene.removeItem(self._item)
+        self._canvas._detach_stroke(self._item, self._stroke_data)
 
     def undo(self):
-        if self._item.scene() is None:
-            self._canvas._scene.addItem(self._item)
+        self._canvas._attach_stroke(self._item, self._stroke_data)
 
 
 class ClearFrameCommand(QUndoCommand):
@@ -58,14 +56,12 @@ class ClearFrameCommand(QUndoCommand):
         self._items = items  # List of (item, stroke_data) tuples
 
     def redo(self):
-        for item, _ in self._items:
-            if item.scene() is not None:
-                self._canvas._scene.removeItem(item)
+        for item, stroke_data in self._items:
+            self._canvas._detach_stroke(item, stroke_data)
 
     def undo(self):
-        for item, _ in self._items:
-            if item.scene() is None:
-                self._canvas._scene.addItem(item)
+        for item, stroke_data in self._items:
+            self._canvas._attach_stroke(item, stroke_data)
 
 
 __all__ = ['AddStrokeCommand', 'RemoveStrokeCommand', 'ClearFrameCommand']
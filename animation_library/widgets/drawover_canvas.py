@@ -26,19 +26,23 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRectF, QEvent
 from PyQt6.QtGui import (
     QPainter, QPen, QBrush, QColor, QPainterPath,
-    QFont, QCursor, QUndoStack, QTabletEvent, QPolygonF
+    QFont, QCursor, QUndoStack, QTabletEvent, QPolygonF, QPixmap
 )
 
 # Import from extracted modules
 from ..utils.coordinate_utils import CoordinateConverter
 from .drawover.undo_commands import AddStrokeCommand, RemoveStrokeCommand
 from .drawover.stroke_renderer import (
+    BrushStamp,
+    BrushStrokeItem,
     add_arrow_head_to_path,
-    render_brush_stroke_to_group,
+    make_brush_stamp,
     create_item_from_stroke
 )
-from .drawover.stroke_serializer import simplify_points, scale_stroke, uv_stroke_to_screen
+from .drawover.stroke_serializer import simplify_points, stroke_to_screen
 from .drawover.ghost_renderer import GhostRenderer
+from .drawover.spatial_index import StrokeSpatialIndex
+from .drawover.overlay_cache import OverlayGeometry
 
 
 class DrawingTool(Enum):
@@ -108,10 +112,12 @@ class DrawoverCanvas(QGraphicsView):
         # Brush tool state (for circle stamping)
         self._last_brush_point: Optional[QPointF] = None
         self._last_brush_pressure: float = 1.0
+        self._brush_stamps: List[BrushStamp] = []  # Stamps of the in-progress stroke
 
         # Stroke tracking
         self._stroke_items: Dict[str, QGraphicsItem] = {}  # stroke_id -> item
         self._item_data: Dict[int, Dict] = {}  # item id -> stroke_data (UV coordinates)
+        self._stroke_index = StrokeSpatialIndex()  # stroke_id -> scene bounding box grid
 
         # Read-only mode (for compare view)
         self._read_only = False
@@ -119,6 +125,9 @@ class DrawoverCanvas(QGraphicsView):
         # Preview cursor for brush/diamond tools
         self._preview_item: Optional[QGraphicsItem] = None
 
+        # Pre-rendered annotations shown instead of items (playback)
+        self._overlay_pixmap: Optional[QPixmap] = None
+
         # Use composition for coordinate conversion and ghost rendering
         self._coord = CoordinateConverter()
         self._ghost = GhostRenderer(self._scene)
@@ -445,6 +454,8 @@ class DrawoverCanvas(QGraphicsView):
         self._is_drawing = False
 
         if self._current_item:
+            if self._current_tool == DrawingTool.BRUSH:
+                self._bake_brush_stroke()
             stroke_data = self._finalize_stroke()
             if stroke_data:
                 cmd = AddStrokeCommand(self, self._current_item, stroke_data)
@@ -458,6 +469,7 @@ class DrawoverCanvas(QGraphicsView):
         self._start_pos = None
         self._last_brush_point = None
         self._last_brush_pressure = 1.0
+        self._brush_stamps = []
 
         self.drawing_finished.emit()
 
@@ -483,9 +495,14 @@ class DrawoverCanvas(QGraphicsView):
     # ==================== Brush Tool (Pressure Sensitive) ====================
 
     def _start_brush(self, pos: QPointF):
-        """Start pressure-sensitive brush drawing using circle stamping."""
+        """Start pressure-sensitive brush drawing using circle stamping.
+
+        The in-progress stroke is live geometry (one ellipse item per stamp);
+        _bake_brush_stroke() replaces it with a single cached item when done.
+        """
         self._current_item = QGraphicsItemGroup()
         self._scene.addItem(self._current_item)
+        self._brush_stamps = []
 
         self._current_points = [[pos.x(), pos.y(), self._current_pressure]]
         self._last_brush_point = pos
@@ -510,24 +527,27 @@ class DrawoverCanvas(QGraphicsView):
 
     def _stamp_brush_circle(self, pos: QPointF, pressure: float):
         """Stamp a single filled circle at the given position."""
-        diameter = max(1.0, self._brush_size * pressure)
-        radius = diameter / 2.0
-
-        ellipse = QGraphicsEllipseItem(
-            pos.x() - radius,
-            pos.y() - radius,
-            diameter,
-            diameter
+        stamp = make_brush_stamp(
+            pos.x(), pos.y(), pressure,
+            self._brush_size, self._current_color, self._opacity
         )
+        self._brush_stamps.append(stamp)
 
-        color = QColor(self._current_color)
-        pressure_opacity = self._opacity * pressure
-        color.setAlphaF(max(0.05, pressure_opacity))
+        rect, color = stamp
+        ellipse = QGraphicsEllipseItem(rect)
         ellipse.setBrush(QBrush(color))
         ellipse.setPen(QPen(Qt.PenStyle.NoPen))
 
         self._current_item.addToGroup(ellipse)
 
+    def _bake_brush_stroke(self):
+        """Replace the live stamp group with one cached item holding the same stamps."""
+        group = self._current_item
+        baked = BrushStrokeItem(self._brush_stamps)
+        self._scene.removeItem(group)
+        self._scene.addItem(baked)
+        self._current_item = baked
+
     def _interpolate_brush_stamps(self, p1: QPointF, pressure1: float,
                                    p2: QPointF, pressure2: float):
         """Interpolate circles between two points to create smooth strokes."""
@@ -694,8 +714,7 @@ class DrawoverCanvas(QGraphicsView):
             'author': self._current_author
         }
 
-        self._stroke_items[stroke_id] = self._current_item
-        self._item_data[id(self._current_item)] = stroke_data
+        self._attach_stroke(self._current_item, stroke_data)
 
         return stroke_data
 
@@ -811,26 +830,71 @@ class DrawoverCanvas(QGraphicsView):
     # ==================== Eraser Tool ====================
 
     def _erase_at(self, pos: QPointF):
-        """Erase strokes at position."""
-        items = self._scene.items(pos)
-        for item in items:
-            if item in self._stroke_items.values():
-                stroke_id = None
-                for sid, sitem in self._stroke_items.items():
-                    if sitem == item:
-                        stroke_id = sid
-                        break
-
-                if stroke_id:
-                    stroke_data = self._item_data.get(id(item), {})
-                    cmd = RemoveStrokeCommand(self, item, stroke_data)
-                    self._undo_stack.push(cmd)
-                    del self._stroke_items[stroke_id]
-                    # Drop the parallel _item_data entry so it doesn't leak across erase/undo cycles.
-                    self._item_data.pop(id(item), None)
-                    self.stroke_removed.emit(stroke_id)
-                    self.drawing_modified.emit()
-                    break
+        """Erase the topmost stroke at position."""
+        stroke_id = self.stroke_at(pos)
+        if not stroke_id:
+            return
+
+        item = self._stroke_items[stroke_id]
+        stroke_data = self._item_data.get(id(item), {})
+        cmd = RemoveStrokeCommand(self, item, stroke_data)
+        self._undo_stack.push(cmd)
+        self.stroke_removed.emit(stroke_id)
+        self.drawing_modified.emit()
+
+    # ==================== Hit Testing ====================
+
+    def stroke_at(self, pos: QPointF) -> Optional[str]:
+        """
+        Get the topmost stroke at a scene position.
+
+        Uses the spatial index for candidates, then tests the exact item
+        shape, so cost depends on strokes near pos rather than on the frame.
+
+        Args:
+            pos: Position in scene coordinates
+
+        Returns:
+            Stroke ID or None
+        """
+        for stroke_id in self._stroke_index.query_point(pos):
+            item = self._stroke_items.get(stroke_id)
+            if item is not None and item.contains(item.mapFromScene(pos)):
+                return stroke_id
+        return None
+
+    def strokes_in_rect(self, rect: QRectF) -> List[str]:
+        """
+        Get strokes whose bounding box intersects a scene rectangle.
+
+        Args:
+            rect: Rectangle in scene coordinates
+
+        Returns:
+            Stroke IDs, topmost first
+        """
+        return self._stroke_index.query_rect(rect)
+
+    def _attach_stroke(self, item: QGraphicsItem, stroke_data: Dict):
+        """Put a stroke in the scene, registry and spatial index (idempotent)."""
+        stroke_id = stroke_data.get('id', '')
+        if item.scene() is None:
+            self._scene.addItem(item)
+        self._stroke_items[stroke_id] = item
+        self._item_data[id(item)] = stroke_data
+        item.setData(0, stroke_id)
+        self._stroke_index.insert(stroke_id, item.sceneBoundingRect())
+
+    def _detach_stroke(self, item: QGraphicsItem, stroke_data: Dict):
+        """Take a stroke out of the scene, registry and spatial index (idempotent)."""
+        stroke_id = stroke_data.get('id', '')
+        if item.scene() is not None:
+            self._scene.removeItem(item)
+        if self._stroke_items.get(stroke_id) is item:
+            del self._stroke_items[stroke_id]
+            self._stroke_index.remove(stroke_id)
+        # Drop the parallel _item_data entry so it doesn't leak across erase/undo cycles.
+        self._item_data.pop(id(item), None)
 
     # ==================== Helpers ====================
 
@@ -959,9 +1023,7 @@ class DrawoverCanvas(QGraphicsView):
             stroke_data['text'] = text
             stroke_data['font_size'] = max(12, self._brush_size * 2) / rect_size
 
-        self._stroke_items[stroke_id] = self._current_item
-        self._item_data[id(self._current_item)] = stroke_data
-        self._current_item.setData(0, stroke_id)
+        self._attach_stroke(self._current_item, stroke_data)
 
         return stroke_data
 
@@ -1003,7 +1065,11 @@ class DrawoverCanvas(QGraphicsView):
         self._scene.clear()
         self._stroke_items.clear()
         self._item_data.clear()
+        self._stroke_index.clear()
         self._undo_stack.clear()
+        if self._overlay_pixmap is not None:
+            self._overlay_pixmap = None
+            self.viewport().update()
 
     def import_strokes(self, strokes: List[Dict], source_canvas_size: Tuple[int, int] = None):
         """Import strokes from data."""
@@ -1012,26 +1078,14 @@ class DrawoverCanvas(QGraphicsView):
         rect_size = self._coord.get_rect_size(self.width(), self.height())
 
         for stroke in strokes:
-            if stroke.get('format') == 'uv':
-                screen_stroke = uv_stroke_to_screen(stroke, self._uv_to_screen, rect_size)
-            else:
-                current_w = self.width()
-                current_h = self.height()
-                if source_canvas_size and source_canvas_size[0] > 0 and source_canvas_size[1] > 0:
-                    scale_x = current_w / source_canvas_size[0]
-                    scale_y = current_h / source_canvas_size[1]
-                else:
-                    scale_x = 1.0
-                    scale_y = 1.0
-                screen_stroke = scale_stroke(stroke, scale_x, scale_y)
+            screen_stroke = stroke_to_screen(
+                stroke, self._uv_to_screen, rect_size,
+                self.width(), self.height(), source_canvas_size
+            )
 
             item = create_item_from_stroke(screen_stroke)
             if item:
-                self._scene.addItem(item)
-                stroke_id = stroke.get('id', '')
-                self._stroke_items[stroke_id] = item
-                self._item_data[id(item)] = stroke
-                item.setData(0, stroke_id)
+                self._attach_stroke(item, stroke)
 
     def export_strokes(self) -> List[Dict]:
         """Export current strokes to data (UV format)."""
@@ -1048,6 +1102,46 @@ class DrawoverCanvas(QGraphicsView):
             return
         self.import_strokes(strokes)
 
+    # ==================== Overlay Pixmap ====================
+
+    def get_overlay_geometry(self) -> OverlayGeometry:
+        """Get the viewport/scene mapping needed to render overlays offscreen."""
+        scene_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        video_rect = self._get_effective_rect()
+        return OverlayGeometry(
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+            (scene_rect.x(), scene_rect.y(), scene_rect.width(), scene_rect.height()),
+            (video_rect.x(), video_rect.y(), video_rect.width(), video_rect.height()),
+        )
+
+    def show_overlay_pixmap(self, pixmap: QPixmap):
+        """
+        Show pre-rendered annotations instead of stroke items.
+
+        Clears the canvas; the next import_strokes() or clear() drops the pixmap.
+
+        Args:
+            pixmap: Overlay rendered for get_overlay_geometry()
+        """
+        self.clear()
+        self._overlay_pixmap = pixmap
+        self.viewport().update()
+
+    def has_overlay_pixmap(self) -> bool:
+        """Check if the canvas shows a pre-rendered overlay (it has no strokes then)."""
+        return self._overlay_pixmap is not None
+
+    def drawForeground(self, painter: QPainter, rect: QRectF):
+        """Paint the overlay pixmap in viewport coordinates."""
+        super().drawForeground(painter, rect)
+        if self._overlay_pixmap is not None:
+            painter.save()
+            painter.resetTransform()
+            painter.drawPixmap(0, 0, self._overlay_pixmap)
+            painter.restore()
+
     # ==================== Resize ====================
 
     def resizeEvent(self, event):
@@ -6,7 +6,7 @@ Inspired by: Current animation_library folder structure
 """
 
 from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu, QAbstractItemView, QCheckBox, QWidget, QVBoxLayout
-from PyQt6.QtCore import pyqtSignal, Qt, QPoint, QSize
+from PyQt6.QtCore import pyqtSignal, Qt, QPoint, QSize, QTimer
 from PyQt6.QtGui import QIcon, QAction, QFont
 
 from ..config import Config
@@ -71,6 +71,12 @@ class FolderTree(QTreeWidget):
         self._archive_item = None
         self._trash_item = None
 
+        # Folder count refresh (coalesces bursts of animation changes)
+        self._count_refresh_timer = QTimer(self)
+        self._count_refresh_timer.setSingleShot(True)
+        self._count_refresh_timer.setInterval(100)
+        self._count_refresh_timer.timeout.connect(self._refresh_folder_counts)
+
         # Recursive search setting (search subfolders)
         self._recursive_search = True  # Default to recursive
 
@@ -197,6 +203,15 @@ class FolderTree(QTreeWidget):
         self._event_bus.archive_count_changed.connect(self._on_archive_count_changed)
         self._event_bus.trash_count_changed.connect(self._on_trash_count_changed)
 
+        # Folder animation counts
+        self._event_bus.folder_changed.connect(self._schedule_count_refresh)
+        self._event_bus.animation_added.connect(self._schedule_count_refresh)
+        self._event_bus.animation_deleted.connect(self._schedule_count_refresh)
+        self._event_bus.animation_archived.connect(self._schedule_count_refresh)
+        self._event_bus.animation_restored_from_archive.connect(self._schedule_count_refresh)
+        self._event_bus.animations_archived.connect(self._schedule_count_refresh)
+        self._event_bus.animations_restored_from_archive.connect(self._schedule_count_refresh)
+
     def _load_folders(self):
         """Load folders from database and create tree"""
         self.clear()
@@ -358,6 +373,7 @@ class FolderTree(QTreeWidget):
         """Load folder preset icons"""
         theme = get_theme_manager().get_current_theme()
         icon_color = theme.palette.folder_icon_color if theme else "#D4AF37"
+        self._folder_icon_color = icon_color
 
         icons = {}
         for preset in self._icon_service.get_all_presets():
@@ -370,36 +386,40 @@ class FolderTree(QTreeWidget):
         """Load user folders from database and build tree hierarchy"""
 
         folders = self._db_service.get_all_folders()
+        counts = self._db_service.get_folder_animation_counts()
 
-        # Build folder lookup dictionary
-        folder_dict = {folder['id']: folder for folder in folders}
-
-        # Find root folder ID
+        # Build parent -> children lookup once (O(n) instead of a scan per folder)
+        children_by_parent = {}
         root_folder_id = None
         for folder in folders:
-            if folder.get('parent_id') is None:
+            parent_id = folder.get('parent_id')
+            if parent_id is None:
                 root_folder_id = folder['id']
-                break
+            else:
+                children_by_parent.setdefault(parent_id, []).append(folder)
 
         # Build tree recursively starting from root's children
         if root_folder_id:
-            self._build_folder_tree(root_folder_id, folder_dict, None)
+            self._build_folder_tree(root_folder_id, children_by_parent, counts, None)
 
-    def _build_folder_tree(self, parent_id: int, folder_dict: dict, parent_item: QTreeWidgetItem = None):
+    def _build_folder_tree(self, parent_id: int, children_by_parent: dict, counts: dict,
+                           parent_item: QTreeWidgetItem = None) -> int:
         """
         Recursively build folder tree
 
         Args:
             parent_id: Parent folder ID to find children for
-            folder_dict: Dictionary of all folders {id: folder_data}
+            children_by_parent: Dictionary of child folders {parent_id: [folder_data]}
+            counts: Direct animation count per folder {folder_id: count}
             parent_item: Parent QTreeWidgetItem (None for top-level)
-        """
-        # Find all children of this parent
-        children = [f for f in folder_dict.values() if f.get('parent_id') == parent_id]
 
+        Returns:
+            Number of animations in the children's subtrees
+        """
         # Sort children by name
-        children.sort(key=lambda f: f['name'].lower())
+        children = sorted(children_by_parent.get(parent_id, []), key=lambda f: f['name'].lower())
 
+        subtree_total = 0
         for folder in children:
             # Create tree item
             if parent_item is None:
@@ -409,8 +429,6 @@ class FolderTree(QTreeWidget):
                 # Child of another folder
                 item = QTreeWidgetItem(parent_item)
 
-            item.setText(0, folder['name'])
-
             # Store metadata
             item.setData(0, Qt.ItemDataRole.UserRole, {
                 'type': 'user',
@@ -426,8 +444,43 @@ class FolderTree(QTreeWidget):
             # Set folder icon (will be updated on expand/collapse)
             self._update_folder_icon(item, is_expanded=False)
 
-            # Recursively build children
-            self._build_folder_tree(folder['id'], folder_dict, item)
+            # Recursively build children, then label with the subtree count
+            total = counts.get(folder['id'], 0)
+            total += self._build_folder_tree(folder['id'], children_by_parent, counts, item)
+            self._set_folder_label(item, folder['name'], total)
+            subtree_total += total
+
+        return subtree_total
+
+    def _set_folder_label(self, item: QTreeWidgetItem, name: str, count: int):
+        """Show folder name with its animation count (subfolders included)"""
+        if count > 0:
+            item.setText(0, f"{name} ({count})")
+        else:
+            item.setText(0, name)
+
+    def _schedule_count_refresh(self, *args):
+        """Coalesce animation changes into one folder count refresh"""
+        self._count_refresh_timer.start()
+
+    def _refresh_folder_counts(self):
+        """Update folder labels from the maintained counts (no tree rebuild)"""
+        counts = self._db_service.get_folder_animation_counts()
+
+        def refresh(item: QTreeWidgetItem) -> int:
+            total = counts.get(item.folder_id, 0)
+            for i in range(item.childCount()):
+                child = item.child(i)
+                if hasattr(child, 'folder_id'):
+                    total += refresh(child)
+            data = item.data(0, Qt.ItemDataRole.UserRole) or {}
+            self._set_folder_label(item, data.get('folder_name', ''), total)
+            return total
+
+        for i in range(self.topLevelItemCount()):
+            item = self.topLevelItem(i)
+            if hasattr(item, 'folder_id'):
+                refresh(item)
 
     def _update_folder_icon(self, item: QTreeWidgetItem, is_expanded: bool):
         """
@@ -468,17 +521,20 @@ class FolderTree(QTreeWidget):
         self._update_folder_icon(item, is_expanded=False)
 
     def _on_theme_changed(self, theme_name: str):
-        """Handle theme change - reload branch indicators and all folder icons"""
+        """Handle theme change - recolor folder icons if their color changed"""
+        # Folder text size is per theme
+        self._update_folder_style(get_theme_manager().get_folder_text_size())
+
         # Get new theme color for folder icons
         theme = get_theme_manager().get_current_theme()
         icon_color = theme.palette.folder_icon_color if theme else "#D4AF37"
+        if icon_color == self._folder_icon_color:
+            return
 
         # Reload folder icons with new theme color
+        # (branch indicators are theme independent and set once)
         self._folder_icons = self._load_folder_icons()
 
-        # Refresh branch indicators
-        self._setup_branch_indicators()
-
         # Map of virtual folder names to icon keys
         virtual_folder_icons = {
             "Home": "root_icon",
@@ -515,9 +571,6 @@ class FolderTree(QTreeWidget):
             if item:
                 update_item_icons(item)
 
-        # Also update folder style (font/icon size)
-        self._update_folder_style(get_theme_manager().get_folder_text_size())
-
     def _update_folder_style(self, size: int):
         """
         Update folder tree font and icon sizes
@@ -525,13 +578,17 @@ class FolderTree(QTreeWidget):
         Args:
             size: Font size in points (8-20)
         """
+        # Changing the font re-lays out every item; skip if already applied
+        icon_size = size + 4
+        if self.font().pointSize() == size and self.iconSize() == QSize(icon_size, icon_size):
+            return
+
         # Update font
         font = self.font()
         font.setPointSize(size)
         self.setFont(font)
 
         # Update icon size (font size + 4)
-        icon_size = size + 4
         self.setIconSize(QSize(icon_size, icon_size))
 
     def _on_selection_changed(self):
@@ -167,6 +167,7 @@ class HeaderToolbar(QWidget):
         # Get theme for icon colorization
         theme = self._theme_manager.get_current_theme()
         icon_color = theme.palette.header_icon_color if theme else "#1a1a1a"
+        self._icon_color = icon_color
 
         # Search box (match old repo: 200px wide)
         self._search_box = QLineEdit()
@@ -429,12 +430,17 @@ class HeaderToolbar(QWidget):
             self._delete_btn.setToolTip("Archive Selected (Del)")
 
     def _on_theme_changed(self, theme_name: str):
-        """Reload all icons when theme changes"""
+        """Reload all icons when the theme's header icon color changes"""
         theme = self._theme_manager.get_current_theme()
         if not theme:
             return
 
+        # The gradient is restyled by the application stylesheet; icons only
+        # need recoloring when their own color changed
         icon_color = theme.palette.header_icon_color
+        if icon_color == self._icon_color:
+            return
+        self._icon_color = icon_color
 
         # Reload all icons with new color
         add_icon = colorize_white_svg(IconLoader.get("add"), icon_color)
@@ -464,11 +470,6 @@ class HeaderToolbar(QWidget):
         settings_icon = colorize_white_svg(IconLoader.get("settings"), icon_color)
         self._settings_btn.setIcon(settings_icon)
 
-        # Force style refresh for gradient background
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
-
     def refresh_mode(self):
         """Refresh button appearance when operation mode changes."""
         self._update_delete_button_mode()
@@ -602,5 +603,36 @@ class HeaderToolbar(QWidget):
         """Public method to refresh filter data (e.g., after library refresh)"""
         self._refresh_filter_data()
 
+    def add_filter_values(self, rig_type: str = None, tags: list = None):
+        """
+        Add rig type/tags of a single new animation to the filter dropdowns
+
+        Cheaper than refresh_filters() when only one asset changed: no
+        database query, and existing entries (and the current selection)
+        are left untouched.
+
+        Args:
+            rig_type: Rig type of the animation
+            tags: Tags of the animation
+        """
+        if rig_type:
+            self._insert_sorted_item(self._rig_type_combo, rig_type)
+        for tag in tags or []:
+            if tag:
+                self._insert_sorted_item(self._tags_combo, tag)
+
+    def _insert_sorted_item(self, combo: QComboBox, value: str):
+        """Insert value after the 'All ...' entry in sorted order, if missing"""
+        if combo.findText(value) >= 0:
+            return
+
+        row = 1
+        while row < combo.count() and combo.itemText(row) < value:
+            row += 1
+
+        combo.blockSignals(True)  # Prevent triggering filter change
+        combo.insertItem(row, value)
+        combo.blockSignals(False)
+
 
 __all__ = ['HeaderToolbar']
@@ -1,23 +1,21 @@
 """
 HoverVideoPopup - Frameless popup window for hover video preview
 
-Pattern: Popup window with OpenCV video playback
+Pattern: Popup window playing a sprite-strip proxy
 Features:
 - Frameless, non-intrusive popup
-- Video playback with gradient background
+- Plays from a pre-decoded sprite strip (no codec work on the GUI thread)
 - Position management
 - Fade in/out animations
 - Resource cleanup
 """
 
 from typing import Optional, Tuple
-import cv2
-import numpy as np
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt6.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage
 
 from ..config import Config
+from ..services.hover_preview_service import get_hover_preview_service, SpriteStrip
 
 
 class HoverVideoPopup(QWidget):
@@ -51,11 +49,11 @@ class HoverVideoPopup(QWidget):
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-        # Video playback state
-        self._video_capture: Optional[cv2.VideoCapture] = None
+        # Playback state
+        self._strip: Optional[SpriteStrip] = None
         self._current_video_path: Optional[str] = None
-        self._video_fps: float = 30.0
-        self._frame_count: int = 0
+        self._pending_video_path: Optional[str] = None
+        self._pending_position = QPoint()
         self._current_frame: int = 0
 
         # Gradient colors
@@ -72,6 +70,11 @@ class HoverVideoPopup(QWidget):
         # Fade animation
         self._fade_animation: Optional[QPropertyAnimation] = None
 
+        # Strips are built off the GUI thread
+        self._hover_service = get_hover_preview_service()
+        self._hover_service.strip_ready.connect(self._on_strip_ready)
+        self._hover_service.strip_failed.connect(self._on_strip_failed)
+
         # Setup UI
         self._setup_ui()
 
@@ -119,7 +122,7 @@ class HoverVideoPopup(QWidget):
             position: Screen position to show popup
         """
         # Check if already showing this video
-        if self._current_video_path == video_path and self._video_capture:
+        if self._current_video_path == video_path and self._strip:
             # Just update position
             self.move(position)
             return
@@ -128,41 +131,24 @@ class HoverVideoPopup(QWidget):
         self._gradient_top = gradient_top
         self._gradient_bottom = gradient_bottom
 
-        # Release old video if any
+        # Release old strip if any
         self._release_video()
 
-        # Open new video
-        self._video_capture = cv2.VideoCapture(video_path)
-
-        if not self._video_capture.isOpened():
-            print(f"Failed to open video: {video_path}")
+        strip = self._hover_service.get_strip(video_path)
+        if strip is None:
+            # Building in background - show once ready (unless hidden first)
+            self._pending_video_path = video_path
+            self._pending_position = position
             return
 
-        # Get video properties
-        self._video_fps = self._video_capture.get(cv2.CAP_PROP_FPS)
-        if self._video_fps <= 0:
-            self._video_fps = 30.0  # Default fallback
-
-        self._frame_count = int(self._video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
-        self._current_frame = 0
-        self._current_video_path = video_path
-
-        # Position popup
-        self.move(position)
-
-        # Show popup
-        self.show()
-        self.raise_()
-
-        # Start playback
-        self._start_playback()
+        self._show_strip(video_path, strip, position)
 
     def hide_preview(self):
         """Hide popup with fade-out animation"""
         # Stop playback
         self._playback_timer.stop()
 
-        # Release video resources
+        # Release strip
         self._release_video()
 
         # Hide immediately (fade animation can be added later)
@@ -191,14 +177,44 @@ class HoverVideoPopup(QWidget):
         self._video_label.setFixedSize(size, size)
         self.setFixedSize(size, size)
 
+    def _show_strip(self, video_path: str, strip: SpriteStrip, position: QPoint):
+        """Show popup and start playing a ready strip"""
+        self._strip = strip
+        self._current_video_path = video_path
+        self._current_frame = 0
+
+        # Position popup
+        self.move(position)
+
+        # Show popup
+        self.show()
+        self.raise_()
+
+        # Start playback
+        self._start_playback()
+
+    def _on_strip_ready(self, video_path: str):
+        """Start the pending preview once its strip is built"""
+        if video_path != self._pending_video_path:
+            return
+        self._pending_video_path = None
+
+        strip = self._hover_service.get_strip(video_path)
+        if strip is not None:
+            self._show_strip(video_path, strip, self._pending_position)
+
+    def _on_strip_failed(self, video_path: str, error_message: str):
+        """Drop the pending preview if its strip could not be built"""
+        if video_path == self._pending_video_path:
+            self._pending_video_path = None
+
     def _start_playback(self):
-        """Start video playback"""
-        if not self._video_capture:
+        """Start strip playback"""
+        if not self._strip:
             return
 
         # Cap at 30 FPS for performance
-        target_fps = min(self._video_fps, 30)
-        frame_delay = int(1000 / target_fps)
+        frame_delay = max(self._strip.interval_ms, int(1000 / 30))
 
         # Start timer
         self._playback_timer.start(frame_delay)
@@ -207,107 +223,31 @@ class HoverVideoPopup(QWidget):
         self._play_next_frame()
 
     def _play_next_frame(self):
-        """Read and display next video frame"""
-        if not self._video_capture:
+        """Display next strip frame"""
+        if not self._strip:
             return
 
-        # Read frame
-        ret, frame = self._video_capture.read()
-
-        if not ret:
-            # End of video, loop back to start
-            self._video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        # Loop back to start at the end
+        if self._current_frame >= self._strip.frame_count:
             self._current_frame = 0
-            ret, frame = self._video_capture.read()
-
-            if not ret:
-                # Failed to loop, stop playback
-                self._playback_timer.stop()
-                return
 
-        # Composite frame on gradient background
-        composited_frame = self._composite_frame_on_gradient(frame)
-
-        # Convert to QPixmap
-        pixmap = self._cv2_to_qpixmap(composited_frame)
+        pixmap = self._strip.frame(self._current_frame)
+        if max(pixmap.width(), pixmap.height()) > self._popup_size:
+            pixmap = pixmap.scaled(
+                self._popup_size, self._popup_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
 
         # Display frame
         self._video_label.setPixmap(pixmap)
 
         self._current_frame += 1
 
-    def _composite_frame_on_gradient(self, frame: np.ndarray) -> np.ndarray:
-        """
-        Composite video frame on gradient background
-
-        Args:
-            frame: OpenCV frame (BGR)
-
-        Returns:
-            Composited frame (BGR)
-        """
-        if self._gradient_top is None or self._gradient_bottom is None:
-            return frame
-
-        # Get frame dimensions
-        h, w = frame.shape[:2]
-
-        # Create gradient background (RGB to BGR)
-        gradient = np.zeros((h, w, 3), dtype=np.uint8)
-
-        for i in range(h):
-            # Interpolate between top and bottom colors
-            ratio = i / h
-            r = int(self._gradient_top[0] * (1 - ratio) + self._gradient_bottom[0] * ratio)
-            g = int(self._gradient_top[1] * (1 - ratio) + self._gradient_bottom[1] * ratio)
-            b = int(self._gradient_top[2] * (1 - ratio) + self._gradient_bottom[2] * ratio)
-            gradient[i, :] = [b, g, r]  # BGR order for OpenCV
-
-        # Resize frame to popup size (maintaining aspect ratio)
-        frame_resized = cv2.resize(frame, (self._popup_size, self._popup_size),
-                                   interpolation=cv2.INTER_LINEAR)
-
-        # Resize gradient to match
-        gradient_resized = cv2.resize(gradient, (self._popup_size, self._popup_size),
-                                     interpolation=cv2.INTER_LINEAR)
-
-        # Simple overlay (can add alpha blending later)
-        # For now, just return the frame with gradient as background
-        # In future: blend based on alpha channel if available
-
-        return frame_resized
-
-    def _cv2_to_qpixmap(self, cv_img: np.ndarray) -> QPixmap:
-        """
-        Convert OpenCV image to QPixmap
-
-        Args:
-            cv_img: OpenCV image (BGR)
-
-        Returns:
-            QPixmap
-        """
-        # Convert BGR to RGB
-        rgb_img = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-
-        # Get image dimensions
-        h, w, ch = rgb_img.shape
-        bytes_per_line = ch * w
-
-        # Convert to QImage
-        q_img = QImage(rgb_img.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-
-        # Convert to QPixmap
-        pixmap = QPixmap.fromImage(q_img)
-
-        return pixmap
-
     def _release_video(self):
-        """Release OpenCV video resources"""
-        if self._video_capture:
-            self._video_capture.release()
-            self._video_capture = None
-
+        """Release strip and cancel any pending preview"""
+        self._strip = None
+        self._pending_video_path = None
         self._current_video_path = None
         self._current_frame = 0
 
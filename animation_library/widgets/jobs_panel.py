@@ -0,0 +1,132 @@
+"""
+Jobs Panel - Status bar list of running background jobs
+
+Shows one compact row per queued/running job (title, progress bar,
+cancel button). Hidden while no job is active.
+"""
+
+from typing import Dict, Optional
+
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QProgressBar, QToolButton
+
+from ..events.event_bus import get_event_bus
+from ..services.job_manager import JobManager, get_job_manager
+
+
+class _JobRow(QWidget):
+    """One job: title, progress bar and cancel button"""
+
+    def __init__(self, job_id: int, title: str, cancellable: bool, job_manager: JobManager, parent=None):
+        super().__init__(parent)
+        self._job_id = job_id
+        self._job_manager = job_manager
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+
+        self._label = QLabel(title)
+        layout.addWidget(self._label)
+
+        self._progress = QProgressBar()
+        self._progress.setFixedWidth(120)
+        self._progress.setFixedHeight(12)
+        self._progress.setTextVisible(False)
+        self._progress.setRange(0, 0)  # Busy until the first progress report
+        layout.addWidget(self._progress)
+
+        self._cancel_btn = QToolButton()
+        self._cancel_btn.setText("✕")
+        self._cancel_btn.setToolTip("Cancel")
+        self._cancel_btn.setAutoRaise(True)
+        self._cancel_btn.setEnabled(cancellable)
+        self._cancel_btn.clicked.connect(self._on_cancel)
+        layout.addWidget(self._cancel_btn)
+
+    def set_progress(self, current: int, total: int, message: str):
+        """
+        Update progress display
+
+        Args:
+            current: Items done
+            total: Total items, 0 if unknown (busy indicator)
+            message: Status text (shown as tooltip)
+        """
+        if total > 0:
+            if self._progress.maximum() != total:
+                self._progress.setRange(0, total)
+            self._progress.setValue(min(current, total))
+        elif self._progress.maximum() != 0:
+            self._progress.setRange(0, 0)
+        self.setToolTip(message)
+
+    def _on_cancel(self):
+        """Request cancellation (row stays until the job actually stops)"""
+        if self._job_manager.cancel(self._job_id):
+            self._cancel_btn.setEnabled(False)
+            self._label.setText(f"{self._label.text()} (cancelling)")
+
+
+class JobsPanel(QWidget):
+    """
+    Compact list of active background jobs for the status bar
+
+    Driven entirely by EventBus job signals, which the JobManager already
+    throttles, so updating it never costs more than a few repaints a second.
+
+    Usage:
+        panel = JobsPanel()
+        status_bar.addPermanentWidget(panel)
+    """
+
+    def __init__(self, parent=None, event_bus=None, job_manager: Optional[JobManager] = None):
+        super().__init__(parent)
+        self._event_bus = event_bus or get_event_bus()
+        self._job_manager = job_manager or get_job_manager()
+        self._rows: Dict[int, _JobRow] = {}
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(2)
+
+        self._event_bus.job_added.connect(self._on_job_added)
+        self._event_bus.job_progress.connect(self._on_job_progress)
+        self._event_bus.job_finished.connect(self._on_job_finished)
+
+        # Jobs submitted before the panel existed
+        for job in self._job_manager.get_jobs():
+            self._add_row(job.id, job.title, job.cancellable)
+
+        self.setVisible(bool(self._rows))
+
+    def _add_row(self, job_id: int, title: str, cancellable: bool):
+        """Create the row for a job"""
+        row = _JobRow(job_id, title, cancellable, self._job_manager, self)
+        self._rows[job_id] = row
+        self._layout.addWidget(row)
+        self.show()
+
+    def _on_job_added(self, job_id: int, kind: str, title: str):
+        """Show a row for a newly submitted job"""
+        job = self._job_manager.get_job(job_id)
+        if job is not None and job_id not in self._rows:
+            self._add_row(job_id, title, job.cancellable)
+
+    def _on_job_progress(self, job_id: int, current: int, total: int, message: str):
+        """Update a job's progress bar"""
+        row = self._rows.get(job_id)
+        if row is not None:
+            row.set_progress(current, total, message)
+
+    def _on_job_finished(self, job_id: int, state: str):
+        """Remove a finished job's row"""
+        row = self._rows.pop(job_id, None)
+        if row is None:
+            return
+        self._layout.removeWidget(row)
+        row.deleteLater()
+        if not self._rows:
+            self.hide()
+
+
+__all__ = ['JobsPanel']
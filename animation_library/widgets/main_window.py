@@ -5,13 +5,15 @@ Pattern: QMainWindow with splitter layout
 Inspired by: Current animation_library structure
 """
 
+import logging
+import os
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QStatusBar, QDialog, QMessageBox, QMenu
 )
-from PyQt6.QtCore import Qt, QSettings, QTimer, QFileSystemWatcher
+from PyQt6.QtCore import Qt, QSettings, QTimer, QFileSystemWatcher, QEvent
 from PyQt6.QtGui import QCloseEvent
 import json
 
@@ -22,8 +24,14 @@ from ..services.blender_service import get_blender_service
 from ..services.archive_service import get_archive_service
 from ..services.trash_service import get_trash_service
 from ..services.thumbnail_loader import get_thumbnail_loader
-from ..services.update_service import UpdateService
+from ..services.notification_server import get_notification_server
+from ..services.directory_cache import get_directory_cache
+from ..services.library_watcher import ChangeKind, get_library_watcher
+from ..services.job_manager import JobKind, JobManager, get_job_manager
+from ..protocol import QUEUE_DIR_NAME, NOTIFICATION_FILE_PREFIXES, NotificationType
 from ..themes.theme_manager import get_theme_manager
+from ..utils.startup_timer import StartupTimer, get_startup_timer
+from ..utils.icon_registry import get_icon_registry
 from ..models.animation_list_model import AnimationListModel
 import threading
 from ..models.animation_filter_proxy_model import AnimationFilterProxyModel
@@ -33,10 +41,12 @@ from .folder_tree import FolderTree
 from .metadata_panel import MetadataPanel
 from .apply_panel import ApplyPanel
 from .bulk_edit_toolbar import BulkEditToolbar
-from .settings.settings_dialog import SettingsDialog
 from .help_overlay import HelpOverlay
+from .jobs_panel import JobsPanel
 from .controllers import ArchiveTrashController, BulkEditController, FilterController
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     """
@@ -65,9 +75,6 @@ class MainWindow(QMainWindow):
         +------------------------------------------+
     """
 
-    # Max number of watched directories to prevent resource exhaustion
-    MAX_WATCHED_DIRECTORIES = 500
-
     def __init__(self, parent=None, db_service=None, blender_service=None,
                  archive_service=None, trash_service=None, event_bus=None,
                  thumbnail_loader=None, theme_manager=None):
@@ -117,9 +124,14 @@ class MainWindow(QMainWindow):
         self._init_controllers()
         self._connect_signals()
         self._load_settings()
+
+        # Watchers, the queue poller and the full animation list start after
+        # the grid's first paint (see _start_deferred_services)
+        self._deferred_services_started = False
+        self._full_load_deferred = False
+        self._animation_view.viewport().installEventFilter(self)
+
         self._load_animations()
-        self._setup_queue_watcher()
-        self._setup_library_watcher()
 
     def _setup_window(self):
         """Configure window properties"""
@@ -155,6 +167,10 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage("Ready")
 
+        # Background jobs (hidden while idle)
+        self._jobs_panel = JobsPanel(event_bus=self._event_bus)
+        self._status_bar.addPermanentWidget(self._jobs_panel)
+
     def _create_layout(self):
         """Create window layout"""
 
@@ -385,37 +401,118 @@ class MainWindow(QMainWindow):
 
     def _load_animations(self):
         """Load animations from database, auto-sync if needed"""
-        from ..services.backup_service import BackupService
-
         self._event_bus.start_loading("Loading animations")
 
         # Check if database is empty - if so, auto-sync with library folder
+        # in the background and load once it is done
         if self._db_service.get_animation_count() == 0:
             self._status_bar.showMessage("Scanning library...")
-            self._db_service.sync_library()
+            get_job_manager().submit(
+                JobKind.SYNC,
+                "Scanning library",
+                lambda ctx: self._db_service.sync_library(ctx.report, ctx.token),
+                group=JobManager.GROUP_LIBRARY,
+                owner=self,
+                on_finished=lambda _: self._load_all_animations(),
+                on_failed=lambda _: self._load_all_animations(),
+                on_cancelled=self._load_all_animations,
+            )
+            return
+
+        # Show the first page now (in the grid's default name order); the
+        # full list loads in the background once the window has painted
+        first_page = self._db_service.get_all_animations(limit=Config.STARTUP_FIRST_PAGE_SIZE)
+        self._animation_model.set_animations(first_page)
+        self._full_load_deferred = True
+
+    def _load_all_animations(self):
+        """Load the full animation list on a job worker (after any initial sync)"""
+        generation = self._animation_model.get_reset_generation()
+
+        get_job_manager().submit(
+            JobKind.LOAD,
+            "Loading animations",
+            self._run_load_animations,
+            priority=JobManager.PRIORITY_HIGH,
+            group=JobManager.GROUP_LIBRARY,
+            cancellable=False,
+            owner=self,
+            on_finished=lambda animations: self._on_animations_loaded(animations, generation),
+            on_failed=lambda _: self._on_animations_loaded(None, generation),
+        )
+
+    def _run_load_animations(self, ctx):
+        """
+        Prepare and read all animations (runs on a job worker)
+
+        Args:
+            ctx: JobContext
+
+        Returns:
+            List of animation dicts
+        """
+        from ..services.backup_service import BackupService
 
         # Fix pose flags for any animations with frame_count=1 that aren't marked as poses
         self._db_service.fix_pose_flags()
 
         # Apply any pending metadata from import
         if BackupService.has_pending_metadata():
-            self._status_bar.showMessage("Restoring metadata...")
+            ctx.report(0, 0, "Restoring metadata...")
             BackupService.apply_pending_metadata()
 
-        # Get all animations from database
-        animations = self._db_service.get_all_animations()
+        return self._db_service.get_all_animations()
 
-        # Load into model
-        self._animation_model.set_animations(animations)
+    def _on_animations_loaded(self, animations, generation: int):
+        """
+        Put the fully loaded animation list into the model
+
+        Args:
+            animations: List of animation dicts, or None if the load job failed
+            generation: Model reset generation when the load was queued; a
+                newer reset (e.g. a refresh) already holds fresher data
+        """
+        if self._animation_model.get_reset_generation() == generation:
+            if animations is None:
+                animations = self._db_service.get_all_animations()
+            self._animation_model.set_animations(animations)
 
         # Update status
-        count = len(animations)
+        count = self._animation_model.rowCount()
         self._status_bar.showMessage(f"Loaded {count} animations")
 
         self._event_bus.finish_loading("Loading animations")
 
+    def eventFilter(self, obj, event):
+        """Start deferred services once the grid has painted for the first time"""
+        if event.type() == QEvent.Type.Paint and not self._deferred_services_started:
+            self._deferred_services_started = True
+            obj.removeEventFilter(self)
+            # Queued so the paint itself completes first
+            QTimer.singleShot(0, self._start_deferred_services)
+        return super().eventFilter(obj, event)
+
+    def _start_deferred_services(self):
+        """Start the full load, watchers and queue poller after first paint"""
+        startup_timer = get_startup_timer()
+        startup_timer.mark(StartupTimer.FIRST_PAINT)
+
+        if self._full_load_deferred:
+            self._full_load_deferred = False
+            self._load_all_animations()
+
+        self._setup_queue_watcher()
+        self._setup_library_watcher()
+
+        # Render common icons for every theme so theme switches and folder
+        # expansion never read or render SVGs on the GUI thread
+        get_icon_registry().prewarm_themes(self._theme_manager.get_all_themes())
+
+        startup_timer.mark("Deferred services")
+        startup_timer.report()
+
     def _setup_queue_watcher(self):
-        """Setup file system watcher for queue directory to detect Blender notifications"""
+        """Setup Blender notification channel (socket first, queue files as fallback)"""
         self._queue_watcher = QFileSystemWatcher(self)
         self._queue_check_timer = QTimer(self)
         self._queue_check_timer.timeout.connect(self._check_queue_notifications)
@@ -423,79 +520,112 @@ class MainWindow(QMainWindow):
         # Get queue directory path
         library_path = Config.load_library_path()
         if library_path:
-            queue_dir = Path(library_path) / ".queue"
+            queue_dir = Path(library_path) / QUEUE_DIR_NAME
             queue_dir.mkdir(parents=True, exist_ok=True)
 
-            # Watch the queue directory for changes
+            # Preferred: Blender pushes notifications over a local socket
+            self._notification_server = get_notification_server()
+            self._notification_server.notification_received.connect(self._on_notification_received)
+            socket_ok = self._notification_server.start(queue_dir)
+
+            # Fallback: Blender writes notification files into the queue directory
             self._queue_watcher.addPath(str(queue_dir))
             self._queue_watcher.directoryChanged.connect(self._on_queue_directory_changed)
 
-            # Also start periodic check (backup in case watcher misses events)
-            self._queue_check_timer.start(Config.QUEUE_CHECK_INTERVAL_MS)
+            # Pick up anything written while the app was closed
+            QTimer.singleShot(Config.QUEUE_NOTIFICATION_DELAY_MS, self._check_queue_notifications)
+
+            # Periodic check only when the socket channel is unavailable
+            # (backup in case watcher misses events, e.g. on network shares)
+            if not socket_ok:
+                self._queue_check_timer.start(Config.QUEUE_CHECK_INTERVAL_MS)
 
     def _setup_library_watcher(self):
-        """Setup file system watcher for library folders to auto-refresh on new captures"""
-        self._library_watcher = QFileSystemWatcher(self)
-        self._library_refresh_timer = QTimer(self)
-        self._library_refresh_timer.setSingleShot(True)
-        self._library_refresh_timer.timeout.connect(self._on_library_auto_refresh)
+        """Watch the library for animations added, changed or removed outside the app"""
+        self._library_watcher = get_library_watcher()
+        self._track_connection(self._library_watcher.changes_available, self._on_library_changes_available)
 
-        # Get library path
         library_path = Config.load_library_path()
         if library_path:
-            library_dir = Path(library_path) / "library"
-
-            # Watch actions and poses folders
-            actions_dir = library_dir / "actions"
-            poses_dir = library_dir / "poses"
-
-            watch_count = 0
-            for folder in [actions_dir, poses_dir]:
-                if folder.exists() and watch_count < self.MAX_WATCHED_DIRECTORIES:
-                    self._library_watcher.addPath(str(folder))
-                    watch_count += 1
-                    # Also watch immediate subfolders (animation folders)
-                    for subfolder in folder.iterdir():
-                        if watch_count >= self.MAX_WATCHED_DIRECTORIES:
-                            break
-                        if subfolder.is_dir():
-                            self._library_watcher.addPath(str(subfolder))
-                            watch_count += 1
-
-            self._library_watcher.directoryChanged.connect(self._on_library_folder_changed)
-
-    def _on_library_folder_changed(self, path: str):
-        """Handle changes in library folders - debounce and auto-refresh"""
-        # Debounce: wait 500ms after last change before refreshing
-        # This prevents multiple refreshes when Blender writes multiple files
-        self._library_refresh_timer.start(500)
-
-        # Check if we've reached the max watched directories limit
-        current_count = len(self._library_watcher.directories())
-        if current_count >= self.MAX_WATCHED_DIRECTORIES:
-            # At limit - don't add more watchers (auto-refresh timer will still work)
+            self._library_watcher.start(Path(library_path))
+
+    def _on_library_changes_available(self):
+        """Apply a burst of library changes on a background job"""
+        # A job still queued picks up these changes too (it takes them when it runs)
+        get_job_manager().submit(
+            JobKind.LIBRARY_CHANGES,
+            "Updating library",
+            self._run_library_changes,
+            priority=JobManager.PRIORITY_LOW,
+            group=JobManager.GROUP_LIBRARY,
+            cancellable=False,
+            coalesce=True,
+            owner=self,
+            on_finished=self._on_library_changes_applied,
+        )
+
+    def _run_library_changes(self, ctx) -> dict:
+        """
+        Import changed folders, or run a full sync for large/lossy change sets (worker thread)
+
+        Returns:
+            Dict with 'sync' (sync_library result) or 'animations',
+            'superseded' and 'missing' (UUIDs whose folders were removed)
+        """
+        # A crashed Blender may have left a journaled version promotion half-done
+        self._db_service.recover_file_operations()
+
+        changes = self._library_watcher.take_changes()
+        if changes.overflow or len(changes) > Config.LIBRARY_WATCH_FULL_SYNC_THRESHOLD:
+            return {'sync': self._db_service.sync_library(ctx.report, ctx.token)}
+
+        folders = changes.get_folders(ChangeKind.ADDED) + changes.get_folders(ChangeKind.MODIFIED)
+        animations, superseded = self._db_service.import_library_folders(folders, ctx.token)
+        missing = self._db_service.get_animation_uuids_in_folders(changes.get_folders(ChangeKind.REMOVED))
+        return {'animations': animations, 'superseded': superseded, 'missing': missing}
+
+    def _on_library_changes_applied(self, result: dict):
+        """Patch the model with the animations a change set touched"""
+        if 'sync' in result:
+            self._on_library_auto_refreshed(result['sync'])
             return
 
-        # Also add the changed path to watcher if it's a new directory
-        path_obj = Path(path)
-        if path_obj.is_dir() and path not in self._library_watcher.directories():
-            if current_count < self.MAX_WATCHED_DIRECTORIES:
-                self._library_watcher.addPath(path)
-                current_count += 1
-
-            # Watch new subfolders too (with limit check)
-            for subfolder in path_obj.iterdir():
-                if current_count >= self.MAX_WATCHED_DIRECTORIES:
-                    break
-                if subfolder.is_dir() and str(subfolder) not in self._library_watcher.directories():
-                    self._library_watcher.addPath(str(subfolder))
-                    current_count += 1
+        self._animation_model.remove_animations(result['superseded'])
+        added = 0
+        for animation in result['animations']:
+            self._thumbnail_loader.invalidate_animation(animation['uuid'])
+            if not animation.get('is_latest', 1):
+                continue  # Older versions are not shown in the grid
+            if not self._animation_model.upsert_animation(animation):
+                added += 1
+            self._header_toolbar.add_filter_values(animation.get('rig_type'), animation.get('tags'))
+
+        # Files gone from disk: the rows stay (as after a full sync) but re-resolve their media
+        for uuid in result['missing']:
+            self._thumbnail_loader.invalidate_animation(uuid)
+            self._animation_model.refresh_animation(uuid)
+
+        if added:
+            self._status_bar.showMessage(f"Auto-imported {added} new animation(s)")
 
     def _on_library_auto_refresh(self):
         """Auto-refresh library after file changes detected"""
-        # Sync library with database (lightweight - only imports new/changed)
-        total_found, newly_imported = self._db_service.sync_library()
+        # Sync library with database (lightweight - only imports new/changed).
+        # Bursts of file changes share one queued sync.
+        get_job_manager().submit(
+            JobKind.SYNC,
+            "Syncing library",
+            lambda ctx: self._db_service.sync_library(ctx.report, ctx.token),
+            priority=JobManager.PRIORITY_LOW,
+            group=JobManager.GROUP_LIBRARY,
+            coalesce=True,
+            owner=self,
+            on_finished=self._on_library_auto_refreshed,
+        )
 
+    def _on_library_auto_refreshed(self, result):
+        """Reload the model if the auto-refresh sync imported anything"""
+        total_found, newly_imported = result
         if newly_imported > 0:
             # Reload animations from database
             animations = self._db_service.get_all_animations()
@@ -507,97 +637,128 @@ class MainWindow(QMainWindow):
             # Update status
             self._status_bar.showMessage(f"Auto-imported {newly_imported} new animation(s)")
 
+    def _import_captured_animation(self, data: dict) -> bool:
+        """
+        Import a single captured animation and patch it into the model.
+
+        Avoids the full library rescan and model reset of
+        _on_library_auto_refresh(), so capture cost stays constant as the
+        library grows and the current selection/scroll position survive.
+
+        Args:
+            data: animation_captured notification payload
+
+        Returns:
+            True if handled, False if the caller should fall back to a full sync
+        """
+        animation, superseded = self._db_service.import_captured_animation(
+            data.get('animation_id'),
+            data.get('json_file_path'),
+            data.get('version_group_id')
+        )
+        if animation is None:
+            return False
+
+        # A new version replaces the previous latest card of its group
+        for uuid in superseded:
+            self._animation_model.remove_animation(uuid)
+        self._animation_model.upsert_animation(animation)
+
+        self._header_toolbar.add_filter_values(
+            animation.get('rig_type'), animation.get('tags')
+        )
+        return True
+
     def _on_queue_directory_changed(self, path: str):
         """Handle changes in queue directory"""
         # Use a short delay to let file writes complete
         QTimer.singleShot(Config.QUEUE_NOTIFICATION_DELAY_MS, self._check_queue_notifications)
 
+    def _on_notification_received(self, message: dict):
+        """Handle a notification pushed by Blender over the socket channel"""
+        self._handle_notification(message.get('type', ''), message)
+
     def _check_queue_notifications(self):
-        """Check for and process preview update notifications from Blender"""
+        """Check for and process notification files written by Blender (fallback channel)"""
         library_path = Config.load_library_path()
         if not library_path:
             return
 
-        queue_dir = Path(library_path) / ".queue"
-        if not queue_dir.exists():
+        queue_dir = Path(library_path) / QUEUE_DIR_NAME
+
+        # Single directory listing, bucketed by prefix
+        pending = {prefix: [] for prefix in NOTIFICATION_FILE_PREFIXES}
+        try:
+            with os.scandir(queue_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    for prefix in NOTIFICATION_FILE_PREFIXES:
+                        if entry.name.startswith(prefix):
+                            pending[prefix].append(Path(entry.path))
+                            break
+        except OSError:
             return
 
-        # First, handle preview_updating_*.json files (release file locks before Blender renders)
-        for notification_file in queue_dir.glob("preview_updating_*.json"):
-            try:
-                with open(notification_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                animation_id = data.get('animation_id')
-                preview_path = data.get('preview_path', '')
-
-                if animation_id:
-                    # Release the video file if it's currently loaded
-                    self._release_preview_file(animation_id, preview_path)
-
-                # Delete notification file after processing
-                notification_file.unlink()
-
-            except Exception as e:
-                print(f"Error processing preview_updating notification: {e}")
+        # Process in protocol order: preview_updating first (release file locks
+        # before Blender renders), then captures, then preview_updated
+        for prefix in NOTIFICATION_FILE_PREFIXES:
+            notification_type = prefix.rstrip('_')
+            for notification_file in sorted(pending[prefix]):
                 try:
-                    notification_file.unlink()
-                except:
-                    pass
-
-        # Handle animation_captured_*.json files (new animation captured from Blender)
-        for notification_file in queue_dir.glob("animation_captured_*.json"):
-            try:
-                with open(notification_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                animation_name = data.get('animation_name', 'Unknown')
-                
-                # Trigger full library refresh to import the new animation
-                self._on_library_auto_refresh()
-                
-                # Update status bar
-                self._status_bar.showMessage(f"New animation captured: {animation_name}")
-
-                # Delete notification file after processing
-                notification_file.unlink()
-
-            except Exception as e:
-                print(f"Error processing animation_captured notification: {e}")
+                    with open(notification_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    self._handle_notification(notification_type, data)
+                except Exception as e:
+                    logger.error("Error processing %s notification: %s", notification_type, e)
+
+                # Delete notification file after processing (even on error,
+                # to avoid an infinite loop)
                 try:
                     notification_file.unlink()
-                except:
+                except OSError:
                     pass
 
-        # Find preview_updated_*.json files
-        for notification_file in queue_dir.glob("preview_updated_*.json"):
-            try:
-                with open(notification_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                animation_id = data.get('animation_id')
-                animation_name = data.get('animation_name', 'Unknown')
-
-                if animation_id:
-                    # Emit animation updated event to refresh the preview
-                    self._event_bus.animation_updated.emit(animation_id)
-
-                    # Update status bar
-                    self._status_bar.showMessage(f"Preview updated: {animation_name}")
+    def _handle_notification(self, notification_type: str, data: dict):
+        """
+        Dispatch a Blender notification (from socket or queue file).
 
-                    # Refresh the currently selected animation if it matches
-                    self._refresh_animation_preview(animation_id)
+        Args:
+            notification_type: NotificationType value
+            data: Notification payload (protocol message fields)
+        """
+        animation_id = data.get('animation_id')
+        animation_name = data.get('animation_name', 'Unknown')
+
+        # Apply the database paths of version promotions Blender handed off
+        # and finish operations it left behind (one folder listing when
+        # nothing is pending)
+        self._db_service.recover_file_operations()
+
+        # Blender writes into the folders named in the message
+        for key in ('json_file_path', 'preview_path'):
+            if data.get(key):
+                get_directory_cache().invalidate(data[key])
+
+        if notification_type == NotificationType.PREVIEW_UPDATING:
+            if animation_id:
+                # Release the video file if it's currently loaded
+                self._release_preview_file(animation_id, data.get('preview_path', ''))
+
+        elif notification_type == NotificationType.ANIMATION_CAPTURED:
+            # Import just the captured asset; full sync only as fallback
+            if not self._import_captured_animation(data):
+                self._on_library_auto_refresh()
+            self._status_bar.showMessage(f"New animation captured: {animation_name}")
 
-                # Delete notification file after processing
-                notification_file.unlink()
+        elif notification_type == NotificationType.PREVIEW_UPDATED:
+            if animation_id:
+                # Emit animation updated event to refresh the preview
+                self._event_bus.animation_updated.emit(animation_id)
+                self._status_bar.showMessage(f"Preview updated: {animation_name}")
 
-            except Exception as e:
-                print(f"Error processing queue notification: {e}")
-                # Still try to delete the file to avoid infinite loop
-                try:
-                    notification_file.unlink()
-                except:
-                    pass
+                # Refresh the currently selected animation if it matches
+                self._refresh_animation_preview(animation_id)
 
     def _release_preview_file(self, animation_id: str, preview_path: str = ''):
         """Release video file lock so Blender can update it"""
@@ -608,7 +769,7 @@ class MainWindow(QMainWindow):
                 # Clear the video preview to release the file handle
                 if hasattr(self._metadata_panel, '_video_preview'):
                     self._metadata_panel._video_preview.clear()
-                    print(f"[Animation Library] Released video file for animation: {animation_id}")
+                    logger.debug("Released video file for animation: %s", animation_id)
 
         # Also stop any hover preview that might have this file
         if hasattr(self._animation_view, '_hover_popup') and self._animation_view._hover_popup:
@@ -619,6 +780,11 @@ class MainWindow(QMainWindow):
         # Invalidate thumbnail cache for this animation so it reloads from disk
         self._thumbnail_loader.invalidate_animation(animation_id)
 
+        # The preview may have been re-rendered with a different extension
+        animation = self._db_service.get_animation_by_uuid(animation_id)
+        if animation and animation.get('preview_path'):
+            get_directory_cache().invalidate(animation['preview_path'])
+
         # Refresh animation data in the model (triggers dataChanged)
         self._animation_model.refresh_animation(animation_id)
 
@@ -629,6 +795,7 @@ class MainWindow(QMainWindow):
                 # Reload animation data from database
                 animation = self._db_service.get_animation_by_uuid(animation_id)
                 if animation:
+                    self._metadata_panel.invalidate_details(animation_id)
                     self._metadata_panel.set_animation(animation)
 
         # Force animation view to repaint with fresh thumbnails
@@ -636,11 +803,13 @@ class MainWindow(QMainWindow):
 
     def _show_settings(self):
         """Show settings dialog"""
+        from .settings.settings_dialog import SettingsDialog  # Heavy; imported on first use
         dialog = SettingsDialog(self._theme_manager, self)
         dialog.exec()
 
     def _show_identity_settings(self):
         """Show settings dialog opened directly to the Identity tab."""
+        from .settings.settings_dialog import SettingsDialog  # Heavy; imported on first use
         dialog = SettingsDialog(self._theme_manager, self)
         dialog.open_identity_tab()
         dialog.exec()
@@ -700,6 +869,7 @@ class MainWindow(QMainWindow):
             if animation:
                 # Update metadata panel
                 self._metadata_panel.set_animation(animation)
+                self._prefetch_neighbour_details(index)
 
                 # Update apply panel
                 self._apply_panel.set_animation(animation)
@@ -716,6 +886,16 @@ class MainWindow(QMainWindow):
 
             self._status_bar.showMessage("Ready")
 
+    def _prefetch_neighbour_details(self, index):
+        """Prefetch metadata panel details for items next to the selection"""
+        neighbours = []
+        for neighbour in self._animation_view.get_neighbour_indexes(index):
+            source_index = self._proxy_model.mapToSource(neighbour)
+            animation = self._animation_model.get_animation_at_index(source_index.row())
+            if animation:
+                neighbours.append(animation)
+        self._metadata_panel.prefetch_details(neighbours)
+
     def _on_notes_changed(self):
         """Handle notes changed (e.g., lineage dialog closed) - refresh badges"""
         self._animation_model.refresh_notes_cache(emit_change=True)
@@ -790,8 +970,8 @@ class MainWindow(QMainWindow):
 
         menu.addSeparator()
 
-        # View Lineage action
-        version_count = self._db_service.get_version_count(version_group_id)
+        # View Lineage action (count comes from the model's version cache)
+        version_count = self._animation_model.get_version_count(uuid)
         if version_count > 1:
             history_action = menu.addAction(f"View Lineage ({version_count} versions)")
             history_action.triggered.connect(
@@ -983,21 +1163,53 @@ class MainWindow(QMainWindow):
 
     def _on_refresh_library(self):
         """Handle refresh library button click - sync database with library folder"""
-        from ..services.backup_service import BackupService
-
         self._event_bus.start_loading("Scanning library")
         self._status_bar.showMessage("Scanning library folder...")
 
+        get_job_manager().submit(
+            JobKind.SYNC,
+            "Scanning library",
+            self._run_library_refresh,
+            priority=JobManager.PRIORITY_HIGH,
+            group=JobManager.GROUP_LIBRARY,
+            owner=self,
+            on_finished=self._on_library_refreshed,
+            on_failed=lambda _: self._on_library_refreshed(None),
+            on_cancelled=lambda: self._on_library_refreshed(None),
+        )
+
+    def _run_library_refresh(self, ctx):
+        """
+        Sync the database with the library folder (runs on a job worker)
+
+        Args:
+            ctx: JobContext
+
+        Returns:
+            Tuple of (total_found, newly_imported, metadata_applied)
+        """
+        from ..services.backup_service import BackupService
+
         # Sync library with database
-        total_found, newly_imported = self._db_service.sync_library()
+        total_found, newly_imported = self._db_service.sync_library(ctx.report, ctx.token)
 
         # Apply any pending metadata from import
         metadata_applied = 0
-        if BackupService.has_pending_metadata():
-            self._status_bar.showMessage("Applying imported metadata...")
+        if not ctx.is_cancelled and BackupService.has_pending_metadata():
+            ctx.report(total_found, 0, "Applying imported metadata...")
             stats = BackupService.apply_pending_metadata()
             metadata_applied = stats.get('updated', 0)
 
+        return total_found, newly_imported, metadata_applied
+
+    def _on_library_refreshed(self, result):
+        """
+        Reload views after a library refresh job
+
+        Args:
+            result: (total_found, newly_imported, metadata_applied), or None
+                if the job failed or was cancelled (partial imports still show)
+        """
         # Reload animations from database
         animations = self._db_service.get_all_animations()
         self._animation_model.set_animations(animations)
@@ -1009,13 +1221,17 @@ class MainWindow(QMainWindow):
         self._folder_tree.refresh()
 
         # Update status
-        status_parts = [f"{total_found} animations found"]
-        if newly_imported > 0:
-            status_parts.append(f"{newly_imported} newly imported")
-        if metadata_applied > 0:
-            status_parts.append(f"{metadata_applied} metadata restored")
+        if result is None:
+            self._status_bar.showMessage("Library refresh stopped")
+        else:
+            total_found, newly_imported, metadata_applied = result
+            status_parts = [f"{total_found} animations found"]
+            if newly_imported > 0:
+                status_parts.append(f"{newly_imported} newly imported")
+            if metadata_applied > 0:
+                status_parts.append(f"{metadata_applied} metadata restored")
 
-        self._status_bar.showMessage(f"Library refresh complete: {', '.join(status_parts)}")
+            self._status_bar.showMessage(f"Library refresh complete: {', '.join(status_parts)}")
 
         self._event_bus.finish_loading("Scanning library")
 
@@ -1136,9 +1352,16 @@ class MainWindow(QMainWindow):
         if hasattr(self, '_queue_check_timer') and self._queue_check_timer.isActive():
             self._queue_check_timer.stop()
 
-        # Stop library refresh timer
-        if hasattr(self, '_library_refresh_timer') and self._library_refresh_timer.isActive():
-            self._library_refresh_timer.stop()
+        # Stop notification server (removes advertised endpoint)
+        if hasattr(self, '_notification_server'):
+            self._notification_server.stop()
+
+        # Stop library watcher
+        if hasattr(self, '_library_watcher'):
+            self._library_watcher.stop()
+
+        # Stop background jobs at their next safe point
+        get_job_manager().shutdown()
 
         # Disconnect all tracked signal connections to prevent memory leaks
         self._disconnect_all_signals()
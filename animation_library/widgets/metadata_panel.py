@@ -5,21 +5,19 @@ Pattern: QWidget with form layout
 Inspired by: Current animation_library metadata display
 """
 
-from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QScrollArea,
     QFrame, QGridLayout, QPushButton, QHBoxLayout, QMenu, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QCursor
 
 from ..themes.theme_manager import get_theme_manager
 from ..config import Config
 from ..services.database_service import get_database_service
+from ..services.selection_details_loader import get_selection_details_loader
 from .video_preview_widget import VideoPreviewWidget
-from .dialogs import VersionHistoryDialog
-from .dialogs.rename_dialog import show_rename_dialog
 
 
 class MetadataPanel(QWidget):
@@ -69,6 +67,17 @@ class MetadataPanel(QWidget):
         # Current animation
         self._animation: Optional[Dict[str, Any]] = None
 
+        # Details loaded off the GUI thread (preview file, version/note counts)
+        self._details: Optional[Dict[str, Any]] = None
+        self._details_loader = get_selection_details_loader()
+        self._details_loader.details_ready.connect(self._on_details_ready)
+
+        # Video opens only once the selection settles (not while arrowing through)
+        self._preview_loaded = False
+        self._preview_settle_timer = QTimer(self)
+        self._preview_settle_timer.setSingleShot(True)
+        self._preview_settle_timer.timeout.connect(self._load_preview_if_ready)
+
         # Services (injectable for testing)
         self._theme_manager = theme_manager or get_theme_manager()
         self._db_service = db_service  # Lazy init via _get_db_service()
@@ -399,18 +408,13 @@ class MetadataPanel(QWidget):
         """
         self._animation = animation
 
-        # Load video preview - resolve path for archived versions
-        preview_path = animation.get('preview_path', '')
-        if preview_path:
-            # Check if stored path exists, otherwise resolve to archive location
-            if not Path(preview_path).exists():
-                db_service = self._get_db_service()
-                resolved = db_service.animations.resolve_preview_file(animation)
-                if resolved:
-                    preview_path = str(resolved)
-            self._video_preview.load_video(preview_path)
-        else:
-            self._video_preview.clear()
+        # Details come from cache or arrive via details_ready
+        self._details = self._details_loader.get_details(animation)
+
+        # Release the previous video now, open this one once the selection settles
+        self._video_preview.clear()
+        self._preview_loaded = False
+        self._preview_settle_timer.start(Config.METADATA_PREVIEW_SETTLE_MS)
 
         # Update description
         description = animation.get('description', '')
@@ -439,9 +443,56 @@ class MetadataPanel(QWidget):
         is_pose = animation.get('is_pose', 0)
         self._pose_actions_section.setVisible(bool(is_pose))
 
+    def prefetch_details(self, animations: List[Dict[str, Any]]):
+        """
+        Load details for animations likely to be selected next
+
+        Args:
+            animations: Animation data dicts (e.g. neighbours of the selection)
+        """
+        self._details_loader.prefetch(animations)
+
+    def invalidate_details(self, uuid: Optional[str] = None):
+        """
+        Drop cached details and reload them for the current animation if affected
+
+        Args:
+            uuid: Animation to invalidate, or None for all
+        """
+        self._details_loader.invalidate(uuid)
+
+        if self._animation and uuid in (None, self._animation.get('uuid')):
+            self._details = self._details_loader.get_details(self._animation)
+            if self._details is not None:
+                self._update_version_section()
+
+    def _on_details_ready(self, uuid: str, details: dict):
+        """Fill in details for the current animation"""
+        if not self._animation or self._animation.get('uuid') != uuid:
+            return
+
+        self._details = details
+        self._update_version_section()
+        self._load_preview_if_ready()
+
+    def _load_preview_if_ready(self):
+        """Open the preview video once the selection has settled and its details are known"""
+        if (self._preview_loaded or self._details is None
+                or self._preview_settle_timer.isActive()):
+            return
+        self._preview_loaded = True
+
+        preview_path = self._details.get('preview_path', '')
+        if preview_path:
+            self._video_preview.load_video(preview_path)
+        else:
+            self._video_preview.clear()
+
     def clear(self):
         """Clear panel"""
         self._animation = None
+        self._details = None
+        self._preview_settle_timer.stop()
         self._description_label.clear()
         self._description_label.hide()
 
@@ -774,7 +825,8 @@ class MetadataPanel(QWidget):
         # Release file locks before renaming (video preview holds .webm file open)
         self._video_preview.clear()
 
-        # Show rename dialog
+        # Show rename dialog (dialogs are imported on first use to keep startup light)
+        from .dialogs.rename_dialog import show_rename_dialog
         new_name = show_rename_dialog(uuid, self._animation, self)
 
         if new_name:
@@ -785,6 +837,7 @@ class MetadataPanel(QWidget):
 
             if updated:
                 self._animation = updated
+                self._details_loader.invalidate(uuid)
                 self._update_technical_section()
 
                 # Reload video preview with new path
@@ -896,17 +949,11 @@ class MetadataPanel(QWidget):
             self._latest_badge.hide()
 
         # Update comment indicator (shows when animation has unresolved review comments)
-        uuid = self._animation.get('uuid')
-        if uuid:
-            from ..services.notes_database import get_notes_database
-            notes_db = get_notes_database()
-            unresolved_count = notes_db.get_unresolved_count(uuid)
-            if unresolved_count > 0:
-                comment_text = f"{unresolved_count} comment{'s' if unresolved_count > 1 else ''}"
-                self._comment_indicator.setText(comment_text)
-                self._comment_widget.show()
-            else:
-                self._comment_widget.hide()
+        unresolved_count = self._details.get('unresolved_count', 0) if self._details else 0
+        if unresolved_count > 0:
+            comment_text = f"{unresolved_count} comment{'s' if unresolved_count > 1 else ''}"
+            self._comment_indicator.setText(comment_text)
+            self._comment_widget.show()
         else:
             self._comment_widget.hide()
 
@@ -919,9 +966,7 @@ class MetadataPanel(QWidget):
         group_id = version_group_id or self._animation.get('uuid')
 
         if group_id:
-            from ..services.database_service import get_database_service
-            db_service = self._get_db_service()
-            version_count = db_service.get_version_count(group_id)
+            version_count = self._details.get('version_count', 1) if self._details else 1
 
             if version_count > 1:
                 self._version_count_label.setText(f"({version_count} versions)")
@@ -997,6 +1042,7 @@ class MetadataPanel(QWidget):
             return
 
         # Open version history dialog
+        from .dialogs import VersionHistoryDialog
         dialog = VersionHistoryDialog(
             version_group_id,
             parent=self,
@@ -1010,7 +1056,7 @@ class MetadataPanel(QWidget):
         dialog.exec()
 
         # After dialog closes, refresh notes (comments may have been resolved/deleted)
-        self._update_version_section()  # Update metadata panel indicator
+        self.invalidate_details()  # Update metadata panel indicator
         self.notes_changed.emit()  # Notify parent to refresh card badges
 
     def _on_version_selected(self, uuid: str):
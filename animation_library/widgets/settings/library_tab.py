@@ -18,52 +18,13 @@ from PyQt6.QtWidgets import (
     QLabel, QPushButton, QFileDialog, QMessageBox,
     QProgressDialog
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal
 
 from ...config import Config
 from ...services.backup_service import BackupService
 from ...services.database_service import get_database_service
-
-
-class ExportWorker(QThread):
-    """Background worker for export operation"""
-    progress = pyqtSignal(int, int, str)
-    finished = pyqtSignal(bool, str)
-
-    def __init__(self, library_path, output_path):
-        super().__init__()
-        self.library_path = library_path
-        self.output_path = output_path
-
-    def run(self):
-        try:
-            success = BackupService.export_library(
-                self.library_path,
-                self.output_path,
-                progress_callback=lambda c, t, m: self.progress.emit(c, t, m)
-            )
-            self.finished.emit(success, "Export complete!" if success else "Export failed")
-        except Exception as e:
-            self.finished.emit(False, str(e))
-
-
-class ImportWorker(QThread):
-    """Background worker for import operation"""
-    progress = pyqtSignal(int, int, str)
-    finished = pyqtSignal(dict)
-
-    def __init__(self, archive_path, library_path):
-        super().__init__()
-        self.archive_path = archive_path
-        self.library_path = library_path
-
-    def run(self):
-        stats = BackupService.import_library(
-            self.archive_path,
-            self.library_path,
-            progress_callback=lambda c, t, m: self.progress.emit(c, t, m)
-        )
-        self.finished.emit(stats)
+from ...services.job_manager import JobKind, JobManager, get_job_manager
+from ...events.event_bus import get_event_bus
 
 
 class LibraryTab(QWidget):
@@ -75,8 +36,9 @@ class LibraryTab(QWidget):
     def __init__(self, theme_manager, parent=None):
         super().__init__(parent)
         self.theme_manager = theme_manager
-        self._worker = None
+        self._job_id = None  # Running export/import job
         self._progress_dialog = None
+        get_event_bus().job_progress.connect(self._on_job_progress)
         self._init_ui()
 
     def _init_ui(self):
@@ -268,27 +230,46 @@ class LibraryTab(QWidget):
         self._progress_dialog.setMinimumDuration(0)
         self._progress_dialog.setValue(0)
 
-        # Start worker
-        self._worker = ExportWorker(library_path, Path(output_path))
-        self._worker.progress.connect(self._on_export_progress)
-        self._worker.finished.connect(self._on_export_finished)
-        self._progress_dialog.canceled.connect(self._worker.terminate)
-        self._worker.start()
+        # Start background job
+        output_path = Path(output_path)
+        self._job_id = get_job_manager().submit(
+            JobKind.BACKUP_EXPORT,
+            "Exporting library",
+            lambda ctx: BackupService.export_library(library_path, output_path, ctx.report, ctx.token),
+            group=JobManager.GROUP_LIBRARY,
+            owner=self,
+            on_finished=lambda success: self._on_export_finished(
+                success, "Export complete!" if success else "Export failed"
+            ),
+            on_failed=lambda error: self._on_export_finished(False, error),
+            on_cancelled=self._close_progress_dialog,
+        )
+        self._progress_dialog.canceled.connect(self._on_progress_canceled)
 
-    def _on_export_progress(self, current, total, message):
-        """Handle export progress updates"""
+    def _on_job_progress(self, job_id, current, total, message):
+        """Handle export/import progress updates"""
         dialog = self._progress_dialog
-        if dialog:
+        if dialog and job_id == self._job_id:
             if total > 0:
                 percent = int((current / total) * 100)
                 dialog.setValue(percent)
             dialog.setLabelText(message)
 
-    def _on_export_finished(self, success, message):
-        """Handle export completion"""
+    def _on_progress_canceled(self):
+        """Cancel the running job (it stops after the current file)"""
+        if self._job_id is not None:
+            get_job_manager().cancel(self._job_id)
+
+    def _close_progress_dialog(self):
+        """Close the progress dialog and forget the job"""
         if self._progress_dialog:
             self._progress_dialog.close()
             self._progress_dialog = None
+        self._job_id = None
+
+    def _on_export_finished(self, success, message):
+        """Handle export completion"""
+        self._close_progress_dialog()
 
         if success:
             QMessageBox.information(
@@ -303,8 +284,6 @@ class LibraryTab(QWidget):
                 f"Failed to export library:\n{message}"
             )
 
-        self._worker = None
-
     def _import_library(self):
         """Import library from .animlib file"""
         library_path = Config.load_library_path()
@@ -374,27 +353,26 @@ class LibraryTab(QWidget):
         self._progress_dialog.setMinimumDuration(0)
         self._progress_dialog.setValue(0)
 
-        # Start worker
-        self._worker = ImportWorker(archive_path, library_path)
-        self._worker.progress.connect(self._on_import_progress)
-        self._worker.finished.connect(self._on_import_finished)
-        self._progress_dialog.canceled.connect(self._worker.terminate)
-        self._worker.start()
+        # Start background job
+        self._job_id = get_job_manager().submit(
+            JobKind.BACKUP_IMPORT,
+            "Importing library",
+            lambda ctx: BackupService.import_library(archive_path, library_path, ctx.report, ctx.token),
+            group=JobManager.GROUP_LIBRARY,
+            owner=self,
+            on_finished=self._on_import_finished,
+            on_cancelled=self._on_import_cancelled,
+        )
+        self._progress_dialog.canceled.connect(self._on_progress_canceled)
 
-    def _on_import_progress(self, current, total, message):
-        """Handle import progress updates"""
-        dialog = self._progress_dialog
-        if dialog:
-            if total > 0:
-                percent = int((current / total) * 100)
-                dialog.setValue(percent)
-            dialog.setLabelText(message)
+    def _on_import_cancelled(self):
+        """Handle cancelled import - files extracted so far are kept"""
+        self._close_progress_dialog()
+        self.library_imported.emit()
 
     def _on_import_finished(self, stats):
         """Handle import completion"""
-        if self._progress_dialog:
-            self._progress_dialog.close()
-            self._progress_dialog = None
+        self._close_progress_dialog()
 
         # Build result message
         message = f"Import complete!\n\n"
@@ -419,7 +397,5 @@ class LibraryTab(QWidget):
         if stats['imported'] > 0:
             self.library_imported.emit()
 
-        self._worker = None
-
 
 __all__ = ['LibraryTab']
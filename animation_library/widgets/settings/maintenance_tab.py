@@ -23,6 +23,7 @@ from PyQt6.QtCore import Qt
 from ...services.database_service import get_database_service
 from ...services.database import SCHEMA_VERSION
 from ...services.notes_database import get_notes_database
+from ...services.job_manager import JobKind, JobManager, get_job_manager
 
 
 class MaintenanceTab(QWidget):
@@ -462,7 +463,20 @@ class MaintenanceTab(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        size_before, size_after = self._db_service.optimize_database()
+        # VACUUM cannot stop part-way, so the job is not cancellable
+        get_job_manager().submit(
+            JobKind.OPTIMIZE,
+            "Optimizing database",
+            lambda ctx: self._db_service.optimize_database(),
+            group=JobManager.GROUP_LIBRARY,
+            cancellable=False,
+            owner=self,
+            on_finished=self._on_optimize_finished,
+        )
+
+    def _on_optimize_finished(self, result):
+        """Show optimization results"""
+        size_before, size_after = result
 
         saved = size_before - size_after
         saved_mb = saved / (1024 * 1024)
@@ -504,36 +518,62 @@ class MaintenanceTab(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        try:
-            # Create backup first
-            self._db_service.create_backup()
+        get_job_manager().submit(
+            JobKind.REBUILD,
+            "Rebuilding database",
+            self._run_rebuild,
+            group=JobManager.GROUP_LIBRARY,
+            owner=self,
+            on_finished=self._on_rebuild_finished,
+            on_failed=self._on_rebuild_failed,
+            on_cancelled=self._refresh_status,
+        )
 
-            # Clear all animations
-            cleared = self._db_service.clear_all_animations()
+    def _run_rebuild(self, ctx):
+        """
+        Back up, clear and reimport the database (runs on a job worker)
 
-            # Rescan library
-            total_found, newly_imported = self._db_service.sync_library()
+        Args:
+            ctx: JobContext
 
-            # Show results
-            QMessageBox.information(
-                self,
-                "Rebuild Complete",
-                f"Database rebuilt successfully!\n\n"
-                f"Cleared: {cleared} old entries\n"
-                f"Found: {total_found} animation folders\n"
-                f"Imported: {newly_imported} animations\n\n"
-                f"Please close Settings and refresh the library."
-            )
+        Returns:
+            Tuple of (cleared, total_found, newly_imported)
+        """
+        # Create backup first
+        ctx.report(0, 0, "Creating backup...")
+        self._db_service.create_backup()
+        ctx.check()
 
-            # Refresh the status display
-            self._refresh_status()
+        # Clear all animations
+        cleared = self._db_service.clear_all_animations()
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Rebuild Failed",
-                f"Failed to rebuild database:\n\n{str(e)}"
-            )
+        # Rescan library
+        total_found, newly_imported = self._db_service.sync_library(ctx.report, ctx.token)
+        return cleared, total_found, newly_imported
+
+    def _on_rebuild_finished(self, result):
+        """Show rebuild results"""
+        cleared, total_found, newly_imported = result
+        QMessageBox.information(
+            self,
+            "Rebuild Complete",
+            f"Database rebuilt successfully!\n\n"
+            f"Cleared: {cleared} old entries\n"
+            f"Found: {total_found} animation folders\n"
+            f"Imported: {newly_imported} animations\n\n"
+            f"Please close Settings and refresh the library."
+        )
+
+        # Refresh the status display
+        self._refresh_status()
+
+    def _on_rebuild_failed(self, error_message):
+        """Report a failed rebuild"""
+        QMessageBox.critical(
+            self,
+            "Rebuild Failed",
+            f"Failed to rebuild database:\n\n{error_message}"
+        )
 
 
 class BackupsDialog(QDialog):
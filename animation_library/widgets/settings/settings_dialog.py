@@ -106,14 +106,8 @@ class SettingsDialog(QDialog):
         self._sidebar.currentRowChanged.connect(self._stack.setCurrentIndex)
         self._sidebar.setCurrentRow(0)
 
-        # Apply sidebar styling using the theme palette
-        self._sidebar.setStyleSheet(self._sidebar_qss())
-
-        # Restyle live if the user changes the theme inside this dialog
-        try:
-            self.theme_manager.theme_changed.connect(self._refresh_sidebar_style)
-        except Exception:
-            pass
+        # Sidebar colors come from the application stylesheet (#settingsSidebar),
+        # so theme changes made inside this dialog restyle it automatically
 
         body_widget = QFrame()
         body_widget.setLayout(body)
@@ -148,57 +142,6 @@ class SettingsDialog(QDialog):
         self._stack.addWidget(widget)
         self._tabs.append((label, widget))
 
-    def _sidebar_qss(self) -> str:
-        """Sidebar styling — pulls colors from the active theme palette."""
-        theme = None
-        try:
-            theme = self.theme_manager.get_current_theme()
-        except Exception:
-            pass
-
-        if theme is None:
-            sidebar_bg = "#1a1a1a"
-            border = "#404040"
-            text = "#e0e0e0"
-            hover_bg = "#2d2d2d"
-            sel_bg = "#3A8FB7"
-            sel_text = "#ffffff"
-        else:
-            p = theme.palette
-            sidebar_bg = p.background_secondary
-            border = p.border
-            text = p.text_primary
-            hover_bg = p.list_item_hover
-            sel_bg = p.list_item_selected
-            sel_text = p.selection_text
-
-        return f"""
-        QListWidget#settingsSidebar {{
-            background: {sidebar_bg};
-            border: none;
-            border-right: 1px solid {border};
-            outline: 0;
-            padding-top: 6px;
-            color: {text};
-        }}
-        QListWidget#settingsSidebar::item {{
-            padding: 6px 14px;
-            border: none;
-            color: {text};
-        }}
-        QListWidget#settingsSidebar::item:hover {{
-            background: {hover_bg};
-        }}
-        QListWidget#settingsSidebar::item:selected {{
-            background: {sel_bg};
-            color: {sel_text};
-        }}
-        """
-
-    def _refresh_sidebar_style(self, *_):
-        """Re-apply the sidebar QSS when the active theme changes."""
-        self._sidebar.setStyleSheet(self._sidebar_qss())
-
     def _on_apply(self):
         """Handle Apply button - save settings without closing dialog"""
         self.blender_tab.save_settings()
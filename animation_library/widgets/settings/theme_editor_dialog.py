@@ -72,18 +72,7 @@ class ThemeEditorDialog(QDialog):
     def _copy_theme(self, theme: Theme) -> Theme:
         """Deep copy theme"""
         palette_copy = copy.deepcopy(theme.palette)
-        theme_copy = Theme(theme.name, palette_copy)
-
-        # Create a new get_stylesheet method that uses the copied palette
-        from ...themes.dark_theme import DarkTheme
-        def get_stylesheet_for_copy():
-            """Generate stylesheet using copied theme's palette"""
-            dark_theme = DarkTheme()
-            dark_theme.palette = theme_copy.palette  # Use copied palette
-            return dark_theme.get_stylesheet()
-
-        theme_copy.get_stylesheet = get_stylesheet_for_copy
-        return theme_copy
+        return Theme(theme.name, palette_copy)
 
     def _create_ui(self):
         """Create dialog UI"""
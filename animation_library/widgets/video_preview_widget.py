@@ -2,23 +2,30 @@
 VideoPreviewWidget - Self-contained video preview with playback controls
 
 Extracts video playback logic from MetadataPanel for better separation of concerns.
+Decoding runs on a VideoFrameDecoder thread; the GUI thread only displays
+pre-scaled frames from its buffer.
 """
 
-from typing import Optional
+import logging
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 from pathlib import Path
-import cv2
-import numpy as np
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QSlider,
     QHBoxLayout, QStyle, QSizePolicy
 )
 from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage, QKeyEvent
+from PyQt6.QtGui import QPixmap, QKeyEvent
 
+from ..config import Config
 from ..themes.theme_manager import get_theme_manager
 from ..utils.icon_loader import IconLoader
 from ..utils.icon_utils import colorize_white_svg
 
+if TYPE_CHECKING:
+    from ..services.video_frame_decoder import VideoFrameDecoder
+
+logger = logging.getLogger(__name__)
+
 
 class VideoPreviewWidget(QWidget):
     """
@@ -30,6 +37,7 @@ class VideoPreviewWidget(QWidget):
     - Loop toggle
     - Progress slider with seek
     - Theme-aware icons
+    - Background decoding with read-ahead (see VideoFrameDecoder)
 
     Signals:
         frame_changed(int): Emitted when current frame changes
@@ -43,8 +51,8 @@ class VideoPreviewWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Video capture state
-        self._cv_cap: Optional[cv2.VideoCapture] = None
+        # Video decoder state
+        self._decoder: Optional["VideoFrameDecoder"] = None
         self._cv_timer = QTimer(self)
         self._cv_timer.timeout.connect(self._update_video_frame)
         self._cv_fps = 24
@@ -78,6 +86,7 @@ class VideoPreviewWidget(QWidget):
         """Load media control icons with theme colors."""
         theme = get_theme_manager().get_current_theme()
         icon_color = theme.palette.header_icon_color if theme else "#1a1a1a"
+        self._icon_color = icon_color
 
         self._play_icon = colorize_white_svg(IconLoader.get("play"), icon_color)
         self._pause_icon = colorize_white_svg(IconLoader.get("pause"), icon_color)
@@ -218,21 +227,27 @@ class VideoPreviewWidget(QWidget):
             self._disable_controls()
             return False
 
-        # Open video
-        self._cv_cap = cv2.VideoCapture(video_path)
-        if not self._cv_cap.isOpened():
+        # Open video (decoder pulls in cv2, so it is imported on first use)
+        from ..services.video_frame_decoder import VideoFrameDecoder
+        decoder = VideoFrameDecoder(video_path)
+        if not decoder.is_opened:
+            decoder.stop()
             self._video_label.setText("Failed to load preview")
             self._disable_controls()
             return False
+        self._decoder = decoder
 
         # Store path
         self._current_video_path = video_path
 
         # Get video properties
-        self._cv_fps = self._cv_cap.get(cv2.CAP_PROP_FPS) or 24
-        self._cv_total_frames = int(self._cv_cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self._cv_fps = decoder.fps
+        self._cv_total_frames = decoder.total_frames
         self._cv_frame_count = 0
 
+        # Start decoding at display size
+        decoder.start(self._calculate_display_size())
+
         # Show first frame
         if self._show_current_frame():
             self._enable_controls()
@@ -254,7 +269,7 @@ class VideoPreviewWidget(QWidget):
 
     def play(self):
         """Start video playback."""
-        if not self._is_playing and self._cv_cap:
+        if not self._is_playing and self._decoder:
             self._start_playback()
 
     def pause(self):
@@ -268,36 +283,49 @@ class VideoPreviewWidget(QWidget):
 
     def seek_to_frame(self, frame: int):
         """
-        Seek to specific frame using timestamp-based seeking for accuracy.
+        Seek to specific frame.
 
         Args:
             frame: Target frame number
         """
-        if self._cv_cap and 0 <= frame < self._cv_total_frames:
-            # Use timestamp-based seeking for better accuracy with compressed video
-            # CAP_PROP_POS_FRAMES is unreliable with H.264 and other codecs
-            if self._cv_fps > 0:
-                target_ms = (frame / self._cv_fps) * 1000.0
-                self._cv_cap.set(cv2.CAP_PROP_POS_MSEC, target_ms)
-            else:
-                self._cv_cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
-
-            # Verify and adjust frame position after seek
-            actual_pos = int(self._cv_cap.get(cv2.CAP_PROP_POS_FRAMES))
-
-            # If we're not at the target, step forward to reach it
-            # (keyframe seeking may land us before the target)
-            while actual_pos < frame and actual_pos < self._cv_total_frames - 1:
-                ret = self._cv_cap.grab()  # grab() is faster than read()
-                if not ret:
-                    break
-                actual_pos += 1
-
+        if self._decoder and 0 <= frame < self._cv_total_frames:
             self._cv_frame_count = frame
             self._show_current_frame()
             self._update_slider_position()
             self.frame_changed.emit(frame)
 
+    def show_frame(self, frame: int, wait: bool = False) -> bool:
+        """
+        Display a frame without emitting signals (for externally clocked playback).
+
+        Args:
+            frame: Frame number
+            wait: Block until the frame is decoded instead of dropping it
+
+        Returns:
+            True if the frame was displayed
+        """
+        if not self._decoder:
+            return False
+        frame = max(0, min(frame, self._decoder.frame_limit - 1))
+        self._cv_frame_count = frame
+        return self._display_frame(frame, Config.VIDEO_SEEK_WAIT_MS if wait else 0)
+
+    def prepare_frame(self, frame: int) -> bool:
+        """
+        Ask the decoder for a frame without displaying or blocking.
+
+        Args:
+            frame: Frame number (clamped to the decodable range)
+
+        Returns:
+            True if the frame can be shown immediately
+        """
+        if not self._decoder:
+            return True  # Nothing to wait for
+        frame = max(0, min(frame, self._decoder.frame_limit - 1))
+        return self._decoder.request_frame(frame)
+
     def hide_controls(self):
         """Hide the built-in controls row (when using external timeline)."""
         self._controls_widget.hide()
@@ -345,13 +373,13 @@ class VideoPreviewWidget(QWidget):
 
     def step_forward(self):
         """Step forward one frame."""
-        if self._cv_cap and self._cv_frame_count < self._cv_total_frames - 1:
+        if self._decoder and self._cv_frame_count < self._cv_total_frames - 1:
             self.pause()
             self.seek_to_frame(self._cv_frame_count + 1)
 
     def step_backward(self):
         """Step backward one frame."""
-        if self._cv_cap and self._cv_frame_count > 0:
+        if self._decoder and self._cv_frame_count > 0:
             self.pause()
             self.seek_to_frame(self._cv_frame_count - 1)
 
@@ -363,10 +391,9 @@ class VideoPreviewWidget(QWidget):
     def recalculate_size(self):
         """Unlock size and refresh the current frame to recalculate."""
         self.unlock_size()
-        if self._cv_cap and self._cv_cap.isOpened():
-            # Re-seek to current position to refresh display
-            current = self._cv_frame_count
-            self._cv_cap.set(cv2.CAP_PROP_POS_FRAMES, current)
+        if self._decoder:
+            # Buffered frames are re-decoded at the new size
+            self._decoder.set_target_size(self._calculate_display_size())
             self._show_current_frame()
 
     @property
@@ -394,6 +421,17 @@ class VideoPreviewWidget(QWidget):
         """Get current playback speed multiplier."""
         return self._playback_speed
 
+    def get_playback_stats(self) -> Dict[str, Any]:
+        """
+        Get decoding/playback statistics for the current video.
+
+        Returns:
+            Dict with dropped frames, decode time and buffer metrics
+        """
+        if not self._decoder:
+            return {}
+        return self._decoder.get_stats()
+
     @property
     def video_label(self) -> QLabel:
         """Get the video display label widget."""
@@ -408,7 +446,7 @@ class VideoPreviewWidget(QWidget):
         """
         from PyQt6.QtCore import QRect
 
-        if not self._cv_cap or not self._cv_cap.isOpened():
+        if not self._decoder:
             return None
 
         pixmap = self._video_label.pixmap()
@@ -434,115 +472,101 @@ class VideoPreviewWidget(QWidget):
         Returns:
             Tuple of (width, height) or None if no video loaded
         """
-        if not self._cv_cap or not self._cv_cap.isOpened():
+        if not self._decoder:
             return None
 
-        width = int(self._cv_cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(self._cv_cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        return (width, height)
+        return self._decoder.native_size
 
     # ==================== INTERNAL METHODS ====================
 
     def _show_current_frame(self) -> bool:
-        """Display current video frame."""
-        if not self._cv_cap or not self._cv_cap.isOpened():
-            return False
+        """Display current video frame, waiting for the decoder if needed."""
+        return self._display_frame(self._cv_frame_count, Config.VIDEO_SEEK_WAIT_MS)
 
-        ret, frame = self._cv_cap.read()
-        if not ret:
-            return False
+    def _display_frame(self, frame: int, wait_ms: int) -> bool:
+        """
+        Display a decoded frame from the decoder buffer.
 
-        # Get frame dimensions
-        h, w = frame.shape[:2]
-        video_aspect = w / h
+        Args:
+            frame: Frame number
+            wait_ms: Max time to wait for the decoder (0 = don't block)
 
-        # Convert OpenCV BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        Returns:
+            True if the frame was available and displayed
+        """
+        if not self._decoder:
+            return False
 
-        # Convert to QImage
-        bytes_per_line = 3 * w
-        qt_frame = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        image = self._decoder.get_frame(frame, wait_ms)
+        if image is None:
+            return False
 
-        # Convert to QPixmap
-        pixmap = QPixmap.fromImage(qt_frame.copy())
+        # Frames arrive already scaled to the locked display size
+        self._video_label.setFixedSize(image.width(), image.height())
+        self._video_label.setPixmap(QPixmap.fromImage(image))
+        return True
 
+    def _calculate_display_size(self) -> Tuple[int, int]:
+        """Calculate (and lock) the display size that fits the widget."""
         # Use locked size if available, otherwise calculate
         if self._size_locked and self._locked_size:
-            new_w, new_h = self._locked_size
+            return self._locked_size
+
+        w, h = self._decoder.native_size if self._decoder else (0, 0)
+        video_aspect = (w / h) if w > 0 and h > 0 else 16 / 9
+
+        # Get available space from the widget itself
+        # Use our own size as the constraint, minus space for controls if visible
+        available_w = self.width()
+        available_h = self.height()
+
+        # Subtract controls height if controls are visible
+        if self._controls_widget.isVisible():
+            available_h -= self._controls_widget.height() + 8  # 8 for spacing
+
+        # Ensure we have valid dimensions (fallback to reasonable defaults)
+        if available_w <= 100:
+            available_w = 640
+        if available_h <= 100:
+            available_h = 480
+
+        # Calculate size maintaining aspect ratio
+        container_aspect = available_w / available_h
+
+        if container_aspect > video_aspect:
+            # Container is wider than video - height constrained
+            new_h = available_h
+            new_w = int(new_h * video_aspect)
         else:
-            # Get available space from the widget itself
-            # Use our own size as the constraint, minus space for controls if visible
-            available_w = self.width()
-            available_h = self.height()
-
-            # Subtract controls height if controls are visible
-            if self._controls_widget.isVisible():
-                available_h -= self._controls_widget.height() + 8  # 8 for spacing
-
-            # Ensure we have valid dimensions (fallback to reasonable defaults)
-            if available_w <= 100:
-                available_w = 640
-            if available_h <= 100:
-                available_h = 480
-
-            # Calculate size maintaining aspect ratio
-            container_aspect = available_w / available_h
-
-            if container_aspect > video_aspect:
-                # Container is wider than video - height constrained
-                new_h = available_h
-                new_w = int(new_h * video_aspect)
-            else:
-                # Container is taller than video - width constrained
-                new_w = available_w
-                new_h = int(new_w / video_aspect)
-
-            # Lock the size after first calculation
-            if not self._size_locked:
-                self._locked_size = (new_w, new_h)
-                self._size_locked = True
-
-        # Scale the pixmap
-        scaled = pixmap.scaled(
-            new_w, new_h,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+            # Container is taller than video - width constrained
+            new_w = available_w
+            new_h = int(new_w / video_aspect)
 
-        # Resize label to exactly fit the scaled video (no black bars)
-        self._video_label.setFixedSize(new_w, new_h)
-        self._video_label.setPixmap(scaled)
-        return True
+        # Lock the size after first calculation
+        self._locked_size = (new_w, new_h)
+        self._size_locked = True
+        return self._locked_size
 
     def _update_video_frame(self):
-        """Timer callback to update frame during playback."""
-        if self._reverse_playback:
-            # Reverse playback - step backwards
-            self._cv_frame_count -= 1
-            if self._cv_frame_count < 0:
-                if self._loop_button.isChecked():
-                    self._cv_frame_count = self._cv_total_frames - 1
-                else:
-                    self._stop_playback()
-                    return
-            self.seek_to_frame(self._cv_frame_count)
-        else:
-            # Forward playback
-            if not self._show_current_frame():
-                # End of video
-                if self._loop_button.isChecked():
-                    # Loop back to start
-                    self._cv_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    self._cv_frame_count = 0
-                    self._show_current_frame()
-                else:
-                    # Stop playback
-                    self._stop_playback()
-            else:
-                # Update progress
-                self._cv_frame_count += 1
-                self._update_slider_position()
-                self.frame_changed.emit(self._cv_frame_count)
+        """Timer callback to advance one frame during playback."""
+        frame_limit = self._decoder.frame_limit if self._decoder else 0
+        step = -1 if self._reverse_playback else 1
+        next_frame = self._cv_frame_count + step
+
+        if next_frame < 0 or next_frame >= frame_limit:
+            if not self._loop_button.isChecked():
+                self._stop_playback()
+                return
+            next_frame = frame_limit - 1 if self._reverse_playback else 0
+
+        self._cv_frame_count = next_frame
+
+        # Never block the timer: a frame the decoder hasn't produced yet is dropped
+        if not self._display_frame(next_frame, 0):
+            self._decoder.record_dropped_frame()
+
+        self._update_slider_position()
+        self.frame_changed.emit(self._cv_frame_count)
 
     def _update_slider_position(self):
         """Update slider to reflect current frame."""
@@ -559,14 +583,16 @@ class VideoPreviewWidget(QWidget):
 
     def _start_playback(self):
         """Start video playback."""
-        if self._cv_cap is None:
+        if self._decoder is None:
             return
 
+        self._decoder.set_direction(-1 if self._reverse_playback else 1)
+
         # Check if at end of video (for forward playback)
         if not self._reverse_playback and self._cv_frame_count >= self._cv_total_frames - 1:
             # Restart from beginning
-            self._cv_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
             self._cv_frame_count = 0
+            self._show_current_frame()
 
         # Check if at start (for reverse playback)
         if self._reverse_playback and self._cv_frame_count <= 0:
@@ -584,6 +610,8 @@ class VideoPreviewWidget(QWidget):
     def _stop_playback(self):
         """Stop video playback."""
         self._cv_timer.stop()
+        if self._is_playing and self._decoder:
+            logger.debug(f"Preview playback stats: {self._decoder.get_stats()}")
         self._is_playing = False
         self._play_pause_button.setIcon(self._play_icon)
         self.playback_state_changed.emit(False)
@@ -614,9 +642,9 @@ class VideoPreviewWidget(QWidget):
 
     def _seek_to_position(self, slider_value: int):
         """Seek video to position based on slider value."""
-        if self._cv_cap and self._cv_total_frames > 0:
-            target_frame = int((slider_value / 1000) * self._cv_total_frames)
-            self._cv_cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+        if self._decoder and self._cv_total_frames > 0:
+            target_frame = min(int((slider_value / 1000) * self._cv_total_frames),
+                               self._cv_total_frames - 1)
             self._cv_frame_count = target_frame
             self._show_current_frame()
             self.frame_changed.emit(self._cv_frame_count)
@@ -648,10 +676,10 @@ class VideoPreviewWidget(QWidget):
 
     def _cleanup_video(self):
         """Release video resources."""
-        if self._cv_cap:
+        if self._decoder:
             self._cv_timer.stop()
-            self._cv_cap.release()
-            self._cv_cap = None
+            self._decoder.stop()
+            self._decoder = None
         self._is_playing = False
 
     def closeEvent(self, event):
@@ -677,7 +705,10 @@ class VideoPreviewWidget(QWidget):
         super().closeEvent(event)
 
     def _on_theme_changed(self, theme_name: str):
-        """Reload icons when theme changes."""
+        """Reload icons when the theme's icon color changes."""
+        theme = get_theme_manager().get_current_theme()
+        if theme is None or theme.palette.header_icon_color == self._icon_color:
+            return
         self._load_icons()
 
         # Update current button icon
@@ -1313,6 +1313,21 @@ class ANIMLIB_OT_check_apply_queue(Operator):
 # Global flag to track if timer is running
 _queue_poll_timer_running = False
 _POLL_INTERVAL = 0.1  # Poll every 0.1 seconds (faster for responsive pose apply)
+_FALLBACK_POLL_INTERVAL = 1.0  # Slower poll while the desktop app is connected via socket
+
+
+def _get_poll_interval():
+    """
+    Queue files are only a fallback when the desktop app is connected to the
+    socket server (commands arrive over the socket), so poll less often then.
+    """
+    try:
+        from ..utils.socket_server import is_server_running, get_connected_clients_count
+        if is_server_running() and get_connected_clients_count() > 0:
+            return _FALLBACK_POLL_INTERVAL
+    except Exception:
+        pass
+    return _POLL_INTERVAL
 
 
 def _auto_poll_queue():
@@ -1330,7 +1345,7 @@ def _auto_poll_queue():
         pending_files = animation_queue_client.get_pending_apply_requests()
 
         if not pending_files:
-            return _POLL_INTERVAL  # Nothing to do
+            return _get_poll_interval()  # Nothing to do
 
         logger.debug(f"Found {len(pending_files)} pending queue file(s)")
 
@@ -1338,7 +1353,7 @@ def _auto_poll_queue():
         wm = bpy.context.window_manager
         if not wm.windows:
             logger.debug("No windows available")
-            return _POLL_INTERVAL
+            return _get_poll_interval()
 
         window = wm.windows[0]
 
@@ -1351,7 +1366,7 @@ def _auto_poll_queue():
 
         if not area:
             logger.debug("No VIEW_3D area found")
-            return _POLL_INTERVAL
+            return _get_poll_interval()
 
         # Find a region in the area
         region = None
@@ -1366,7 +1381,7 @@ def _auto_poll_queue():
 
         if not active_object or active_object.type != 'ARMATURE':
             logger.debug(f"No armature selected (active: {active_object})")
-            return _POLL_INTERVAL
+            return _get_poll_interval()
 
         logger.info(f"Auto-applying animation to: {active_object.name}")
 
@@ -1380,7 +1395,7 @@ def _auto_poll_queue():
         import traceback
         traceback.print_exc()
 
-    return _POLL_INTERVAL  # Continue polling
+    return _get_poll_interval()  # Continue polling
 
 
 def start_queue_poll_timer():
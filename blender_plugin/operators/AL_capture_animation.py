@@ -14,6 +14,15 @@ from ..utils.naming_engine import get_naming_engine, BlenderNamingEngine
 # Initialize logger
 logger = get_logger()
 
+# Database path column for each file type moved to cold storage
+_COLD_STORAGE_COLUMNS = {
+    '.blend': 'blend_file_path',
+    '.json': 'json_file_path',
+    '.webm': 'preview_path',
+    '.mp4': 'preview_path',
+    '.png': 'thumbnail_path',
+}
+
 
 class ANIMLIB_OT_cancel_versioning(Operator):
     """Cancel versioning mode"""
@@ -759,40 +768,43 @@ class ANIMLIB_OT_capture_animation(Operator):
     def _notify_desktop_app_capture(self, animation_name: str, metadata: dict):
         """
         Notify the desktop app that a new animation was captured.
-        
-        This writes a notification file to the queue directory that the
-        desktop app watches. When detected, it triggers a library refresh.
-        
+
+        Pushes the notification over the desktop app's notification socket;
+        falls back to a notification file in the queue directory that the
+        desktop app watches. Either way it triggers a library refresh.
+
         Args:
             animation_name: Name of the captured animation
             metadata: Saved animation metadata dict
         """
-        from pathlib import Path
+        import time
         from ..preferences import get_library_path
-        
+        from ..utils.notify_client import send_notification
+
         try:
             library_path = get_library_path()
             if not library_path:
                 return
-                
-            queue_dir = Path(library_path) / ".queue"
-            queue_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create notification file
+
             notification_data = {
                 'animation_id': metadata.get('id', ''),
                 'animation_name': animation_name,
                 'version': metadata.get('version', 1),
                 'version_label': metadata.get('version_label', 'v001'),
-                'timestamp': time.time()
+                # Lets the desktop app import just this asset instead of rescanning
+                'json_file_path': metadata.get('json_file_path', ''),
+                'version_group_id': metadata.get('version_group_id', ''),
             }
-            
-            notification_file = queue_dir / f"animation_captured_{int(time.time() * 1000)}.json"
-            with open(notification_file, 'w', encoding='utf-8') as f:
-                json.dump(notification_data, f)
-            
+
+            send_notification(
+                'animation_captured',
+                notification_data,
+                library_path,
+                f"animation_captured_{int(time.time() * 1000)}"
+            )
+
             logger.info(f"Notified desktop app: animation captured '{animation_name}'")
-            
+
         except Exception as e:
             logger.warning(f"Could not notify desktop app: {e}")
 
@@ -877,6 +889,211 @@ class ANIMLIB_OT_capture_animation(Operator):
 
         return result
 
+    def _group_files_by_version(self, animation_folder) -> dict:
+        """Group the files in a hot storage folder by version label
+
+        Args:
+            animation_folder: Hot storage folder (library/actions/{base_name}/)
+
+        Returns:
+            Dict of version_label -> list of file paths
+        """
+        import re
+
+        # Group files by their version (detected from filename pattern)
+        version_files = {}  # version_label -> list of files
+
+        for f in list(animation_folder.iterdir()):
+            if f.is_file():
+                # Try to detect version from filename (e.g., name_v002.blend -> v002)
+                match = re.search(r'_v(\d{3,4})\.\w+$', f.name)
+                if match:
+                    version_label = f"v{match.group(1)}"
+                else:
+                    # No version suffix - assume v001
+                    version_label = "v001"
+
+                if version_label not in version_files:
+                    version_files[version_label] = []
+                version_files[version_label].append(f)
+
+        return version_files
+
+    def _move_to_cold_storage(self, library_dir, animation_folder, safe_base_name):
+        """Move the current files of a version group to cold storage (_versions/)
+
+        The move runs as one journaled operation (shared FileJournal from the
+        library protocol): a crash or a locked file part-way leaves every file
+        either in hot or in cold storage, never split, and the next capture or
+        desktop app start finishes or undoes it. The superseded rows' new
+        paths travel in the same journal entry and are applied by the desktop
+        app when it handles the capture notification. When the hot folder holds a
+        single version and its cold folder does not exist yet, the whole
+        folder moves with one directory rename.
+
+        Args:
+            library_dir: Library root path
+            animation_folder: Hot storage folder (library/actions/{base_name}/)
+            safe_base_name: Sanitized base name (folder name)
+        """
+        from ..utils.protocol_loader import get_protocol_function, get_constant
+
+        version_files = self._group_files_by_version(animation_folder)
+        if not version_files:
+            return
+
+        FileJournal = get_protocol_function('FileJournal')
+        if FileJournal is None:
+            self._move_to_cold_storage_legacy(library_dir, safe_base_name, version_files)
+            return
+
+        journal = FileJournal(
+            library_dir / get_constant('META_DIR_NAME', '.meta')
+            / get_constant('FILE_JOURNAL_DIR_NAME', 'journal')
+        )
+        # Finish moves interrupted by an earlier crash (database-backed
+        # operations are left for the desktop app)
+        journal.recover()
+
+        cold_root = library_dir / "_versions" / safe_base_name
+        only_files = all(entry.is_file() for entry in animation_folder.iterdir())
+        steps = []
+        moves = []  # (current path, cold storage path)
+
+        if len(version_files) == 1 and only_files:
+            version_label, files = next(iter(version_files.items()))
+            cold_folder = cold_root / version_label
+            if not cold_folder.exists():
+                steps.append(FileJournal.rename(animation_folder, cold_folder))
+                moves = [(f, cold_folder / f.name) for f in files]
+
+        if not steps:
+            for version_label, files in version_files.items():
+                for f in files:
+                    dest = cold_root / version_label / f.name
+                    steps.append(FileJournal.rename(f, dest))
+                    moves.append((f, dest))
+
+        # Archived versions are no longer latest, and their database rows
+        # follow the files to cold storage
+        db_paths, db_undo = {}, {}
+        for src, dest in moves:
+            if dest.suffix != '.json':
+                continue
+            try:
+                steps.append(FileJournal.update_json(dest, {'is_latest': 0}, current_path=src))
+                with open(src, 'r', encoding='utf-8') as f:
+                    version_uuid = json.load(f).get('uuid')
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read {src.name}, is_latest not updated: {e}")
+                continue
+            if not version_uuid:
+                continue
+            db_paths[version_uuid], db_undo[version_uuid] = {}, {}
+            for other_src, other_dest in moves:
+                column = _COLD_STORAGE_COLUMNS.get(other_dest.suffix)
+                if column and other_dest.parent == dest.parent and other_dest.stem == dest.stem:
+                    db_paths[version_uuid][column] = str(other_dest)
+                    db_undo[version_uuid][column] = str(other_src)
+
+        # Blender has no database access: the desktop app applies the new
+        # paths when it handles the capture notification (or on next start)
+        if journal.run('promote_version', steps,
+                       db={'animations': db_paths} if db_paths else None,
+                       db_undo={'animations': db_undo} if db_paths else None):
+            logger.info(f"Moved {len(moves)} files to cold storage: {', '.join(version_files)}")
+        else:
+            logger.error(f"Failed to move {safe_base_name} to cold storage, files left in hot storage")
+
+        # A directory rename takes the hot folder with it
+        animation_folder.mkdir(parents=True, exist_ok=True)
+
+    def _move_to_cold_storage_legacy(self, library_dir, safe_base_name, version_files):
+        """Move files to cold storage one by one (library protocol without FileJournal)
+
+        Args:
+            library_dir: Library root path
+            safe_base_name: Sanitized base name (folder name)
+            version_files: Dict of version_label -> list of file paths
+        """
+        from pathlib import Path
+
+        # Move each version's files to cold storage with transaction-like rollback
+        # Track all successful moves for potential rollback
+        completed_moves = []  # List of (source, dest) tuples
+        json_files_to_update = []  # Track JSON files to update AFTER all moves succeed
+        move_failed = False
+
+        for version_label, files in version_files.items():
+            if move_failed:
+                break
+
+            cold_folder = library_dir / "_versions" / safe_base_name / version_label
+            cold_folder.mkdir(parents=True, exist_ok=True)
+
+            for f in files:
+                if move_failed:
+                    break
+
+                dest = cold_folder / f.name
+                try:
+                    shutil.move(str(f), str(dest))
+                    completed_moves.append((str(dest), str(f)))  # Store for rollback
+                    logger.info(f"Moved to cold storage: {f.name} -> {version_label}/")
+
+                    # Track JSON files to update AFTER all moves complete
+                    if f.suffix == '.json':
+                        json_files_to_update.append(dest)
+                except PermissionError as e:
+                    # File is locked (likely by desktop app viewing preview)
+                    # Try copy instead - source stays but copy exists in cold storage
+                    logger.warning(f"File locked, trying copy instead: {f.name}")
+                    try:
+                        shutil.copy2(str(f), str(dest))
+                        completed_moves.append((str(dest), str(f)))  # Track for potential rollback
+                        logger.info(f"Copied to cold storage (source locked): {f.name} -> {version_label}/")
+
+                        # Track JSON files to update
+                        if f.suffix == '.json':
+                            json_files_to_update.append(dest)
+
+                        # Try to delete original - if it fails, that's ok
+                        try:
+                            f.unlink()
+                            logger.info(f"Deleted locked source after copy: {f.name}")
+                        except PermissionError:
+                            logger.warning(f"Could not delete locked file {f.name} - will be orphaned in hot storage")
+                    except Exception as copy_error:
+                        logger.error(f"Failed to copy {f.name}: {copy_error}")
+                        move_failed = True
+                        break
+                except Exception as e:
+                    logger.error(f"Failed to move {f.name}: {e}")
+                    move_failed = True
+                    break
+
+        # Rollback if any move failed
+        if move_failed and completed_moves:
+            logger.warning(f"Rolling back {len(completed_moves)} cold storage moves due to failure")
+            for src, dest in reversed(completed_moves):
+                try:
+                    shutil.move(src, dest)
+                    logger.info(f"Rollback: moved {Path(src).name} back to hot storage")
+                except Exception as re:
+                    logger.error(f"Rollback failed for {Path(src).name}: {re}")
+        elif not move_failed and json_files_to_update:
+            # Only update is_latest AFTER all files moved successfully (no rollback needed)
+            for json_dest in json_files_to_update:
+                try:
+                    with open(json_dest, 'r', encoding='utf-8') as jf:
+                        json_data = json.load(jf)
+                    json_data['is_latest'] = 0
+                    with open(json_dest, 'w', encoding='utf-8') as jf:
+                        json.dump(json_data, jf, indent=2)
+                    logger.info(f"Updated {json_dest.name}: is_latest = 0")
+                except Exception as je:
+                    logger.warning(f"Failed to update is_latest in {json_dest.name}: {je}")
+
     def save_action_to_library(self, action, animation_name, rig_type, scene, version_info=None, naming_info=None):
         """Save action to library .blend file and create JSON metadata
 
@@ -928,98 +1145,7 @@ class ANIMLIB_OT_capture_animation(Operator):
 
             # HOT/COLD STORAGE: If creating a new version, move ALL existing files to _versions/
             if version_info and version_info.get('version_group_id'):
-                # Group files by their version (detected from filename pattern)
-                version_files = {}  # version_label -> list of files
-
-                for f in list(animation_folder.iterdir()):
-                    if f.is_file():
-                        # Try to detect version from filename (e.g., name_v002.blend -> v002)
-                        match = re.search(r'_v(\d{3,4})\.\w+$', f.name)
-                        if match:
-                            version_label = f"v{match.group(1)}"
-                        else:
-                            # No version suffix - assume v001
-                            version_label = "v001"
-
-                        if version_label not in version_files:
-                            version_files[version_label] = []
-                        version_files[version_label].append(f)
-
-                # Move each version's files to cold storage with transaction-like rollback
-                # Track all successful moves for potential rollback
-                completed_moves = []  # List of (source, dest) tuples
-                json_files_to_update = []  # Track JSON files to update AFTER all moves succeed
-                move_failed = False
-
-                for version_label, files in version_files.items():
-                    if move_failed:
-                        break
-
-                    cold_folder = library_dir / "_versions" / safe_base_name / version_label
-                    cold_folder.mkdir(parents=True, exist_ok=True)
-
-                    for f in files:
-                        if move_failed:
-                            break
-
-                        dest = cold_folder / f.name
-                        try:
-                            shutil.move(str(f), str(dest))
-                            completed_moves.append((str(dest), str(f)))  # Store for rollback
-                            logger.info(f"Moved to cold storage: {f.name} -> {version_label}/")
-
-                            # Track JSON files to update AFTER all moves complete
-                            if f.suffix == '.json':
-                                json_files_to_update.append(dest)
-                        except PermissionError as e:
-                            # File is locked (likely by desktop app viewing preview)
-                            # Try copy instead - source stays but copy exists in cold storage
-                            logger.warning(f"File locked, trying copy instead: {f.name}")
-                            try:
-                                shutil.copy2(str(f), str(dest))
-                                completed_moves.append((str(dest), str(f)))  # Track for potential rollback
-                                logger.info(f"Copied to cold storage (source locked): {f.name} -> {version_label}/")
-                                
-                                # Track JSON files to update
-                                if f.suffix == '.json':
-                                    json_files_to_update.append(dest)
-                                    
-                                # Try to delete original - if it fails, that's ok
-                                try:
-                                    f.unlink()
-                                    logger.info(f"Deleted locked source after copy: {f.name}")
-                                except PermissionError:
-                                    logger.warning(f"Could not delete locked file {f.name} - will be orphaned in hot storage")
-                            except Exception as copy_error:
-                                logger.error(f"Failed to copy {f.name}: {copy_error}")
-                                move_failed = True
-                                break
-                        except Exception as e:
-                            logger.error(f"Failed to move {f.name}: {e}")
-                            move_failed = True
-                            break
-
-                # Rollback if any move failed
-                if move_failed and completed_moves:
-                    logger.warning(f"Rolling back {len(completed_moves)} cold storage moves due to failure")
-                    for src, dest in reversed(completed_moves):
-                        try:
-                            shutil.move(src, dest)
-                            logger.info(f"Rollback: moved {Path(src).name} back to hot storage")
-                        except Exception as re:
-                            logger.error(f"Rollback failed for {Path(src).name}: {re}")
-                elif not move_failed and json_files_to_update:
-                    # Only update is_latest AFTER all files moved successfully (no rollback needed)
-                    for json_dest in json_files_to_update:
-                        try:
-                            with open(json_dest, 'r', encoding='utf-8') as jf:
-                                json_data = json.load(jf)
-                            json_data['is_latest'] = 0
-                            with open(json_dest, 'w', encoding='utf-8') as jf:
-                                json.dump(json_data, jf, indent=2)
-                            logger.info(f"Updated {json_dest.name}: is_latest = 0")
-                        except Exception as je:
-                            logger.warning(f"Failed to update is_latest in {json_dest.name}: {je}")
+                self._move_to_cold_storage(library_dir, animation_folder, safe_base_name)
 
             # Files use animation name (with version) for clarity: walk_cycle_v001.blend
             blend_path = animation_folder / f"{safe_anim_name}.blend"
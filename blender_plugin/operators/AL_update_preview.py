@@ -1,5 +1,4 @@
 import bpy
-import json
 import os
 import glob
 import shutil
@@ -11,7 +10,6 @@ from ..utils.utils import (get_action_keyframe_range, get_active_armature,
 from ..utils.logger import get_logger
 from pathlib import Path
 from ..preferences import get_preview_settings, get_library_path
-from datetime import datetime
 
 # Initialize logger
 logger = get_logger()
@@ -276,50 +274,44 @@ class ANIMLIB_OT_update_preview(Operator):
         return False
 
     def notify_preview_updating(self, uuid, library_path, animation_name, preview_path):
-        """Write notification file to tell desktop app to release the preview file"""
+        """Tell desktop app to release the preview file (socket, or queue file fallback)"""
+        from ..utils.notify_client import send_notification
+
         try:
-            queue_dir = Path(library_path) / ".queue"
-            queue_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create notification file - desktop app will release the file
-            notification_file = queue_dir / f"preview_updating_{uuid[:8]}.json"
-            notification_data = {
-                "type": "preview_updating",
-                "animation_id": uuid,
-                "animation_name": animation_name,
-                "preview_path": preview_path,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            with open(notification_file, 'w', encoding='utf-8') as f:
-                json.dump(notification_data, f)
-
-            logger.info(f"Notified desktop app to release file: {notification_file}")
-            return True
+            delivered = send_notification(
+                'preview_updating',
+                {
+                    "animation_id": uuid,
+                    "animation_name": animation_name,
+                    "preview_path": preview_path,
+                },
+                library_path,
+                f"preview_updating_{uuid[:8]}"
+            )
+
+            if delivered:
+                logger.info(f"Notified desktop app to release file: {preview_path}")
+            return delivered
 
         except Exception as e:
             logger.warning(f"Failed to notify desktop app: {e}")
             return False
 
     def notify_desktop_app(self, uuid, library_path, animation_name):
-        """Write notification file for desktop app to refresh preview"""
+        """Tell desktop app to refresh preview (socket, or queue file fallback)"""
+        from ..utils.notify_client import send_notification
+
         try:
-            queue_dir = Path(library_path) / ".queue"
-            queue_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create notification file
-            notification_file = queue_dir / f"preview_updated_{uuid[:8]}.json"
-            notification_data = {
-                "type": "preview_updated",
-                "animation_id": uuid,
-                "animation_name": animation_name,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            with open(notification_file, 'w', encoding='utf-8') as f:
-                json.dump(notification_data, f)
-
-            logger.info(f"Notified desktop app: {notification_file}")
+            if send_notification(
+                'preview_updated',
+                {
+                    "animation_id": uuid,
+                    "animation_name": animation_name,
+                },
+                library_path,
+                f"preview_updated_{uuid[:8]}"
+            ):
+                logger.info(f"Notified desktop app: preview updated '{animation_name}'")
 
         except Exception as e:
             logger.warning(f"Failed to notify desktop app: {e}")
@@ -0,0 +1,142 @@
+"""
+Notification client for Animation Library - Blender→Desktop messages
+
+Pushes notifications (animation captured, preview updating/updated) to the
+desktop app's local notification server, so the app reacts immediately
+instead of discovering queue files by polling.
+
+Falls back to writing the notification as a JSON file into the queue
+directory when the desktop app is not reachable (not running, older
+version, socket blocked). The file format is unchanged, so older desktop
+builds keep working.
+
+Uses the protocol package from library/.schema/protocol/ for constants
+and message building.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .logger import get_logger
+from .protocol_loader import get_constant, build_message
+
+logger = get_logger()
+
+QUEUE_DIR_NAME = get_constant('QUEUE_DIR_NAME', '.queue')
+SOCKET_HOST = get_constant('SOCKET_HOST', '127.0.0.1')
+DEFAULT_NOTIFY_PORT = get_constant('DEFAULT_NOTIFY_PORT', 9877)
+NOTIFY_PORT_ENV_VAR = get_constant('NOTIFY_PORT_ENV_VAR', 'ANIMLIB_NOTIFY_PORT')
+NOTIFY_ENDPOINT_FILE = get_constant('NOTIFY_ENDPOINT_FILE', 'notify_endpoint.json')
+NOTIFY_SEND_TIMEOUT = get_constant('NOTIFY_SEND_TIMEOUT', 0.5)
+
+# Cached endpoint: (endpoint file mtime, (host, port))
+_endpoint_cache: Optional[Tuple[float, Tuple[str, int]]] = None
+
+
+def _get_endpoint(queue_dir: Path) -> Tuple[str, int]:
+    """
+    Resolve the desktop app's notification endpoint.
+
+    Order: environment override, endpoint file advertised by the desktop
+    app (cached by mtime), protocol default.
+    """
+    global _endpoint_cache
+
+    env_port = os.environ.get(NOTIFY_PORT_ENV_VAR)
+    if env_port:
+        try:
+            return SOCKET_HOST, int(env_port)
+        except ValueError:
+            pass
+
+    endpoint_file = queue_dir / NOTIFY_ENDPOINT_FILE
+    try:
+        mtime = endpoint_file.stat().st_mtime
+        if _endpoint_cache and _endpoint_cache[0] == mtime:
+            return _endpoint_cache[1]
+        with open(endpoint_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        endpoint = (data.get('host', SOCKET_HOST), int(data.get('port', DEFAULT_NOTIFY_PORT)))
+        _endpoint_cache = (mtime, endpoint)
+        return endpoint
+    except (OSError, ValueError, TypeError):
+        _endpoint_cache = None
+
+    return SOCKET_HOST, DEFAULT_NOTIFY_PORT
+
+
+def _send_over_socket(message: dict, queue_dir: Path) -> bool:
+    """Send a message to the desktop app and wait for its acknowledgement"""
+    host, port = _get_endpoint(queue_dir)
+    try:
+        with socket.create_connection((host, port), timeout=NOTIFY_SEND_TIMEOUT) as sock:
+            sock.sendall((json.dumps(message) + '\n').encode('utf-8'))
+
+            buffer = b''
+            while b'\n' not in buffer:
+                data = sock.recv(4096)
+                if not data:
+                    return False
+                buffer += data
+
+        response = json.loads(buffer.split(b'\n', 1)[0].decode('utf-8'))
+        if response.get('status') != 'success':
+            logger.debug(f"Desktop app rejected notification: {response.get('message')}")
+            return False
+        return True
+    except (OSError, ValueError) as e:
+        logger.debug(f"Notification socket unavailable ({host}:{port}): {e}")
+        return False
+
+
+def _write_queue_file(message: dict, queue_dir: Path, file_stem: str) -> bool:
+    """Write the message as a queue notification file (fallback channel)"""
+    try:
+        queue_dir.mkdir(parents=True, exist_ok=True)
+        notification_file = queue_dir / f"{file_stem}.json"
+        temp_file = notification_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(message, f)
+        os.replace(temp_file, notification_file)
+        logger.debug(f"Wrote notification file: {notification_file}")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to write notification file: {e}")
+        return False
+
+
+def send_notification(message_type: str, data: dict, library_path, file_stem: str) -> bool:
+    """
+    Notify the desktop app, preferring the socket channel.
+
+    Args:
+        message_type: Protocol notification type (e.g. 'animation_captured')
+        data: Notification fields
+        library_path: Library root (queue directory lives inside it)
+        file_stem: File name (without .json) for the queue file fallback
+
+    Returns:
+        True if the notification was delivered or queued
+    """
+    if not library_path:
+        return False
+
+    queue_dir = Path(library_path) / QUEUE_DIR_NAME
+
+    try:
+        message = build_message(message_type, data)
+    except Exception as e:
+        logger.warning(f"Invalid {message_type} notification: {e}")
+        message = {'type': message_type, **data}
+
+    if _send_over_socket(message, queue_dir):
+        logger.debug(f"Notified desktop app via socket: {message_type}")
+        return True
+
+    return _write_queue_file(message, queue_dir, file_stem)
+
+
+__all__ = ['send_notification']
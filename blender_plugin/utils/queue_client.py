@@ -7,7 +7,9 @@ Maintains rig detection functionality for compatibility checking
 Uses the protocol package from library/.schema/protocol/ for constants.
 """
 
+import os
 import tempfile
+import time
 from pathlib import Path
 import json
 from .logger import get_logger
@@ -74,9 +76,13 @@ class AnimationLibraryQueueClient:
     }
     """
 
+    # Seconds after which a directory mtime is considered settled
+    MTIME_SETTLE_SECONDS = 2.0
+
     def __init__(self):
         """Initialize queue client"""
         self.queue_dir = None
+        self._empty_dir_mtime = None  # Directory mtime of last empty scan
         self._init_queue_dir()
 
     def _init_queue_dir(self):
@@ -93,6 +99,7 @@ class AnimationLibraryQueueClient:
             self.queue_dir = Path(tempfile.gettempdir()) / FALLBACK_QUEUE_DIR
 
         self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self._empty_dir_mtime = None
         logger.info(f"AnimationLibraryQueueClient initialized. Queue directory: {self.queue_dir}")
 
     def refresh_queue_dir(self):
@@ -103,9 +110,15 @@ class AnimationLibraryQueueClient:
         """
         Get pending apply requests from queue
 
+        Uses a single directory listing (no per-file stat). Queue files are
+        named apply_{timestamp_ms}_{id}.json, so name order is time order.
+        When the last scan found nothing and the directory mtime hasn't
+        changed since, the listing is skipped entirely - one stat per poll
+        instead of a full glob, which matters on network shares.
+
         Returns:
             list: List of Path objects for pending apply_*.json files,
-                  sorted by modification time (newest first)
+                  sorted newest first
         """
         # Always get fresh library path (preferences may have loaded after init)
         from ..preferences import get_library_path
@@ -116,15 +129,38 @@ class AnimationLibraryQueueClient:
             if current_queue_dir != self.queue_dir:
                 self.queue_dir = current_queue_dir
                 self.queue_dir.mkdir(parents=True, exist_ok=True)
+                self._empty_dir_mtime = None
+
+        if not self.queue_dir:
+            return []
+
+        try:
+            dir_mtime = self.queue_dir.stat().st_mtime
+        except OSError:
+            return []
 
-        if not self.queue_dir or not self.queue_dir.exists():
+        if dir_mtime == self._empty_dir_mtime:
             return []
 
         try:
-            pending_files = list(self.queue_dir.glob(QUEUE_FILE_PATTERN))
-            # Sort by modification time (newest first)
-            pending_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            logger.debug(f"Found {len(pending_files)} pending requests")
+            prefix, _, suffix = QUEUE_FILE_PATTERN.partition('*')
+            with os.scandir(self.queue_dir) as entries:
+                pending_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                ]
+            pending_files.sort(key=lambda f: f.name, reverse=True)
+
+            # Only trust an empty result once the directory mtime is safely in
+            # the past (coarse mtime resolution on FAT/SMB could hide a file
+            # written in the same tick as this scan)
+            if not pending_files and time.time() - dir_mtime > self.MTIME_SETTLE_SECONDS:
+                self._empty_dir_mtime = dir_mtime
+            else:
+                self._empty_dir_mtime = None
+
+            if pending_files:
+                logger.debug(f"Found {len(pending_files)} pending requests")
             return pending_files
         except Exception as e:
             logger.error(f"Error checking queue: {e}")
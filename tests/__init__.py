@@ -0,0 +1,6 @@
+"""
+Animation Library test suite.
+
+Run from the repository root:
+    python -m pytest tests
+"""
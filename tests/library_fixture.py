@@ -0,0 +1,104 @@
+"""
+Library Fixture - Throwaway library and user data folder for tests.
+
+Points Config at a temporary user data dir (so the real library config is
+never touched) and a temporary library, and writes animation folders the
+way the Blender plugin does.
+
+Usage:
+    library = TempLibrary()
+    data = library.add_animation('walk_v001')
+    ...
+    library.cleanup()
+"""
+
+import json
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from animation_library.config import Config
+from animation_library.services.directory_cache import get_directory_cache
+
+# File types an animation folder holds, with their database path column
+ASSET_FILES = {
+    '.blend': 'blend_file_path',
+    '.json': 'json_file_path',
+    '.webm': 'preview_path',
+    '.png': 'thumbnail_path',
+}
+
+
+class TempLibrary:
+    """
+    Temporary library configured as the current library.
+
+    Attributes:
+        root: Temporary folder holding the user data dir and the library
+        path: Library root (what the user picks in the setup wizard)
+    """
+
+    def __init__(self):
+        self.root = Path(tempfile.mkdtemp(prefix='animlib_test_'))
+        self.path = self.root / 'library_root'
+        self.path.mkdir()
+
+        self._saved_user_data_dir = Config._user_data_dir
+        Config._user_data_dir = self.root / 'user_data'
+        Config._user_data_dir.mkdir()
+        Config.save_library_path(self.path)
+        get_directory_cache().clear()
+
+    @property
+    def actions_folder(self) -> Path:
+        """library/actions/ inside the temporary library"""
+        return Config.get_actions_folder()
+
+    def add_animation(self, name: str, folder: Optional[Path] = None,
+                      **fields: Any) -> Dict[str, Any]:
+        """
+        Write an animation folder (.blend, .json, .webm, .png).
+
+        Args:
+            name: Animation name (also the file names)
+            folder: Folder to write to (default: actions/{name})
+            **fields: Extra JSON fields (e.g. version_group_id, version)
+
+        Returns:
+            The JSON data written, with 'json_file_path' set
+        """
+        folder = folder or self.actions_folder / Config.get_base_name(name)
+        folder.mkdir(parents=True, exist_ok=True)
+        animation_uuid = str(uuid.uuid4())
+        data = {
+            'id': animation_uuid,
+            'uuid': animation_uuid,
+            'name': name,
+            'rig_type': 'rig',
+            'frame_count': 30,
+            'fps': 24,
+            'version_group_id': animation_uuid,
+            'version': 1,
+            'version_label': 'v001',
+            'is_latest': 1,
+            'app_version': '1.3.0',  # Written by the Blender plugin (not a legacy asset)
+        }
+        data.update(fields)
+        for ext, column in ASSET_FILES.items():
+            data[column] = str(folder / f"{name}{ext}")
+        for ext in ('.blend', '.webm', '.png'):
+            (folder / f"{name}{ext}").write_bytes(b'test')
+        Path(data['json_file_path']).write_text(json.dumps(data, indent=2), encoding='utf-8')
+        return data
+
+    def cleanup(self):
+        """Restore the previous Config state and delete the temporary folders"""
+        Config._user_data_dir = self._saved_user_data_dir
+        Config.invalidate_path_cache()
+        get_directory_cache().clear()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+__all__ = ['TempLibrary', 'ASSET_FILES']
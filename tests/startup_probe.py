@@ -0,0 +1,84 @@
+"""
+Startup Probe - Cold start the application in a fresh interpreter.
+
+Run with HOME (LOCALAPPDATA on Windows) pointing at a throwaway folder, so
+the user data dir (library config, identity, logs) is a temporary one.
+
+Usage:
+    python -m tests.startup_probe build <result.json> <library_path> <asset_count>
+    python -m tests.startup_probe start <result.json>
+
+'build' configures the library and identity and fills the database with
+generated animation rows. 'start' runs main() as run.py does, quits once
+the window has painted, and writes the startup marks. Results go to a
+JSON file, as the application logs to stdout.
+"""
+
+import json
+import sys
+import uuid
+from pathlib import Path
+
+
+def build(result_path: Path, library_path: Path, asset_count: int):
+    """Configure a library holding asset_count animations"""
+    from animation_library.config import Config
+    from animation_library.services.database_service import DatabaseService
+    from animation_library.services.identity import Identity
+
+    library_path.mkdir(parents=True, exist_ok=True)
+    Config.save_library_path(library_path)
+    Config.save_identity(Identity(name='bench', display_name='Bench', color='#E91E63'))
+
+    db = DatabaseService()
+    root_folder_id = db.get_root_folder_id()
+    actions_folder = Config.get_actions_folder()
+    with db._connection.transaction() as conn:
+        cursor = conn.cursor()
+        for i in range(asset_count):
+            name = f'anim_{i:05d}'
+            folder = actions_folder / name
+            db.animations.insert(cursor, {
+                'uuid': str(uuid.uuid4()),
+                'folder_id': root_folder_id,
+                'name': name,
+                'rig_type': 'rig',
+                'frame_count': 30 + i % 50,
+                'fps': 24,
+                'tags': ['walk', f'tag_{i % 20}'],
+                'json_file_path': str(folder / f'{name}.json'),
+                'blend_file_path': str(folder / f'{name}.blend'),
+            })
+    result_path.write_text(json.dumps({'animations': db.get_animation_count()}))
+    db.close()
+
+
+def start(result_path: Path):
+    """Run main() until the first paint and write the startup marks"""
+    # Importing main starts the startup timer, as run.py does
+    from animation_library import main as app_main
+    from animation_library.utils.startup_timer import get_startup_timer
+
+    from PyQt6.QtWidgets import QApplication
+
+    timer = get_startup_timer()
+    report = timer.report
+
+    def report_and_quit(budget_ms=None):
+        first_paint = report(budget_ms)
+        result_path.write_text(json.dumps({'first_paint_ms': first_paint, 'marks': timer.get_marks()}))
+        QApplication.instance().quit()
+        return first_paint
+
+    timer.report = report_and_quit
+    try:
+        app_main.main()
+    except SystemExit:
+        pass
+
+
+if __name__ == '__main__':
+    if sys.argv[1] == 'build':
+        build(Path(sys.argv[2]), Path(sys.argv[3]), int(sys.argv[4]))
+    else:
+        start(Path(sys.argv[2]))
@@ -0,0 +1,155 @@
+"""
+Tests for Config's library path cache (config.py).
+
+Path getters sit on hot paths (scanning, capture, path resolution), so the
+library path is resolved and folders are created once per session. These
+tests count the filesystem calls the getters make during a 10k-asset sync
+and per-asset path resolution.
+"""
+
+import io
+import os
+import time
+import unittest
+from unittest import mock
+
+from animation_library.config import Config
+from animation_library.services.database_service import DatabaseService
+
+from .library_fixture import TempLibrary
+
+SYNC_ASSETS = 10000
+
+
+class SyscallCounter:
+    """
+    Count os.stat / os.mkdir / io.open calls (what Path.exists, Path.mkdir
+    and Path.read_text end up in), optionally only for some paths.
+    """
+
+    def __init__(self, paths=None):
+        self.paths = {os.fspath(path) for path in paths} if paths is not None else None
+        self.counts = {'stat': 0, 'mkdir': 0, 'open': 0}
+        self._patches = [
+            mock.patch('os.stat', self._wrap('stat', os.stat)),
+            mock.patch('os.mkdir', self._wrap('mkdir', os.mkdir)),
+            mock.patch('io.open', self._wrap('open', io.open)),
+        ]
+
+    def _wrap(self, name, function):
+        def wrapped(path, *args, **kwargs):
+            if self.paths is None or os.fspath(path) in self.paths:
+                self.counts[name] += 1
+            return function(path, *args, **kwargs)
+        return wrapped
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def __enter__(self):
+        for patch in self._patches:
+            patch.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        for patch in reversed(self._patches):
+            patch.stop()
+
+
+class TestLibraryPathCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.library = TempLibrary()
+        cls.names = [f'walk_{i:05d}_v001' for i in range(SYNC_ASSETS)]
+        for name in cls.names:
+            cls.library.add_animation(name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.library.cleanup()
+
+    def setUp(self):
+        Config.save_library_path(self.library.path)
+
+    def config_paths(self):
+        """The config file, the library root and every folder Config creates"""
+        return [
+            Config.get_library_config_path(), self.library.path,
+            Config.get_library_folder(), Config.get_actions_folder(), Config.get_poses_folder(),
+            Config.get_versions_folder(), Config.get_deleted_folder(), Config.get_database_folder(),
+        ]
+
+    def resolve_all(self, uncached=False):
+        """Resolve every asset's paths the way capture and rename do"""
+        for name in self.names:
+            if uncached:
+                Config.invalidate_path_cache()  # Every getter re-reads and re-creates
+            Config.get_animation_library_path(name)
+            Config.get_animation_version_path(name, 'v001')
+            Config.get_database_folder()
+
+    def test_sync_library_syscalls_do_not_grow_with_assets(self):
+        db = DatabaseService()
+        self.addCleanup(db.close)
+        paths = self.config_paths()
+        Config.invalidate_path_cache()
+
+        with SyscallCounter(paths) as syscalls:
+            self.assertEqual(db.sync_library(), (SYNC_ASSETS, SYNC_ASSETS))
+
+        # Config file read once; each folder created (or found) once
+        self.assertLessEqual(syscalls.counts['open'], 1)
+        self.assertLessEqual(syscalls.counts['mkdir'], len(paths))
+        self.assertLess(syscalls.total, 30)
+
+    def test_path_resolution_syscalls_before_and_after(self):
+        with SyscallCounter() as before:
+            self.resolve_all(uncached=True)
+        Config.invalidate_path_cache()
+        with SyscallCounter() as after:
+            self.resolve_all()
+
+        # Before: config file read, root stat'ed and folders mkdir'ed per call
+        self.assertGreaterEqual(before.counts['open'], SYNC_ASSETS)
+        self.assertGreaterEqual(before.counts['mkdir'], SYNC_ASSETS)
+        # After: only the first call of each getter touches the disk
+        self.assertLessEqual(after.counts['open'], 1)
+        self.assertLess(after.total, 20)
+
+    def test_save_library_path_invalidates(self):
+        other = self.library.root / 'other_library'
+        other.mkdir()
+        self.addCleanup(other.rmdir)
+        self.assertEqual(Config.load_library_path(), self.library.path)
+        Config.save_library_path(other)
+        self.assertEqual(Config.load_library_path(), other)
+
+    def test_missing_library_is_rechecked(self):
+        # A share that is not mounted yet at startup is picked up once it is
+        unmounted = self.library.root / 'unmounted'
+        os.rename(self.library.path, unmounted)
+        self.addCleanup(lambda: unmounted.exists() and os.rename(unmounted, self.library.path))
+        Config.invalidate_path_cache()
+        self.assertIsNone(Config.load_library_path())
+        with self.assertRaises(ValueError):
+            Config.get_actions_folder()
+        self.assertFalse(self.library.path.exists())  # Mount point left alone
+
+        os.rename(unmounted, self.library.path)
+        self.assertIsNone(Config.load_library_path())  # Remembered briefly
+
+        later = time.monotonic() + Config.LIBRARY_PATH_RETRY_SECONDS + 1
+        with mock.patch('animation_library.config.time.monotonic', return_value=later):
+            self.assertEqual(Config.load_library_path(), self.library.path)
+
+        # A resolved path is kept for the session
+        with SyscallCounter() as syscalls:
+            for _ in range(100):
+                Config.load_library_path()
+        self.assertEqual(syscalls.total, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Tests for the directory listing cache (services/directory_cache.py).
+
+Preview, thumbnail, blend and JSON resolution make several existence
+checks per asset; with the cache they must cost one listing per folder,
+O(folders) rather than O(lookups), and invalidation must force a re-read.
+"""
+
+import os
+import time
+import unittest
+from unittest import mock
+
+from animation_library.config import Config
+from animation_library.services.database_service import DatabaseService
+from animation_library.services.directory_cache import get_directory_cache
+
+from .library_fixture import ASSET_FILES, TempLibrary
+
+HOT_ASSETS = 300
+COLD_ASSETS = 100
+
+
+class FilesystemCounter:
+    """Record the folders passed to os.scandir and count os.stat calls"""
+
+    def __init__(self):
+        self.scanned = []
+        self.stats = 0
+        real_scandir, real_stat = os.scandir, os.stat
+
+        def scandir(path='.'):
+            self.scanned.append(os.fspath(path))
+            return real_scandir(path)
+
+        def stat(path, *args, **kwargs):
+            self.stats += 1
+            return real_stat(path, *args, **kwargs)
+
+        self._patches = [mock.patch('os.scandir', scandir), mock.patch('os.stat', stat)]
+
+    def __enter__(self):
+        for patch in self._patches:
+            patch.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        for patch in reversed(self._patches):
+            patch.stop()
+
+
+class TestDirectoryCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.library = TempLibrary()
+        cls.db = DatabaseService()
+        uuids = []
+        for i in range(HOT_ASSETS):
+            data = cls.library.add_animation(f'walk_{i:04d}_v001')
+            uuids.append(data['uuid'])
+
+        # Older versions in cold storage whose rows still name the hot
+        # folder: resolution falls back from the stored path to _versions/
+        versions_folder = Config.get_versions_folder()
+        for i in range(COLD_ASSETS):
+            name = f'run_{i:04d}_v001'
+            data = cls.library.add_animation(name, folder=versions_folder / f'run_{i:04d}' / 'v001')
+            uuids.append(data['uuid'])
+
+        cls.db.sync_library()
+        for i, uuid in enumerate(uuids[HOT_ASSETS:]):
+            stale = cls.library.actions_folder / f'run_{i:04d}'
+            cls.db.animations.update(uuid, {
+                column: str(stale / f'run_{i:04d}_v001{ext}') for ext, column in ASSET_FILES.items()
+            })
+        cls.animations = [cls.db.get_animation_by_uuid(uuid) for uuid in uuids]
+
+        # Folders written just now have "racy" mtimes that are never trusted
+        for folder, _, _ in os.walk(cls.library.path):
+            cls.age(folder)
+
+    @staticmethod
+    def age(folder):
+        """Give a folder an mtime well outside the racy window"""
+        an_hour_ago = time.time() - 3600
+        os.utime(folder, (an_hour_ago, an_hour_ago))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        cls.library.cleanup()
+
+    def setUp(self):
+        Config.save_library_path(self.library.path)
+        Config.get_library_folder()  # Resolve the library before counting
+        Config.get_versions_folder()
+        get_directory_cache().clear()
+
+    def resolve_all(self):
+        """Resolve every asset's files; returns the number of paths found"""
+        repository = self.db.animations
+        found = 0
+        for animation in self.animations:
+            for resolve in (repository.resolve_preview_file, repository.resolve_thumbnail_file,
+                            repository.resolve_blend_file, repository.resolve_json_file):
+                found += resolve(animation) is not None
+        return found
+
+    def test_one_listing_per_folder(self):
+        cache = get_directory_cache()
+        hits_before = cache.cache_hits
+        with FilesystemCounter() as fs:
+            self.assertEqual(self.resolve_all(), 4 * len(self.animations))
+
+        # Every asset folder listed exactly once, however many lookups it answered
+        self.assertEqual(len(fs.scanned), len(set(fs.scanned)))
+        self.assertEqual(len(fs.scanned), HOT_ASSETS + COLD_ASSETS)
+        # One stat per listing, plus the missing hot folders of cold assets
+        self.assertEqual(fs.stats, HOT_ASSETS + 2 * COLD_ASSETS)
+        self.assertGreater(cache.cache_hits - hits_before, 4 * len(self.animations))
+
+        # Within the revalidation window the filesystem is not touched again
+        with FilesystemCounter() as fs:
+            self.resolve_all()
+        self.assertEqual((fs.scanned, fs.stats), ([], 0))
+
+    def test_revalidation_is_one_stat_per_folder(self):
+        self.resolve_all()
+        later = time.monotonic() + Config.FS_CACHE_REVALIDATE_SECONDS + 1
+        with mock.patch('time.monotonic', return_value=later), FilesystemCounter() as fs:
+            self.resolve_all()
+        self.assertEqual(fs.scanned, [])
+        self.assertEqual(fs.stats, HOT_ASSETS + 2 * COLD_ASSETS)
+
+    def test_invalidate_forces_reread(self):
+        cache = get_directory_cache()
+        folder = self.library.actions_folder / 'walk_0000'
+        new_file = folder / 'walk_0000_v001.mp4'
+        self.assertFalse(cache.exists(new_file))
+        new_file.write_bytes(b'test')
+        self.addCleanup(self.age, folder)
+        self.addCleanup(new_file.unlink)
+        self.assertFalse(cache.exists(new_file))  # Cached listing
+
+        cache.invalidate(new_file)
+        with FilesystemCounter() as fs:
+            self.assertTrue(cache.exists(new_file))
+        self.assertEqual(fs.scanned, [os.fspath(folder)])
+
+    def test_invalidate_tree_forces_reread(self):
+        self.resolve_all()
+        cache = get_directory_cache()
+        cache.invalidate_tree(self.library.actions_folder)
+        with FilesystemCounter() as fs:
+            self.resolve_all()
+        self.assertEqual(sorted(fs.scanned), sorted(
+            os.fspath(self.library.actions_folder / f'walk_{i:04d}') for i in range(HOT_ASSETS)
+        ))
+
+        # Folders outside the tree keep their listings
+        cold_folder = Config.get_versions_folder() / f'run_{COLD_ASSETS - 1:04d}' / 'v001'
+        self.assertTrue(cold_folder.is_dir())
+        self.assertNotIn(os.fspath(cold_folder), fs.scanned)
+
+    def test_missing_folder_is_cached(self):
+        cache = get_directory_cache()
+        missing = self.library.actions_folder / 'missing'
+        with FilesystemCounter() as fs:
+            for ext in ('.blend', '.json', '.webm', '.png'):
+                self.assertFalse(cache.exists(missing / f'missing{ext}'))
+        self.assertEqual((fs.scanned, fs.stats), ([], 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,318 @@
+"""
+Tests for the file operation journal (protocol/file_journal.py).
+
+Every journaled operation - animation rename, actions/poses folder
+migration and version promotion to cold storage - is interrupted before
+and after each of its steps, either by an error (the operation rolls
+itself back) or by a simulated crash (the intent file is left behind and
+recover() finishes it). Afterwards the files, the JSON metadata and the
+database must agree and the journal must be empty.
+"""
+
+import json
+import os
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+from animation_library.config import Config
+from animation_library.protocol.file_journal import FileJournal
+from animation_library.services.database_service import DatabaseService
+
+from .library_fixture import ASSET_FILES, TempLibrary
+
+
+class SimulatedCrash(BaseException):
+    """Process death: not caught by the journal's error handling"""
+
+
+@contextmanager
+def fail_at(index, when, error, db):
+    """
+    Raise `error` before or after the index-th journal step.
+
+    Steps are counted across file renames, JSON updates and database
+    payloads, in the order the journal runs them.
+    """
+    calls = [0]
+
+    def inject(function):
+        def wrapped(*args, **kwargs):
+            call = calls[0]
+            calls[0] += 1
+            if call == index and when == 'before':
+                raise error('injected')
+            result = function(*args, **kwargs)
+            if call == index and when == 'after':
+                raise error('injected')
+            return result
+        return wrapped
+
+    with mock.patch.object(FileJournal, '_do_rename', inject(FileJournal._do_rename)), \
+         mock.patch.object(FileJournal, '_set_json_keys', inject(FileJournal._set_json_keys)), \
+         mock.patch.object(db, '_apply_journaled_updates', inject(db._apply_journaled_updates)):
+        yield calls
+
+
+def age_intents(journal):
+    """Make pending intents look abandoned by a process that has exited"""
+    for path, intent in journal.pending():
+        intent['created'] -= 3600
+        intent['pid'] = None
+        path.write_text(json.dumps(intent), encoding='utf-8')
+
+
+class JournalTestCase(unittest.TestCase):
+    """Fresh library and database per fault-injection case"""
+
+    def new_library(self):
+        """Create a library and DatabaseService, cleaned up after the test"""
+        library = TempLibrary()
+        self.addCleanup(library.cleanup)
+        db = DatabaseService()
+        self.addCleanup(db.close)
+        return library, db
+
+    def import_animation(self, library, db, name, folder=None):
+        """Write an animation folder and import it"""
+        data = library.add_animation(name, folder)
+        animation, _ = db.import_captured_animation(data['uuid'], data['json_file_path'])
+        self.assertIsNotNone(animation)
+        return animation
+
+    def assert_consistent(self, db, uuid, folder, **json_values):
+        """Database paths, files on disk and JSON agree; nothing is pending"""
+        row = db.get_animation_by_uuid(uuid)
+        for column in ASSET_FILES.values():
+            path = Path(row[column])
+            self.assertEqual(path.parent, folder, column)
+            self.assertTrue(path.is_file(), path)
+        self.assertEqual(
+            sorted(os.listdir(folder)),
+            sorted(Path(row[column]).name for column in ASSET_FILES.values())
+        )
+        with open(row['json_file_path'], 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for key, value in json_values.items():
+            self.assertEqual(data[key], value, key)
+        self.assertEqual(db._journal.pending(), [])
+        return row
+
+
+class TestRenameAnimation(JournalTestCase):
+    """rename_animation(): folder rename, 4 file renames, JSON name, database"""
+
+    STEPS = 7
+
+    def test_error_at_each_step_rolls_back(self):
+        for when in ('before', 'after'):
+            for index in range(self.STEPS):
+                with self.subTest(when=when, step=index):
+                    library, db = self.new_library()
+                    animation = self.import_animation(library, db, 'walk_v001')
+                    with fail_at(index, when, OSError, db) as calls:
+                        self.assertFalse(db.rename_animation(animation['uuid'], 'run_v001'))
+                    self.assertGreater(calls[0], index)
+
+                    row = self.assert_consistent(
+                        db, animation['uuid'], library.actions_folder / 'walk', name='walk_v001'
+                    )
+                    self.assertEqual(row['name'], 'walk_v001')
+                    self.assertFalse((library.actions_folder / 'run').exists())
+
+    def test_crash_at_each_step_is_finished_by_recovery(self):
+        for when in ('before', 'after'):
+            for index in range(self.STEPS):
+                with self.subTest(when=when, step=index):
+                    library, db = self.new_library()
+                    animation = self.import_animation(library, db, 'walk_v001')
+                    with fail_at(index, when, SimulatedCrash, db):
+                        with self.assertRaises(SimulatedCrash):
+                            db.rename_animation(animation['uuid'], 'run_v001')
+                    self.assertEqual(len(db._journal.pending()), 1)
+
+                    # Still owned by a live process: left alone
+                    self.assertEqual(db.recover_file_operations()['skipped'], 1)
+                    age_intents(db._journal)
+                    self.assertEqual(db.recover_file_operations()['completed'], 1)
+
+                    row = self.assert_consistent(
+                        db, animation['uuid'], library.actions_folder / 'run', name='run_v001'
+                    )
+                    self.assertEqual(row['name'], 'run_v001')
+                    self.assertFalse((library.actions_folder / 'walk').exists())
+
+    def test_blocked_roll_forward_rolls_back(self):
+        # Crash after the folder rename, then something takes the name the
+        # next file rename needs: recovery undoes the operation instead
+        for index in range(1, 5):
+            with self.subTest(step=index):
+                library, db = self.new_library()
+                animation = self.import_animation(library, db, 'walk_v001')
+                with fail_at(index, 'before', SimulatedCrash, db):
+                    with self.assertRaises(SimulatedCrash):
+                        db.rename_animation(animation['uuid'], 'run_v001')
+                _, intent = db._journal.pending()[0]
+                blocker = Path(intent['steps'][index]['dst'])
+                blocker.write_bytes(b'other')
+                age_intents(db._journal)
+
+                self.assertEqual(db.recover_file_operations()['rolled_back'], 1)
+                # The blocker moved back with the folder; it is not ours to delete
+                moved_blocker = library.actions_folder / 'walk' / blocker.name
+                self.assertEqual(moved_blocker.read_bytes(), b'other')
+                moved_blocker.unlink()
+                self.assert_consistent(
+                    db, animation['uuid'], library.actions_folder / 'walk', name='walk_v001'
+                )
+
+
+class TestFolderMigration(JournalTestCase):
+    """_migrate_to_actions_poses_folders(): folder rename, database"""
+
+    STEPS = 2
+
+    def legacy_animation(self):
+        """An animation stored directly in library/{name}/ (pre actions/poses)"""
+        library, db = self.new_library()
+        animation = self.import_animation(
+            library, db, 'jump_v001', folder=Config.get_library_folder() / 'jump'
+        )
+        return library, db, animation
+
+    def test_error_at_each_step_rolls_back(self):
+        for when in ('before', 'after'):
+            for index in range(self.STEPS):
+                with self.subTest(when=when, step=index):
+                    library, db, animation = self.legacy_animation()
+                    with fail_at(index, when, OSError, db):
+                        self.assertEqual(db._migrate_to_actions_poses_folders(), 0)
+
+                    self.assert_consistent(db, animation['uuid'], Config.get_library_folder() / 'jump')
+                    self.assertFalse((library.actions_folder / 'jump').exists())
+
+    def test_crash_at_each_step_is_finished_by_recovery(self):
+        for when in ('before', 'after'):
+            for index in range(self.STEPS):
+                with self.subTest(when=when, step=index):
+                    library, db, animation = self.legacy_animation()
+                    with fail_at(index, when, SimulatedCrash, db):
+                        with self.assertRaises(SimulatedCrash):
+                            db._migrate_to_actions_poses_folders()
+                    age_intents(db._journal)
+                    self.assertEqual(db.recover_file_operations()['completed'], 1)
+
+                    self.assert_consistent(db, animation['uuid'], library.actions_folder / 'jump')
+                    self.assertFalse((Config.get_library_folder() / 'jump').exists())
+
+
+class TestVersionPromotion(JournalTestCase):
+    """
+    Moving the previous version to cold storage, as the Blender plugin
+    journals it (AL_capture_animation._move_to_cold_storage): the process
+    has no database access, so it hands the new paths off to the app.
+    """
+
+    STEPS = 2  # Folder rename, is_latest JSON update
+
+    def promote(self, library, db, animation):
+        """Run the promotion the way Blender does (no apply_db)"""
+        hot = Path(animation['blend_file_path']).parent
+        cold = Config.get_versions_folder() / hot.name / 'v001'
+        journal = FileJournal(library.path / Config.META_FOLDER_NAME / 'journal')
+        steps = [
+            FileJournal.rename(hot, cold),
+            FileJournal.update_json(
+                cold / Path(animation['json_file_path']).name, {'is_latest': 0},
+                current_path=animation['json_file_path']
+            ),
+        ]
+        uuid = animation['uuid']
+        db_paths = {column: str(cold / Path(animation[column]).name) for column in ASSET_FILES.values()}
+        db_undo = {column: animation[column] for column in ASSET_FILES.values()}
+        result = journal.run(
+            'promote_version', steps,
+            db={'animations': {uuid: db_paths}}, db_undo={'animations': {uuid: db_undo}}
+        )
+        return result, hot, cold
+
+    def test_handed_off_paths_applied_by_app(self):
+        library, db = self.new_library()
+        animation = self.import_animation(library, db, 'idle_v001')
+        result, hot, cold = self.promote(library, db, animation)
+        self.assertTrue(result)
+        self.assertFalse(hot.exists())
+        self.assertEqual(len(db._journal.pending()), 1)
+
+        # Applied even though the owning process is alive and the entry new
+        self.assertEqual(db.recover_file_operations()['completed'], 1)
+        self.assert_consistent(db, animation['uuid'], cold, is_latest=0)
+
+    def test_error_at_each_step_rolls_back(self):
+        for when in ('before', 'after'):
+            for index in range(self.STEPS):
+                with self.subTest(when=when, step=index):
+                    library, db = self.new_library()
+                    animation = self.import_animation(library, db, 'idle_v001')
+                    with fail_at(index, when, OSError, db):
+                        result, hot, cold = self.promote(library, db, animation)
+                    self.assertFalse(result)
+
+                    db.recover_file_operations()
+                    self.assert_consistent(db, animation['uuid'], hot, is_latest=1)
+                    self.assertFalse(cold.exists())
+
+    def test_crash_at_each_step_is_finished_by_recovery(self):
+        for when in ('before', 'after'):
+            for index in range(self.STEPS):
+                with self.subTest(when=when, step=index):
+                    library, db = self.new_library()
+                    animation = self.import_animation(library, db, 'idle_v001')
+                    with fail_at(index, when, SimulatedCrash, db):
+                        with self.assertRaises(SimulatedCrash):
+                            self.promote(library, db, animation)
+                    age_intents(db._journal)
+                    self.assertEqual(db.recover_file_operations()['completed'], 1)
+
+                    cold = Config.get_versions_folder() / 'idle' / 'v001'
+                    self.assert_consistent(db, animation['uuid'], cold, is_latest=0)
+
+    def test_database_failure_is_retried(self):
+        for error in (OSError, SimulatedCrash):
+            with self.subTest(error=error.__name__):
+                library, db = self.new_library()
+                animation = self.import_animation(library, db, 'idle_v001')
+                result, hot, cold = self.promote(library, db, animation)
+                self.assertTrue(result)
+
+                with fail_at(0, 'before', error, db):
+                    try:
+                        self.assertEqual(db.recover_file_operations()['failed'], 1)
+                    except SimulatedCrash:
+                        pass
+                # Files stay in cold storage; the entry waits for the database
+                self.assertFalse(hot.exists())
+                self.assertEqual(len(db._journal.pending()), 1)
+
+                self.assertEqual(db.recover_file_operations()['completed'], 1)
+                self.assert_consistent(db, animation['uuid'], cold, is_latest=0)
+
+
+class TestRecoveryCost(JournalTestCase):
+    """Recovery reads pending intent files only"""
+
+    def test_nothing_pending_does_not_touch_the_library(self):
+        library, db = self.new_library()
+        for i in range(20):
+            self.import_animation(library, db, f'walk_{i:02d}_v001')
+        with mock.patch.object(db, '_apply_journaled_updates') as apply_db, \
+             mock.patch('os.rename') as rename:
+            counts = db.recover_file_operations()
+        self.assertEqual(counts, {'completed': 0, 'rolled_back': 0, 'skipped': 0, 'failed': 0})
+        apply_db.assert_not_called()
+        rename.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for the colorized icon cache (utils/icon_registry.py).
+"""
+
+import os
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+
+from animation_library.utils.icon_loader import IconLoader
+from animation_library.utils.icon_registry import IconRegistry
+from animation_library.utils.icon_utils import colorize_svg_content
+
+
+def setUpModule():
+    global _app
+    _app = QApplication.instance() or QApplication([])
+
+
+class TestIconRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = IconRegistry()
+
+    def test_svg_read_once_per_path(self):
+        svg_path = IconLoader.get('refresh')
+        for color in ('#ff0000', '#00ff00', '#FF0000'):
+            icon = self.registry.get_icon(svg_path, color, colorize_svg_content)
+            self.assertFalse(icon.isNull())
+        self.assertEqual(self.registry.disk_reads, 1)
+        self.assertEqual(self.registry.cache_misses, 2)  # Color case is normalized
+
+    def test_missing_svg_reported_once_and_cached(self):
+        with self.assertLogs('animation_library.utils.icon_registry', 'WARNING') as logs:
+            for _ in range(100):
+                icon = self.registry.get_icon('/missing/icon.svg', '#ff0000', colorize_svg_content)
+                self.assertTrue(icon.isNull())
+            self.registry.get_icon('/missing/icon.svg', '#00ff00', colorize_svg_content)
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(self.registry.disk_reads, 1)
+        self.assertEqual(self.registry.cache_hits, 99)
+
+    def test_colorize_error_logged_once_per_icon(self):
+        def broken_colorizer(svg_content, hex_color, use_saturation_variations):
+            raise ValueError('broken')
+
+        with self.assertLogs('animation_library.utils.icon_registry', 'WARNING') as logs:
+            for _ in range(10):
+                icon = self.registry.get_icon(IconLoader.get('refresh'), '#ff0000', broken_colorizer)
+                self.assertFalse(icon.isNull())  # Falls back to the original SVG
+        self.assertEqual(len(logs.records), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
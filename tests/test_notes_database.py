@@ -0,0 +1,156 @@
+"""
+Tests for notes.db concurrency and badge counts (services/notes_database.py).
+
+Badge counts are read on the GUI thread while note edits are written, so
+reads must not wait behind an open write transaction, and the counts for
+a whole grid must load in one query. Startup must not write to notes.db
+once its indexes and statistics exist (it may sit on a studio share).
+"""
+
+import sqlite3
+import threading
+import time
+import unittest
+import uuid
+from unittest import mock
+
+from animation_library.services.notes_database import NotesDatabase
+
+from .library_fixture import TempLibrary
+
+BADGE_ANIMATIONS = 10000
+
+
+class StatementTrace:
+    """Record the SQL statements of every connection opened meanwhile"""
+
+    def __init__(self):
+        self.statements = []
+        real_connect = sqlite3.connect
+
+        def connect(*args, **kwargs):
+            conn = real_connect(*args, **kwargs)
+            conn.set_trace_callback(self.statements.append)
+            return conn
+
+        self._patch = mock.patch('sqlite3.connect', connect)
+
+    def matching(self, prefix):
+        """Statements starting with an SQL keyword"""
+        return [s for s in self.statements if s.lstrip().upper().startswith(prefix)]
+
+    def __enter__(self):
+        self._patch.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._patch.stop()
+
+
+class TestNotesDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.library = TempLibrary()
+        self.addCleanup(self.library.cleanup)
+        self.notes = NotesDatabase()
+        self.assertTrue(self.notes.initialize())
+        self.addCleanup(self.notes.close)
+
+    def test_analyze_runs_only_until_statistics_exist(self):
+        self.notes.close()
+        with StatementTrace() as trace:
+            restarted = NotesDatabase()
+            self.assertTrue(restarted.initialize())
+            restarted.close()
+        self.assertEqual(trace.matching('ANALYZE'), [])
+
+        # A database from before the count indexes gets them (and statistics)
+        conn = sqlite3.connect(str(self.notes._db_path))
+        conn.execute('DROP INDEX idx_notes_session_counts')
+        conn.execute('DROP TABLE sqlite_stat1')
+        conn.commit()
+        conn.close()
+        with StatementTrace() as trace:
+            upgraded = NotesDatabase()
+            self.assertTrue(upgraded.initialize())
+            upgraded.close()
+        self.assertEqual(len(trace.matching('ANALYZE')), 1)
+
+    def test_reads_do_not_wait_for_note_writes(self):
+        animation_uuid = str(uuid.uuid4())
+        self.notes.add_note(animation_uuid, 'v001', 1, 'first')
+
+        writing = threading.Event()
+        release = threading.Event()
+
+        def write_notes():
+            # A long note transaction whose pages no longer fit in the
+            # writer's cache, so they are spilled to disk before commit
+            conn = self.notes._connection
+            conn.execute('PRAGMA cache_size = 10')
+            conn.execute('BEGIN IMMEDIATE')
+            session_id = conn.execute(
+                'SELECT id FROM review_sessions WHERE animation_uuid = ?', (animation_uuid,)
+            ).fetchone()[0]
+            conn.executemany(
+                'INSERT INTO review_notes (session_id, frame, note) VALUES (?, ?, ?)',
+                [(session_id, frame, 'x' * 200) for frame in range(5000)]
+            )
+            writing.set()
+            release.wait(10)
+            conn.commit()
+            self.notes.close()
+
+        writer = threading.Thread(target=write_notes)
+        writer.start()
+        self.addCleanup(writer.join)
+        self.addCleanup(release.set)
+        self.assertTrue(writing.wait(10))
+
+        started = time.perf_counter()
+        counts = self.notes.get_note_counts([animation_uuid])
+        notes = self.notes.get_notes_for_version(animation_uuid, 'v001')
+        elapsed = time.perf_counter() - started
+
+        # Answered from the last committed state, without waiting
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(counts[animation_uuid]['total'], 1)
+        self.assertEqual(len(notes), 1)
+
+        release.set()
+        writer.join()
+        self.assertEqual(self.notes.get_note_counts([animation_uuid])[animation_uuid]['total'], 5001)
+
+    def test_badge_counts_load_in_one_query(self):
+        uuids = [str(uuid.uuid4()) for _ in range(BADGE_ANIMATIONS)]
+        conn = self.notes._connection
+        conn.executemany(
+            'INSERT INTO review_sessions (animation_uuid, version_label) VALUES (?, ?)',
+            [(animation_uuid, 'v001') for animation_uuid in uuids]
+        )
+        session_ids = {row[1]: row[0] for row in conn.execute('SELECT id, animation_uuid FROM review_sessions')}
+        # Every animation: 3 notes (1 resolved, 1 deleted); every 10th: a drawover
+        conn.executemany(
+            'INSERT INTO review_notes (session_id, frame, note, resolved, deleted) VALUES (?, ?, ?, ?, ?)',
+            [(session_ids[animation_uuid], frame, 'note', int(frame == 1), int(frame == 2))
+             for animation_uuid in uuids for frame in range(3)]
+        )
+        conn.executemany(
+            'INSERT INTO drawover_metadata (animation_uuid, version_label, frame, stroke_count) VALUES (?, ?, ?, ?)',
+            [(animation_uuid, 'v001', 1, 4) for animation_uuid in uuids[::10]]
+        )
+        conn.commit()
+
+        statements = []
+        conn.set_trace_callback(statements.append)
+        counts = self.notes.get_note_counts(uuids)
+        conn.set_trace_callback(None)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(len(counts), BADGE_ANIMATIONS)
+        self.assertEqual(counts[uuids[0]], {'total': 2, 'unresolved': 1, 'drawovers': 1})
+        self.assertEqual(counts[uuids[1]], {'total': 2, 'unresolved': 1, 'drawovers': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests for cold start time (main.py, widgets/main_window.py).
+
+The window must paint within Config.STARTUP_BUDGET_MS on a large library,
+so it may only load what the first screen shows. Each start runs in a
+fresh interpreter (imports included) with the offscreen Qt platform.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from animation_library.config import Config
+from animation_library.utils.startup_timer import StartupTimer
+
+STARTUP_ASSETS = 50000
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestStartupBudget(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.home = Path(tempfile.mkdtemp(prefix='animlib_startup_'))
+        cls.env = dict(
+            os.environ,
+            HOME=str(cls.home),
+            LOCALAPPDATA=str(cls.home),
+            USERPROFILE=str(cls.home),
+            QT_QPA_PLATFORM='offscreen',
+        )
+        built = cls.probe('build', str(cls.home / 'library_root'), str(STARTUP_ASSETS))
+        assert built['animations'] == STARTUP_ASSETS, built
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.home, ignore_errors=True)
+
+    @classmethod
+    def probe(cls, *args):
+        """Run tests.startup_probe in a fresh interpreter; returns its result"""
+        result_path = cls.home / 'probe_result.json'
+        result_path.unlink(missing_ok=True)
+        command, *rest = args
+        result = subprocess.run(
+            [sys.executable, '-m', 'tests.startup_probe', command, str(result_path), *rest],
+            cwd=PROJECT_ROOT, env=cls.env, capture_output=True, text=True, timeout=300,
+        )
+        if result.returncode != 0:
+            raise AssertionError(f"startup_probe {command} failed:\n{result.stderr}")
+        if not result_path.exists():
+            raise AssertionError(f"startup_probe {command} wrote no result:\n{result.stderr}")
+        return json.loads(result_path.read_text())
+
+    def test_first_paint_within_budget(self):
+        # The first start also creates the user data folders; time the second
+        self.probe('start')
+        started = self.probe('start')
+
+        marks = dict(started['marks'])
+        self.assertIn(StartupTimer.FIRST_PAINT, marks)
+        self.assertLess(started['first_paint_ms'], Config.STARTUP_BUDGET_MS,
+                        msg=f"Startup marks: {started['marks']}")
+
+
+if __name__ == '__main__':
+    unittest.main()